@@ -0,0 +1,94 @@
+"""Benchmark grouped FrequencyTable merges against the legacy per-group loop.
+
+Compares :meth:`pmaf.biome.essentials.FrequencyTable.merge_features_by_map`
+with the former implementation that aggregated ``.loc`` selections of each
+group separately and checks that both produce identical tables.
+
+Usage::
+
+    python benchmarks/bench_frequency_merge.py --features 100000 --groups 5000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from pmaf.biome.essentials import FrequencyTable
+
+
+def legacy_merge(frequency, map_dict, aggfunc):
+    """Former group-wise implementation kept for reference."""
+    tmp_agg_dict = {}
+    for new_id, group in map_dict.items():
+        tmp_agg_dict[new_id] = frequency.loc[group, :].agg(func=aggfunc, axis=0).values
+    return pd.DataFrame.from_dict(
+        tmp_agg_dict, orient="index", columns=frequency.columns
+    )
+
+
+def make_frequency(features, samples, groups, seed=0):
+    """Make synthetic count table and random feature groups."""
+    rng = np.random.default_rng(seed)
+    counts = rng.poisson(0.3, size=(features, samples))
+    feature_ids = np.char.add("ASV", np.arange(features).astype(str))
+    frequency = pd.DataFrame(
+        counts,
+        index=feature_ids,
+        columns=np.char.add("S", np.arange(samples).astype(str)),
+    )
+    feature_groups = rng.integers(0, groups, features)
+    tmp_order = np.argsort(feature_groups, kind="stable")
+    tmp_bounds = np.searchsorted(feature_groups[tmp_order], np.arange(groups + 1))
+    map_dict = {
+        "G{}".format(group): feature_ids[tmp_order[start:stop]].tolist()
+        for group, (start, stop) in enumerate(zip(tmp_bounds[:-1], tmp_bounds[1:]))
+        if stop > start
+    }
+    return frequency, map_dict
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--features", type=int, default=100000)
+    parser.add_argument("--samples", type=int, default=50)
+    parser.add_argument("--groups", type=int, default=2000)
+    parser.add_argument("--aggfunc", default="sum")
+    args = parser.parse_args()
+
+    frequency, map_dict = make_frequency(args.features, args.samples, args.groups)
+
+    for sparse in (False, True):
+        frequency_table = FrequencyTable(frequency.copy(), sparse=sparse)
+        start = time.perf_counter()
+        frequency_table.merge_features_by_map(map_dict, args.aggfunc)
+        if sparse:
+            sparse_grouped = time.perf_counter() - start
+            sparse_product = frequency_table.to_dense()
+        else:
+            grouped = time.perf_counter() - start
+            product = frequency_table.data
+
+    start = time.perf_counter()
+    should_product = legacy_merge(frequency, map_dict, args.aggfunc)
+    legacy = time.perf_counter() - start
+
+    pd.testing.assert_frame_equal(product, should_product)
+    pd.testing.assert_frame_equal(sparse_product, should_product, check_dtype=False)
+    print(
+        "FrequencyTable merge ({} features x {} samples into {} groups, {})".format(
+            args.features, args.samples, len(map_dict), args.aggfunc
+        )
+    )
+    print("  legacy:         {:.3f}s".format(legacy))
+    print("  grouped:        {:.3f}s ({:.2f}x)".format(grouped, legacy / grouped))
+    print(
+        "  grouped sparse: {:.3f}s ({:.2f}x)".format(
+            sparse_grouped, legacy / sparse_grouped
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Benchmark out-of-core FrequencyTable against the in-memory table.
+
+Runs relative abundance transform, sample dropping and feature merge with
+:class:`pmaf.biome.essentials.FrequencyTable` in dense and out-of-core modes
+and checks that both produce identical tables. Peak memory is traced with
+:mod:`tracemalloc` while the table is processed. The dense source frame is
+created before tracing starts.
+
+Usage::
+
+    python benchmarks/bench_frequency_outofcore.py --features 200000 --samples 400
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from pmaf.biome.essentials import FrequencyTable
+
+
+def make_frequency(features, samples, groups, seed=0):
+    """Make synthetic count table and random feature groups."""
+    rng = np.random.default_rng(seed)
+    feature_ids = np.char.add("ASV", np.arange(features).astype(str))
+    frequency = pd.DataFrame(
+        rng.poisson(0.3, size=(features, samples)).astype(np.float64),
+        index=feature_ids,
+        columns=np.char.add("S", np.arange(samples).astype(str)),
+    )
+    feature_groups = rng.integers(0, groups, features)
+    map_dict = (
+        pd.Series(feature_ids)
+        .groupby(feature_groups)
+        .agg(list)
+        .rename(lambda group: "G{}".format(group))
+        .to_dict()
+    )
+    return frequency, map_dict
+
+
+def process(frequency, map_dict, **kwargs):
+    """Process table and return result with elapsed time and peak memory."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    frequency_table = FrequencyTable(frequency, **kwargs)
+    frequency_table.transform_to_relative_abundance()
+    frequency_table.drop_samples_by_id(frequency.columns[::10])
+    frequency_table.merge_features_by_map(map_dict, "sum")
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return frequency_table.data, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--features", type=int, default=100000)
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--groups", type=int, default=2000)
+    parser.add_argument("--block-size", type=int, default=32)
+    args = parser.parse_args()
+
+    frequency, map_dict = make_frequency(args.features, args.samples, args.groups)
+    product, dense, dense_peak = process(frequency.copy(), map_dict)
+    with tempfile.TemporaryDirectory() as dirpath:
+        outofcore_product, outofcore, outofcore_peak = process(
+            frequency, map_dict, outofcore=dirpath, block_size=args.block_size
+        )
+
+    pd.testing.assert_frame_equal(outofcore_product, product)
+    print(
+        "FrequencyTable processing ({} features x {} samples, {} per block)".format(
+            args.features, args.samples, args.block_size
+        )
+    )
+    print("  dense:       {:.3f}s, peak {:.1f} MiB".format(dense, dense_peak / 2**20))
+    print(
+        "  out-of-core: {:.3f}s, peak {:.1f} MiB".format(
+            outofcore, outofcore_peak / 2**20
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Benchmark single-pass FASTA ingestion against the legacy two-pass path.
+
+Compares time spent by
+:func:`pmaf.database._parsers._qiime.parse_qiime_sequence_generator` on
+synthetic FASTA files and total
+:meth:`pmaf.database.DatabaseGreengenes.build_database_storage` time on the
+bundled Greengenes test data.
+
+Usage::
+
+    python benchmarks/bench_sequence_ingestion.py --records 100000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from pmaf.database import DatabaseGreengenes
+from pmaf.database._parsers._qiime import parse_qiime_sequence_generator
+
+RAW_ROOT = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "pmaf",
+    "tests",
+    "data",
+    "tdbs",
+    "greengenes",
+    "raw",
+)
+
+
+def make_fasta(fasta_fp, records, alignment, seed=0):
+    """Write synthetic FASTA file with `records` sequences."""
+    rng = np.random.default_rng(seed)
+    alphabet = np.frombuffer(b"ACGT-" if alignment else b"ACGTN", dtype=np.uint8)
+    weights = (
+        [0.2, 0.2, 0.2, 0.2, 0.2] if alignment else [0.25, 0.25, 0.25, 0.249, 0.001]
+    )
+    with open(fasta_fp, "w") as fasta_file:
+        for rid in range(records):
+            length = 7682 if alignment else int(rng.integers(1200, 1600))
+            sequence = rng.choice(alphabet, size=length, p=weights).tobytes().decode()
+            fasta_file.write(">{}\n".format(rid))
+            for i in range(0, length, 80):
+                fasta_file.write(sequence[i : i + 80] + "\n")
+
+
+def time_parser(fasta_fp, alignment, single_pass, chunksize):
+    """Consume the parser and return elapsed seconds."""
+    start = time.perf_counter()
+    parser = parse_qiime_sequence_generator(fasta_fp, chunksize, alignment, single_pass)
+    dims, _ = next(parser)
+    for _ in parser:
+        pass
+    return time.perf_counter() - start, dims
+
+
+def time_build(output_fp, single_pass):
+    """Build bundled Greengenes test database and return elapsed seconds."""
+    start = time.perf_counter()
+    DatabaseGreengenes.build_database_storage(
+        output_fp,
+        os.path.join(RAW_ROOT, "reftax.txt"),
+        os.path.join(RAW_ROOT, "tree.nwk"),
+        os.path.join(RAW_ROOT, "refseq.fa"),
+        os.path.join(RAW_ROOT, "refaln.fa"),
+        {"benchmark": "sequence-ingestion"},
+        force=True,
+        chunksize=50,
+        single_pass=single_pass,
+    )
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--chunksize", type=int, default=500)
+    parser.add_argument("--alignment", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        fasta_fp = os.path.join(tmp_dir, "synthetic.fa")
+        make_fasta(fasta_fp, args.records, args.alignment)
+        two_pass, two_pass_dims = time_parser(
+            fasta_fp, args.alignment, False, args.chunksize
+        )
+        one_pass, one_pass_dims = time_parser(
+            fasta_fp, args.alignment, True, args.chunksize
+        )
+        if two_pass_dims != one_pass_dims:
+            raise RuntimeError("Dimensions differ between ingestion modes.")
+        print("Parser ({} records)".format(args.records))
+        print("  two-pass:    {:.3f}s".format(two_pass))
+        print("  single-pass: {:.3f}s ({:.2f}x)".format(one_pass, two_pass / one_pass))
+
+        build_two_pass = time_build(os.path.join(tmp_dir, "two_pass.hdf5"), False)
+        build_one_pass = time_build(os.path.join(tmp_dir, "one_pass.hdf5"), True)
+        print("Greengenes test database build")
+        print("  two-pass:    {:.3f}s".format(build_two_pass))
+        print(
+            "  single-pass: {:.3f}s ({:.2f}x)".format(
+                build_one_pass, build_two_pass / build_one_pass
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Benchmark vectorized sequence stats against the legacy row-wise engine.
+
+Compares :func:`pmaf.internal._shared.get_stats_for_sequence_record_df` with
+the former ``DataFrame.apply`` implementation on a synthetic chunk of
+sequence records and checks that both produce identical frames.
+
+Usage::
+
+    python benchmarks/bench_sequence_stats.py --records 100000
+"""
+
+import argparse
+import statistics
+import time
+from itertools import groupby
+
+import numpy as np
+import pandas as pd
+
+from pmaf.internal._constants import IUPAC_AMBIGUOUS, IUPAC_BASES
+from pmaf.internal._shared import get_stats_for_sequence_record_df
+
+
+def legacy_stats(sequence_record_df):
+    """Former row-wise implementation kept for reference."""
+    reps_ex_columns = list(IUPAC_AMBIGUOUS.keys())
+    reps_columns = (
+        [
+            "length",
+            "tab",
+            "complexity",
+            "amb_mean",
+            "amb_rep_mean",
+            "amb_repmax_mean",
+            "amb_repmin_mean",
+        ]
+        + ["{}_total".format(col) for col in IUPAC_BASES]
+        + ["{}_repmax".format(col) for col in reps_ex_columns]
+        + ["{}_repmin".format(col) for col in reps_ex_columns]
+    )
+
+    def process_rep(rep_series):
+        complexity_level = 0
+        abase_count = []
+        reps_ex_buffer = {}
+        for b, bb in IUPAC_AMBIGUOUS.items():
+            total_abases = rep_series["sequence"].count(b)
+            abase_count.append(total_abases)
+            complexity_level = complexity_level + total_abases * len(bb)
+            if total_abases > 0:
+                base_reps = [
+                    len(list(y)) for (c, y) in groupby(rep_series["sequence"]) if c == b
+                ]
+                reps_ex_buffer[b] = [max(base_reps), min(base_reps)]
+            else:
+                reps_ex_buffer[b] = [0, 0]
+        base_count_list = [rep_series["sequence"].count(b) for b in IUPAC_BASES]
+        amb_repmax_list = [reps_ex_buffer[col][0] for col in reps_ex_columns]
+        amb_repmin_list = [reps_ex_buffer[col][1] for col in reps_ex_columns]
+        amb_repmax_mean = statistics.mean(amb_repmax_list)
+        amb_repmin_mean = statistics.mean(amb_repmin_list)
+        return (
+            [
+                rep_series["length"],
+                rep_series["tab"],
+                complexity_level,
+                statistics.mean(abase_count),
+                statistics.mean([amb_repmax_mean, amb_repmin_mean]),
+                amb_repmax_mean,
+                amb_repmin_mean,
+            ]
+            + base_count_list
+            + amb_repmax_list
+            + amb_repmin_list
+        )
+
+    sequence_stats = sequence_record_df.apply(process_rep, axis=1, result_type="expand")
+    sequence_stats.columns = reps_columns
+    return sequence_stats
+
+
+def make_records(records, seed=0):
+    """Make synthetic sequence record chunk with rare ambiguous bases."""
+    rng = np.random.default_rng(seed)
+    alphabet = np.frombuffer(b"ACGTRYSWKMBDHVN", dtype=np.uint8)
+    weights = np.asarray([0.2495] * 4 + [0.0002] * 11)
+    weights = weights / weights.sum()
+    lengths = rng.integers(1200, 1600, size=records)
+    buffer = rng.choice(alphabet, size=int(lengths.sum()), p=weights).tobytes()
+    offsets = np.concatenate([[0], np.cumsum(lengths)])
+    sequences = [
+        buffer[start:end].decode() for start, end in zip(offsets[:-1], offsets[1:])
+    ]
+    return pd.DataFrame(
+        {"sequence": sequences, "length": lengths.astype(np.int32), "tab": 0},
+        index=pd.RangeIndex(records, name="index"),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--records", type=int, default=100000)
+    args = parser.parse_args()
+
+    records_df = make_records(args.records)
+
+    start = time.perf_counter()
+    product = get_stats_for_sequence_record_df(records_df)
+    vectorized = time.perf_counter() - start
+
+    start = time.perf_counter()
+    should_product = legacy_stats(records_df)
+    legacy = time.perf_counter() - start
+
+    pd.testing.assert_frame_equal(product, should_product)
+    print("Sequence stats ({} records)".format(args.records))
+    print("  row-wise:   {:.3f}s".format(legacy))
+    print("  vectorized: {:.3f}s ({:.2f}x)".format(vectorized, legacy / vectorized))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Benchmark long-format FrequencyTable merging of BiomeSurvey against the
+legacy nested loops.
+
+Compares :func:`pmaf.biome.survey._shared.mergeFrequencyTable` with index
+grouping to the former implementation that aggregated every sample group x
+feature group x assembly cell separately. Assemblies share part of their
+features and samples. Both results are checked to be identical for every
+assembly count.
+
+Usage::
+
+    python benchmarks/bench_survey_merge.py --assemblies 2 4 8 16 --features 200
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from pmaf.biome.assembly import BiomeAssembly
+from pmaf.biome.essentials import FrequencyTable
+from pmaf.biome.survey._shared import mergeFrequencyTable, parse_assembly_maps
+
+
+def legacy_merge(features_map, samples_map, essentials_map, aggfunc_dict):
+    """Former cell-wise implementation kept for reference."""
+    feature_groups = features_map.reset_index(drop=True).set_index("index")
+    sample_groups = samples_map.reset_index(drop=True).set_index("index")
+    new_freq_table_parts = {
+        nsid: {nfid: list() for nfid in feature_groups.index}
+        for nsid in sample_groups.index
+    }
+    for label, essential in essentials_map[FrequencyTable].items():
+        tmp_freq_table = essential.data
+        for new_sid, sids in sample_groups.loc[:, label].items():
+            if len(sids) > 0:
+                for new_rid, rids in feature_groups.loc[:, label].items():
+                    if len(rids) > 0:
+                        new_freq_table_parts[new_sid][new_rid].append(
+                            tmp_freq_table.loc[rids, sids]
+                        )
+    new_freq_table_dict = {
+        nsid: {nfid: list() for nfid in feature_groups.index}
+        for nsid in sample_groups.index
+    }
+    for sid in sample_groups.index:
+        for rid in feature_groups.index:
+            if len(new_freq_table_parts[sid][rid]) > 0:
+                new_freq_table_dict[sid][rid] = (
+                    pd.concat(
+                        new_freq_table_parts[sid][rid],
+                        join="outer",
+                        verify_integrity=False,
+                        ignore_index=True,
+                    )
+                    .agg(aggfunc_dict[FrequencyTable][0], axis=0)
+                    .agg(aggfunc_dict[FrequencyTable][1])
+                )
+            else:
+                new_freq_table_dict[sid][rid] = None
+    return pd.DataFrame.from_dict(new_freq_table_dict)
+
+
+def make_assemblies(assemblies, features, samples, seed=0):
+    """Make assemblies with random overlapping feature and sample subsets."""
+    rng = np.random.default_rng(seed)
+    assembly_map = {}
+    for assembly in range(assemblies):
+        feature_ids = np.sort(rng.choice(features * 2, features, replace=False))
+        sample_ids = np.sort(rng.choice(samples * 2, samples, replace=False))
+        frequency = pd.DataFrame(
+            rng.poisson(2, size=(features, samples)).astype(np.float64),
+            index=np.char.add("F", feature_ids.astype(str)),
+            columns=np.char.add("S", sample_ids.astype(str)),
+        )
+        assembly_map["A{}".format(assembly)] = BiomeAssembly(
+            [FrequencyTable(frequency)]
+        )
+    return assembly_map
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--assemblies", type=int, nargs="+", default=[2, 4, 8])
+    parser.add_argument("--features", type=int, default=100)
+    parser.add_argument("--samples", type=int, default=10)
+    args = parser.parse_args()
+
+    aggfunc_dict = {FrequencyTable: {0: "sum", 1: "mean"}}
+    print(
+        "BiomeSurvey FrequencyTable merge ({} features x {} samples per assembly)".format(
+            args.features, args.samples
+        )
+    )
+    for assemblies in args.assemblies:
+        assembly_map = make_assemblies(assemblies, args.features, args.samples)
+        features_map, samples_map = parse_assembly_maps("index", "index", assembly_map)
+        essentials_map = {
+            FrequencyTable: {
+                label: assembly.essentials[0]
+                for label, assembly in assembly_map.items()
+            }
+        }
+
+        start = time.perf_counter()
+        product = mergeFrequencyTable(
+            "index", "index", features_map, samples_map, essentials_map, aggfunc_dict
+        ).data
+        long_format = time.perf_counter() - start
+
+        start = time.perf_counter()
+        should_product = legacy_merge(
+            features_map, samples_map, essentials_map, aggfunc_dict
+        )
+        legacy = time.perf_counter() - start
+
+        pd.testing.assert_frame_equal(product, should_product, check_dtype=False)
+        print(
+            "  {:>3} assemblies: legacy {:.3f}s, long-format {:.3f}s ({:.2f}x)".format(
+                assemblies, legacy, long_format, legacy / long_format
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
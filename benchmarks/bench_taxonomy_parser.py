@@ -0,0 +1,110 @@
+"""Benchmark column-wise QIIME taxonomy parser against the legacy parser.
+
+Compares :func:`pmaf.database._parsers._qiime.parse_qiime_taxonomy_map` with
+the former ``np.vectorize`` implementation on a synthetic taxonomy map and
+checks that both produce identical sheets.
+
+Usage::
+
+    python benchmarks/bench_taxonomy_parser.py --lineages 1000000
+"""
+
+import argparse
+import time
+from itertools import chain
+
+import numpy as np
+import pandas as pd
+
+from pmaf.database._parsers._qiime import parse_qiime_taxonomy_map
+
+
+def legacy_parse(taxonomy_map_df):
+    """Former lineage-wise implementation kept for reference."""
+    taxonomy_map = taxonomy_map_df.iloc[:, 0]
+    zip_list = list(
+        chain(
+            *taxonomy_map.map(
+                lambda lineage: [
+                    e.strip().split("__")[0] for e in lineage.split(";") if ("__" in e)
+                ]
+            ).tolist()
+        )
+    )
+    seen = set()
+    found_levels = [x for x in zip_list if not (x in seen or seen.add(x))]
+
+    def allocator(lineage, levels):
+        taxa_dict = {
+            e[0]: e[1]
+            for e in [e.strip().split("__") for e in lineage.split(";") if ("__" in e)]
+        }
+        taxa_dict_allowed = {
+            rank: taxa_dict[rank] for rank in taxa_dict.keys() if rank in levels
+        }
+        for key in levels:
+            if not (key in taxa_dict_allowed.keys()):
+                taxa_dict_allowed[key] = ""
+        return [taxa_dict_allowed[rank] for rank in levels]
+
+    allocator_vectorized = np.vectorize(allocator, excluded=["levels"], otypes=[list])
+    master_taxonomy_sheet = pd.DataFrame(
+        index=list(taxonomy_map.index),
+        data=list(
+            allocator_vectorized(lineage=list(taxonomy_map.values), levels=found_levels)
+        ),
+        columns=found_levels,
+    )
+    return master_taxonomy_sheet.applymap(
+        lambda x: None if (x == "" or pd.isna(x)) else x
+    )
+
+
+def make_taxonomy_map(lineages, seed=0):
+    """Make synthetic GTDB-like taxonomy map with missing and unnamed ranks."""
+    rng = np.random.default_rng(seed)
+    ranks = ["d", "p", "c", "o", "f", "g", "s"]
+    taxa = [
+        np.char.add(
+            "{}_".format(rank).upper(),
+            rng.integers(0, 10 ** (level + 1), lineages).astype(str),
+        )
+        for level, rank in enumerate(ranks)
+    ]
+    elements = []
+    for level, rank in enumerate(ranks):
+        tmp_elements = np.char.add("{}__".format(rank), taxa[level]).astype(object)
+        tmp_elements[rng.random(lineages) < 0.05 * level] = "{}__".format(rank)
+        elements.append(tmp_elements)
+    lineage_series = pd.Series(elements[0])
+    for tmp_elements in elements[1:]:
+        lineage_series = lineage_series + "; " + tmp_elements
+    return pd.DataFrame(
+        {"taxonomy": lineage_series.values},
+        index=pd.Index(np.arange(lineages).astype(str)),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--lineages", type=int, default=200000)
+    args = parser.parse_args()
+
+    taxonomy_map_df = make_taxonomy_map(args.lineages)
+
+    start = time.perf_counter()
+    product = parse_qiime_taxonomy_map(taxonomy_map_df)
+    columnwise = time.perf_counter() - start
+
+    start = time.perf_counter()
+    should_product = legacy_parse(taxonomy_map_df)
+    legacy = time.perf_counter() - start
+
+    pd.testing.assert_frame_equal(product, should_product)
+    print("QIIME taxonomy parser ({} lineages)".format(args.lineages))
+    print("  legacy:      {:.3f}s".format(legacy))
+    print("  column-wise: {:.3f}s ({:.2f}x)".format(columnwise, legacy / columnwise))
+
+
+if __name__ == "__main__":
+    main()
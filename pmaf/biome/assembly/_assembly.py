@@ -9,6 +9,7 @@ from pmaf.biome.essentials._metakit import (
 )
 from pmaf.biome.essentials._taxonomy import RepTaxonomy
 from pmaf.biome.essentials._frequency import FrequencyTable
+from pmaf.biome.essentials._samplemeta import SampleMetadata
 from pmaf.biome._base import BiomeBackboneBase
 from pmaf.biome.essentials._controller import EssentialsController
 import numpy as np
@@ -17,6 +18,7 @@ import pandas as pd
 from os import path
 from typing import Union, Sequence, Any, Optional, List
 from pmaf.internal._typing import AnyGenericIdentifier
+from pmaf.internal.io._biom import BiomReader, open_biom
 
 
 class BiomeAssembly(BiomeBackboneBase, BiomeAssemblyBackboneMetabase):
@@ -121,6 +123,64 @@ class BiomeAssembly(BiomeBackboneBase, BiomeAssemblyBackboneMetabase):
         self.__controller = controller
         super().__init__(**kwargs)
 
+    @classmethod
+    def from_biom(
+        cls,
+        filepath: Union[str, BiomReader],
+        rids: Optional[AnyGenericIdentifier] = None,
+        sids: Optional[AnyGenericIdentifier] = None,
+        sparse: bool = False,
+        outofcore: Union[bool, str] = False,
+        **kwargs: Any
+    ) -> "BiomeAssembly":
+        """Factory method to construct a :class:`.BiomeAssembly` from
+        :mod:`biom` file.
+
+        File is opened once and shared by all `essentials`.
+        :class:`~pmaf.biome.essentials._taxonomy.RepTaxonomy` and
+        :class:`~pmaf.biome.essentials._samplemeta.SampleMetadata` are
+        added only if file has observation and sample metadata respectively.
+
+        Parameters
+        ----------
+        filepath
+            Path to :mod:`biom` file or opened
+            :class:`~pmaf.internal.io.BiomReader`
+        rids
+            Feature identifiers to read or None for all features.
+        sids
+            Sample identifiers to read or None for all samples.
+        sparse
+            Store counts of
+            :class:`~pmaf.biome.essentials._frequency.FrequencyTable` as
+            sparse matrix.
+        outofcore
+            Store counts of
+            :class:`~pmaf.biome.essentials._frequency.FrequencyTable` on disk.
+            Either True or path to directory for temporary files.
+        kwargs
+            Passed to the constructor
+
+        Returns
+        -------
+            Instance of class:`.BiomeAssembly`
+        """
+        with open_biom(filepath) as biom_reader:
+            tmp_essentials = [
+                FrequencyTable.from_biom(
+                    biom_reader,
+                    rids=rids,
+                    sids=sids,
+                    sparse=sparse,
+                    outofcore=outofcore,
+                )
+            ]
+            if biom_reader.has_metadata("observation"):
+                tmp_essentials.append(RepTaxonomy.from_biom(biom_reader, rids=rids))
+            if biom_reader.has_metadata("sample"):
+                tmp_essentials.append(SampleMetadata.from_biom(biom_reader, sids=sids))
+        return cls(tmp_essentials, copy=False, **kwargs)
+
     def __getattr__(self, attribute: str) -> EssentialBackboneMetabase:
         """Provides attribute lookup for installed `essentials`.
 
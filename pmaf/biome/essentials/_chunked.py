@@ -0,0 +1,436 @@
+import os
+import tempfile
+import weakref
+import numpy as np
+import pandas as pd
+import tables
+from typing import Any, Callable, Generator, Optional, Tuple, Union
+
+# Number of samples per block of out-of-core frequency tables.
+DEFAULT_BLOCK_SAMPLES = 256
+# Upper limit of chunk size of on-disk frequency arrays.
+MAX_CHUNK_BYTES = 2**20
+# Compression of on-disk frequency arrays.
+DEFAULT_COMPLIB = "blosc:lz4"
+DEFAULT_COMPLEVEL = 5
+
+PositionSelector = Optional[Union[slice, np.ndarray]]
+
+
+def _close_store(store_file: tables.File, filepath: str) -> None:
+    """Close `store_file` and remove its temporary file."""
+    if store_file.isopen:
+        store_file.close()
+    if os.path.isfile(filepath):
+        os.unlink(filepath)
+
+
+class ChunkedFrequency:
+    """Out-of-core frequency matrix stored in chunked :mod:`tables` array.
+
+    Counts are kept in compressed :class:`tables.CArray` within temporary
+    HDF5 file with features as rows and samples as columns. Each chunk spans
+    block of samples so that whole sample blocks are read and written at
+    once. Counts keep dtype of the source data. Identifiers are kept in
+    memory. Operations that change the shape
+    of the matrix are streamed block by block into new stores by
+    :meth:`.map_blocks` and :meth:`.take`. Temporary file is removed when
+    store is closed or garbage collected.
+    """
+
+    def __init__(
+        self,
+        index: pd.Index,
+        columns: pd.Index,
+        dirpath: Optional[str] = None,
+        block_size: int = DEFAULT_BLOCK_SAMPLES,
+        dtype: Any = np.float64,
+    ):
+        """Constructor for :class:`.ChunkedFrequency`
+
+        Parameters
+        ----------
+        index
+            Feature identifiers.
+        columns
+            Sample identifiers.
+        dirpath
+            Directory for temporary file or None for default temporary
+            directory.
+        block_size
+            Number of samples per block.
+        dtype
+            Numeric dtype of counts. Unwritten values of floating dtypes are
+            NaN and zero otherwise.
+        """
+        tmp_dtype = np.dtype(dtype)
+        if tmp_dtype.kind not in "biuf":
+            raise TypeError("`dtype` must be numeric.")
+        if isinstance(block_size, int) and not isinstance(block_size, bool):
+            if block_size < 1:
+                raise ValueError("`block_size` must be positive.")
+        else:
+            raise TypeError("`block_size` must be integer.")
+        if dirpath is not None and not os.path.isdir(dirpath):
+            raise ValueError("`dirpath` is invalid.")
+        self.__index = pd.Index(index)
+        self.__columns = pd.Index(columns)
+        self.__dirpath = dirpath
+        self.__block_size = block_size
+        tmp_fd, self.__filepath = tempfile.mkstemp(suffix=".h5", dir=dirpath)
+        os.close(tmp_fd)
+        self.__file = tables.open_file(
+            self.__filepath,
+            mode="w",
+            filters=tables.Filters(
+                complib=DEFAULT_COMPLIB, complevel=DEFAULT_COMPLEVEL
+            ),
+        )
+        self.__finalizer = weakref.finalize(
+            self, _close_store, self.__file, self.__filepath
+        )
+        tmp_atom = tables.Atom.from_dtype(
+            tmp_dtype, dflt=np.nan if tmp_dtype.kind == "f" else 0
+        )
+        tmp_total_rows, tmp_total_columns = self.shape
+        tmp_chunk_columns = min(block_size, max(tmp_total_columns, 1))
+        tmp_chunk_rows = int(
+            np.clip(
+                MAX_CHUNK_BYTES // (tmp_atom.size * tmp_chunk_columns),
+                1,
+                max(tmp_total_rows, 1),
+            )
+        )
+        self.__array = self.__file.create_carray(
+            "/",
+            "frequency",
+            atom=tmp_atom,
+            shape=self.shape,
+            title="Frequency",
+            chunkshape=(tmp_chunk_rows, tmp_chunk_columns),
+        )
+
+    def __repr__(self):
+        class_name = self.__class__.__name__
+        repr_str = "<{}: {} features x {} samples, Filepath: {}>".format(
+            class_name, self.shape[0], self.shape[1], self.__filepath
+        )
+        return repr_str
+
+    @classmethod
+    def from_frame(
+        cls,
+        frame: pd.DataFrame,
+        dirpath: Optional[str] = None,
+        block_size: int = DEFAULT_BLOCK_SAMPLES,
+    ) -> "ChunkedFrequency":
+        """Factory method to construct a :class:`.ChunkedFrequency` from
+        :class:`~pandas.DataFrame`
+
+        Parameters
+        ----------
+        frame
+            Frequency data with features as index and samples as columns.
+        dirpath
+            Directory for temporary file.
+        block_size
+            Number of samples per block.
+
+        Returns
+        -------
+            Instance of class:`.ChunkedFrequency`
+        """
+        # Frames with missing values among objects are stored as floats.
+        if frame.shape[1] > 0 and all(
+            isinstance(dtype, np.dtype) and dtype.kind in "biuf"
+            for dtype in frame.dtypes.values
+        ):
+            tmp_dtype = np.result_type(*frame.dtypes.values)
+        else:
+            tmp_dtype = np.dtype(np.float64)
+        tmp_store = cls(frame.index, frame.columns, dirpath, block_size, tmp_dtype)
+        for block in tmp_store.iter_slices(axis=1):
+            tmp_store.write(
+                frame.iloc[:, block].values.astype(tmp_dtype), columns=block
+            )
+        return tmp_store
+
+    def close(self) -> None:
+        """Close and remove the temporary file."""
+        self.__finalizer()
+
+    def iter_slices(self, axis: int = 1) -> Generator[slice, None, None]:
+        """Iterate over block slices along `axis`
+
+        Sample blocks hold :attr:`block_size` samples. Feature blocks hold
+        whole chunk rows and take about as much memory as sample blocks.
+
+        Parameters
+        ----------
+        axis
+            0 for feature blocks or 1 for sample blocks.
+        """
+        tmp_total_rows, tmp_total_columns = self.shape
+        if axis == 1:
+            tmp_total, tmp_step = tmp_total_columns, self.__block_size
+        elif axis == 0:
+            tmp_chunk_rows = self.__array.chunkshape[0]
+            tmp_step = (
+                self.__block_size * tmp_total_rows // max(tmp_total_columns, 1)
+            ) // tmp_chunk_rows
+            tmp_total, tmp_step = tmp_total_rows, max(tmp_step, 1) * tmp_chunk_rows
+        else:
+            raise ValueError("`axis` is invalid.")
+        for start in range(0, tmp_total, tmp_step):
+            yield slice(start, min(start + tmp_step, tmp_total))
+
+    def iter_blocks(
+        self, axis: int = 1
+    ) -> Generator[Tuple[slice, np.ndarray], None, None]:
+        """Iterate over blocks along `axis`
+
+        Parameters
+        ----------
+        axis
+            0 for feature blocks or 1 for sample blocks.
+
+        Returns
+        -------
+            Generator of block slices and :class:`~numpy.ndarray` blocks.
+        """
+        for block in self.iter_slices(axis):
+            if axis == 1:
+                yield block, self.__array[:, block]
+            else:
+                yield block, self.__array[block, :]
+
+    def read(
+        self, rows: PositionSelector = None, columns: PositionSelector = None
+    ) -> np.ndarray:
+        """Read block of the matrix.
+
+        Parameters
+        ----------
+        rows
+            Row positions, :class:`slice` or None for all rows.
+        columns
+            Column positions, :class:`slice` or None for all columns.
+
+        Returns
+        -------
+            :class:`~numpy.ndarray` with selected values.
+        """
+        if columns is None or isinstance(columns, slice):
+            tmp_values = self.__array[:, slice(None) if columns is None else columns]
+        else:
+            tmp_unique, tmp_inverse = np.unique(
+                np.asarray(columns, dtype=np.int64), return_inverse=True
+            )
+            # Columns that are less than chunk apart are read with single
+            # slice so that no chunk is decompressed twice.
+            tmp_runs = np.split(
+                tmp_unique,
+                np.flatnonzero(np.diff(tmp_unique) > self.__array.chunkshape[1]) + 1,
+            )
+            tmp_values = np.hstack(
+                [np.empty((self.shape[0], 0), dtype=self.dtype)]
+                + [
+                    self.__array[:, run[0] : run[-1] + 1][:, run - run[0]]
+                    for run in tmp_runs
+                    if len(run)
+                ]
+            )[:, tmp_inverse]
+        if rows is None:
+            return tmp_values
+        return tmp_values[rows]
+
+    def write(
+        self,
+        values: np.ndarray,
+        rows: slice = slice(None),
+        columns: slice = slice(None),
+    ) -> None:
+        """Write `values` into block of the matrix.
+
+        Parameters
+        ----------
+        values
+            Values of the block. Must be castable to :attr:`dtype` without
+            change of kind, so that floats are not truncated into integers.
+        rows
+            Target rows.
+        columns
+            Target columns.
+        """
+        self.__array[rows, columns] = np.asarray(values).astype(
+            self.dtype, casting="same_kind", copy=False
+        )
+
+    def update_blocks(self, func: Callable[[np.ndarray], np.ndarray]) -> None:
+        """Apply `func` to sample blocks in place.
+
+        Parameters
+        ----------
+        func
+            Function that takes and returns block of same shape.
+        """
+        for block, values in self.iter_blocks(axis=1):
+            self.write(func(values), columns=block)
+
+    def map_blocks(
+        self,
+        func: Callable[[np.ndarray], np.ndarray],
+        index: pd.Index,
+        columns: pd.Index,
+        axis: int = 1,
+    ) -> "ChunkedFrequency":
+        """Stream blocks through `func` into new store.
+
+        Results are placed along `axis` one after another.
+
+        Parameters
+        ----------
+        func
+            Function that takes block along `axis` and returns block of the
+            new matrix. Dtype of the new matrix is the dtype of the first
+            returned block.
+        index
+            Feature identifiers of the new matrix.
+        columns
+            Sample identifiers of the new matrix.
+        axis
+            0 for feature blocks or 1 for sample blocks.
+
+        Returns
+        -------
+            New instance of class:`.ChunkedFrequency`
+        """
+        tmp_store = None
+        tmp_offset = 0
+        for _, values in self.iter_blocks(axis):
+            tmp_values = np.asarray(func(values))
+            if tmp_store is None:
+                tmp_store = type(self)(
+                    index, columns, self.__dirpath, self.__block_size, tmp_values.dtype
+                )
+            tmp_next = tmp_offset + tmp_values.shape[axis]
+            if axis == 1:
+                tmp_store.write(tmp_values, columns=slice(tmp_offset, tmp_next))
+            else:
+                tmp_store.write(tmp_values, rows=slice(tmp_offset, tmp_next))
+            tmp_offset = tmp_next
+        if tmp_store is None:
+            tmp_store = type(self)(
+                index, columns, self.__dirpath, self.__block_size, self.dtype
+            )
+        if tmp_offset != tmp_store.shape[axis]:
+            tmp_store.close()
+            raise ValueError("Blocks do not match shape of the new matrix.")
+        return tmp_store
+
+    def take(
+        self, rows: Optional[np.ndarray] = None, columns: Optional[np.ndarray] = None
+    ) -> "ChunkedFrequency":
+        """Copy selected rows and columns into new store.
+
+        Parameters
+        ----------
+        rows
+            Row positions or None for all rows.
+        columns
+            Column positions or None for all columns.
+
+        Returns
+        -------
+            New instance of class:`.ChunkedFrequency`
+        """
+        tmp_index = self.__index if rows is None else self.__index[rows]
+        tmp_columns = self.__columns if columns is None else self.__columns[columns]
+        tmp_store = type(self)(
+            tmp_index, tmp_columns, self.__dirpath, self.__block_size, self.dtype
+        )
+        for block in tmp_store.iter_slices(axis=1):
+            tmp_store.write(
+                self.read(
+                    rows=rows, columns=block if columns is None else columns[block]
+                ),
+                columns=block,
+            )
+        return tmp_store
+
+    def sum(self, axis: int = 0) -> np.ndarray:
+        """Sum values along `axis` skipping NaN values.
+
+        Parameters
+        ----------
+        axis
+            0 for sample totals or 1 for feature totals.
+        """
+        if axis == 0:
+            return np.concatenate(
+                [np.zeros(0, dtype=self.dtype)]
+                + [np.nansum(values, axis=0) for _, values in self.iter_blocks(axis=1)]
+            )
+        tmp_totals = np.zeros(self.shape[0], dtype=self.dtype)
+        for _, values in self.iter_blocks(axis=1):
+            tmp_totals = tmp_totals + np.nansum(values, axis=1)
+        return tmp_totals
+
+    def any_nan(self) -> bool:
+        """Is there NaN values present?"""
+        if self.dtype.kind != "f":
+            return False
+        return any(np.isnan(values).any() for _, values in self.iter_blocks(axis=1))
+
+    def to_frame(self) -> pd.DataFrame:
+        """Read whole matrix into :class:`~pandas.DataFrame`"""
+        return pd.DataFrame(self.read(), index=self.__index, columns=self.__columns)
+
+    @property
+    def index(self) -> pd.Index:
+        """Feature identifiers."""
+        return self.__index
+
+    @index.setter
+    def index(self, value: Any) -> None:
+        tmp_index = pd.Index(value)
+        if len(tmp_index) != self.shape[0]:
+            raise ValueError("Length of `index` does not match the matrix.")
+        self.__index = tmp_index
+
+    @property
+    def columns(self) -> pd.Index:
+        """Sample identifiers."""
+        return self.__columns
+
+    @columns.setter
+    def columns(self, value: Any) -> None:
+        tmp_columns = pd.Index(value)
+        if len(tmp_columns) != self.shape[1]:
+            raise ValueError("Length of `columns` does not match the matrix.")
+        self.__columns = tmp_columns
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Dtype of counts."""
+        return self.__array.dtype
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """Shape of the matrix."""
+        return len(self.__index), len(self.__columns)
+
+    @property
+    def block_size(self) -> int:
+        """Number of samples per block."""
+        return self.__block_size
+
+    @property
+    def dirpath(self) -> Optional[str]:
+        """Directory of temporary file."""
+        return self.__dirpath
+
+    @property
+    def filepath(self) -> str:
+        """Path to temporary file."""
+        return self.__filepath
@@ -6,13 +6,15 @@ from pmaf.biome.essentials._metakit import (
     EssentialSampleMetabase,
 )
 from pmaf.biome.essentials._base import EssentialBackboneBase
-from collections import defaultdict
 from os import path
 import pandas as pd
 import numpy as np
-import biom
+import scipy.sparse as sp
 from typing import Union, Sequence, Tuple, Callable, Any, Optional
 from pmaf.internal._typing import AnyGenericIdentifier, Mapper
+from pmaf.internal._shared import make_group_codes, aggregate_by_group_codes
+from pmaf.internal.io._biom import BiomReader, open_biom
+from pmaf.biome.essentials._chunked import ChunkedFrequency, DEFAULT_BLOCK_SAMPLES
 
 
 class FrequencyTable(
@@ -22,9 +24,12 @@ class FrequencyTable(
 
     def __init__(
         self,
-        frequency: Union[pd.DataFrame, str],
+        frequency: Union[pd.DataFrame, str, ChunkedFrequency],
         skipcols: Union[Sequence[Union[str, int]], str, int] = None,
         allow_nan: bool = False,
+        sparse: bool = False,
+        outofcore: Union[bool, str] = False,
+        block_size: int = DEFAULT_BLOCK_SAMPLES,
         **kwargs
     ):
         """Constructor for :class:`.FrequencyTable`
@@ -37,10 +42,31 @@ class FrequencyTable(
              Columns to skip when processing data.
         allow_nan
             Allow NA/NaN values or raise an error.
+        sparse
+            Store counts as :mod:`scipy.sparse` matrix instead of dense
+            :class:`~pandas.DataFrame`.
+        outofcore
+            Store counts on disk in
+            :class:`~pmaf.biome.essentials._chunked.ChunkedFrequency`. Either
+            True for default temporary directory or path to directory for
+            temporary files.
+        block_size
+            Number of samples per block of out-of-core counts.
         kwargs
             Remaining parameters passed to :func:`~pandas.read_csv` or :mod:`biom` loader
         """
+        if isinstance(frequency, ChunkedFrequency) and not outofcore:
+            outofcore = True
+        if sparse and outofcore:
+            raise ValueError("`sparse` and `outofcore` cannot be used together.")
+        if isinstance(outofcore, str) and not path.isdir(outofcore):
+            raise ValueError("`outofcore` directory is invalid.")
         self.__internal_frequency = None
+        self.__sparse = bool(sparse)
+        self.__outofcore = outofcore
+        self.__block_size = block_size
+        self.__feature_ids = None
+        self.__sample_ids = None
         tmp_skipcols = np.asarray([])
         tmp_metadata = kwargs.pop("metadata", {})
         if skipcols is not None:
@@ -67,23 +93,37 @@ class FrequencyTable(
             if file_extension in [".csv", ".tsv"]:
                 tmp_frequency = pd.read_csv(frequency, **kwargs)
             elif file_extension in [".biom", ".biome"]:
-                tmp_frequency, new_metadata = self.__load_biom(frequency, **kwargs)
+                tmp_frequency, new_metadata = self.__load_biom(
+                    frequency,
+                    sparse=sparse,
+                    outofcore=outofcore,
+                    block_size=block_size,
+                    **kwargs
+                )
                 tmp_metadata.update({"biom": new_metadata})
             else:
                 raise NotImplementedError("File type is not supported.")
+        elif isinstance(frequency, ChunkedFrequency):
+            tmp_frequency = frequency
         else:
             raise TypeError("Provided `frequency` has invalid type.")
         if skipcols is not None:
             if np.issubdtype(tmp_skipcols.dtype, np.number):
-                if tmp_frequency.columns.isin(tmp_skipcols).any():
-                    tmp_frequency.drop(columns=tmp_skipcols, inplace=True)
-                else:
-                    tmp_frequency.drop(
-                        columns=tmp_frequency.columns[tmp_skipcols], inplace=True
-                    )
+                if not tmp_frequency.columns.isin(tmp_skipcols).any():
+                    tmp_skipcols = tmp_frequency.columns[tmp_skipcols]
+            if isinstance(tmp_frequency, ChunkedFrequency):
+                tmp_keep = ~tmp_frequency.columns.isin(tmp_skipcols)
+                tmp_chunked_frequency = tmp_frequency
+                tmp_frequency = tmp_chunked_frequency.take(
+                    columns=np.flatnonzero(tmp_keep)
+                )
+                tmp_chunked_frequency.close()
             else:
                 tmp_frequency.drop(columns=tmp_skipcols, inplace=True)
-        tmp_dtypes = list(set(tmp_frequency.dtypes.values))
+        if isinstance(tmp_frequency, ChunkedFrequency):
+            tmp_dtypes = [tmp_frequency.dtype]
+        else:
+            tmp_dtypes = list(set(tmp_frequency.dtypes.values))
         if len(tmp_dtypes) == 1 and pd.api.types.is_numeric_dtype(tmp_dtypes[0]):
             self.__init_frequency_table(tmp_frequency)
         else:
@@ -111,14 +151,25 @@ class FrequencyTable(
         super().__init__(metadata=tmp_metadata, **kwargs)
 
     @classmethod
-    def from_biom(cls, filepath: str, **kwargs) -> "FrequencyTable":
+    def from_biom(
+        cls,
+        filepath: Union[str, BiomReader],
+        rids: Optional[AnyGenericIdentifier] = None,
+        sids: Optional[AnyGenericIdentifier] = None,
+        **kwargs
+    ) -> "FrequencyTable":
         """Factory method to construct a :class:`.FrequencyTable` from
         :mod:`biom` file.
 
         Parameters
         ----------
         filepath
-            Path to :mod:`biom` file
+            Path to :mod:`biom` file or opened
+            :class:`~pmaf.internal.io.BiomReader`
+        rids
+            Feature identifiers to read or None for all features.
+        sids
+            Sample identifiers to read or None for all samples.
         kwargs
             Compatibility
 
@@ -126,7 +177,9 @@ class FrequencyTable(
         -------
             Instance of class:`.FrequencyTable`
         """
-        frequency_frame, new_metadata = cls.__load_biom(filepath, **kwargs)
+        frequency_frame, new_metadata = cls.__load_biom(
+            filepath, rids=rids, sids=sids, **kwargs
+        )
         tmp_metadata = kwargs.pop("metadata", {})
         tmp_metadata.update({"biom": new_metadata})
         return cls(frequency=frequency_frame, metadata=tmp_metadata, **kwargs)
@@ -153,18 +206,65 @@ class FrequencyTable(
         return cls(frequency=tmp_frequency, metadata=tmp_metadata, **kwargs)
 
     @classmethod
-    def __load_biom(cls, filepath: str, **kwargs) -> Tuple[pd.DataFrame, dict]:
+    def __load_biom(
+        cls,
+        filepath: Union[str, BiomReader],
+        sparse: bool = False,
+        rids: Optional[AnyGenericIdentifier] = None,
+        sids: Optional[AnyGenericIdentifier] = None,
+        outofcore: Union[bool, str] = False,
+        block_size: int = DEFAULT_BLOCK_SAMPLES,
+        **kwargs
+    ) -> Tuple[Union[pd.DataFrame, ChunkedFrequency], dict]:
         """Actual private method to process :mod:`biom` file.
 
         Parameters
         ----------
         filepath
-            :mod:`biom` file path.
+            :mod:`biom` file path or opened
+            :class:`~pmaf.internal.io.BiomReader`
+        sparse
+            Keep counts in sparse :class:`~pandas.DataFrame`.
+        rids
+            Feature identifiers to read or None for all features.
+        sids
+            Sample identifiers to read or None for all samples.
+        outofcore
+            Stream counts by sample blocks into
+            :class:`~pmaf.biome.essentials._chunked.ChunkedFrequency`
+        block_size
+            Number of samples per block of out-of-core counts.
         kwargs
             Compatibility
         """
-        biom_file = biom.load_table(filepath)
-        return biom_file.to_dataframe(dense=True), {}
+        with open_biom(filepath) as biom_reader:
+            if not outofcore:
+                return (
+                    biom_reader.read_frequency(rids=rids, sids=sids, sparse=sparse),
+                    {},
+                )
+            tmp_ids = {}
+            for axis, ids in [("observation", rids), ("sample", sids)]:
+                tmp_ids[axis] = biom_reader.get_ids(axis)
+                if ids is not None:
+                    tmp_target_ids = pd.Index(np.asarray(ids).astype(str), dtype=object)
+                    if not tmp_target_ids.isin(tmp_ids[axis]).all():
+                        raise ValueError("Invalid ids are provided.")
+                    tmp_ids[axis] = tmp_target_ids
+            tmp_store = ChunkedFrequency(
+                tmp_ids["observation"],
+                tmp_ids["sample"],
+                outofcore if isinstance(outofcore, str) else None,
+                block_size,
+            )
+            for block in tmp_store.iter_slices(axis=1):
+                tmp_store.write(
+                    biom_reader.read_frequency(
+                        rids=rids, sids=tmp_store.columns[block]
+                    ).values,
+                    columns=block,
+                )
+            return tmp_store, {}
 
     def _rename_samples_by_map(
         self, map_like: Mapper, **kwargs
@@ -178,7 +278,14 @@ class FrequencyTable(
         kwargs
             Compatibility
         """
-        self.__internal_frequency.rename(mapper=map_like, axis=1, inplace=True)
+        if self.__sparse:
+            self.__sample_ids = self.__sample_ids.to_series().rename(map_like).index
+        elif self.__outofcore:
+            self.__internal_frequency.columns = (
+                self.__internal_frequency.columns.to_series().rename(map_like).index
+            )
+        else:
+            self.__internal_frequency.rename(mapper=map_like, axis=1, inplace=True)
         return self._ratify_action("_rename_samples_by_map", map_like, **kwargs)
 
     def _remove_features_by_id(
@@ -193,9 +300,20 @@ class FrequencyTable(
         kwargs
             Compatibility
         """
-        tmp_ids = np.asarray(ids, dtype=self.__internal_frequency.index.dtype)
+        tmp_ids = np.asarray(ids, dtype=self.xrid.dtype)
         if len(tmp_ids) > 0:
-            self.__internal_frequency.drop(index=tmp_ids, inplace=True)
+            if self.__sparse:
+                tmp_keep = ~self.__feature_ids.isin(tmp_ids)
+                self.__internal_frequency = self.__internal_frequency[tmp_keep]
+                self.__feature_ids = self.__feature_ids[tmp_keep]
+            elif self.__outofcore:
+                self.__init_frequency_table(
+                    self.__internal_frequency.take(
+                        rows=np.flatnonzero(~self.xrid.isin(tmp_ids))
+                    )
+                )
+            else:
+                self.__internal_frequency.drop(index=tmp_ids, inplace=True)
         return self._ratify_action("_remove_features_by_id", ids, **kwargs)
 
     def _merge_features_by_map(
@@ -212,15 +330,44 @@ class FrequencyTable(
         kwargs
             Compatibility
         """
-        tmp_agg_dict = defaultdict(list)
-        for new_id, group in map_dict.items():
-            tmp_agg_dict[new_id] = (
-                self.__internal_frequency.loc[group, :].agg(func=aggfunc, axis=0).values
+        tmp_keys, tmp_positions, tmp_codes = make_group_codes(map_dict, self.xrid)
+        if self.__sparse:
+            self.__init_sparse_frequency(
+                aggregate_by_group_codes(
+                    self.__internal_frequency,
+                    tmp_positions,
+                    tmp_codes,
+                    len(tmp_keys),
+                    aggfunc,
+                ),
+                pd.Index(tmp_keys),
+                self.__sample_ids,
             )
-        tmp_freq_table = pd.DataFrame.from_dict(
-            tmp_agg_dict, orient="index", columns=self.__internal_frequency.columns
-        )
-        self.__init_frequency_table(tmp_freq_table)
+        elif self.__outofcore:
+            self.__init_frequency_table(
+                self.__internal_frequency.map_blocks(
+                    lambda values: aggregate_by_group_codes(
+                        pd.DataFrame(values),
+                        tmp_positions,
+                        tmp_codes,
+                        len(tmp_keys),
+                        aggfunc,
+                    ).values,
+                    pd.Index(tmp_keys),
+                    self.xsid,
+                    axis=1,
+                )
+            )
+        else:
+            tmp_freq_table = aggregate_by_group_codes(
+                self.__internal_frequency,
+                tmp_positions,
+                tmp_codes,
+                len(tmp_keys),
+                aggfunc,
+            )
+            tmp_freq_table.index = pd.Index(tmp_keys)
+            self.__init_frequency_table(tmp_freq_table)
         return self._ratify_action(
             "_merge_features_by_map", map_dict, aggfunc=aggfunc, **kwargs
         )
@@ -237,9 +384,20 @@ class FrequencyTable(
         kwargs
             Compatibility
         """
-        tmp_ids = np.asarray(ids, dtype=self.__internal_frequency.columns.dtype)
+        tmp_ids = np.asarray(ids, dtype=self.xsid.dtype)
         if len(tmp_ids) > 0:
-            self.__internal_frequency.drop(columns=tmp_ids, inplace=True)
+            if self.__sparse:
+                tmp_keep = ~self.__sample_ids.isin(tmp_ids)
+                self.__internal_frequency = self.__internal_frequency[:, tmp_keep]
+                self.__sample_ids = self.__sample_ids[tmp_keep]
+            elif self.__outofcore:
+                self.__init_frequency_table(
+                    self.__internal_frequency.take(
+                        columns=np.flatnonzero(~self.xsid.isin(tmp_ids))
+                    )
+                )
+            else:
+                self.__internal_frequency.drop(columns=tmp_ids, inplace=True)
         return self._ratify_action("_remove_samples_by_id", ids, **kwargs)
 
     def _merge_samples_by_map(
@@ -257,24 +415,84 @@ class FrequencyTable(
         kwargs
             Compatibility
         """
-        tmp_agg_dict = defaultdict(list)
-        for new_id, group in map_dict.items():
-            tmp_agg_dict[new_id] = (
-                self.__internal_frequency.loc[:, group]
-                .agg(func=aggfunc, axis=1)
-                .to_dict()
+        tmp_keys, tmp_positions, tmp_codes = make_group_codes(map_dict, self.xsid)
+        if self.__sparse:
+            self.__init_sparse_frequency(
+                aggregate_by_group_codes(
+                    self.__internal_frequency.T,
+                    tmp_positions,
+                    tmp_codes,
+                    len(tmp_keys),
+                    aggfunc,
+                ).T,
+                self.__feature_ids,
+                pd.Index(tmp_keys),
             )
-        tmp_freq_table = pd.DataFrame.from_dict(tmp_agg_dict, orient="columns")
-        self.__init_frequency_table(tmp_freq_table)
+        elif self.__outofcore:
+            self.__init_frequency_table(
+                self.__internal_frequency.map_blocks(
+                    lambda values: aggregate_by_group_codes(
+                        pd.DataFrame(values.T),
+                        tmp_positions,
+                        tmp_codes,
+                        len(tmp_keys),
+                        aggfunc,
+                    ).values.T,
+                    self.xrid,
+                    pd.Index(tmp_keys),
+                    axis=0,
+                )
+            )
+        else:
+            tmp_freq_table = aggregate_by_group_codes(
+                self.__internal_frequency.T,
+                tmp_positions,
+                tmp_codes,
+                len(tmp_keys),
+                aggfunc,
+            )
+            tmp_freq_table.index = pd.Index(tmp_keys)
+            self.__init_frequency_table(tmp_freq_table.T)
         return self._ratify_action(
             "_merge_samples_by_map", map_dict, aggfunc=aggfunc, **kwargs
         )
 
     def transform_to_relative_abundance(self):
-        """Transform absolute counts to relative."""
-        self.__internal_frequency = self.__internal_frequency.div(
-            self.__internal_frequency.sum(axis=0), axis=1
-        )
+        """Transform absolute counts to relative.
+
+        In sparse mode samples without counts remain zero instead of NaN.
+        """
+        if self.__sparse:
+            tmp_totals = np.asarray(self.__internal_frequency.sum(axis=0)).ravel()
+            tmp_scales = np.divide(
+                1,
+                tmp_totals,
+                out=np.zeros(tmp_totals.shape[0], dtype=np.float64),
+                where=tmp_totals != 0,
+            )
+            self.__internal_frequency = (
+                self.__internal_frequency @ sp.diags(tmp_scales)
+            ).tocsc()
+        elif self.__outofcore:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                if self.__internal_frequency.dtype.kind == "f":
+                    self.__internal_frequency.update_blocks(
+                        lambda values: values / np.nansum(values, axis=0)
+                    )
+                else:
+                    # Integer counts are streamed into new floating store.
+                    self.__init_frequency_table(
+                        self.__internal_frequency.map_blocks(
+                            lambda values: values / np.nansum(values, axis=0),
+                            self.xrid,
+                            self.xsid,
+                            axis=1,
+                        )
+                    )
+        else:
+            self.__internal_frequency = self.__internal_frequency.div(
+                self.__internal_frequency.sum(axis=0), axis=1
+            )
 
     def replace_nan_with(self, value: Any) -> None:
         """Replace NaN values with `value`.
@@ -284,7 +502,18 @@ class FrequencyTable(
         value
             Value to replace NaN's
         """
-        self.__internal_frequency.fillna(value, inplace=True)
+        if self.__sparse:
+            tmp_values = self.__internal_frequency.data
+            tmp_values[np.isnan(tmp_values)] = value
+            self.__internal_frequency.eliminate_zeros()
+        elif self.__outofcore:
+            # Counts of other than floating dtypes cannot hold NaN values.
+            if self.__internal_frequency.dtype.kind == "f":
+                self.__internal_frequency.update_blocks(
+                    lambda values: np.where(np.isnan(values), value, values)
+                )
+        else:
+            self.__internal_frequency.fillna(value, inplace=True)
 
     def drop_features_by_id(self, ids: AnyGenericIdentifier) -> Union[None, np.ndarray]:
         """Drop features by `ids`
@@ -295,7 +524,7 @@ class FrequencyTable(
             Feature identifiers
         """
         target_ids = np.asarray(ids)
-        if self.__internal_frequency.index.isin(target_ids).sum() == len(target_ids):
+        if self.xrid.isin(target_ids).sum() == len(target_ids):
             self._remove_features_by_id(target_ids)
             if self.is_buckled:
                 return target_ids
@@ -312,9 +541,7 @@ class FrequencyTable(
         """
         if isinstance(mapper, dict) or callable(mapper):
             if isinstance(mapper, dict):
-                if self.__internal_frequency.columns.isin(
-                    list(mapper.keys())
-                ).sum() == len(mapper):
+                if self.xsid.isin(list(mapper.keys())).sum() == len(mapper):
                     self._rename_samples_by_map(mapper)
                 else:
                     raise ValueError("Invalid sample ids are provided.")
@@ -328,9 +555,13 @@ class FrequencyTable(
 
         Typically required after dropping samples.
         """
-        target_ids = self.__internal_frequency.index[
-            self.__internal_frequency.sum(axis=1) == 0
-        ].values
+        if self.__sparse:
+            tmp_totals = np.asarray(self.__internal_frequency.sum(axis=1)).ravel()
+        elif self.__outofcore:
+            tmp_totals = self.__internal_frequency.sum(axis=1)
+        else:
+            tmp_totals = self.__internal_frequency.sum(axis=1).values
+        target_ids = self.xrid[tmp_totals == 0].values
         self._remove_features_by_id(target_ids)
         if self.is_buckled:
             return target_ids
@@ -344,7 +575,7 @@ class FrequencyTable(
             Sample identifiers
         """
         target_ids = np.asarray(ids)
-        if self.__internal_frequency.columns.isin(target_ids).sum() == len(target_ids):
+        if self.xsid.isin(target_ids).sum() == len(target_ids):
             self._remove_samples_by_id(target_ids)
             if self.is_buckled:
                 return target_ids
@@ -353,7 +584,89 @@ class FrequencyTable(
 
     def __init_frequency_table(self, freq_table: pd.DataFrame) -> None:
         """Initiate the frequency table."""
-        self.__internal_frequency = freq_table
+        if self.__sparse:
+            if all(
+                isinstance(dtype, pd.SparseDtype) for dtype in freq_table.dtypes.values
+            ):
+                tmp_matrix = freq_table.sparse.to_coo()
+            else:
+                tmp_matrix = freq_table.values
+                if tmp_matrix.dtype == object:
+                    tmp_matrix = tmp_matrix.astype(np.float64)
+            self.__init_sparse_frequency(
+                tmp_matrix, freq_table.index, freq_table.columns
+            )
+        elif self.__outofcore:
+            if not isinstance(freq_table, ChunkedFrequency):
+                freq_table = ChunkedFrequency.from_frame(
+                    freq_table,
+                    self.__outofcore if isinstance(self.__outofcore, str) else None,
+                    self.__block_size,
+                )
+            if isinstance(self.__internal_frequency, ChunkedFrequency):
+                self.__internal_frequency.close()
+            self.__internal_frequency = freq_table
+        else:
+            self.__internal_frequency = freq_table
+
+    def __init_sparse_frequency(
+        self, matrix: Any, feature_ids: pd.Index, sample_ids: pd.Index
+    ) -> None:
+        """Initiate the sparse frequency table.
+
+        Parameters
+        ----------
+        matrix
+            Matrix of counts with features as rows and samples as columns.
+        feature_ids
+            Feature identifiers.
+        sample_ids
+            Sample identifiers.
+        """
+        self.__internal_frequency = sp.csc_matrix(matrix)
+        self.__internal_frequency.eliminate_zeros()
+        self.__feature_ids = pd.Index(feature_ids)
+        self.__sample_ids = pd.Index(sample_ids)
+
+    @staticmethod
+    def __sort_sparse_rows(matrix: sp.csc_matrix, ascending: bool) -> np.ndarray:
+        """Get order that sorts rows of `matrix` by all columns.
+
+        Rows are sorted by first column and ties are resolved by following
+        columns until every row is unique. Only tied rows are densified at
+        each column.
+
+        Parameters
+        ----------
+        matrix
+            Sparse matrix to sort.
+        ascending
+            Sorting
+
+        Returns
+        -------
+            :class:`~numpy.ndarray` with row positions in sorted order
+        """
+        tmp_total_rows = matrix.shape[0]
+        tmp_order = np.arange(tmp_total_rows)
+        tmp_groups = np.zeros(tmp_total_rows, dtype=np.int64)
+        for column in range(matrix.shape[1]):
+            tmp_group_sizes = np.bincount(tmp_groups)
+            tmp_tied = np.flatnonzero(tmp_group_sizes[tmp_groups] > 1)
+            if tmp_tied.shape[0] == 0:
+                break
+            tmp_values = matrix[:, column].toarray().ravel()[tmp_order]
+            if not ascending:
+                tmp_values = -tmp_values
+            tmp_tied_order = np.lexsort((tmp_values[tmp_tied], tmp_groups[tmp_tied]))
+            tmp_order[tmp_tied] = tmp_order[tmp_tied[tmp_tied_order]]
+            tmp_values[tmp_tied] = tmp_values[tmp_tied[tmp_tied_order]]
+            tmp_breaks = (tmp_groups[1:] != tmp_groups[:-1]) | ~(
+                (tmp_values[1:] == tmp_values[:-1])
+                | (np.isnan(tmp_values[1:]) & np.isnan(tmp_values[:-1]))
+            )
+            tmp_groups = np.append(0, np.cumsum(tmp_breaks))
+        return tmp_order
 
     def merge_features_by_map(
         self, mapping: Mapper, aggfunc: Union[str, Callable] = "sum", **kwargs
@@ -373,7 +686,7 @@ class FrequencyTable(
             tmp_ids = sorted(
                 {x for _, v in mapping.items() for x in v}
             )  # FIXME: Uncool behavior make it better and follow the usage.
-            if self.__internal_frequency.index.isin(tmp_ids).sum() == len(tmp_ids):
+            if self.xrid.isin(tmp_ids).sum() == len(tmp_ids):
                 return self._merge_features_by_map(mapping, aggfunc, **kwargs)
             else:
                 raise ValueError("Invalid feature ids were found.")
@@ -398,7 +711,7 @@ class FrequencyTable(
             tmp_ids = sorted(
                 {x for _, v in mapping.items() for x in v}
             )  # FIXME: Uncool. See above.
-            if self.__internal_frequency.columns.isin(tmp_ids).sum() == len(tmp_ids):
+            if self.xsid.isin(tmp_ids).sum() == len(tmp_ids):
                 return self._merge_samples_by_map(mapping, aggfunc, **kwargs)
             else:
                 raise ValueError("Invalid sample ids were found.")
@@ -407,10 +720,19 @@ class FrequencyTable(
 
     def copy(self) -> "FrequencyTable":
         """Copy of the instance."""
+        if self.__outofcore:
+            return type(self)(
+                frequency=self.__internal_frequency.take(),
+                metadata=self.metadata,
+                name=self.name,
+                outofcore=self.__outofcore,
+                block_size=self.__block_size,
+            )
         return type(self)(
-            frequency=self.__internal_frequency.copy(),
+            frequency=self.data.copy(),
             metadata=self.metadata,
             name=self.name,
+            sparse=self.__sparse,
         )
 
     def get_subset(
@@ -440,22 +762,38 @@ class FrequencyTable(
         if rids is None:
             target_rids = self.xrid
         else:
-            target_rids = np.asarray(rids).astype(self.__internal_frequency.index.dtype)
+            target_rids = np.asarray(rids).astype(self.xrid.dtype)
         if sids is None:
             target_sids = self.xsid
         else:
-            target_sids = np.asarray(sids).astype(
-                self.__internal_frequency.columns.dtype
-            )
+            target_sids = np.asarray(sids).astype(self.xsid.dtype)
         if not (
             (self.xrid.isin(target_rids).sum() == len(target_rids))
             and (self.xsid.isin(target_sids).sum() == len(target_sids))
         ):
             raise ValueError("Invalid ids are provided.")
+        if self.__sparse:
+            tmp_rows = self.__feature_ids.get_indexer(target_rids)
+            tmp_columns = self.__sample_ids.get_indexer(target_sids)
+            tmp_frequency = pd.DataFrame.sparse.from_spmatrix(
+                self.__internal_frequency[tmp_rows][:, tmp_columns],
+                index=self.__feature_ids[tmp_rows],
+                columns=self.__sample_ids[tmp_columns],
+            )
+        elif self.__outofcore:
+            tmp_frequency = self.__internal_frequency.take(
+                rows=self.xrid.get_indexer(target_rids),
+                columns=self.xsid.get_indexer(target_sids),
+            )
+        else:
+            tmp_frequency = self.__internal_frequency.loc[target_rids, target_sids]
         return type(self)(
-            frequency=self.__internal_frequency.loc[target_rids, target_sids],
+            frequency=tmp_frequency,
             metadata=self.metadata,
             name=self.name,
+            sparse=self.__sparse,
+            outofcore=self.__outofcore,
+            block_size=self.__block_size,
         )
 
     def _export(
@@ -473,6 +811,13 @@ class FrequencyTable(
             Compatibility
         """
         if sortby == "counts":
+            if self.__sparse:
+                return (
+                    self.data.iloc[
+                        self.__sort_sparse_rows(self.__internal_frequency, ascending)
+                    ],
+                    kwargs,
+                )
             return (
                 self.data.sort_values(
                     by=self.xsid.values.tolist(), axis=0, ascending=ascending
@@ -506,22 +851,67 @@ class FrequencyTable(
         else:
             tmp_export.to_csv(output_fp, sep=sep)
 
+    def to_dense(self) -> pd.DataFrame:
+        """Get dense pandas dataframe of `FrequencyTable`
+
+        Out-of-core counts are read into memory.
+        """
+        if self.__sparse:
+            return pd.DataFrame(
+                self.__internal_frequency.toarray(),
+                index=self.__feature_ids,
+                columns=self.__sample_ids,
+            )
+        if self.__outofcore:
+            return self.__internal_frequency.to_frame()
+        return self.__internal_frequency
+
     @property
     def data(self) -> pd.DataFrame:
-        """Pandas dataframe of `FrequencyTable`"""
+        """Pandas dataframe of `FrequencyTable`.
+
+        Sparse pandas dataframe if :attr:`is_sparse`. Out-of-core counts
+        are read into memory if :attr:`is_outofcore`
+        """
+        if self.__sparse:
+            return pd.DataFrame.sparse.from_spmatrix(
+                self.__internal_frequency,
+                index=self.__feature_ids,
+                columns=self.__sample_ids,
+            )
+        if self.__outofcore:
+            return self.__internal_frequency.to_frame()
         return self.__internal_frequency
 
     @property
     def xrid(self) -> pd.Index:
         """Feature axis."""
+        if self.__sparse:
+            return self.__feature_ids
         return self.__internal_frequency.index
 
     @property
     def xsid(self) -> pd.Index:
         """Sample axis."""
+        if self.__sparse:
+            return self.__sample_ids
         return self.__internal_frequency.columns
 
+    @property
+    def is_sparse(self) -> bool:
+        """Are counts stored as sparse matrix?"""
+        return self.__sparse
+
+    @property
+    def is_outofcore(self) -> bool:
+        """Are counts stored on disk?"""
+        return bool(self.__outofcore)
+
     @property
     def any_nan(self) -> bool:
         """Is there nan values present?"""
+        if self.__sparse:
+            return bool(np.isnan(self.__internal_frequency.data).any())
+        if self.__outofcore:
+            return self.__internal_frequency.any_nan()
         return self.__internal_frequency.isnull().any().any()
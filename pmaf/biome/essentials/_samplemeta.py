@@ -7,9 +7,9 @@ from os import path
 import pandas as pd
 import numpy as np
 from collections import defaultdict
-import biom
 from typing import Union, Optional, Tuple, Callable, Any
 from pmaf.internal._typing import AnyGenericIdentifier, Mapper
+from pmaf.internal.io._biom import BiomReader, open_biom
 
 
 class SampleMetadata(EssentialBackboneBase, EssentialSampleMetabase):
@@ -52,8 +52,9 @@ class SampleMetadata(EssentialBackboneBase, EssentialSampleMetabase):
                 if file_extension in [".csv", ".tsv"]:
                     tmp_sample = pd.read_csv(samples, index_col=index_col, **kwargs)
                 elif file_extension in [".biom", ".biome"]:
-                    tmp_frequency, new_metadata = self.__load_biom(samples, **kwargs)
+                    tmp_sample, new_metadata = self.__load_biom(samples, **kwargs)
                     tmp_metadata.update({"biom": new_metadata})
+                    tmp_axis = 0
                 else:
                     raise NotImplementedError("File type is not supported.")
             else:
@@ -95,14 +96,21 @@ class SampleMetadata(EssentialBackboneBase, EssentialSampleMetabase):
         return cls(samples=tmp_sample, metadata=tmp_metadata, **kwargs)
 
     @classmethod
-    def from_biom(cls, filepath: str, **kwargs) -> "SampleMetadata":
+    def from_biom(
+        cls,
+        filepath: Union[str, BiomReader],
+        sids: Optional[AnyGenericIdentifier] = None,
+        **kwargs
+    ) -> "SampleMetadata":
         """Factory method to construct a :class:`.SampleMetadata` from
         :mod:`biom` file.
 
         Parameters
         ----------
         filepath
-             Path to :mod:`biom` file
+             Path to :mod:`biom` file or opened :class:`~pmaf.internal.io.BiomReader`
+        sids
+            Sample identifiers to read or None for all samples.
         kwargs
             Passed to the constructor
 
@@ -110,26 +118,33 @@ class SampleMetadata(EssentialBackboneBase, EssentialSampleMetabase):
         -------
             Instance of class:`.SampleMetadata`
         """
-        samples_frame, new_metadata = cls.__load_biom(filepath, **kwargs)
+        samples_frame, new_metadata = cls.__load_biom(filepath, sids=sids, **kwargs)
         tmp_metadata = kwargs.pop("metadata", {})
         tmp_metadata.update({"biom": new_metadata})
-        return cls(frequency=samples_frame, metadata=tmp_metadata, **kwargs)
+        kwargs.pop("axis", None)
+        return cls(samples=samples_frame, axis=0, metadata=tmp_metadata, **kwargs)
 
     @classmethod
-    def __load_biom(cls, filepath: str, **kwargs: Any) -> Tuple[pd.DataFrame, dict]:
+    def __load_biom(
+        cls,
+        filepath: Union[str, BiomReader],
+        sids: Optional[AnyGenericIdentifier] = None,
+        **kwargs: Any
+    ) -> Tuple[pd.DataFrame, dict]:
         """Actual private method to process :mod:`biom` file.
 
         Parameters
         ----------
         filepath
-             :mod:`biom` file path
+             :mod:`biom` file path or opened :class:`~pmaf.internal.io.BiomReader`
+        sids
+            Sample identifiers to read or None for all samples.
         kwargs
             Compatibility
         """
-        biom_file = biom.load_table(filepath)
-        if biom_file.metadata(axis="sample") is not None:
-            sample_data = biom_file.metadata_to_dataframe("sample")
-        else:
+        with open_biom(filepath) as biom_reader:
+            sample_data = biom_reader.read_metadata("sample", sids)
+        if sample_data is None:
             raise ValueError("Biom file does not contain sample metadata.")
         return sample_data, {}
 
@@ -5,6 +5,7 @@ from pmaf.biome.essentials._metakit import EssentialFeatureMetabase
 from pmaf.biome.essentials._base import EssentialBackboneBase
 from pmaf.internal._constants import (
     AVAIL_TAXONOMY_NOTATIONS,
+    MAIN_RANKS,
     jRegexGG,
     jRegexQIIME,
     BIOM_TAXONOMY_NAMES,
@@ -17,14 +18,15 @@ from pmaf.internal._shared import (
     validate_ranks,
     extract_valid_ranks,
     cols2ranks,
+    findall_ranked_taxa,
+    pivot_ranked_taxa,
 )
-from collections import defaultdict
 from os import path
 import pandas as pd
 import numpy as np
-import biom
 from typing import Union, Sequence, Tuple, Any, Optional
 from pmaf.internal._typing import AnyGenericIdentifier, Mapper
+from pmaf.internal.io._biom import BiomReader, open_biom
 
 
 class RepTaxonomy(EssentialBackboneBase, EssentialFeatureMetabase):
@@ -50,6 +52,8 @@ class RepTaxonomy(EssentialBackboneBase, EssentialFeatureMetabase):
         tmp_metadata = kwargs.pop("metadata", {})
         self.__avail_ranks = []
         self.__internal_taxonomy = None
+        self.__internal_lineages = None
+        self.__data_columns = []
         if isinstance(taxonomy, pd.DataFrame):
             if taxonomy.shape[0] > 0:
                 if taxonomy.shape[1] > 1:
@@ -142,14 +146,21 @@ class RepTaxonomy(EssentialBackboneBase, EssentialFeatureMetabase):
         return cls(taxonomy=tmp_taxonomy, metadata=tmp_metadata, **kwargs)
 
     @classmethod
-    def from_biom(cls, filepath: str, **kwargs: Any) -> "RepTaxonomy":
+    def from_biom(
+        cls,
+        filepath: Union[str, BiomReader],
+        rids: Optional[AnyGenericIdentifier] = None,
+        **kwargs: Any
+    ) -> "RepTaxonomy":
         """Factory method to construct a :class:`.RepTaxonomy` from :mod:`biom`
         file.
 
         Parameters
         ----------
         filepath
-            :mod:`biom` file path.
+            :mod:`biom` file path or opened :class:`~pmaf.internal.io.BiomReader`
+        rids
+            Feature identifiers to read or None for all features.
         kwargs
             Passed to the constructor.
 
@@ -158,25 +169,32 @@ class RepTaxonomy(EssentialBackboneBase, EssentialFeatureMetabase):
         Instance of
             class:`.RepTaxonomy`
         """
-        taxonomy_frame, new_metadata = cls.__load_biom(filepath, **kwargs)
+        taxonomy_frame, new_metadata = cls.__load_biom(filepath, rids=rids, **kwargs)
         tmp_metadata = kwargs.pop("metadata", {})
         tmp_metadata.update({"biom": new_metadata})
         return cls(taxonomy=taxonomy_frame, metadata=tmp_metadata, **kwargs)
 
     @classmethod
-    def __load_biom(cls, filepath: str, **kwargs: Any) -> Tuple[pd.DataFrame, dict]:
+    def __load_biom(
+        cls,
+        filepath: Union[str, BiomReader],
+        rids: Optional[AnyGenericIdentifier] = None,
+        **kwargs: Any
+    ) -> Tuple[pd.DataFrame, dict]:
         """Actual private method to process :mod:`biom` file.
 
         Parameters
         ----------
         filepath
-            :mod:`biom` file path.
+            :mod:`biom` file path or opened :class:`~pmaf.internal.io.BiomReader`
+        rids
+            Feature identifiers to read or None for all features.
         kwargs
             Compatibility
         """
-        biom_file = biom.load_table(filepath)
-        if biom_file.metadata(axis="observation") is not None:
-            obs_data = biom_file.metadata_to_dataframe("observation")
+        with open_biom(filepath) as biom_reader:
+            obs_data = biom_reader.read_metadata("observation", rids)
+        if obs_data is not None:
             col_names = list(obs_data.columns.values)
             col_names_low = [col.lower() for col in col_names]
             avail_col_names = [
@@ -192,6 +210,18 @@ class RepTaxonomy(EssentialBackboneBase, EssentialFeatureMetabase):
             if len(avail_col_names) == 1:
                 tmp_col_index = col_names_low.index(avail_col_names[0])
                 taxonomy_frame = obs_data[col_names[tmp_col_index]]
+            elif len(avail_col_names) > 1:
+                # List-like taxonomy is expanded by biom into columns like
+                # `taxonomy_0`, `taxonomy_1` and is joined back to lineages.
+                tmp_taxa = obs_data.loc[
+                    :, [col for col in col_names if col.lower() in avail_col_names]
+                ].fillna("")
+                taxonomy_frame = tmp_taxa.iloc[:, 0].astype(str)
+                for tmp_col in tmp_taxa.columns[1:]:
+                    taxonomy_frame = taxonomy_frame.str.cat(
+                        tmp_taxa[tmp_col].astype(str), sep="; "
+                    )
+                taxonomy_frame = taxonomy_frame.str.replace(r"(; )+$", "", regex=True)
             else:
                 taxonomy_frame = obs_data
             tmp_metadata = obs_data.loc[:, metadata_cols].to_dict()
@@ -214,6 +244,7 @@ class RepTaxonomy(EssentialBackboneBase, EssentialFeatureMetabase):
         tmp_ids = np.asarray(ids, dtype=self.__internal_taxonomy.index.dtype)
         if len(tmp_ids) > 0:
             self.__internal_taxonomy.drop(tmp_ids, inplace=True)
+            self.__internal_lineages = None
         return self._ratify_action("_remove_features_by_id", ids, **kwargs)
 
     def _merge_features_by_map(
@@ -236,7 +267,7 @@ class RepTaxonomy(EssentialBackboneBase, EssentialFeatureMetabase):
             return self._ratify_action(
                 "_merge_features_by_map",
                 map_dict,
-                _annotations=self.__internal_taxonomy.loc[:, "lineage"].to_dict(),
+                _annotations=self.__get_internal_lineages().to_dict(),
                 **kwargs
             )
 
@@ -277,7 +308,9 @@ class RepTaxonomy(EssentialBackboneBase, EssentialFeatureMetabase):
         else:
             target_ids = np.asarray(ids)
         if self.xrid.isin(target_ids).sum() <= len(target_ids):
-            return self.__internal_taxonomy.loc[target_ids, self.__avail_ranks]
+            return self.__decode_taxa(
+                self.__internal_taxonomy.loc[target_ids, self.__avail_ranks]
+            )
         else:
             raise ValueError("Invalid feature ids are provided.")
 
@@ -317,21 +350,35 @@ class RepTaxonomy(EssentialBackboneBase, EssentialFeatureMetabase):
         tmp_desired_ranks = VALID_RANKS if desired_ranks is False else desired_ranks
         total_valid_rids = self.xrid.isin(target_ids).sum()
         if total_valid_rids == len(target_ids):
-            return generate_lineages_from_taxa(
-                self.__internal_taxonomy.loc[target_ids],
-                missing_rank,
-                tmp_desired_ranks,
-                drop_ranks,
-            )
+            tmp_target_ids = target_ids
         elif total_valid_rids < len(target_ids):
+            tmp_target_ids = np.unique(target_ids)
+        else:
+            raise ValueError("Invalid feature ids are provided.")
+        if drop_ranks or not all(rank in VALID_RANKS for rank in tmp_desired_ranks):
             return generate_lineages_from_taxa(
-                self.__internal_taxonomy.loc[np.unique(target_ids)],
+                self.__decode_taxa(self.__internal_taxonomy.loc[tmp_target_ids]),
                 missing_rank,
                 tmp_desired_ranks,
                 drop_ranks,
             )
-        else:
-            raise ValueError("Invalid feature ids are provided.")
+        tmp_positions = pd.Series(
+            np.arange(len(self.__internal_taxonomy)),
+            index=self.__internal_taxonomy.index,
+        ).loc[tmp_target_ids]
+        tmp_ranks = (
+            [rank for rank in VALID_RANKS if rank in tmp_desired_ranks]
+            if tmp_desired_ranks
+            else MAIN_RANKS
+        )
+        return pd.Series(
+            index=tmp_positions.index,
+            data=self.__make_lineages(
+                self.__get_rank_codes(tmp_ranks)[tmp_positions.values],
+                tmp_ranks,
+                missing_rank,
+            ),
+        )
 
     def find_features_by_pattern(
         self, pattern_str: str, case_sensitive: bool = False, regex: bool = False
@@ -352,11 +399,17 @@ class RepTaxonomy(EssentialBackboneBase, EssentialFeatureMetabase):
         -------
             class:`~numpy.ndarray` with indices
         """
-        return self.__internal_taxonomy[
-            self.__internal_taxonomy.loc[:, "lineage"].str.contains(
-                pattern_str, case=case_sensitive, regex=regex
-            )
-        ].index.values
+        tmp_unique_codes, tmp_feature_groups = self.__group_rank_codes(
+            self.__avail_ranks
+        )
+        tmp_unique_matches = (
+            pd.Series(self.__make_lineages(tmp_unique_codes, self.__avail_ranks, True))
+            .str.contains(pattern_str, case=case_sensitive, regex=regex)
+            .values
+        )
+        return self.__internal_taxonomy.index.values[
+            tmp_unique_matches[tmp_feature_groups]
+        ]
 
     def drop_features_without_taxa(
         self, **kwargs: Any
@@ -408,14 +461,11 @@ class RepTaxonomy(EssentialBackboneBase, EssentialFeatureMetabase):
             Compatibility
         """
         ret = {}
-        groupby = self.__internal_taxonomy.groupby("lineage")
-        if any([len(group) > 1 for group in groupby.groups.values()]):
-            tmp_feature_lineage = []
-            tmp_groups = []
-            group_indices = list(range(len(groupby.groups)))
-            for lineage, feature_ids in groupby.groups.items():
-                tmp_feature_lineage.append(lineage)
-                tmp_groups.append(list(feature_ids))
+        tmp_feature_lineage, tmp_groups = self.__group_features_by_ranks(
+            self.__avail_ranks, True
+        )
+        if any([len(group) > 1 for group in tmp_groups]):
+            group_indices = list(range(len(tmp_groups)))
             self.__init_internal_taxonomy(
                 pd.Series(data=tmp_feature_lineage, index=group_indices)
             )
@@ -438,17 +488,11 @@ class RepTaxonomy(EssentialBackboneBase, EssentialFeatureMetabase):
         if level in self.__avail_ranks:
             target_ranks = get_rank_upto(self.avail_ranks, level, True)
             if target_ranks:
-                tmp_lineages = generate_lineages_from_taxa(
-                    self.__internal_taxonomy, False, target_ranks, False
+                tmp_feature_lineage, tmp_groups = self.__group_features_by_ranks(
+                    [rank for rank in VALID_RANKS if rank in target_ranks], False
                 )
-                groups = tmp_lineages.groupby(tmp_lineages)
-                if len(groups.groups) > 1:
-                    tmp_feature_lineage = []
-                    tmp_groups = []
-                    group_indices = list(range(len(groups.groups)))
-                    for lineage, feature_ids in groups.groups.items():
-                        tmp_feature_lineage.append(lineage)
-                        tmp_groups.append(list(feature_ids))
+                if len(tmp_groups) > 1:
+                    group_indices = list(range(len(tmp_groups)))
                     self.__init_internal_taxonomy(
                         pd.Series(data=tmp_feature_lineage, index=group_indices)
                     )
@@ -464,12 +508,9 @@ class RepTaxonomy(EssentialBackboneBase, EssentialFeatureMetabase):
         -------
             class:`~numpy.ndarray` with feature indices.
         """
-        return self.__internal_taxonomy.loc[
-            self.__internal_taxonomy.loc[:, VALID_RANKS].agg(
-                lambda rank: len("".join(map(lambda x: (str(x or "")), rank))), axis=1
-            )
-            < 1
-        ].index.values
+        return self.__internal_taxonomy.index.values[
+            (self.__get_rank_codes(VALID_RANKS) < 0).all(axis=1)
+        ]
 
     def get_subset(
         self, rids: Optional[AnyGenericIdentifier] = None, *args, **kwargs: Any
@@ -496,7 +537,7 @@ class RepTaxonomy(EssentialBackboneBase, EssentialFeatureMetabase):
         if not self.xrid.isin(target_rids).sum() == len(target_rids):
             raise ValueError("Invalid feature ids are provided.")
         return type(self)(
-            taxonomy=self.__internal_taxonomy.loc[target_rids, "lineage"],
+            taxonomy=self.__get_internal_lineages().loc[target_rids],
             metadata=self.metadata,
             name=self.name,
         )
@@ -555,13 +596,13 @@ class RepTaxonomy(EssentialBackboneBase, EssentialFeatureMetabase):
     def copy(self) -> "RepTaxonomy":
         """Copy of the instance."""
         return type(self)(
-            taxonomy=self.__internal_taxonomy.loc[:, "lineage"],
+            taxonomy=self.__get_internal_lineages(),
             metadata=self.metadata,
             name=self.name,
         )
 
     def __fix_taxon_names(self) -> None:
-        """Fix invalid taxon names."""
+        """Fix invalid taxon names and store ranks as categoricals."""
 
         def taxon_fixer(taxon):
             if taxon is not None and pd.notna(taxon):
@@ -577,15 +618,142 @@ class RepTaxonomy(EssentialBackboneBase, EssentialFeatureMetabase):
             else:
                 return None
 
-        self.__internal_taxonomy.loc[:, VALID_RANKS] = self.__internal_taxonomy.loc[
-            :, VALID_RANKS
-        ].applymap(taxon_fixer)
+        # Each unique taxon is fixed once and mapped back to its cells.
+        tmp_taxa = self.__internal_taxonomy.loc[:, VALID_RANKS]
+        tmp_taxon_codes, tmp_unique_taxa = pd.factorize(tmp_taxa.values.ravel())
+        tmp_fixed_taxa = np.empty(len(tmp_unique_taxa) + 1, dtype=object)
+        tmp_fixed_taxa[:-1] = [taxon_fixer(taxon) for taxon in tmp_unique_taxa]
+        tmp_fixed_values = tmp_fixed_taxa[tmp_taxon_codes].reshape(tmp_taxa.shape)
+        self.__internal_taxonomy = pd.DataFrame(
+            {
+                rank: pd.Categorical(tmp_fixed_values[:, rank_position])
+                for rank_position, rank in enumerate(VALID_RANKS)
+            },
+            index=tmp_taxa.index,
+        )
+
+    def __decode_taxa(self, taxa: pd.DataFrame) -> pd.DataFrame:
+        """Convert categorical taxa to object taxa with None for missing
+        taxa."""
+        return taxa.astype(object).where(taxa.notna(), None)
+
+    def __get_rank_codes(self, ranks: Sequence[str]) -> np.ndarray:
+        """Get taxon codes of features with shape (features, ranks). Missing
+        taxa have code -1."""
+        tmp_rank_codes = np.empty((len(self.__internal_taxonomy), len(ranks)), np.int32)
+        for rank_position, rank in enumerate(ranks):
+            tmp_rank_codes[:, rank_position] = self.__internal_taxonomy[rank].cat.codes
+        return tmp_rank_codes
+
+    def __group_rank_codes(self, ranks: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Group features by their taxon codes at `ranks`.
+
+        Parameters
+        ----------
+        ranks
+            Target ranks.
+
+        Returns
+        -------
+            Tuple with unique taxon codes of groups and group of each feature.
+        """
+        tmp_rank_codes = self.__get_rank_codes(ranks)
+        tmp_feature_groups = np.zeros(tmp_rank_codes.shape[0], dtype=np.int64)
+        # Groups are refined rank by rank and renumbered to stay within int64.
+        for rank_position, rank in enumerate(ranks):
+            tmp_feature_groups, _ = pd.factorize(
+                tmp_feature_groups
+                * (len(self.__internal_taxonomy[rank].cat.categories) + 1)
+                + tmp_rank_codes[:, rank_position]
+                + 1
+            )
+        # Groups are numbered in order of their first feature.
+        tmp_group_maximums = np.maximum.accumulate(tmp_feature_groups)
+        tmp_group_starts = np.flatnonzero(np.diff(tmp_group_maximums, prepend=-1) > 0)
+        return tmp_rank_codes[tmp_group_starts], tmp_feature_groups
+
+    def __make_lineages(
+        self, rank_codes: np.ndarray, ranks: Sequence[str], missing_rank: bool
+    ) -> list:
+        """Generate lineages in Greengenes notation from taxon codes.
+
+        Parameters
+        ----------
+        rank_codes
+            Taxon codes from :meth:`.__get_rank_codes` for `ranks`
+        ranks
+            Ranks to generate.
+        missing_rank
+            If True will generate prefix like `s__` or `d__`
+
+        Returns
+        -------
+            List of lineages.
+        """
+        tmp_lineages = np.full(rank_codes.shape[0], "", dtype=object)
+        for rank_position, rank in enumerate(ranks):
+            tmp_rank_taxa = np.asarray(
+                [
+                    "{}__{}; ".format(rank, taxon)
+                    for taxon in self.__internal_taxonomy[rank].cat.categories
+                ]
+                + ["{}__; ".format(rank) if missing_rank else ""],
+                dtype=object,
+            )
+            tmp_lineages = tmp_lineages + tmp_rank_taxa[rank_codes[:, rank_position]]
+        return [lineage[:-2] for lineage in tmp_lineages]
 
-    def __reconstruct_internal_lineages(self) -> None:
-        """Reconstruct the internal lineages."""
-        self.__internal_taxonomy.loc[:, "lineage"] = generate_lineages_from_taxa(
-            self.__internal_taxonomy, True, self.__avail_ranks, False
+    def __group_features_by_ranks(
+        self, ranks: Sequence[str], missing_rank: bool
+    ) -> Tuple[list, list]:
+        """Group features with same taxa at `ranks`.
+
+        Parameters
+        ----------
+        ranks
+            Ranks to group by.
+        missing_rank
+            If True lineages of groups will have prefix like `s__` or `d__`
+
+        Returns
+        -------
+            Tuple with list of group lineages sorted and list of lists with
+            feature ids in each group.
+        """
+        tmp_unique_codes, tmp_feature_groups = self.__group_rank_codes(ranks)
+        tmp_group_lineages = np.asarray(
+            self.__make_lineages(tmp_unique_codes, ranks, missing_rank), dtype=object
         )
+        tmp_group_order = np.argsort(tmp_group_lineages, kind="stable")
+        tmp_group_ranks = np.empty_like(tmp_group_order)
+        tmp_group_ranks[tmp_group_order] = np.arange(len(tmp_group_order))
+        tmp_feature_ranks = tmp_group_ranks[tmp_feature_groups]
+        tmp_feature_order = np.argsort(tmp_feature_ranks, kind="stable")
+        tmp_group_bounds = np.cumsum(
+            np.bincount(tmp_feature_ranks, minlength=len(tmp_group_order))
+        ).tolist()
+        tmp_feature_ids = self.__internal_taxonomy.index.values[
+            tmp_feature_order
+        ].tolist()
+        return tmp_group_lineages[tmp_group_order].tolist(), [
+            tmp_feature_ids[start:stop]
+            for start, stop in zip([0] + tmp_group_bounds[:-1], tmp_group_bounds)
+        ]
+
+    def __get_internal_lineages(self) -> pd.Series:
+        """Get internal lineages with all available ranks. Lineages are
+        generated on first access."""
+        if self.__internal_lineages is None:
+            self.__internal_lineages = pd.Series(
+                index=self.__internal_taxonomy.index,
+                data=self.__make_lineages(
+                    self.__get_rank_codes(self.__avail_ranks),
+                    self.__avail_ranks,
+                    True,
+                ),
+                dtype=object,
+            )
+        return self.__internal_lineages
 
     def __init_internal_taxonomy(
         self,
@@ -635,13 +803,19 @@ class RepTaxonomy(EssentialBackboneBase, EssentialFeatureMetabase):
 
         # Assign newly constructed taxonomy to the self.__internal_taxonomy
         self.__internal_taxonomy = new_taxonomy
+        # Column order of :attr:`.data` follows the constructed taxonomy
+        self.__data_columns = new_taxonomy.columns.tolist()
+        if "lineage" not in self.__data_columns:
+            self.__data_columns.append("lineage")
         self.__fix_taxon_names()  # Fix incorrect taxa
         tmp_avail_ranks = [rank for rank in VALID_RANKS if rank in new_taxonomy.columns]
         self.__avail_ranks = [
-            rank for rank in tmp_avail_ranks if new_taxonomy.loc[:, rank].notna().any()
+            rank
+            for rank in tmp_avail_ranks
+            if self.__internal_taxonomy.loc[:, rank].notna().any()
         ]
-        # Reconstruct internal lineages for default greengenes notation
-        self.__reconstruct_internal_lineages()
+        # Internal lineages in default greengenes notation are generated lazily
+        self.__internal_lineages = None
         self._init_state = True
 
     def __init_taxonomy_from_lineages(
@@ -676,42 +850,34 @@ class RepTaxonomy(EssentialBackboneBase, EssentialFeatureMetabase):
                 raise NotImplementedError
         else:
             target_order_ranks = VALID_RANKS
+        lineages = taxonomy_series.values.tolist()
+        lineage_index = pd.Index(taxonomy_series.index.tolist())
         if notation == "greengenes":
-            lineages = taxonomy_series.reset_index().values.tolist()
-            ordered_taxa_list = []
-            ordered_indices_list = [elem[0] for elem in lineages]
-            for lineage in lineages:
-                tmp_lineage = jRegexGG.findall(lineage[1])
-                tmp_taxa_dict = {
-                    elem[0]: elem[1] for elem in tmp_lineage if elem[0] in VALID_RANKS
-                }
-                for rank in VALID_RANKS:
-                    if rank not in tmp_taxa_dict.keys():
-                        tmp_taxa_dict.update({rank: None})
-                tmp_taxa_ordered = [tmp_taxa_dict[rank] for rank in VALID_RANKS]
-                ordered_taxa_list.append([None] + tmp_taxa_ordered)
+            tmp_ranks, tmp_taxa = pivot_ranked_taxa(
+                *findall_ranked_taxa(jRegexGG, lineages), len(lineages)
+            )
+            tmp_rank_taxa = dict(zip(tmp_ranks, tmp_taxa))
             taxonomy = pd.DataFrame(
-                index=ordered_indices_list,
-                data=ordered_taxa_list,
+                index=lineage_index,
+                data={
+                    rank: tmp_rank_taxa.get(rank, None)
+                    for rank in ["lineage"] + VALID_RANKS
+                },
                 columns=["lineage"] + VALID_RANKS,
+                dtype=object,
             )
             return taxonomy
         elif notation == "qiime":
-            lineages = taxonomy_series.reset_index().values.tolist()
-            tmp_taxa_dict_list = []
-            tmp_ranks = set()
-            for lineage in lineages:
-                tmp_lineage = jRegexQIIME.findall(lineage[1])
-                tmp_lineage.sort(key=lambda x: x[0])
-                tmp_taxa_dict = defaultdict(None)
-                tmp_taxa_dict[None] = lineage[0]
-                for rank, taxon in tmp_lineage:
-                    tmp_taxa_dict[rank] = taxon
-                    tmp_ranks.add(rank)
-                tmp_taxa_dict_list.append(dict(tmp_taxa_dict))
-            tmp_taxonomy_df = pd.DataFrame.from_records(tmp_taxa_dict_list)
-            tmp_taxonomy_df.set_index(None, inplace=True)
-            tmp_taxonomy_df = tmp_taxonomy_df.loc[:, sorted(list(tmp_ranks))]
+            tmp_ranks, tmp_taxa = pivot_ranked_taxa(
+                *findall_ranked_taxa(jRegexQIIME, lineages), len(lineages)
+            )
+            tmp_rank_taxa = dict(zip(tmp_ranks, tmp_taxa))
+            tmp_taxonomy_df = pd.DataFrame(
+                index=lineage_index,
+                data={rank: tmp_rank_taxa[rank] for rank in sorted(tmp_ranks)},
+                columns=sorted(tmp_ranks),
+                dtype=object,
+            )
             tmp_taxonomy_df.columns = [
                 rank for rank in target_order_ranks[::-1][: len(tmp_ranks)]
             ][::-1]
@@ -720,20 +886,13 @@ class RepTaxonomy(EssentialBackboneBase, EssentialFeatureMetabase):
                     tmp_taxonomy_df.loc[:, rank] = None
             return tmp_taxonomy_df
         elif notation == "silva":
-            lineages = taxonomy_series.reset_index().values.tolist()
-            tmp_taxa_dict_list = []
-            tmp_ranks = set()
-            for lineage in lineages:
-                tmp_lineage = lineage[1].split(";")
-                tmp_taxa_dict = defaultdict(None)
-                tmp_taxa_dict[None] = lineage[0]
-                for rank_i, taxon in enumerate(tmp_lineage):
-                    rank = target_order_ranks[rank_i]
-                    tmp_taxa_dict[rank] = taxon
-                    tmp_ranks.add(rank)
-                tmp_taxa_dict_list.append(dict(tmp_taxa_dict))
-            tmp_taxonomy_df = pd.DataFrame.from_records(tmp_taxa_dict_list)
-            tmp_taxonomy_df.set_index(None, inplace=True)
+            tmp_taxonomy_df = pd.DataFrame(
+                [lineage.split(";") for lineage in lineages],
+                index=lineage_index,
+                dtype=object,
+            )
+            tmp_ranks = target_order_ranks[: tmp_taxonomy_df.shape[1]]
+            tmp_taxonomy_df.columns = tmp_ranks
             tmp_rank_ordered = [
                 rank for rank in target_order_ranks if rank in VALID_RANKS
             ]
@@ -814,14 +973,22 @@ class RepTaxonomy(EssentialBackboneBase, EssentialFeatureMetabase):
     @property
     def duplicated(self) -> pd.Index:
         """List of duplicated feature indices."""
+        _, tmp_feature_groups = self.__group_rank_codes(self.__avail_ranks)
         return self.__internal_taxonomy.index[
-            self.__internal_taxonomy["lineage"].duplicated(keep=False)
+            np.bincount(tmp_feature_groups)[tmp_feature_groups] > 1
         ]
 
     @property
     def data(self) -> pd.DataFrame:
-        """Actual data representation as pd.DataFrame."""
-        return self.__internal_taxonomy
+        """Actual data representation as pd.DataFrame. Taxa are decoded on
+        every access and only lineages are kept in the memory."""
+        return pd.concat(
+            [
+                self.__get_internal_lineages().rename("lineage"),
+                self.__decode_taxa(self.__internal_taxonomy),
+            ],
+            axis=1,
+        ).loc[:, self.__data_columns]
 
     @property
     def xrid(self) -> pd.Index:
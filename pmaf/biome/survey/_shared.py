@@ -121,43 +121,73 @@ def mergeFrequencyTable(
     else:
         feature_groups = features_map.reset_index(drop=True).set_index("index")
         sample_groups = samples_map.reset_index(drop=True).set_index("index")
-        new_freq_table_parts = {
-            nsid: {nfid: list() for nfid in feature_groups.index}
-            for nsid in sample_groups.index
-        }
+        tmp_feature_codes = []
+        tmp_sample_codes = []
+        tmp_sample_ids = []
+        tmp_values = []
         for label, essential in essentials_map[FrequencyTable].items():
-            tmp_freq_table = essential.data
-            for new_sid, sids in sample_groups.loc[:, label].iteritems():
-                if len(sids) > 0:
-                    for new_rid, rids in feature_groups.loc[:, label].iteritems():
-                        if len(rids) > 0:
-                            new_freq_table_parts[new_sid][new_rid].append(
-                                tmp_freq_table.loc[rids, sids]
-                            )
-
-        new_freq_table_dict = {
-            nsid: {nfid: list() for nfid in feature_groups.index}
-            for nsid in sample_groups.index
-        }
-        for sid in sample_groups.index:
-            for rid in feature_groups.index:
-                if len(new_freq_table_parts[sid][rid]) > 0:
-                    new_freq_table_dict[sid][rid] = (
-                        pd.concat(
-                            new_freq_table_parts[sid][rid],
-                            join="outer",
-                            verify_integrity=False,
-                            ignore_index=True,
-                        )
-                        .agg(aggfunc_dict[FrequencyTable][0], axis=0)
-                        .agg(aggfunc_dict[FrequencyTable][1])
-                    )
-                else:
-                    new_freq_table_dict[sid][rid] = None
-        new_frequency_table = pd.DataFrame.from_dict(new_freq_table_dict)
+            tmp_freq_table = essential.to_dense()
+            tmp_new_rids, tmp_rids = _explode_group_map(feature_groups.loc[:, label])
+            tmp_new_sids, tmp_sids = _explode_group_map(sample_groups.loc[:, label])
+            tmp_block = tmp_freq_table.values[
+                np.ix_(
+                    tmp_freq_table.index.get_indexer(tmp_rids),
+                    tmp_freq_table.columns.get_indexer(tmp_sids),
+                )
+            ]
+            tmp_feature_codes.append(np.repeat(tmp_new_rids, len(tmp_sids)))
+            tmp_sample_codes.append(np.tile(tmp_new_sids, len(tmp_rids)))
+            tmp_sample_ids.append(
+                np.tile(np.asarray(tmp_sids, dtype=object), len(tmp_rids))
+            )
+            tmp_values.append(tmp_block.ravel())
+        # Long format with one row per original cell. Cells are aggregated
+        # over features of each original sample first and then over samples.
+        tmp_long_table = pd.DataFrame(
+            {
+                "feature": np.concatenate(tmp_feature_codes),
+                "sample": np.concatenate(tmp_sample_codes),
+                "sid": pd.factorize(np.concatenate(tmp_sample_ids))[0],
+                "value": np.concatenate(tmp_values),
+            }
+        )
+        new_frequency_table = (
+            tmp_long_table.groupby(["feature", "sample", "sid"], sort=False)["value"]
+            .agg(aggfunc_dict[FrequencyTable][0])
+            .groupby(level=["feature", "sample"], sort=False)
+            .agg(aggfunc_dict[FrequencyTable][1])
+            .unstack("sample")
+            .reindex(
+                index=np.arange(len(feature_groups.index)),
+                columns=np.arange(len(sample_groups.index)),
+            )
+        )
+        new_frequency_table.index = feature_groups.index.rename(None)
+        new_frequency_table.columns = sample_groups.index.rename(None)
         return FrequencyTable(new_frequency_table, name="FrequencyTable")
 
 
+def _explode_group_map(group_map: pd.Series) -> Tuple[np.ndarray, list]:
+    """Explode group map into pairs of group position and member id.
+
+    Parameters
+    ----------
+    group_map
+        Series with list of member ids per group like columns of
+        `features_map` or `samples_map`.
+
+    Returns
+    -------
+        Tuple with :class:`~numpy.ndarray` of group positions and list of
+        member ids.
+    """
+    tmp_group_sizes = group_map.map(len).values
+    return (
+        np.repeat(np.arange(len(group_map)), tmp_group_sizes),
+        [member for group in group_map.values for member in group],
+    )
+
+
 def mergeSampleMetadata(
     sample_groupby: str,
     samples_map: pd.DataFrame,
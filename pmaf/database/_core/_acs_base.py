@@ -47,9 +47,19 @@ class DatabaseAccessionMixin(DatabaseAccessionMetabase):
             if iterator:
                 return acc_gen
             else:
+                # Accessions of all rids are read at once and split per tid.
+                tmp_repseq_map = list(repseq_map_gen)
+                tmp_repseq_ids = [
+                    rid for _, repseq_ids in tmp_repseq_map for rid in repseq_ids
+                ]
+                tmp_accs = self._retrieve_accs_by_id(np.unique(tmp_repseq_ids))
                 tmp_seq_dict = defaultdict(None)
-                for taxon_id, acc_dict in acc_gen:
-                    tmp_seq_dict[taxon_id] = acc_dict
+                for taxon_id, repseq_ids in tmp_repseq_map:
+                    tmp_seq_dict[taxon_id] = (
+                        {rid: tmp_accs[rid] for rid in repseq_ids}
+                        if len(repseq_ids) > 0
+                        else None
+                    )
                 return dict(tmp_seq_dict)
         else:
             raise RuntimeError("Storage is closed.")
@@ -5,6 +5,12 @@ from pmaf.database._metakit import DatabaseBackboneMetabase
 from pmaf.database._manager import DatabaseStorageManager
 from pmaf.internal._shared import get_rank_upto, sort_ranks
 from pmaf.database._shared._common import to_mode
+from pmaf.database._shared._tax_index import (
+    make_taxonomy_index,
+    make_tid_rid_index,
+    TaxonomyIndex,
+    TidRidIndex,
+)
 import numpy as np
 import pandas as pd
 from collections import defaultdict
@@ -31,6 +37,8 @@ class DatabaseBase(DatabaseBackboneMetabase):
         self.__avail_ranks = self.__storage_manager.summary["avail-ranks"].split("|")
         tmp_tid_stats = self.__storage_manager.retrieve_data_by_element("stat-taxs")
         self.__novel_tids = tmp_tid_stats[tmp_tid_stats["novel"] == True].index.values
+        self.__taxonomy_index = None
+        self.__tid_rid_index = None
 
     def __repr__(self):
         class_name = self.__class__.__name__
@@ -41,9 +49,7 @@ class DatabaseBase(DatabaseBackboneMetabase):
             tax_state = (
                 "+" if self.__storage_manager.element_state["taxonomy-sheet"] else "-"
             )
-            tree_state = (
-                "+" if self.__storage_manager.element_state["tree-object"] else "-"
-            )
+            tree_state = "+" if self.__storage_manager.has_tree else "-"
             seq_state = "".join(
                 [
                     "+" if state_elem else "-"
@@ -61,6 +67,42 @@ class DatabaseBase(DatabaseBackboneMetabase):
             repr_str = "<{}:[Closed]>".format(class_name)
         return repr_str
 
+    def __get_taxonomy_index(self) -> Optional[TaxonomyIndex]:
+        """Get taxonomy hierarchy index. Index is loaded once and built from
+        *map-rep2tid* for storage files without *taxonomy-index* element.
+        None is returned if hierarchy cannot be indexed."""
+        if self.__taxonomy_index is None:
+            if self.__storage_manager.element_state["taxonomy-index"]:
+                tmp_index_arrays = self.__storage_manager.retrieve_data_by_element(
+                    "taxonomy-index"
+                )
+            else:
+                tmp_index_arrays = make_taxonomy_index(
+                    self.__storage_manager.retrieve_data_by_element("map-rep2tid")
+                )
+            self.__taxonomy_index = (
+                TaxonomyIndex(tmp_index_arrays)
+                if tmp_index_arrays is not None
+                else False
+            )
+        return self.__taxonomy_index if self.__taxonomy_index else None
+
+    def __get_tid_rid_index(self) -> TidRidIndex:
+        """Get :term:`tid` to :term:`rids` index. Index is loaded once and
+        built from *map-rep2tid* for storage files without *map-tid2rep*
+        element."""
+        if self.__tid_rid_index is None:
+            if self.__storage_manager.element_state["map-tid2rep"]:
+                tmp_index_arrays = self.__storage_manager.retrieve_data_by_element(
+                    "map-tid2rep"
+                )
+            else:
+                tmp_index_arrays = make_tid_rid_index(
+                    self.__storage_manager.retrieve_data_by_element("map-rep2tid")
+                )
+            self.__tid_rid_index = TidRidIndex(tmp_index_arrays)
+        return self.__tid_rid_index
+
     def take_tids_by_rank(
         self,
         levels: Union[str, Sequence[str], None] = None,
@@ -220,6 +262,34 @@ class DatabaseBase(DatabaseBackboneMetabase):
         target_unique_ids = np.unique(target_ids)
         if not self.xtid.isin(target_unique_ids).sum() == len(target_unique_ids):
             raise ValueError("Invalid taxon ids provided.")
+        taxonomy_index = self.__get_taxonomy_index()
+        if taxonomy_index is not None:
+            tmp_tids_map = {}
+            tmp_positions = taxonomy_index.get_positions(target_unique_ids)
+            for tid, position in zip(target_unique_ids, tmp_positions):
+                if position < 0:
+                    continue
+                tmp_subranks = get_rank_upto(
+                    self.avail_ranks[::-1], taxonomy_index.get_rank(position)
+                )
+                if tmp_subranks and ter_rank is not None:
+                    tmp_subranks = get_rank_upto(tmp_subranks[::-1], ter_rank, True)
+                if tmp_subranks:
+                    tmp_tids_map[tid] = taxonomy_index.get_sub_tids(
+                        position, tmp_subranks
+                    )
+            if not flatten:
+                return to_mode(tmp_tids_map, mode, target_ids)
+            else:
+                return to_mode(
+                    np.unique(
+                        np.concatenate(
+                            [np.empty(0, dtype=np.int64)] + list(tmp_tids_map.values())
+                        )
+                    ).tolist(),
+                    "array",
+                    None,
+                )
         map2tid = self.storage_manager.retrieve_data_by_element("map-rep2tid")
         focus_map2tid = map2tid[map2tid.columns[map2tid.columns != "tid"]]
         target_ranks = focus_map2tid.columns[
@@ -336,14 +406,31 @@ class DatabaseBase(DatabaseBackboneMetabase):
             total_valid_tids = self.xtid.isin(target_ids).sum()
             target_unique_ids = np.unique(target_ids)
             if self.xtid.isin(target_unique_ids).sum() == len(target_unique_ids):
-                map2tid = self.storage_manager.retrieve_data_by_element("map-rep2tid")
+                if not subs:
+                    tid_rid_index = self.__get_tid_rid_index()
+                    if flatten and not iterator:
+                        return tid_rid_index.get_flat_rids(target_unique_ids)
+                else:
+                    taxonomy_index = self.__get_taxonomy_index()
+                    if taxonomy_index is None:
+                        map2tid = self.storage_manager.retrieve_data_by_element(
+                            "map-rep2tid"
+                        )
 
                 def map_generator():
                     if not subs:
-                        partial_map = map2tid[map2tid["tid"].isin(target_ids)]
-                        tid_rid_gps = partial_map.groupby("tid", sort=False).groups
-                        for tid in target_ids:
-                            yield tid, tid_rid_gps.get(tid, pd.Index([])).values
+                        yield from zip(target_ids, tid_rid_index.get_rids(target_ids))
+                    elif taxonomy_index is not None:
+                        for tid, position in zip(
+                            target_ids, taxonomy_index.get_positions(target_ids)
+                        ):
+                            if position < 0 or (
+                                taxonomy_index.get_rank(position)
+                                not in self.avail_ranks
+                            ):
+                                yield tid, np.asarray([])
+                            else:
+                                yield tid, taxonomy_index.get_rids(position)
                     else:
                         partial_map = map2tid[
                             map2tid[map2tid.columns[map2tid.columns != "tid"]]
@@ -432,7 +519,12 @@ class DatabaseBase(DatabaseBackboneMetabase):
             else:
                 target_ranks = np.asarray(levels)
 
-            target_unique_ranks = np.asarray(sort_ranks(np.unique(target_ranks)))
+            # Column "tid" of rid-to-tid map is not a rank but can be targeted.
+            target_unique_ranks = np.asarray(
+                sort_ranks(np.unique(target_ranks[target_ranks != "tid"])) or []
+            )
+            if "tid" in target_ranks:
+                target_unique_ranks = np.append(target_unique_ranks, "tid")
             target_unique_ids = np.unique(target_ids)
             if self.xrid.isin(target_unique_ids).sum() == len(target_unique_ids):
                 map2tid = self.storage_manager.retrieve_data_by_element("map-rep2tid")
@@ -6,6 +6,16 @@ from collections import defaultdict
 import ete3
 import pickle
 from pmaf.internal._typing import AnyGenericIdentifier
+from pmaf.database._shared._tree_arrays import (
+    make_tree_arrays,
+    find_tip_nodes,
+    find_group_tip_nodes,
+    get_subtree_starts,
+    mark_root_paths,
+    find_mrca_nodes,
+    collapse_unary_nodes,
+    build_ete3_subtree,
+)
 from typing import Optional, Tuple
 
 
@@ -16,22 +26,14 @@ class DatabasePhylogenyMixin(DatabasePhylogenyMetabase):
         tree_pickled = self.storage_manager.retrieve_data_by_element("tree-object")
         return pickle.loads(tree_pickled)
 
-    @staticmethod
-    def __copy_ete3_node(node: ete3.Tree) -> ete3.Tree:
-        """Static method that make a ete3 tree node copy.
-
-        Parameters
-        ----------
-        node
-            Ete3 Tree
-
-        Returns
-        -------
-        """
-        tmp_node = ete3.TreeNode()
-        for feature in node.features:
-            tmp_node.add_feature(feature, getattr(node, feature))
-        return tmp_node
+    def __retrieve_tree_arrays(self) -> dict:
+        """Retrieve columnar arrays of the reference tree. Storage files
+        built before *tree-array* element was introduced fall back to the
+        pickled tree."""
+        if self.storage_manager.element_state["tree-array"]:
+            return self.storage_manager.retrieve_data_by_element("tree-array")
+        else:
+            return make_tree_arrays(self.__retrieve_tree_instance())
 
     def prune_tree_by_tid(
         self,
@@ -41,6 +43,10 @@ class DatabasePhylogenyMixin(DatabasePhylogenyMetabase):
     ) -> PhyloTree:
         """Prune reference tree and keep tips with `ids`
 
+        Children keep the order of the reference tree. Versions before
+        *tree-array* element moved the child of every removed unary node to
+        the end of its new parent, so their trees match only topologically.
+
         Parameters
         ----------
         ids
@@ -64,77 +70,74 @@ class DatabasePhylogenyMixin(DatabasePhylogenyMetabase):
                     raise ValueError(
                         "At least one of tids does not contain any direct rids. Use `subreps=True` to prevent this error."
                     )
-                rids_flat = list(
-                    set(
-                        [
-                            str(rid)
-                            for rid_list in repseq_map.values()
-                            for rid in rid_list
-                        ]
-                    )
+                tid_list = list(repseq_map.keys())
+                tree_arrays = self.__retrieve_tree_arrays()
+                tree_parent = tree_arrays["parent"]
+                subtree_starts = get_subtree_starts(tree_parent)
+                group_indices, group_nodes = find_group_tip_nodes(
+                    tree_arrays, list(repseq_map.values())
                 )
-                tid_rid_map = {
-                    tid: list(map(str, rids)) for tid, rids in repseq_map.items()
-                }
-
-                ref_tree = self.__retrieve_tree_instance()
-
-                target_nodes = []
-                tid_rid_node_map = defaultdict(list)
-                for node in ref_tree.iter_leaves():
-                    if node.name in rids_flat:
-                        target_nodes.append(node)
-                        for tid, rids in tid_rid_map.items():
-                            if node.name in rids:
-                                tid_rid_node_map[tid].append(node)
-
-                node_map = defaultdict(None)
-                tmp_tree = self.__copy_ete3_node(ref_tree)
-                tmp_tree.name = "root"
-                node_map[ref_tree] = tmp_tree
-
-                for node in target_nodes:
-                    ancestors = [node] + node.get_ancestors()
-                    for ancestor in ancestors[::-1][1:]:
-                        if ancestor not in node_map.keys():
-                            tmp_new_node = self.__copy_ete3_node(ancestor)
-                            node_map[ancestor.up].add_child(tmp_new_node)
-                            node_map[ancestor] = tmp_new_node
-
-                tmp_tree.standardize(preserve_branch_length=True)
-                if not include_rid:
-                    adj_tids = []
-                    for tid, rid_nodes in tid_rid_node_map.items():
-                        new_rid_nodes = [node_map[node] for node in rid_nodes]
-                        adj_tid = "t{}".format(str(tid))
-                        adj_tids.append(adj_tid)
-                        if len(new_rid_nodes) > 1:
-                            tmp_tid_node = tmp_tree.get_common_ancestor(new_rid_nodes)
-                            tmp_tid_node.add_child(name=adj_tid)
-                        else:
-                            new_rid_nodes[0].add_child(name=adj_tid)
+                mrca_nodes, group_firsts = find_mrca_nodes(
+                    tree_parent,
+                    group_indices,
+                    group_nodes,
+                    total_groups=len(repseq_map),
+                    subtree_starts=subtree_starts,
+                )
+                # Tids follow the leaf order of the reference tree.
+                tid_order = np.flatnonzero(mrca_nodes >= 0)
+                tid_order = tid_order[
+                    np.argsort(group_firsts[tid_order], kind="stable")
+                ]
+                target_tids = [tid_list[i] for i in tid_order.tolist()]
+                target_mrca_nodes = mrca_nodes[tid_order]
 
-                    tmp_tree.prune(adj_tids, preserve_branch_length=True)
-                    for leave in tmp_tree.traverse():
-                        if leave.name.startswith("t"):
-                            leave.name = leave.name[1:]
+                if not include_rid:
+                    marked = mark_root_paths(
+                        tree_parent, target_mrca_nodes, subtree_starts
+                    )
+                    (
+                        kept_nodes,
+                        kept_parents,
+                        kept_lengths,
+                        tid_parents,
+                        tid_lengths,
+                    ) = collapse_unary_nodes(
+                        tree_parent,
+                        tree_arrays["length"],
+                        marked,
+                        anchors=target_mrca_nodes,
+                        collapse_root=True,
+                    )
+                    tmp_tree, node_map = build_ete3_subtree(
+                        tree_arrays, kept_nodes, kept_parents, kept_lengths
+                    )
+                    tmp_tree.name = "root"
+                    tmp_tree.resolve_polytomy()
+                    for tid, tid_parent, tid_length in zip(
+                        target_tids, tid_parents.tolist(), tid_lengths.tolist()
+                    ):
+                        node_map[tid_parent].add_child(name=str(tid), dist=tid_length)
                 else:
-                    for node in target_nodes:
-                        node_map[node].name = "r{}".format(node.name)
-
-                    for tid, rid_nodes in tid_rid_node_map.items():
-                        new_rid_nodes = [node_map[node] for node in rid_nodes]
-                        if len(new_rid_nodes) > 1:
-                            tmp_mcra = tmp_tree.get_common_ancestor(new_rid_nodes)
-                            if tmp_mcra.name.startswith("t"):
-                                tmp_mcra.add_sister(name=str(tid))
-                            else:
-                                tmp_mcra.name = str(tid)
+                    target_nodes = np.unique(group_nodes)
+                    marked = mark_root_paths(tree_parent, target_nodes, subtree_starts)
+                    kept_nodes, kept_parents, kept_lengths, _, _ = collapse_unary_nodes(
+                        tree_parent, tree_arrays["length"], marked
+                    )
+                    tmp_tree, node_map = build_ete3_subtree(
+                        tree_arrays, kept_nodes, kept_parents, kept_lengths
+                    )
+                    tmp_tree.name = "root"
+                    tmp_tree.resolve_polytomy()
+                    for node in target_nodes.tolist():
+                        node_map[node].name = "r{}".format(node_map[node].name)
+
+                    for tid, mrca_node in zip(target_tids, target_mrca_nodes.tolist()):
+                        tmp_mcra = node_map[mrca_node]
+                        if tmp_mcra.name.startswith("t"):
+                            tmp_mcra.add_sister(name=str(tid))
                         else:
-                            if new_rid_nodes[0].name.startswith("t"):
-                                new_rid_nodes[0].add_sister(name=str(tid))
-                            else:
-                                new_rid_nodes[0].name = str(tid)
+                            tmp_mcra.name = str(tid)
                 return PhyloTree(tmp_tree)
             else:
                 raise RuntimeError("Invalid identifiers are provided.")
@@ -144,6 +147,10 @@ class DatabasePhylogenyMixin(DatabasePhylogenyMetabase):
     def prune_tree_by_rid(self, ids: AnyGenericIdentifier) -> PhyloTree:
         """Prune the reference tree and keep `ids`
 
+        Children keep the order of the reference tree. Versions before
+        *tree-array* element moved the child of every removed unary node to
+        the end of its new parent, so their trees match only topologically.
+
         Parameters
         ----------
         ids
@@ -156,26 +163,16 @@ class DatabasePhylogenyMixin(DatabasePhylogenyMetabase):
         if self.storage_manager.state == 1:
             target_ids = np.unique(np.asarray(ids))
             if self.xrid.isin(target_ids).sum() == len(target_ids):
-                repseq_ids = list(map(str, target_ids))
-                ref_tree = self.__retrieve_tree_instance()
-
-                target_nodes = []
-                for node in ref_tree.iter_leaves():
-                    if node.name in repseq_ids:
-                        target_nodes.append(node)
-
-                node_map = defaultdict(None)
-                tmp_tree = self.__copy_ete3_node(ref_tree)
-                node_map[ref_tree] = tmp_tree
-
-                for node in target_nodes:
-                    ancestors = [node] + node.get_ancestors()
-                    for ancestor in ancestors[::-1][1:]:
-                        if ancestor not in node_map.keys():
-                            tmp_new_node = self.__copy_ete3_node(ancestor)
-                            node_map[ancestor.up].add_child(tmp_new_node)
-                            node_map[ancestor] = tmp_new_node
-                tmp_tree.standardize(preserve_branch_length=True)
+                tree_arrays = self.__retrieve_tree_arrays()
+                tip_nodes, _ = find_tip_nodes(tree_arrays, target_ids)
+                marked = mark_root_paths(tree_arrays["parent"], tip_nodes)
+                kept_nodes, kept_parents, kept_lengths, _, _ = collapse_unary_nodes(
+                    tree_arrays["parent"], tree_arrays["length"], marked
+                )
+                tmp_tree, _ = build_ete3_subtree(
+                    tree_arrays, kept_nodes, kept_parents, kept_lengths
+                )
+                tmp_tree.resolve_polytomy()
                 return PhyloTree(tmp_tree)
             else:
                 raise RuntimeError("Invalid identifiers are provided.")
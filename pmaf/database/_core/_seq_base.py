@@ -1,7 +1,11 @@
 import pandas as pd
 
 from pmaf.database._metakit import DatabaseSequenceMetabase
-from pmaf.sequence import Nucleotide, MultiSequence, MultiSequenceStream
+from pmaf.database._shared._alignment import (
+    drop_gap_columns,
+    drop_gap_buffer_columns,
+)
+from pmaf.sequence import MultiSequence, MultiSequenceStream
 import numpy as np
 from pmaf.internal._typing import AnyGenericIdentifier
 from typing import Optional, Tuple, Generator, Any, Union
@@ -10,6 +14,8 @@ from typing import Optional, Tuple, Generator, Any, Union
 class DatabaseSequenceMixin(DatabaseSequenceMetabase):
     """Mixin class for handling sequence data."""
 
+    ALIGNMENT_REGIONS = {}  # Named alignment regions as slices of alignment columns
+
     def get_sequence_by_tid(
         self,
         ids: Optional[AnyGenericIdentifier] = None,
@@ -29,7 +35,7 @@ class DatabaseSequenceMixin(DatabaseSequenceMetabase):
         iterator :
             Whether to produce chunked generator. Default is True
         like
-            Result type can be 'multiseq'(default), 'stream', 'asis', 'seqlist' or 'tuples'.
+            Result type can be 'multiseq'(default), 'stream', 'asis', 'seqlist', 'tuples' or 'arrays'.
         chunksize :
             Chunk size. Default 100 records per chunk.
 
@@ -61,6 +67,8 @@ class DatabaseSequenceMixin(DatabaseSequenceMetabase):
         iterator: bool = True,
         like: str = "multiseq",
         chunksize: int = 100,
+        region: Union[slice, str, None] = None,
+        drop_gaps: bool = False,
     ) -> Union[Generator, Any]:
         """Get representative alignments for :term:`tids`
 
@@ -73,9 +81,14 @@ class DatabaseSequenceMixin(DatabaseSequenceMetabase):
         iterator :
             Whether to produce chunked generator. Default is True
         like
-            Result type can be 'multiseq'(default), 'stream', 'asis', 'seqlist' or 'tuples'.
+            Result type can be 'multiseq'(default), 'stream', 'asis', 'seqlist', 'tuples' or 'arrays'.
         chunksize :
             Chunk size. Default 100 records per chunk.
+        region
+            Slice of alignment columns or name of region in
+            :attr:`.alignment_regions` to retrieve. Default is whole alignment.
+        drop_gaps
+            Whether to drop columns that contain only gaps within each chunk.
 
         Returns
         -------
@@ -83,16 +96,21 @@ class DatabaseSequenceMixin(DatabaseSequenceMetabase):
             .
         """
         if self.storage_manager.state == 1:
+            tmp_region = self._get_alignment_region(region)
             repseq_map_gen = self.find_rid_by_tid(ids, subs, True)
             if iterator:
                 return {
-                    tid: self._iter_repseq_by_rid(rid_list, like, tid, True, chunksize)
+                    tid: self._iter_repseq_by_rid(
+                        rid_list, like, tid, True, chunksize, tmp_region, drop_gaps
+                    )
                     for tid, rid_list in repseq_map_gen
                 }
             else:
                 return {
                     tid: next(
-                        self._iter_repseq_by_rid(rid_list, like, tid, True, None)
+                        self._iter_repseq_by_rid(
+                            rid_list, like, tid, True, None, tmp_region, drop_gaps
+                        )
                     )[1]
                     for tid, rid_list in repseq_map_gen
                 }
@@ -115,7 +133,7 @@ class DatabaseSequenceMixin(DatabaseSequenceMetabase):
         iterator :
             Whether to produce chunked generator. Default is True
         like
-            Result type can be 'multiseq'(default), 'stream', 'asis', 'seqlist' or 'tuples'.
+            Result type can be 'multiseq'(default), 'stream', 'asis', 'seqlist', 'tuples' or 'arrays'.
         chunksize :
             Chunk size. Default 300 records per chunk.
 
@@ -145,6 +163,8 @@ class DatabaseSequenceMixin(DatabaseSequenceMetabase):
         iterator: bool = True,
         like: str = "multiseq",
         chunksize: int = 300,
+        region: Union[slice, str, None] = None,
+        drop_gaps: bool = False,
     ) -> Union[Generator, Any]:
         """Get representative alignments for :term:`rids`
 
@@ -155,34 +175,91 @@ class DatabaseSequenceMixin(DatabaseSequenceMetabase):
         iterator :
             Whether to produce chunked generator. Default is True
         like
-            Result type can be 'multiseq'(default), 'stream', 'asis', 'seqlist' or 'tuples'.
+            Result type can be 'multiseq'(default), 'stream', 'asis', 'seqlist', 'tuples' or 'arrays'.
         chunksize :
             Chunk size. Default 300 records per chunk.
+        region
+            Slice of alignment columns or name of region in
+            :attr:`.alignment_regions` to retrieve. Default is whole alignment.
+        drop_gaps
+            Whether to drop columns that contain only gaps within each chunk.
 
         Returns
         -------
             Depends on `like` parameter.
         """
         if self.storage_manager.state == 1:
+            tmp_region = self._get_alignment_region(region)
             if ids is None:
                 target_ids = np.asarray(self.xrid)
             else:
                 target_ids = np.asarray(ids)
             if iterator:
-                return self._iter_repseq_by_rid(target_ids, like, None, True, chunksize)
+                return self._iter_repseq_by_rid(
+                    target_ids, like, None, True, chunksize, tmp_region, drop_gaps
+                )
             else:
                 return next(
-                    self._iter_repseq_by_rid(target_ids, like, None, True, None)
+                    self._iter_repseq_by_rid(
+                        target_ids, like, None, True, None, tmp_region, drop_gaps
+                    )
                 )[1]
         else:
             raise RuntimeError("Storage is closed.")
 
+    def define_alignment_region(self, name: str, columns: slice) -> None:
+        """Define named alignment region that can be passed as `region` to
+        alignment retrieval methods.
+
+        Parameters
+        ----------
+        name
+            Name of the region. For example, "V4".
+        columns
+            Slice of alignment columns of the region.
+        """
+        if not isinstance(name, str):
+            raise TypeError("`name` must be string.")
+        if not isinstance(columns, slice):
+            raise TypeError("`columns` must be a slice of alignment columns.")
+        self._alignment_regions = {**self.alignment_regions, name: columns}
+        return
+
+    def _get_alignment_region(self, region: Union[slice, str, None]) -> Optional[slice]:
+        """Get slice of alignment columns for `region`
+
+        Parameters
+        ----------
+        region
+            Slice of alignment columns, name of region or None.
+
+        Returns
+        -------
+            Slice of alignment columns or None for whole alignment.
+        """
+        if isinstance(region, str):
+            if region in self.alignment_regions:
+                return self.alignment_regions[region]
+            else:
+                raise ValueError("Alignment region `{}` is not defined.".format(region))
+        elif region is None or isinstance(region, slice):
+            return region
+        else:
+            raise TypeError("`region` must be slice, region name or None.")
+
+    @property
+    def alignment_regions(self) -> dict:
+        """Named alignment regions as slices of alignment columns."""
+        return getattr(self, "_alignment_regions", self.ALIGNMENT_REGIONS)
+
     def _retrieve_repseq_by_rid(
         self,
         repseq_ids: AnyGenericIdentifier,
         like: str,
         seq_name: str,
         alignment: bool,
+        region: Optional[slice] = None,
+        drop_gaps: bool = False,
     ) -> Any:
         """
 
@@ -191,35 +268,58 @@ class DatabaseSequenceMixin(DatabaseSequenceMetabase):
         repseq_ids
             Target :term:`rids`
         like
-            Result type can be 'multiseq'(default), 'stream', 'asis', 'seqlist' or 'tuples'.
+            Result type can be 'multiseq'(default), 'stream', 'asis', 'seqlist', 'tuples' or 'arrays'.
         seq_name
             Sequence object name (for 'multiseq')
         alignment
             Indicate whether alignments should be retrieved
+        region
+            Slice of alignment columns or None for whole alignment.
+        drop_gaps
+            Whether to drop alignment columns that contain only gaps.
 
         Returns
         -------
-            Depend on the result of `like` parameter
+            Depend on the result of `like` parameter. For 'arrays' dictionary
+            with `ids`, `buffer` of uint8 character codes of all sequences,
+            `offsets` of sequences within `buffer` and `lengths`.
 
         """
         if len(repseq_ids) > 0:
-            tmp_repseq_df = self.storage_manager.get_element_data_by_ids(
-                "sequence-representative" if not alignment else "sequence-aligned",
-                repseq_ids,
-            )
+            if like == "arrays":
+                tmp_arrays = self.storage_manager.get_element_arrays_by_ids(
+                    "sequence-aligned" if alignment else "sequence-representative",
+                    repseq_ids,
+                    region=region,
+                )
+                tmp_buffer, tmp_offsets = tmp_arrays["buffer"], tmp_arrays["offsets"]
+                if alignment and drop_gaps:
+                    tmp_buffer, tmp_offsets = drop_gap_buffer_columns(
+                        tmp_buffer, tmp_offsets
+                    )
+                return {
+                    "ids": tmp_arrays["index"],
+                    "buffer": tmp_buffer,
+                    "offsets": tmp_offsets,
+                    "lengths": np.diff(tmp_offsets),
+                }
+            if alignment:
+                tmp_repseq_df = self.storage_manager.get_element_data_by_ids(
+                    "sequence-aligned", repseq_ids, region=region
+                )
+                if drop_gaps:
+                    tmp_repseq_df = drop_gap_columns(tmp_repseq_df)
+            else:
+                tmp_repseq_df = self.storage_manager.get_element_data_by_ids(
+                    "sequence-representative", repseq_ids
+                )
             if like == "multiseq":
-                tmp_repseq_transformed = tmp_repseq_df.apply(
-                    lambda seq: Nucleotide(
-                        seq["sequence"],
-                        name=int(seq.name),
-                        mode="DNA",
-                        metadata=seq[seq.index != "sequence"].to_dict(),
-                    ),
-                    axis=1,
-                ).values.tolist()
-                return MultiSequence(
-                    tmp_repseq_transformed,
+                return MultiSequence.from_arrays(
+                    tmp_repseq_df.index.astype(np.int64).tolist(),
+                    tmp_repseq_df["sequence"].tolist(),
+                    tmp_repseq_df.drop(columns="sequence"),
                     name=seq_name,
+                    mode="DNA",
                     aligned=False if not alignment else True,
                 )
             elif like == "stream":
@@ -228,18 +328,12 @@ class DatabaseSequenceMixin(DatabaseSequenceMetabase):
                     expected_rows=len(repseq_ids),
                     aligned=False if not alignment else True,
                 )
-                tmp_repseq_transformed = tmp_repseq_df.apply(
-                    lambda seq: Nucleotide(
-                        seq["sequence"],
-                        name=int(seq.name),
-                        mode="DNA",
-                        metadata=seq[seq.index != "sequence"].to_dict(),
-                    ),
-                    axis=1,
-                ).values.tolist()
-                tmp_multiseq = MultiSequence(
-                    tmp_repseq_transformed,
+                tmp_multiseq = MultiSequence.from_arrays(
+                    tmp_repseq_df.index.astype(np.int64).tolist(),
+                    tmp_repseq_df["sequence"].tolist(),
+                    tmp_repseq_df.drop(columns="sequence"),
                     name=seq_name,
+                    mode="DNA",
                     aligned=False if not alignment else True,
                 )
                 tmp_seq_stream.extend_multiseq(tmp_multiseq)
@@ -247,15 +341,12 @@ class DatabaseSequenceMixin(DatabaseSequenceMetabase):
             elif like == "asis":
                 return tmp_repseq_df
             elif like == "seqlist":
-                tmp_repseq_transformed = tmp_repseq_df.apply(
-                    lambda seq: Nucleotide(
-                        seq["sequence"],
-                        name=int(seq.name),
-                        metadata=seq[seq.index != "sequence"].to_dict(),
-                    ),
-                    axis=1,
-                ).values.tolist()
-                return tmp_repseq_transformed
+                return MultiSequence.from_arrays(
+                    tmp_repseq_df.index.astype(np.int64).tolist(),
+                    tmp_repseq_df["sequence"].tolist(),
+                    tmp_repseq_df.drop(columns="sequence"),
+                    mode="DNA",
+                ).sequences
             elif like == "tuples":
                 tmp_repseq_transformed = tuple(
                     zip(
@@ -274,6 +365,8 @@ class DatabaseSequenceMixin(DatabaseSequenceMetabase):
         seq_name: str,
         alignment: bool,
         chunksize: int,
+        region: Optional[slice] = None,
+        drop_gaps: bool = False,
     ):
         """Iterator for target data.
 
@@ -282,13 +375,17 @@ class DatabaseSequenceMixin(DatabaseSequenceMetabase):
         repseq_ids
             Target :term:`rids`
         like
-            Result type can be 'multiseq'(default), 'stream', 'asis', 'seqlist' or 'tuples'.
+            Result type can be 'multiseq'(default), 'stream', 'asis', 'seqlist', 'tuples' or 'arrays'.
         seq_name
             Sequence name if `multiseq`
         alignment
             Indicate whether alignments should be retrieved.
         chunksize
             Size of chunks to yield
+        region
+            Slice of alignment columns or None for whole alignment.
+        drop_gaps
+            Whether to drop alignment columns that contain only gaps.
 
         Yields
         -------
@@ -306,6 +403,8 @@ class DatabaseSequenceMixin(DatabaseSequenceMetabase):
                     like,
                     int(seq_name) if seq_name is not None else seq_name,
                     alignment,
+                    region,
+                    drop_gaps,
                 )
         else:
             yield None, None
@@ -2,8 +2,10 @@ from pmaf.database._core._base import DatabaseBase
 from pmaf.database._core._tax_base import DatabaseTaxonomyMixin
 from pmaf.database._core._seq_base import DatabaseSequenceMixin
 from pmaf.database._core._phy_base import DatabasePhylogenyMixin
+import gzip
 import numpy as np
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Callable, Generator
 from os import path
 from pmaf.internal._typing import AnyGenericIdentifier
 
@@ -26,10 +28,18 @@ def export_database_by_rid(
     output_dir: str,
     ids: Optional[AnyGenericIdentifier] = None,
     chunksize: int = 100,
+    workers: int = 4,
+    compress: bool = False,
+    buffer_size: int = 2**22,
 ):
     """Export database taxonomy, sequence, alignment and phylogeny into given
     `output_dir` as QIIME formatted files.
 
+    Outputs are written concurrently by thread pool. FASTA records are
+    formatted directly from character buffers of storage chunks. When
+    `workers` is greater than one storage manager of `database` is switched
+    to concurrent read mode for the export and restored afterwards.
+
     Parameters
     ----------
     database
@@ -39,7 +49,15 @@ def export_database_by_rid(
     ids
         Reference :term:`rids` identifiers to extract. Default is None to extract all
     chunksize
-        Process data in chunks. Default is 100 records per chunk
+        Number of records in first chunk of each output. Following chunks are
+        sized to fit `buffer_size`. Default is 100 records.
+    workers
+        Number of outputs to write at once. Default is 4.
+    compress
+        Whether to write gzip compressed outputs with *.gz* suffix.
+    buffer_size
+        Approximate maximum size in bytes of formatted records that each
+        output holds in memory before writing. Default is 4 MiB.
     """
     if not isinstance(database, DatabaseBase):
         raise TypeError("`database` is invalid.")
@@ -51,33 +69,110 @@ def export_database_by_rid(
         raise ValueError("`database` does not have taxonomy and sequences.")
     if database.storage_manager.state != 1:
         raise RuntimeError("Storage is closed.")
+    if isinstance(workers, int) and not isinstance(workers, bool):
+        if workers < 1:
+            raise ValueError("`workers` must be greater than zero.")
+    else:
+        raise TypeError("`workers` must be integer.")
+    if isinstance(buffer_size, int) and not isinstance(buffer_size, bool):
+        if buffer_size < 1:
+            raise ValueError("`buffer_size` must be greater than zero.")
+    else:
+        raise TypeError("`buffer_size` must be integer.")
     if ids is None:
         target_ids = np.asarray(database.xrid)
     else:
         target_ids = np.asarray(ids)
-    output_fasta_fp = path.join(output_dir, "refseq.fa")
-    output_aln_fp = path.join(output_dir, "refaln.fa")
-    output_tax_fp = path.join(output_dir, "reftax.txt")
-    output_phy_fp = path.join(output_dir, "tree.nwk")
-    # Sequences
-    multiseq_gen = database.get_sequence_by_rid(
-        target_ids, iterator=True, chunksize=chunksize
-    )
-    _, first_multiseq = next(multiseq_gen)
-    first_multiseq.write(output_fasta_fp, mode="w")
-    for _, multiseq in multiseq_gen:
-        multiseq.write(output_fasta_fp, mode="a")
-    # Alignments
-    multiseq_aln_gen = database.get_alignment_by_rid(
-        target_ids, iterator=True, chunksize=chunksize
-    )
-    _, first_multiseq_aln = next(multiseq_aln_gen)
-    first_multiseq_aln.write(output_aln_fp, mode="w")
-    for _, multiseq in multiseq_aln_gen:
-        multiseq.write(output_aln_fp, mode="a")
-    taxonomy_df = database.get_lineage_by_rid(
-        target_ids, missing_rank=True, desired_ranks=database.avail_ranks
+    tmp_suffix = ".gz" if compress else ""
+    tmp_outputs = [
+        (
+            path.join(output_dir, "refseq.fa" + tmp_suffix),
+            lambda chunk_ids: _format_fasta(
+                database.get_sequence_by_rid(chunk_ids, iterator=False, like="arrays")
+            ),
+        ),
+        (
+            path.join(output_dir, "refaln.fa" + tmp_suffix),
+            lambda chunk_ids: _format_fasta(
+                database.get_alignment_by_rid(chunk_ids, iterator=False, like="arrays")
+            ),
+        ),
+        (
+            path.join(output_dir, "reftax.txt" + tmp_suffix),
+            lambda chunk_ids: database.get_lineage_by_rid(
+                chunk_ids, missing_rank=True, desired_ranks=database.avail_ranks
+            )
+            .to_csv(header=False, sep="\t")
+            .encode(),
+        ),
+    ]
+    tmp_concurrent_state = database.storage_manager.concurrent_state
+    if workers > 1:
+        database.storage_manager.initiate_concurrent_mode()
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as tmp_pool:
+            tmp_futures = [
+                tmp_pool.submit(
+                    _write_output,
+                    output_fp,
+                    compress,
+                    _iter_output_chunks(
+                        format_chunk, target_ids, chunksize, buffer_size
+                    ),
+                )
+                for output_fp, format_chunk in tmp_outputs
+            ]
+            tmp_futures.append(
+                tmp_pool.submit(
+                    _write_output,
+                    path.join(output_dir, "tree.nwk" + tmp_suffix),
+                    compress,
+                    _iter_tree_chunks(database, target_ids),
+                )
+            )
+            for future in tmp_futures:
+                future.result()
+    finally:
+        if not tmp_concurrent_state:
+            database.storage_manager.terminate_concurrent_mode()
+
+
+def _format_fasta(sequence_arrays: dict) -> bytes:
+    """Format sequences retrieved as 'arrays' into FASTA records."""
+    tmp_buffer = sequence_arrays["buffer"].tobytes()
+    tmp_offsets = sequence_arrays["offsets"].tolist()
+    return b"".join(
+        b">%d\n%s\n" % (rid, tmp_buffer[start:stop])
+        for rid, start, stop in zip(
+            sequence_arrays["ids"].tolist(), tmp_offsets[:-1], tmp_offsets[1:]
+        )
     )
-    taxonomy_df.to_csv(output_tax_fp, header=False, sep="\t")
-    tree = database.prune_tree_by_rid(target_ids)
-    tree.write(output_phy_fp)
+
+
+def _iter_output_chunks(
+    format_chunk: Callable, target_ids: np.ndarray, chunksize: int, buffer_size: int
+) -> Generator:
+    """Format `target_ids` chunk by chunk. First chunk has `chunksize` records
+    and following chunks are sized by average record size so far to fit
+    `buffer_size`."""
+    tmp_start = 0
+    tmp_rows = chunksize
+    tmp_total_bytes = 0
+    while tmp_start < len(target_ids):
+        tmp_chunk = format_chunk(target_ids[tmp_start : tmp_start + tmp_rows])
+        tmp_start += tmp_rows
+        tmp_total_bytes += len(tmp_chunk)
+        tmp_rows = max(1, buffer_size * tmp_start // max(tmp_total_bytes, 1))
+        yield tmp_chunk
+
+
+def _iter_tree_chunks(database: ExportableDatabase, target_ids: np.ndarray):
+    """Prune tree by `target_ids` and produce it as single Newick chunk."""
+    yield database.prune_tree_by_rid(target_ids).get_newick_str().encode()
+
+
+def _write_output(output_fp: str, compress: bool, chunk_gen: Generator) -> None:
+    """Write byte chunks of `chunk_gen` into `output_fp`"""
+    with gzip.open(output_fp, "wb") if compress else open(output_fp, "wb") as output:
+        for chunk in chunk_gen:
+            output.write(chunk)
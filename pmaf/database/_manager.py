@@ -10,13 +10,84 @@ import warnings
 
 import pandas as pd
 import tables
+import threading
+import weakref
 from os import path
+from types import SimpleNamespace
+from contextlib import nullcontext
 import pickle
 from collections import defaultdict
 from pmaf.database._shared._common import *
+from pmaf.database._shared._interx_index import InterxIndexMap
+from pmaf.database._shared._row_cache import RowCache
+from pmaf.database._shared._budget import ElementCachePolicy, estimate_node_bytes
+from pmaf.database._shared._packed import (
+    create_packed_element,
+    append_packed_chunk,
+    read_packed_metadata,
+    read_packed_rows,
+    read_packed_buffer,
+    sequences_to_buffer,
+)
+from pmaf.database._shared._alignment import (
+    create_matrix_element,
+    append_matrix_chunk,
+    read_matrix_metadata,
+    read_matrix_rows,
+    create_gaprle_element,
+    append_gaprle_chunk,
+    read_gaprle_metadata,
+    read_gaprle_rows,
+    read_matrix_buffer,
+    read_gaprle_buffer,
+    slice_alignment_frame,
+)
 from typing import Optional, Tuple, Union, Dict, Generator, Any
 from pmaf.internal._typing import AnyGenericIdentifier
 
+# HDF5 library is not thread-safe and :mod:`tables` releases GIL during I/O.
+_HDF5_LOCK = threading.RLock()
+
+# Writers and readers of elements with encodings other than table as
+# (create element, append chunk, read metadata, read rows).
+_ELEMENT_CODECS = {
+    "packed": (
+        create_packed_element,
+        append_packed_chunk,
+        read_packed_metadata,
+        read_packed_rows,
+    ),
+    "matrix": (
+        create_matrix_element,
+        append_matrix_chunk,
+        read_matrix_metadata,
+        read_matrix_rows,
+    ),
+    "gap-rle": (
+        create_gaprle_element,
+        append_gaprle_chunk,
+        read_gaprle_metadata,
+        read_gaprle_rows,
+    ),
+}
+
+# Readers of encoded sequence elements that decode rows into single character
+# buffer without creating per-row strings.
+_ELEMENT_BUFFER_READERS = {
+    "packed": read_packed_buffer,
+    "matrix": read_matrix_buffer,
+    "gap-rle": read_gaprle_buffer,
+}
+
+
+class _ThreadStorerHandles(threading.local):
+    """Storer handles of single thread in concurrent read mode."""
+
+    storer = None
+    state = False
+    mode = None
+    store = None
+
 
 class DatabaseStorageManager:
     """Database :term:`hdf5` storage manager."""
@@ -33,9 +104,14 @@ class DatabaseStorageManager:
         force_new
             If file exists the override it for new construction
         """
-        self._storer = None  # Current storer(pandas/pytables) handle
-        self._storer_state = False  # Current storer state
-        self._storer_mode = None  # Value can be either 1 for `tables` or 2 for `pandas`
+        self._concurrent_state = False  # Whether threads use own read-only handles
+        self._shared_handles = SimpleNamespace(
+            storer=None, state=False, mode=None
+        )  # Storer handles shared by all threads
+        self._thread_handles = _ThreadStorerHandles()  # Per-thread storer handles
+        self._thread_stores = []  # All per-thread stores opened in concurrent mode
+        self._idle_stores = []  # Stores released by finished threads for reuse
+        self._handle_lock = threading.RLock()  # Lock for shared handles and caches
         self._hdf5_filepath = None  # HDF5 filepath
         self._storage_name = None  # Storage database name
         self._init_state = 0  # Initiation state. 0 or False: Inactive; -1: Under construction; 1: Active for data retrieval.
@@ -48,8 +124,15 @@ class DatabaseStorageManager:
         self._interxmap_cache = {
             "map-interx-taxon": None,
             "map-interx-repseq": None,
-        }  # Cache for interxmap elements
+        }  # Cache for interxmap elements as memory-mapped sorted indices
         self._supplement_cache = defaultdict(None)  # Additional optional cache elements
+        self._row_cache = None  # Optional size-bounded cache of rows selected by ids
+        self._cache_policy = None  # Optional memory budget policy for resident elements
+        self._element_encodings = {
+            element_key: element_encodings[0]
+            for element_key, element_encodings in DATABASE_ELEMENT_ENCODINGS.items()
+        }  # Storage encodings of elements that support alternative encodings
+        self._encoded_metadata_cache = {}  # Cache for arrays of packed elements
         if isinstance(storage_name, str) and isinstance(hdf5_filepath, str):
             if len(storage_name) > 0 and len(hdf5_filepath) > 0:
                 if not path.exists(hdf5_filepath) or force_new:
@@ -85,6 +168,16 @@ class DatabaseStorageManager:
             self._db_info_cache = pd.read_hdf(
                 self._hdf5_filepath, DATABASE_HDF5_STRUCT["metadata-db-info"]
             )
+            for element_key in DATABASE_OPTIONAL_ELEMENTS:
+                if element_key not in self._db_info_cache.index:
+                    self._db_info_cache[element_key] = False
+            with tables.open_file(self._hdf5_filepath, mode="r") as tmp_storer:
+                for element_key in self._element_encodings.keys():
+                    self._element_encodings[element_key] = getattr(
+                        tmp_storer.get_node(DATABASE_HDF5_STRUCT[element_key])._v_attrs,
+                        "storage_encoding",
+                        DATABASE_ELEMENT_ENCODINGS[element_key][0],
+                    )
             self._init_state = 1
             if not self.initiate_memory_cache():
                 raise RuntimeError("Cannot initiate cache.")
@@ -97,7 +190,9 @@ class DatabaseStorageManager:
 
         return
 
-    def initiate_memory_cache(self, level: int = 1) -> bool:
+    def initiate_memory_cache(
+        self, level: int = 1, memory_budget: Optional[int] = None
+    ) -> bool:
         """Load various elements based on `level` from storage to the memory
         for rapid data access.
 
@@ -106,10 +201,15 @@ class DatabaseStorageManager:
         level
             Level of data caching.
             Levels:
-            - Level 1: Only loads inter index map to the memory. # Run by default
+            - Level 1: Only maps inter index maps to the memory. # Run by default
             - Level 2: Additionally load taxonomy-sheet to the memory
             - Level 3: Additionally load all map-elements to the memory
-            - Level 4: Additionally load all tree-instance to the memory
+            - Level 4: Additionally load reference tree to the memory
+        memory_budget
+            Approximate memory in bytes for cached data. If provided, levels
+            above 1 are replaced by adaptive caching. Most frequently accessed
+            elements are loaded as whole while they fit to the budget and rows
+            of other elements are cached with remaining budget.
 
         Returns
         -------
@@ -124,16 +224,34 @@ class DatabaseStorageManager:
                     self._db_info_cache["map-interx-taxon"]
                     and self._db_info_cache["map-interx-repseq"]
                 ):
-                    self._interxmap_cache["map-interx-repseq"] = tmp_storer.select(
-                        DATABASE_HDF5_STRUCT["map-interx-repseq"]
-                    )
-                    self._interxmap_cache["map-interx-taxon"] = tmp_storer.select(
-                        DATABASE_HDF5_STRUCT["map-interx-taxon"]
-                    )
+                    for interxmap_key in ["map-interx-repseq", "map-interx-taxon"]:
+                        # Storage files built before interx index elements
+                        # were introduced get index built in memory.
+                        tmp_index_key = interxmap_key.replace("map-", "index-")
+                        if self._db_info_cache[tmp_index_key]:
+                            tmp_index_map = InterxIndexMap.from_storage(
+                                self._hdf5_filepath, DATABASE_HDF5_STRUCT[tmp_index_key]
+                            )
+                        else:
+                            tmp_index_map = InterxIndexMap.from_frame(
+                                tmp_storer.select(DATABASE_HDF5_STRUCT[interxmap_key])
+                            )
+                        self._interxmap_cache[interxmap_key] = tmp_index_map
                     self._db_summary = tmp_storer.select(
                         DATABASE_HDF5_STRUCT["metadata-db-summary"]
                     )
                     ret = 1
+            if memory_budget is not None:
+                tmp_storer.close()
+                for element_key in self.__get_resident_elements():
+                    del self._supplement_cache[element_key]
+                self._cache_policy = ElementCachePolicy(memory_budget)
+                if self._row_cache is None:
+                    self._row_cache = RowCache(memory_budget)
+                else:
+                    self._row_cache.resize(memory_budget)
+                return ret
+            self._cache_policy = None
             if level >= 2:
                 if self._db_info_cache["taxonomy-sheet"]:
                     self._supplement_cache["taxonomy-sheet"] = tmp_storer.select(
@@ -142,7 +260,8 @@ class DatabaseStorageManager:
                     ret = 2
             if level >= 3:
                 for element_key in filter_elements_by(
-                    "map-", ["map-interx-repseq", "map-interx-taxon"]
+                    "map-",
+                    ["map-interx-repseq", "map-interx-taxon"] + DATABASE_ARRAY_ELEMENTS,
                 ):
                     if self._db_info_cache[element_key]:
                         self._supplement_cache[element_key] = tmp_storer.select(
@@ -151,8 +270,15 @@ class DatabaseStorageManager:
                         ret = 3
             tmp_storer.close()
             if level >= 4:
-                if self._db_info_cache["tree-object"]:
-                    tmp_storer = tmp_storer.get_handle_by_element("tree-object")
+                if self._db_info_cache["tree-array"]:
+                    self._supplement_cache["tree-array"] = (
+                        self.retrieve_data_by_element("tree-array")
+                    )
+                    ret = 4
+                elif self._db_info_cache["tree-object"]:
+                    # Pickled tree is loaded only for storage files built
+                    # before *tree-array* element was introduced.
+                    tmp_storer = tables.open_file(self._hdf5_filepath, mode="r")
                     tree_object_bytes = tmp_storer.get_node(
                         DATABASE_HDF5_STRUCT["tree-object"]
                     ).read()[0]
@@ -161,6 +287,111 @@ class DatabaseStorageManager:
                     ret = 4
         return ret
 
+    def __get_resident_elements(self) -> list:
+        """Get storage elements that are loaded to the memory as whole."""
+        return [
+            element_key
+            for element_key, element_data in self._supplement_cache.items()
+            if element_data is not None
+        ]
+
+    def __touch_element(self, element_key: str) -> None:
+        """Record access to `element_key` and load it to the memory as whole
+        if memory budget policy allows it."""
+        if self._cache_policy is None:
+            return
+        with self._handle_lock:
+            self._cache_policy.record_access(element_key)
+            if self._supplement_cache.get(element_key, None) is not None:
+                return
+            self.__set_handle_by_element(element_key)
+            with self.__storage_io():
+                tmp_element_bytes = estimate_node_bytes(
+                    self._storer.get_node(DATABASE_HDF5_STRUCT[element_key])
+                )
+            tmp_evictions = self._cache_policy.select_evictions(
+                element_key, tmp_element_bytes
+            )
+            if tmp_evictions is None:
+                return
+            for evicted_key in tmp_evictions:
+                del self._supplement_cache[evicted_key]
+                self._cache_policy.evict(evicted_key)
+            with self.__storage_io():
+                if self.__is_encoded(element_key):
+                    tmp_element_data = self.__read_encoded_element(element_key)
+                elif get_element_mode(element_key) == 2:
+                    tmp_element_data = self._storer.select(
+                        DATABASE_HDF5_STRUCT[element_key]
+                    )
+                else:
+                    tmp_element_data = self._storer.get_node(
+                        DATABASE_HDF5_STRUCT[element_key]
+                    ).read()[0]
+            tmp_element_bytes = (
+                tmp_element_data.memory_usage(deep=True).sum()
+                if isinstance(tmp_element_data, pd.DataFrame)
+                else len(tmp_element_data)
+            )
+            if self._cache_policy.admit(element_key, int(tmp_element_bytes)):
+                self._supplement_cache[element_key] = tmp_element_data
+                if self._row_cache is not None:
+                    self._row_cache.discard_element(element_key)
+            if self._row_cache is not None:
+                self._row_cache.resize(self._cache_policy.free_bytes)
+        return
+
+    def initiate_row_cache(self, max_bytes: Optional[int]) -> None:
+        """Enable or disable cache of rows retrieved by
+        :meth:`.get_element_data_by_ids`. Rows are cached per storage element
+        and row coordinate so that only missing rows are selected from
+        storage. Least recently used rows are evicted once `max_bytes` is
+        exceeded.
+
+        Parameters
+        ----------
+        max_bytes
+            Approximate maximum size of cached rows in bytes or None to
+            disable caching.
+        """
+        if self._init_state == 1:
+            if self._row_cache is not None:
+                self._row_cache.clear()
+            self._row_cache = RowCache(max_bytes) if max_bytes is not None else None
+        else:
+            raise RuntimeError("Storage manager must be initiated.")
+        return
+
+    def initiate_concurrent_mode(self) -> None:
+        """Switch storage manager to concurrent read-only mode.
+
+        Each thread opens its own read-only handle on first access and keeps
+        it until :meth:`.shutdown`, so that data can be retrieved from a
+        thread pool without switching or reopening shared handle. Shared
+        caches are guarded by a lock.
+        """
+        if self._init_state == 1:
+            if not self._concurrent_state:
+                self.__close_storer()
+                self._concurrent_state = True
+        else:
+            raise RuntimeError("Storage manager must be initiated.")
+        return
+
+    def terminate_concurrent_mode(self) -> None:
+        """Switch storage manager back from concurrent read-only mode.
+
+        Per-thread handles are closed and shared handle is reopened on next
+        access.
+        """
+        if self._init_state == 1:
+            if self._concurrent_state:
+                self.__close_storer()
+                self._concurrent_state = False
+        else:
+            raise RuntimeError("Storage manager must be initiated.")
+        return
+
     @staticmethod
     def validate_storage(hdf5_filepath: str, storage_name: str) -> bool:
         """Validates storage :term:`hdf5` file.
@@ -188,11 +419,16 @@ class DatabaseStorageManager:
                         title_list.append(node._v_title)
                         path_list.append(node._v_pathname)
                 tmp_storer.close()
+                required_struct = {
+                    element_key: element_path
+                    for element_key, element_path in DATABASE_HDF5_STRUCT.items()
+                    if element_key not in DATABASE_OPTIONAL_ELEMENTS
+                }
                 title_verify = all(
-                    [title in title_list[1:] for title in DATABASE_HDF5_STRUCT.keys()]
+                    [title in title_list[1:] for title in required_struct.keys()]
                 )
                 path_verify = all(
-                    [path in path_list[1:] for path in DATABASE_HDF5_STRUCT.values()]
+                    [path in path_list[1:] for path in required_struct.values()]
                 )
                 if title_verify and path_verify:
                     ret = True
@@ -212,9 +448,15 @@ class DatabaseStorageManager:
                 "map-interx-repseq": None,
             }
             self._supplement_cache = defaultdict(None)
+            self._encoded_metadata_cache = {}
+            if self._row_cache is not None:
+                self._row_cache.clear()
+            self._row_cache = None
+            self._cache_policy = None
             self._db_summary = None
             self._storer_state = False
             self._storer = None
+            self._concurrent_state = False
             self._init_state = 0
         except:
             raise RuntimeError("Error during closing _local.")
@@ -223,6 +465,14 @@ class DatabaseStorageManager:
     def __close_storer(self):
         """This method closes :meth:`.storer` and releases the storage file for
         reopening."""
+        if self._concurrent_state:
+            with self._handle_lock:
+                for tmp_store in self._thread_stores:
+                    tmp_store.close()
+                self._thread_stores = []
+                self._idle_stores = []
+                self._thread_handles = _ThreadStorerHandles()
+            return
         if self._storer_state:
             try:
                 self._storer.close()  # Same function for both pandas and tables. Might change in the future.
@@ -288,6 +538,7 @@ class DatabaseStorageManager:
             tmp_storer.create_group("/tre", "master", title="tree-prior")
             tmp_storer.create_group("/tre", "parsed", title="tree-parsed")
             tmp_storer.create_group("/tre", "pickled", title="tree-object")
+            tmp_storer.create_group("/tre", "array", title="tree-array")
             tmp_storer.create_vlarray(
                 "/tre/master", "value", title="bytes", atom=tables.VLUnicodeAtom()
             )
@@ -301,6 +552,7 @@ class DatabaseStorageManager:
             tmp_storer.create_group("/", "tax", title="root-taxonomy")
             tmp_storer.create_group("/tax", "master", title="taxonomy-prior")
             tmp_storer.create_group("/tax", "parsed", title="taxonomy-sheet")
+            tmp_storer.create_group("/tax", "index", title="taxonomy-index")
 
             tmp_storer.create_group("/", "seq", title="root-sequence")
             tmp_storer.create_group("/seq", "reps", title="sequence-representative")
@@ -313,6 +565,9 @@ class DatabaseStorageManager:
             tmp_storer.create_group("/map", "reptid", title="map-rep2tid")
             tmp_storer.create_group("/map", "repseq", title="map-repseq")
             tmp_storer.create_group("/map", "tree", title="map-tree")
+            tmp_storer.create_group("/map", "tidrep", title="map-tid2rep")
+            tmp_storer.create_group("/map", "xindextax", title="index-interx-taxon")
+            tmp_storer.create_group("/map", "xindexreps", title="index-interx-repseq")
 
             tmp_storer.create_group("/", "stat", title="root-stats")
             tmp_storer.create_group("/stat", "reps", title="stat-reps")
@@ -328,8 +583,10 @@ class DatabaseStorageManager:
                 "tree-parsed",
                 "tree-prior",
                 "tree-object",
+                "tree-array",
                 "taxonomy-prior",
                 "taxonomy-sheet",
+                "taxonomy-index",
                 "sequence-representative",
                 "sequence-aligned",
                 "sequence-accession",
@@ -340,6 +597,9 @@ class DatabaseStorageManager:
                 "map-rep2tid",
                 "map-repseq",
                 "map-tree",
+                "map-tid2rep",
+                "index-interx-taxon",
+                "index-interx-repseq",
                 "stat-reps",
                 "stat-taxs",
             ]
@@ -415,7 +675,32 @@ class DatabaseStorageManager:
         """
         ret = None
         try:
-            if element_key in ["sequence-representative", "sequence-aligned"]:
+            if self.__is_encoded(element_key):
+                if self.__open_as_tables("a"):
+                    product_inits, product_generator_first_chunk = next(
+                        product_generator
+                    )
+                    (
+                        create_element,
+                        append_chunk,
+                        _,
+                        _,
+                    ) = _ELEMENT_CODECS[self._element_encodings[element_key]]
+                    tmp_element_group = create_element(
+                        self._storer,
+                        DATABASE_HDF5_STRUCT[element_key],
+                        product_generator_first_chunk,
+                        product_inits["max_rows"],
+                    )
+                    last_chunk = product_generator_first_chunk
+                    for next_chunk in product_generator:
+                        append_chunk(tmp_element_group, next_chunk)
+                        last_chunk = next_chunk
+                    tmp_element_group._v_attrs.storage_encoding = (
+                        self._element_encodings[element_key]
+                    )
+                    ret = last_chunk
+            elif element_key in ["sequence-representative", "sequence-aligned"]:
                 if self.__open_as_pandas("a"):
                     product_inits, product_generator_first_chunk = next(
                         product_generator
@@ -532,6 +817,21 @@ class DatabaseStorageManager:
                         product_product_whole_bytes
                     )
                     ret = product_product_whole
+            elif element_key in DATABASE_ARRAY_ELEMENTS:
+                if self.__open_as_tables("a"):
+                    _, _ = next(product_generator)
+                    product_product_whole = next(product_generator)
+                    # Product is None when the element cannot be made for
+                    # the database, which leaves the element inactive.
+                    if product_product_whole is not None:
+                        for array_name, array in product_product_whole.items():
+                            self._storer.create_array(
+                                DATABASE_HDF5_STRUCT[element_key],
+                                array_name,
+                                obj=array,
+                                title=array_name,
+                            )
+                    ret = product_product_whole
             elif element_key in ["map-interx-taxon", "map-interx-repseq", "map-tree"]:
                 if self.__open_as_pandas("a"):
                     _, _ = next(product_generator)
@@ -614,6 +914,29 @@ class DatabaseStorageManager:
     def __set_handle_by_element(self, element_key: str):
         """Re-assign :attr:`.storer` handle based on `element_key`"""
         storer_mode = get_element_mode(element_key)
+        if self._concurrent_state:
+            # Both modes share single read-only file handle of the thread.
+            if self._thread_handles.store is None:
+                with self._handle_lock:
+                    tmp_store = self._idle_stores.pop() if self._idle_stores else None
+                if tmp_store is None:
+                    with self.__storage_io():
+                        tmp_store = pd.HDFStore(self._hdf5_filepath, mode="r")
+                    with self._handle_lock:
+                        self._thread_stores.append(tmp_store)
+                # Store returns to the pool once the thread is finished.
+                weakref.finalize(
+                    threading.current_thread(), self.__release_store, tmp_store
+                )
+                self._thread_handles.store = tmp_store
+            self._storer = (
+                self._thread_handles.store
+                if storer_mode == 2
+                else self._thread_handles.store._handle
+            )
+            self._storer_mode = storer_mode
+            self._storer_state = True
+            return self._storer_state
         if not ((storer_mode == self._storer_mode) and self._storer_state):
             if storer_mode == 2:
                 self.__open_as_pandas()
@@ -621,6 +944,138 @@ class DatabaseStorageManager:
                 self.__open_as_tables()
         return self._storer_state
 
+    def __release_store(self, store):
+        """Return `store` of finished thread to the pool of idle stores."""
+        with self._handle_lock:
+            if store.is_open:
+                self._idle_stores.append(store)
+        return
+
+    def __storage_io(self):
+        """Get context manager that serializes :term:`hdf5` I/O between
+        threads in concurrent mode."""
+        return _HDF5_LOCK if self._concurrent_state else nullcontext()
+
+    def set_element_encoding(self, element_key: str, encoding: str) -> None:
+        """Select storage encoding of `element_key` before it is committed.
+
+        Parameters
+        ----------
+        element_key
+            Target storage element
+        encoding
+            One of encodings supported by `element_key`. Representative
+            sequences support "table"(default) and "packed", which stores
+            nucleotides with two bits and keeps other characters as exceptions.
+            Alignments support "table"(default), "matrix", which stores
+            alignment as character matrix chunked by columns so that column
+            regions are read without reading whole rows, and "gap-rle", which
+            stores packed ungapped residues with run-length encoded gaps.
+        """
+        if self._init_state == -1:
+            if element_key in DATABASE_ELEMENT_ENCODINGS:
+                if encoding in DATABASE_ELEMENT_ENCODINGS[element_key]:
+                    if self._db_info_cache[element_key]:
+                        raise RuntimeError(
+                            "Element `{}` was already committed.".format(element_key)
+                        )
+                    self._element_encodings[element_key] = encoding
+                else:
+                    raise ValueError(
+                        "Invalid `encoding` for element `{}`.".format(element_key)
+                    )
+            else:
+                raise ValueError(
+                    "Element `{}` does not support alternative encodings.".format(
+                        element_key
+                    )
+                )
+        else:
+            raise RuntimeError("Encoding can only be set during construction.")
+        return
+
+    def __is_encoded(self, element_key: str) -> bool:
+        """Check whether `element_key` is stored with encoding other than
+        table."""
+        return self._element_encodings.get(element_key, "table") != "table"
+
+    def __get_encoded_node(self, element_key: str) -> tables.Group:
+        """Get group node of encoded `element_key` from currently open storer
+        so that encoded elements can be read while other elements are
+        written during construction."""
+        if not self._storer_state:
+            self.__set_handle_by_element(element_key)
+        tmp_handle = self._storer._handle if self._storer_mode == 2 else self._storer
+        return tmp_handle.get_node(DATABASE_HDF5_STRUCT[element_key])
+
+    def __get_encoded_metadata(self, element_key: str) -> dict:
+        """Get index and other small arrays of encoded `element_key`. Arrays
+        are cached once storage manager is initiated for data retrieval."""
+        tmp_metadata = self._encoded_metadata_cache.get(element_key, None)
+        if tmp_metadata is None:
+            _, _, read_metadata, _ = _ELEMENT_CODECS[
+                self._element_encodings[element_key]
+            ]
+            with self.__storage_io():
+                tmp_metadata = read_metadata(self.__get_encoded_node(element_key))
+            if self._init_state == 1:
+                self._encoded_metadata_cache[element_key] = tmp_metadata
+        return tmp_metadata
+
+    def __read_encoded_element(self, element_key, rows=None, columns=None, region=None):
+        """Decode rows of encoded `element_key` into table.
+
+        Parameters
+        ----------
+        element_key
+            Target storage element
+        rows
+            Row coordinates, :class:`slice` or None for all rows.
+        columns
+            Target columns or None for all columns.
+        region
+            :class:`slice` of alignment columns or None for whole alignment.
+
+        Returns
+        -------
+            :class:`~pandas.DataFrame` in same layout as table encoding.
+        """
+        tmp_encoding = self._element_encodings[element_key]
+        _, _, _, read_rows = _ELEMENT_CODECS[tmp_encoding]
+        tmp_metadata = self.__get_encoded_metadata(element_key)
+        with self.__storage_io():
+            if tmp_encoding in DATABASE_REGION_ENCODINGS:
+                return read_rows(
+                    self.__get_encoded_node(element_key),
+                    tmp_metadata,
+                    rows,
+                    columns,
+                    region,
+                )
+            product = read_rows(
+                self.__get_encoded_node(element_key), tmp_metadata, rows, columns
+            )
+        return self.__apply_region(product, region)
+
+    @staticmethod
+    def __validate_region(element_key, region):
+        """Validate alignment column `region` requested for `element_key`"""
+        if region is not None:
+            if element_key != "sequence-aligned":
+                raise ValueError("Column regions are supported only for alignments.")
+            if not isinstance(region, slice):
+                raise TypeError("`region` must be a slice of alignment columns.")
+            if region.step is not None and region.step <= 0:
+                raise ValueError("`region` step must be positive.")
+        return
+
+    @staticmethod
+    def __apply_region(product, region):
+        """Keep only alignment columns within `region` of retrieved rows."""
+        if region is None or "sequence" not in product.columns:
+            return product
+        return slice_alignment_frame(product, region)
+
     def __get_coordinates_for_element_by_ids(
         self, element_key: str, ids: AnyGenericIdentifier
     ) -> pd.Index:
@@ -640,18 +1095,13 @@ class DatabaseStorageManager:
         """
         tmp_interxmap_type = get_element_index_type(element_key)
         if self._init_state == 1:
-            valid_ids = self._interxmap_cache[tmp_interxmap_type].index.isin(ids)
-            if valid_ids.sum() == len(ids):
-                tmp_target_index_map = self._interxmap_cache[tmp_interxmap_type][
-                    element_key
-                ][valid_ids]
-                ret = pd.Index(tmp_target_index_map.values)
-            else:
-                raise ValueError("Invalid identifiers are provided.")
-        else:
-            index_coord = self._storer.select_column(
-                DATABASE_HDF5_STRUCT[element_key], "index"
+            ret = pd.Index(
+                self._interxmap_cache[tmp_interxmap_type].get_coordinates(
+                    element_key, ids
+                )
             )
+        else:
+            index_coord = self.get_index_by_element(element_key)
             ret = index_coord[index_coord.isin(ids)].index
         return ret
 
@@ -673,18 +1123,30 @@ class DatabaseStorageManager:
         """
         if self._init_state:
             if self._db_info_cache[element_key] or self._init_state == -1:
-                if get_element_mode(element_key) == 2:
-                    self.__set_handle_by_element(element_key)
+                if self.__is_encoded(element_key):
                     if condition is None:
-                        return self._storer.select_column(
-                            DATABASE_HDF5_STRUCT[element_key], "index"
+                        return pd.Series(
+                            self.__get_encoded_metadata(element_key)["index"],
+                            name="index",
                         )
                     else:
-                        if isinstance(condition, str):
-                            return self._storer.select(
-                                DATABASE_HDF5_STRUCT[element_key],
-                                "columns == index & {}".format(condition),
+                        raise ValueError(
+                            "Conditions are not supported for packed storage elements."
+                        )
+                elif get_element_mode(element_key) == 2:
+                    self.__set_handle_by_element(element_key)
+                    if condition is None:
+                        with self.__storage_io():
+                            return self._storer.select_column(
+                                DATABASE_HDF5_STRUCT[element_key], "index"
                             )
+                    else:
+                        if isinstance(condition, str):
+                            with self.__storage_io():
+                                return self._storer.select(
+                                    DATABASE_HDF5_STRUCT[element_key],
+                                    "columns == index & {}".format(condition),
+                                )
                         else:
                             raise ValueError(
                                 "Invalid condition parameter is provided. `condition` must have string type."
@@ -697,7 +1159,7 @@ class DatabaseStorageManager:
             raise RuntimeError("Storage manager must be initiated.")
 
     def retrieve_data_by_element(
-        self, element_key, columns=None, chunksize=None
+        self, element_key, columns=None, chunksize=None, region=None
     ) -> Any:
         """Retrieves data from storage element as whole or in chunks.
 
@@ -706,19 +1168,31 @@ class DatabaseStorageManager:
         element_key
             Target storage element
         columns
-            Target columns of table to retrieve
+            Target columns of table to retrieve or target arrays of array group
+            elements such as *tree-array*
         chunksize
             Size of chunks to split retrieval or None to retrieve as whole.
+        region
+            :class:`slice` of alignment columns to retrieve from
+            *sequence-aligned* or None for whole alignment.
 
         Returns
         -------
             Depends on input parameters. If chunked the return generator, if not then depends on type of storage element.
         """
 
-        def fixed_product_generator(chunk_iter):
-            for product_chunk in chunk_iter:
-                yield self.__fix_table(element_key, product_chunk)
+        def fixed_product_generator(chunk_iter, chunk_region=None):
+            chunk_iter = iter(chunk_iter)
+            while True:
+                with self.__storage_io():
+                    product_chunk = next(chunk_iter, None)
+                if product_chunk is None:
+                    break
+                yield self.__fix_table(
+                    element_key, self.__apply_region(product_chunk, chunk_region)
+                )
 
+        self.__validate_region(element_key, region)
         if self._init_state:
             if self._db_info_cache[element_key]:
                 if get_element_mode(element_key) == 2:
@@ -728,52 +1202,115 @@ class DatabaseStorageManager:
                         raise ValueError(
                             "Error! Attempt to use `chunksize` on fixed tables."
                         )
-                    if self._supplement_cache.get(element_key, None) is None:
-                        self.__set_handle_by_element(element_key)
-                        if columns is None:
-                            product = self._storer.select(
-                                DATABASE_HDF5_STRUCT[element_key], chunksize=chunksize
-                            )
-                        else:
-                            product = self._storer.select(
-                                DATABASE_HDF5_STRUCT[element_key],
-                                "columns in ['index', {}]".format(
-                                    ", ".join(
-                                        ["'{}'".format(column) for column in columns]
-                                    )
+                    self.__touch_element(element_key)
+                    tmp_resident_data = self._supplement_cache.get(element_key, None)
+                    if tmp_resident_data is None and self.__is_encoded(element_key):
+                        if chunksize is None:
+                            return self.__fix_table(
+                                element_key,
+                                self.__read_encoded_element(
+                                    element_key, columns=columns, region=region
                                 ),
-                                chunksize=chunksize,
                             )
+                        tmp_total_rows = self.__get_encoded_metadata(element_key)[
+                            "index"
+                        ].shape[0]
+                        return fixed_product_generator(
+                            self.__read_encoded_element(
+                                element_key,
+                                slice(position, position + chunksize),
+                                columns,
+                                region,
+                            )
+                            for position in range(0, tmp_total_rows, chunksize)
+                        )
+                    elif tmp_resident_data is None:
+                        self.__set_handle_by_element(element_key)
+                        with self.__storage_io():
+                            if columns is None:
+                                product = self._storer.select(
+                                    DATABASE_HDF5_STRUCT[element_key],
+                                    chunksize=chunksize,
+                                )
+                            else:
+                                product = self._storer.select(
+                                    DATABASE_HDF5_STRUCT[element_key],
+                                    "columns in ['index', {}]".format(
+                                        ", ".join(
+                                            [
+                                                "'{}'".format(column)
+                                                for column in columns
+                                            ]
+                                        )
+                                    ),
+                                    chunksize=chunksize,
+                                )
                         return (
-                            self.__fix_table(element_key, product)
+                            self.__fix_table(
+                                element_key, self.__apply_region(product, region)
+                            )
                             if chunksize is None
-                            else fixed_product_generator(product)
+                            else fixed_product_generator(product, region)
                         )
                     else:
-                        if columns is None:
-                            return self.__fix_table(
-                                element_key, self._supplement_cache[element_key]
+                        product = (
+                            tmp_resident_data
+                            if columns is None
+                            else tmp_resident_data[columns]
+                        )
+                        return (
+                            self.__fix_table(
+                                element_key, self.__apply_region(product, region)
                             )
-                        else:
-                            return self.__fix_table(
-                                element_key,
-                                self._supplement_cache[element_key][columns],
+                            if chunksize is None
+                            else fixed_product_generator(
+                                (
+                                    product.iloc[position : position + chunksize]
+                                    for position in range(0, len(product), chunksize)
+                                ),
+                                region,
                             )
+                        )
 
+                elif element_key in DATABASE_ARRAY_ELEMENTS:
+                    tmp_resident_data = self._supplement_cache.get(element_key, None)
+                    if tmp_resident_data is not None:
+                        return {
+                            array_name: tmp_resident_data[array_name]
+                            for array_name in (
+                                tmp_resident_data.keys() if columns is None else columns
+                            )
+                        }
+                    self.__set_handle_by_element(element_key)
+                    with self.__storage_io():
+                        tmp_array_group = self._storer.get_node(
+                            DATABASE_HDF5_STRUCT[element_key]
+                        )
+                        return {
+                            array_name: tmp_array_group._f_get_child(array_name).read()
+                            for array_name in (
+                                tmp_array_group._v_children.keys()
+                                if columns is None
+                                else columns
+                            )
+                        }
                 else:
-                    if self._supplement_cache.get(element_key, None) is None:
+                    self.__touch_element(element_key)
+                    tmp_resident_data = self._supplement_cache.get(element_key, None)
+                    if tmp_resident_data is None:
                         self.__set_handle_by_element(element_key)
-                        return self._storer.get_node(
-                            DATABASE_HDF5_STRUCT[element_key]
-                        ).read()[0]
+                        with self.__storage_io():
+                            return self._storer.get_node(
+                                DATABASE_HDF5_STRUCT[element_key]
+                            ).read()[0]
                     else:
-                        return self._supplement_cache[element_key]
+                        return tmp_resident_data
             else:
                 raise ValueError("Invalid element requested.")
         else:
             raise RuntimeError("Storage manager must be initiated.")
 
-    def get_element_data_by_ids(self, element_key, ids):
+    def get_element_data_by_ids(self, element_key, ids, region=None):
         """Get partial data from storage element by `ids`.
 
         Parameters
@@ -782,34 +1319,84 @@ class DatabaseStorageManager:
             Target storage element
         ids
             Target identifiers to retrieve data for
+        region
+            :class:`slice` of alignment columns to retrieve from
+            *sequence-aligned* or None for whole alignment.
 
         Returns
         -------
             Depends on storage element type.
         """
+        self.__validate_region(element_key, region)
         if self._init_state:
             if self._db_info_cache[element_key]:
                 target_ids = np.asarray(ids)
                 if (get_element_mode(element_key) == 2) and (
                     get_element_index_type(element_key) != None
                 ):
-                    if self._supplement_cache.get(element_key, None) is None:
+                    self.__touch_element(element_key)
+                    tmp_resident_data = self._supplement_cache.get(element_key, None)
+                    if tmp_resident_data is None:
                         self.__set_handle_by_element(element_key)
                         coord = self.__get_coordinates_for_element_by_ids(
                             element_key, target_ids
                         )
-                        product = self._storer.select(
-                            DATABASE_HDF5_STRUCT[element_key], coord
+                        if self.__is_encoded(element_key) and (
+                            self._row_cache is None or region is not None
+                        ):
+                            # Regions of encoded elements are read directly
+                            # instead of caching whole rows.
+                            return self.__fix_table(
+                                element_key,
+                                self.__read_encoded_element(
+                                    element_key, coord.values, region=region
+                                ),
+                            )
+                        elif self._row_cache is None:
+                            with self.__storage_io():
+                                product = self._storer.select(
+                                    DATABASE_HDF5_STRUCT[element_key], coord
+                                )
+                        else:
+                            coord_list = coord.tolist()
+                            (
+                                cached_rows,
+                                missing_coord,
+                            ) = self._row_cache.split_coordinates(
+                                element_key, coord_list
+                            )
+                            missing_product = None
+                            if missing_coord.shape[0] > 0 and self.__is_encoded(
+                                element_key
+                            ):
+                                missing_product = self.__read_encoded_element(
+                                    element_key, missing_coord
+                                )
+                            elif missing_coord.shape[0] > 0:
+                                with self.__storage_io():
+                                    missing_product = self._storer.select(
+                                        DATABASE_HDF5_STRUCT[element_key],
+                                        pd.Index(missing_coord),
+                                    )
+                            product = self._row_cache.assemble(
+                                element_key,
+                                coord_list,
+                                cached_rows,
+                                missing_coord,
+                                missing_product,
+                            )
+                        return self.__fix_table(
+                            element_key, self.__apply_region(product, region)
                         )
-                        return self.__fix_table(element_key, product)
                     else:
-                        valid_ids = self._supplement_cache[element_key].index.isin(
-                            target_ids
-                        )
+                        valid_ids = tmp_resident_data.index.isin(target_ids)
                         if valid_ids.sum() == len(target_ids):
                             return self.__fix_table(
                                 element_key,
-                                self._supplement_cache[element_key].loc[target_ids],
+                                self.__apply_region(
+                                    tmp_resident_data.loc[valid_ids].sort_index(),
+                                    region,
+                                ),
                             )
                         else:
                             raise ValueError("Invalid identifiers provided.")
@@ -822,6 +1409,76 @@ class DatabaseStorageManager:
         else:
             raise RuntimeError("Storage manager must be initiated.")
 
+    def get_element_arrays_by_ids(
+        self, element_key: str, ids: AnyGenericIdentifier, region=None
+    ) -> dict:
+        """Get sequences of storage element by `ids` as single character
+        buffer.
+
+        Encoded sequence elements are decoded directly into the buffer. Other
+        elements are retrieved by :meth:`.get_element_data_by_ids` and
+        concatenated.
+
+        Parameters
+        ----------
+        element_key
+            Target sequence storage element
+        ids
+            Target identifiers to retrieve data for
+        region
+            :class:`slice` of alignment columns to retrieve from
+            *sequence-aligned* or None for whole alignment.
+
+        Returns
+        -------
+            Dictionary with `index` of retrieved rows, `buffer` with uint8
+            character codes of all sequences, `offsets` of sequences within
+            `buffer` with one extra element and `lengths` of sequences.
+        """
+        if element_key not in ("sequence-representative", "sequence-aligned"):
+            raise ValueError("Buffers can only be retrieved for sequence elements.")
+        self.__validate_region(element_key, region)
+        if (
+            self._init_state
+            and self._db_info_cache.get(element_key, False)
+            and self.__is_encoded(element_key)
+            and self._row_cache is None
+            and element_key not in self._supplement_cache
+        ):
+            self.__set_handle_by_element(element_key)
+            coord = self.__get_coordinates_for_element_by_ids(
+                element_key, np.asarray(ids)
+            )
+            tmp_encoding = self._element_encodings[element_key]
+            tmp_read_buffer = _ELEMENT_BUFFER_READERS[tmp_encoding]
+            tmp_metadata = self.__get_encoded_metadata(element_key)
+            with self.__storage_io():
+                if tmp_encoding in DATABASE_REGION_ENCODINGS:
+                    tmp_index, tmp_buffer, tmp_offsets = tmp_read_buffer(
+                        self.__get_encoded_node(element_key),
+                        tmp_metadata,
+                        coord.values,
+                        region,
+                    )
+                else:
+                    tmp_index, tmp_buffer, tmp_offsets = tmp_read_buffer(
+                        self.__get_encoded_node(element_key),
+                        tmp_metadata,
+                        coord.values,
+                    )
+        else:
+            tmp_product = self.get_element_data_by_ids(element_key, ids, region)
+            tmp_index = tmp_product.index.values
+            tmp_buffer, tmp_offsets = sequences_to_buffer(
+                tmp_product["sequence"].tolist()
+            )
+        return {
+            "index": tmp_index,
+            "buffer": tmp_buffer,
+            "offsets": tmp_offsets,
+            "lengths": np.diff(tmp_offsets),
+        }
+
     def compress_storage(
         self, complevel: int = 9, complib: str = "blosc", overwrite: bool = False
     ) -> bool:
@@ -850,6 +1507,12 @@ class DatabaseStorageManager:
 
                     self.__open_as_tables()
                     original_title = self._storer.title
+                    # Column chunks of alignment matrix must survive repacking.
+                    chunkshape = (
+                        "keep"
+                        if "matrix" in self._element_encodings.values()
+                        else "auto"
+                    )
                     self.shutdown()
                     hdf5_abs_path = path.abspath(self._hdf5_filepath)
                     hdf5_dir_path = path.dirname(hdf5_abs_path)
@@ -862,8 +1525,8 @@ class DatabaseStorageManager:
                     compressed_hdf5_abs_path = "{}/{}".format(
                         hdf5_dir_path, compressed_hdf5_basename
                     )
-                    ptrepack_cmd = "ptrepack --dest-title={} --chunkshape=auto --propindexes --complevel={} --complib={}".format(
-                        original_title, str(complevel), complib
+                    ptrepack_cmd = "ptrepack --dest-title={} --chunkshape={} --propindexes --complevel={} --complib={}".format(
+                        original_title, chunkshape, str(complevel), complib
                     ).split()
                     ptrepack_cmd.extend([hdf5_abs_path, compressed_hdf5_abs_path])
                     process = subprocess.Popen(
@@ -893,6 +1556,38 @@ class DatabaseStorageManager:
         else:
             return missing_to_none(target_df)
 
+    def __get_handles(self):
+        """Get storer handles of current thread in concurrent mode or shared
+        handles otherwise."""
+        return self._thread_handles if self._concurrent_state else self._shared_handles
+
+    @property
+    def _storer(self):
+        """Current storer(pandas/pytables) handle."""
+        return self.__get_handles().storer
+
+    @_storer.setter
+    def _storer(self, value):
+        self.__get_handles().storer = value
+
+    @property
+    def _storer_state(self):
+        """Current storer state."""
+        return self.__get_handles().state
+
+    @_storer_state.setter
+    def _storer_state(self, value):
+        self.__get_handles().state = value
+
+    @property
+    def _storer_mode(self):
+        """Current storer mode. 1 for `tables` or 2 for `pandas`"""
+        return self.__get_handles().mode
+
+    @_storer_mode.setter
+    def _storer_mode(self, value):
+        self.__get_handles().mode = value
+
     @property
     def state(self):
         """State of the storage manager.
@@ -901,6 +1596,11 @@ class DatabaseStorageManager:
         """
         return self._init_state
 
+    @property
+    def concurrent_state(self) -> bool:
+        """Whether storage manager is in concurrent read-only mode."""
+        return self._concurrent_state
+
     @property
     def active_elements(self):
         """Active storage elements that can be used."""
@@ -911,6 +1611,37 @@ class DatabaseStorageManager:
         """Cached states per storage element."""
         return self._db_info_cache
 
+    @property
+    def resident_sizes(self) -> pd.Series:
+        """Approximate memory size in bytes of cached data per storage
+        element. Includes elements loaded as whole and cached rows."""
+        tmp_resident_sizes = defaultdict(int)
+        with self._handle_lock:
+            tmp_resident_data = {
+                element_key: self._supplement_cache[element_key]
+                for element_key in self.__get_resident_elements()
+            }
+        for element_key, tmp_element_data in tmp_resident_data.items():
+            if isinstance(tmp_element_data, pd.DataFrame):
+                tmp_element_bytes = tmp_element_data.memory_usage(deep=True).sum()
+            elif isinstance(tmp_element_data, dict):
+                tmp_element_bytes = sum(
+                    array.nbytes for array in tmp_element_data.values()
+                )
+            else:
+                tmp_element_bytes = len(tmp_element_data)
+            tmp_resident_sizes[element_key] += int(tmp_element_bytes)
+        if self._row_cache is not None:
+            for element_key, element_bytes in self._row_cache.element_sizes.items():
+                tmp_resident_sizes[element_key] += element_bytes
+        return pd.Series(tmp_resident_sizes, dtype=np.int64, name="bytes")
+
+    @property
+    def row_cache_stats(self) -> Optional[dict]:
+        """Hit, miss and eviction counters of row cache or None if row cache
+        is disabled."""
+        return self._row_cache.stats if self._row_cache is not None else None
+
     @property
     def summary(self):
         """Cached storage database summary table."""
@@ -9,9 +9,14 @@ from pmaf.database._core._seq_base import DatabaseSequenceMixin
 from pmaf.database._core._phy_base import DatabasePhylogenyMixin
 from pmaf.database._core._acs_base import DatabaseAccessionMixin
 from pmaf.database._manager import DatabaseStorageManager
+from pmaf.database._shared._common import DATABASE_ELEMENT_ENCODINGS
 import pmaf.database._shared._assemblers as transformer
+import pmaf.database._shared._tax_index as tax_index
+import pmaf.database._shared._interx_index as interx_index
 import pmaf.database._shared._summarizers as summarizer
-from typing import Any, Tuple
+import pmaf.database._shared._parallel as parallel
+from typing import Any, Tuple, Optional
+from concurrent.futures import Executor, Future
 from pmaf.internal._typing import AnyGenericIdentifier
 
 
@@ -42,6 +47,10 @@ class DatabaseGreengenes(
         stamp_dict: dict,
         force: bool = False,
         chunksize: int = 500,
+        single_pass: bool = True,
+        workers: int = 1,
+        repseq_format: str = "table",
+        alignment_format: str = "table",
         **kwargs: Any
     ) -> None:
         """Factory method to build new database :term:`hdf5`
@@ -65,6 +74,21 @@ class DatabaseGreengenes(
         chunksize
             Sequence/Alignment data processing chunk size. Longer chunks are
             faster to process but require more memory.
+        single_pass
+            Parse sequence FASTA files only once and get storage column
+            widths from lightweight pre-scan. Set to False to use legacy two-pass parsing.
+        workers
+            Number of worker processes. If greater than one, tree processing,
+            FASTA parsing and per-chunk statistics run in parallel while
+            the main process remains the only writer of the storage.
+        repseq_format
+            Storage format of representative sequences. Either "table" or
+            "packed" to store nucleotides with two bits per base.
+        alignment_format
+            Storage format of alignments. Either "table", "matrix" to store
+            alignment in column chunks for fast retrieval of column regions
+            or "gap-rle" to store ungapped residues with run-length encoded
+            gaps.
         **kwargs
             Compatibility.
 
@@ -88,31 +112,51 @@ class DatabaseGreengenes(
                 raise ValueError("`chunksize` must be greater than zero.")
         else:
             raise TypeError("`chunksize` must be integer.")
+        if repseq_format not in DATABASE_ELEMENT_ENCODINGS["sequence-representative"]:
+            raise ValueError("Invalid `repseq_format` provided.")
+        if alignment_format not in DATABASE_ELEMENT_ENCODINGS["sequence-aligned"]:
+            raise ValueError("Invalid `alignment_format` provided.")
+        tmp_worker_pool_context = parallel.make_worker_pool(workers)
 
         tmp_storage_manager = DatabaseStorageManager(
             hdf5_filepath=storage_hdf5_fp,
             storage_name=cls.DATABASE_NAME,
             force_new=force,
         )
+        tmp_storage_manager.set_element_encoding(
+            "sequence-representative", repseq_format
+        )
+        tmp_storage_manager.set_element_encoding("sequence-aligned", alignment_format)
 
         removed_rids, novel_tids, index_mapper, tmp_recap = cls.__process_tax_acs_map(
             tmp_storage_manager, taxonomy_map_csv_fp
         )
-        cls.__process_tree(tmp_storage_manager, tree_newick_fp, index_mapper)
+        with tmp_worker_pool_context as tmp_worker_pool:
+            tmp_tree_future = cls.__process_tree(
+                tmp_storage_manager, tree_newick_fp, index_mapper, tmp_worker_pool
+            )
 
-        tmp_recap = cls.__process_sequence(
-            tmp_storage_manager,
-            index_mapper,
-            removed_rids,
-            tmp_recap,
-            sequence_fasta_fp,
-            sequence_alignment_fasta_fp,
-            chunksize,
-        )
+            tmp_recap = cls.__process_sequence(
+                tmp_storage_manager,
+                index_mapper,
+                removed_rids,
+                tmp_recap,
+                sequence_fasta_fp,
+                sequence_alignment_fasta_fp,
+                chunksize,
+                single_pass,
+                tmp_worker_pool,
+            )
 
-        tmp_storage_manager.commit_to_storage(
-            "stat-reps", transformer.produce_rep_stats(tmp_storage_manager, chunksize)
-        )
+            if tmp_tree_future is not None:
+                transformer.commit_tree_elements(tmp_storage_manager, tmp_tree_future)
+
+            tmp_storage_manager.commit_to_storage(
+                "stat-reps",
+                transformer.produce_rep_stats(
+                    tmp_storage_manager, chunksize, tmp_worker_pool, workers
+                ),
+            )
         tmp_storage_manager.commit_to_storage(
             "stat-taxs", transformer.produce_tax_stats(tmp_storage_manager, novel_tids)
         )
@@ -177,6 +221,16 @@ class DatabaseGreengenes(
             yield None, None
             yield transformation_details["map-rep2tid"]
 
+        def produce_taxonomy_index(transformation_details):
+            """The *taxonomy-index* storage element producer function."""
+            yield None, None
+            yield tax_index.make_taxonomy_index(transformation_details["map-rep2tid"])
+
+        def produce_map_tid2rep(transformation_details):
+            """The *map-tid2rep* storage element producer function."""
+            yield None, None
+            yield tax_index.make_tid_rid_index(transformation_details["map-rep2tid"])
+
         tmp_taxonomy_prior = read_qiime_taxonomy_map(taxonomy_map_csv_fp)
         index_mapper = transformer.make_rid_index_mapper(tmp_taxonomy_prior.index)
         taxonomy_prior = storage_manager.commit_to_storage(
@@ -212,6 +266,12 @@ class DatabaseGreengenes(
         storage_manager.commit_to_storage(
             "map-rep2tid", produce_map_rep2tid(transformation_details)
         )
+        storage_manager.commit_to_storage(
+            "taxonomy-index", produce_taxonomy_index(transformation_details)
+        )
+        storage_manager.commit_to_storage(
+            "map-tid2rep", produce_map_tid2rep(transformation_details)
+        )
         return (
             removed_rids,
             transformation_details["novel-tids"],
@@ -225,7 +285,8 @@ class DatabaseGreengenes(
         storage_manager: DatabaseStorageManager,
         tree_newick_fp: str,
         index_mapper: pd.Series,
-    ):
+        worker_pool: Optional[Executor] = None,
+    ) -> Optional[Future]:
         """Process phylogenetic tree.
 
         Parameters
@@ -236,11 +297,15 @@ class DatabaseGreengenes(
             Path to Newick tree
         index_mapper
             New index mapper.
+        worker_pool
+            Process pool to run tree processing in. If provided, only
+            *tree-prior* is committed and the rest must be committed by
+            :func:`~pmaf.database._shared._assemblers.commit_tree_elements`
 
         Returns
         -------
 
-            Results of the process that need to be passed to builder.
+            Future of tree processing results if `worker_pool` is provided.
         """
         from pmaf.database._parsers._phylo import read_newick_tree
         from ete3 import Tree
@@ -256,10 +321,10 @@ class DatabaseGreengenes(
             tmp_tree = Tree(tree_newick_string, format=0)
             yield transformer.reparse_tree(tmp_tree, index_mapper)
 
-        def produce_tree_object(tree_newick_string):
-            """The *tree-object* storage element producer function."""
+        def produce_tree_array(tree_object):
+            """The *tree-array* storage element producer function."""
             yield None, None
-            yield Tree(tree_newick_string, format=2, quoted_node_names=True)
+            yield transformer.make_tree_arrays(tree_object)
 
         def produce_map_tree(tree_object):
             """The *map-tree* storage element producer function."""
@@ -270,11 +335,18 @@ class DatabaseGreengenes(
         tmp_newick_string = storage_manager.commit_to_storage(
             "tree-prior", produce_tree_prior(tree_newick_fp)
         )
+        if worker_pool is not None:
+            return worker_pool.submit(
+                transformer.assemble_tree_elements, tmp_newick_string, index_mapper, 0
+            )
         tmp_newick_parsed = storage_manager.commit_to_storage(
             "tree-parsed", produce_tree_parsed(tmp_newick_string, index_mapper)
         )
-        tmp_tree_object = storage_manager.commit_to_storage(
-            "tree-object", produce_tree_object(tmp_newick_parsed)
+        # Pickled *tree-object* is superseded by *tree-array* and no longer
+        # stored. Older storage files still load it as a fallback.
+        tmp_tree_object = Tree(tmp_newick_parsed, format=2, quoted_node_names=True)
+        storage_manager.commit_to_storage(
+            "tree-array", produce_tree_array(tmp_tree_object)
         )
         storage_manager.commit_to_storage("map-tree", produce_map_tree(tmp_tree_object))
 
@@ -290,6 +362,8 @@ class DatabaseGreengenes(
         sequence_fasta_fp: str,
         sequence_alignment_fasta_fp: str,
         chunksize: int,
+        single_pass: bool,
+        worker_pool: Optional[Executor] = None,
     ) -> pd.Series:
         """Process sequences and alignments.
 
@@ -309,6 +383,10 @@ class DatabaseGreengenes(
             Path to MSA FASTA file
         chunksize
             Size of sequence processing chunks
+        single_pass
+            Whether to parse FASTA files in single pass
+        worker_pool
+            If provided, FASTA files are parsed in separate processes.
 
         Returns
         -------
@@ -322,9 +400,18 @@ class DatabaseGreengenes(
         ):
             """The *sequence-representative* storage element producer
             function."""
-            sequence_parser = parse_qiime_sequence_generator(
-                sequence_fasta_fp, chunksize, False
-            )
+            if worker_pool is None:
+                sequence_parser = parse_qiime_sequence_generator(
+                    sequence_fasta_fp, chunksize, False, single_pass
+                )
+            else:
+                sequence_parser = parallel.iterate_in_process(
+                    parse_qiime_sequence_generator,
+                    sequence_fasta_fp,
+                    chunksize,
+                    False,
+                    single_pass,
+                )
             preparse_info, first_chunk = next(sequence_parser)
             yield preparse_info.copy()
             preparse_info["max_rows"] = preparse_info["max_rows"] - len(dropped_taxa)
@@ -341,9 +428,18 @@ class DatabaseGreengenes(
             sequence_alignment_fasta_fp, index_mapper, dropped_taxa, chunksize
         ):
             """The *sequence-aligned* storage element producer function."""
-            sequence_parser = parse_qiime_sequence_generator(
-                sequence_alignment_fasta_fp, chunksize, True
-            )
+            if worker_pool is None:
+                sequence_parser = parse_qiime_sequence_generator(
+                    sequence_alignment_fasta_fp, chunksize, True, single_pass
+                )
+            else:
+                sequence_parser = parallel.iterate_in_process(
+                    parse_qiime_sequence_generator,
+                    sequence_alignment_fasta_fp,
+                    chunksize,
+                    True,
+                    single_pass,
+                )
             preparse_info, first_chunk = next(sequence_parser)
             yield preparse_info.copy()
             preparse_info["max_rows"] = preparse_info["max_rows"] - len(dropped_taxa)
@@ -399,6 +495,14 @@ class DatabaseGreengenes(
             yield None, None
             yield interx_maker_result["map-interx-repseq"]
 
+        def produce_index_interx(interx_maker_result, interxmap_key):
+            """The *index-interx-taxon* and *index-interx-repseq* storage
+            element producer function."""
+            yield None, None
+            yield interx_index.make_interx_index_arrays(
+                interx_maker_result[interxmap_key]
+            )
+
         tmp_interx_result = transformer.make_interxmaps(storage_manager)
         storage_manager.commit_to_storage(
             "map-interx-taxon", produce_map_interx_taxon(tmp_interx_result)
@@ -406,6 +510,14 @@ class DatabaseGreengenes(
         storage_manager.commit_to_storage(
             "map-interx-repseq", produce_map_interx_repseq(tmp_interx_result)
         )
+        storage_manager.commit_to_storage(
+            "index-interx-taxon",
+            produce_index_interx(tmp_interx_result, "map-interx-taxon"),
+        )
+        storage_manager.commit_to_storage(
+            "index-interx-repseq",
+            produce_index_interx(tmp_interx_result, "map-interx-repseq"),
+        )
         return
 
     @property
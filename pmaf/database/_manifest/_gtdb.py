@@ -5,12 +5,17 @@ from pmaf.database._core._seq_base import DatabaseSequenceMixin
 from pmaf.database._core._phy_base import DatabasePhylogenyMixin
 from pmaf.database._core._acs_base import DatabaseAccessionMixin
 from pmaf.database._manager import DatabaseStorageManager
+from pmaf.database._shared._common import DATABASE_ELEMENT_ENCODINGS
 import pmaf.database._shared._assemblers as transformer
+import pmaf.database._shared._tax_index as tax_index
+import pmaf.database._shared._interx_index as interx_index
 import pmaf.database._shared._summarizers as summarizer
+import pmaf.database._shared._parallel as parallel
 from pmaf.internal.io._seq import SequenceIO
 import numpy as np
 import pandas as pd
-from typing import Any, Tuple
+from typing import Any, Tuple, Optional
+from concurrent.futures import Executor, Future
 from pmaf.internal._typing import AnyGenericIdentifier
 
 
@@ -41,6 +46,10 @@ class DatabaseGTDB(
         stamp_dict: dict,
         force: bool = False,
         chunksize: int = 500,
+        single_pass: bool = True,
+        workers: int = 1,
+        repseq_format: str = "table",
+        alignment_format: str = "table",
         **kwargs: Any
     ) -> None:
         """Factory method to build new database :term:`hdf5`
@@ -62,6 +71,21 @@ class DatabaseGTDB(
         chunksize
             Sequence/Alignment data processing chunk size. Longer chunks are
             faster to process but require more memory.
+        single_pass
+            Parse sequence FASTA files only once and get storage column
+            widths from lightweight pre-scan. Set to False to use legacy two-pass parsing.
+        workers
+            Number of worker processes. If greater than one, tree processing,
+            FASTA parsing and per-chunk statistics run in parallel while
+            the main process remains the only writer of the storage.
+        repseq_format
+            Storage format of representative sequences. Either "table" or
+            "packed" to store nucleotides with two bits per base.
+        alignment_format
+            Storage format of alignments. Either "table", "matrix" to store
+            alignment in column chunks for fast retrieval of column regions
+            or "gap-rle" to store ungapped residues with run-length encoded
+            gaps.
         **kwargs
             Compatibility.
 
@@ -111,12 +135,21 @@ class DatabaseGTDB(
                 raise ValueError("`chunksize` must be greater than zero.")
         else:
             raise TypeError("`chunksize` must be integer.")
+        if repseq_format not in DATABASE_ELEMENT_ENCODINGS["sequence-representative"]:
+            raise ValueError("Invalid `repseq_format` provided.")
+        if alignment_format not in DATABASE_ELEMENT_ENCODINGS["sequence-aligned"]:
+            raise ValueError("Invalid `alignment_format` provided.")
+        tmp_worker_pool_context = parallel.make_worker_pool(workers)
 
         tmp_storage_manager = DatabaseStorageManager(
             hdf5_filepath=storage_hdf5_fp,
             storage_name=cls.DATABASE_NAME,
             force_new=force,
         )
+        tmp_storage_manager.set_element_encoding(
+            "sequence-representative", repseq_format
+        )
+        tmp_storage_manager.set_element_encoding("sequence-aligned", alignment_format)
 
         valid_ids = np.asarray(
             [
@@ -133,20 +166,31 @@ class DatabaseGTDB(
         cls.__process_acs(
             tmp_storage_manager, metadata_csv_fp, index_mapper, removed_rids
         )
-        cls.__process_tree(tmp_storage_manager, tree_newick_fp, index_mapper)
+        with tmp_worker_pool_context as tmp_worker_pool:
+            tmp_tree_future = cls.__process_tree(
+                tmp_storage_manager, tree_newick_fp, index_mapper, tmp_worker_pool
+            )
 
-        tmp_recap = cls.__process_sequence(
-            tmp_storage_manager,
-            index_mapper,
-            removed_rids,
-            tmp_recap,
-            sequence_fasta_fp,
-            chunksize,
-        )
+            tmp_recap = cls.__process_sequence(
+                tmp_storage_manager,
+                index_mapper,
+                removed_rids,
+                tmp_recap,
+                sequence_fasta_fp,
+                chunksize,
+                single_pass,
+                tmp_worker_pool,
+            )
 
-        tmp_storage_manager.commit_to_storage(
-            "stat-reps", transformer.produce_rep_stats(tmp_storage_manager, chunksize)
-        )
+            if tmp_tree_future is not None:
+                transformer.commit_tree_elements(tmp_storage_manager, tmp_tree_future)
+
+            tmp_storage_manager.commit_to_storage(
+                "stat-reps",
+                transformer.produce_rep_stats(
+                    tmp_storage_manager, chunksize, tmp_worker_pool, workers
+                ),
+            )
         tmp_storage_manager.commit_to_storage(
             "stat-taxs", transformer.produce_tax_stats(tmp_storage_manager, novel_tids)
         )
@@ -205,6 +249,16 @@ class DatabaseGTDB(
             yield None, None
             yield transformation_details["map-rep2tid"]
 
+        def produce_taxonomy_index(transformation_details):
+            """The *taxonomy-index* storage element producer function."""
+            yield None, None
+            yield tax_index.make_taxonomy_index(transformation_details["map-rep2tid"])
+
+        def produce_map_tid2rep(transformation_details):
+            """The *map-tid2rep* storage element producer function."""
+            yield None, None
+            yield tax_index.make_tid_rid_index(transformation_details["map-rep2tid"])
+
         full_taxonomy_prior = pd.concat(
             [read_qiime_taxonomy_map(tax_map_fp) for tax_map_fp in taxonomy_map_csv_fp],
             axis=0,
@@ -241,6 +295,12 @@ class DatabaseGTDB(
         storage_manager.commit_to_storage(
             "map-rep2tid", produce_map_rep2tid(transformation_details)
         )
+        storage_manager.commit_to_storage(
+            "taxonomy-index", produce_taxonomy_index(transformation_details)
+        )
+        storage_manager.commit_to_storage(
+            "map-tid2rep", produce_map_tid2rep(transformation_details)
+        )
         return (
             removed_rids,
             transformation_details["novel-tids"],
@@ -308,7 +368,8 @@ class DatabaseGTDB(
         storage_manager: DatabaseStorageManager,
         tree_newick_fp: str,
         index_mapper: pd.Series,
-    ):
+        worker_pool: Optional[Executor] = None,
+    ) -> Optional[Future]:
         """Process phylogenetic tree.
 
         Parameters
@@ -319,6 +380,15 @@ class DatabaseGTDB(
             Path to Newick tree
         index_mapper
             Index renamer/mapper
+        worker_pool
+            Process pool to run tree processing in. If provided, only
+            *tree-prior* is committed and the rest must be committed by
+            :func:`~pmaf.database._shared._assemblers.commit_tree_elements`
+
+        Returns
+        -------
+
+            Future of tree processing results if `worker_pool` is provided.
         """
         from ete3 import Tree
 
@@ -333,10 +403,10 @@ class DatabaseGTDB(
             tmp_tree = Tree(tree_newick_string, format=2)
             yield transformer.reparse_tree(tmp_tree, index_mapper)
 
-        def produce_tree_object(tree_newick_string):
-            """The *tree-object* storage element producer function."""
+        def produce_tree_array(tree_object):
+            """The *tree-array* storage element producer function."""
             yield None, None
-            yield Tree(tree_newick_string, format=2, quoted_node_names=True)
+            yield transformer.make_tree_arrays(tree_object)
 
         def produce_map_tree(tree_object):
             """The *map-tree* storage element producer function."""
@@ -351,11 +421,18 @@ class DatabaseGTDB(
         tmp_newick_string = storage_manager.commit_to_storage(
             "tree-prior", produce_tree_prior(merged_tree)
         )
+        if worker_pool is not None:
+            return worker_pool.submit(
+                transformer.assemble_tree_elements, tmp_newick_string, index_mapper, 2
+            )
         tmp_newick_parsed = storage_manager.commit_to_storage(
             "tree-parsed", produce_tree_parsed(tmp_newick_string, index_mapper)
         )
-        tmp_tree_object = storage_manager.commit_to_storage(
-            "tree-object", produce_tree_object(tmp_newick_parsed)
+        # Pickled *tree-object* is superseded by *tree-array* and no longer
+        # stored. Older storage files still load it as a fallback.
+        tmp_tree_object = Tree(tmp_newick_parsed, format=2, quoted_node_names=True)
+        storage_manager.commit_to_storage(
+            "tree-array", produce_tree_array(tmp_tree_object)
         )
         storage_manager.commit_to_storage("map-tree", produce_map_tree(tmp_tree_object))
 
@@ -370,6 +447,8 @@ class DatabaseGTDB(
         prior_recap: pd.Series,
         sequence_fasta_fp: str,
         chunksize: int,
+        single_pass: bool,
+        worker_pool: Optional[Executor] = None,
     ) -> pd.Series:
         """Process sequence data.
 
@@ -387,6 +466,10 @@ class DatabaseGTDB(
             Path to FASTA file
         chunksize
             Size of processing chunks
+        single_pass
+            Whether to parse FASTA files in single pass
+        worker_pool
+            If provided, FASTA files are parsed in separate process.
 
         Returns
         -------
@@ -398,9 +481,18 @@ class DatabaseGTDB(
         def produce_sequence_representative(
             sequence_fasta_fp, index_mapper, dropped_taxa, chunksize
         ):
-            sequence_parser = parse_qiime_sequence_generator(
-                sequence_fasta_fp, chunksize, False
-            )
+            if worker_pool is None:
+                sequence_parser = parse_qiime_sequence_generator(
+                    sequence_fasta_fp, chunksize, False, single_pass
+                )
+            else:
+                sequence_parser = parallel.iterate_in_process(
+                    parse_qiime_sequence_generator,
+                    sequence_fasta_fp,
+                    chunksize,
+                    False,
+                    single_pass,
+                )
             preparse_info, first_chunk = next(sequence_parser)
             yield preparse_info.copy()
             preparse_info["max_rows"] = preparse_info["max_rows"] - len(dropped_taxa)
@@ -444,6 +536,12 @@ class DatabaseGTDB(
             yield None, None
             yield interx_maker_result["map-interx-repseq"]
 
+        def produce_index_interx(interx_maker_result, interxmap_key):
+            yield None, None
+            yield interx_index.make_interx_index_arrays(
+                interx_maker_result[interxmap_key]
+            )
+
         tmp_interx_result = transformer.make_interxmaps(storage_manager)
         storage_manager.commit_to_storage(
             "map-interx-taxon", produce_map_interx_taxon(tmp_interx_result)
@@ -451,6 +549,14 @@ class DatabaseGTDB(
         storage_manager.commit_to_storage(
             "map-interx-repseq", produce_map_interx_repseq(tmp_interx_result)
         )
+        storage_manager.commit_to_storage(
+            "index-interx-taxon",
+            produce_index_interx(tmp_interx_result, "map-interx-taxon"),
+        )
+        storage_manager.commit_to_storage(
+            "index-interx-repseq",
+            produce_index_interx(tmp_interx_result, "map-interx-repseq"),
+        )
         return
 
     @property
@@ -6,6 +6,8 @@ from pmaf.database._core._phy_base import DatabasePhylogenyMixin
 from pmaf.database._core._acs_base import DatabaseAccessionMixin
 from pmaf.database._manager import DatabaseStorageManager
 import pmaf.database._shared._assemblers as transformer
+import pmaf.database._shared._tax_index as tax_index
+import pmaf.database._shared._interx_index as interx_index
 import pmaf.database._shared._summarizers as summarizer
 import pandas as pd
 import numpy as np
@@ -212,6 +214,16 @@ class DatabaseOTL(
             yield None, None
             yield transformation_details["map-rep2tid"]
 
+        def produce_taxonomy_index(transformation_details):
+            """The *taxonomy-index* storage element producer function."""
+            yield None, None
+            yield tax_index.make_taxonomy_index(transformation_details["map-rep2tid"])
+
+        def produce_map_tid2rep(transformation_details):
+            """The *map-tid2rep* storage element producer function."""
+            yield None, None
+            yield tax_index.make_tid_rid_index(transformation_details["map-rep2tid"])
+
         full_taxonomy_map = pd.read_csv(
             taxonomy_map_csv_fp,
             index_col="uid",
@@ -284,6 +296,12 @@ class DatabaseOTL(
         storage_manager.commit_to_storage(
             "map-rep2tid", produce_map_rep2tid(transformation_details)
         )
+        storage_manager.commit_to_storage(
+            "taxonomy-index", produce_taxonomy_index(transformation_details)
+        )
+        storage_manager.commit_to_storage(
+            "map-tid2rep", produce_map_tid2rep(transformation_details)
+        )
         return (
             removed_rids,
             transformation_details["novel-tids"],
@@ -323,9 +341,9 @@ class DatabaseOTL(
             tmp_tree = Tree(newick_string_parsed, format=8)
             yield transformer.reparse_tree(tmp_tree, index_mapper)
 
-        def produce_tree_object(tree_newick_string):
+        def produce_tree_array(tree_object):
             yield None, None
-            yield Tree(tree_newick_string, format=2, quoted_node_names=True)
+            yield transformer.make_tree_arrays(tree_object)
 
         def produce_map_tree(tree_object):
             yield None, None
@@ -338,8 +356,11 @@ class DatabaseOTL(
         tmp_newick_parsed = storage_manager.commit_to_storage(
             "tree-parsed", produce_tree_parsed(tmp_newick_string, index_mapper)
         )
-        tmp_tree_object = storage_manager.commit_to_storage(
-            "tree-object", produce_tree_object(tmp_newick_parsed)
+        # Pickled *tree-object* is superseded by *tree-array* and no longer
+        # stored. Older storage files still load it as a fallback.
+        tmp_tree_object = Tree(tmp_newick_parsed, format=2, quoted_node_names=True)
+        storage_manager.commit_to_storage(
+            "tree-array", produce_tree_array(tmp_tree_object)
         )
         storage_manager.commit_to_storage("map-tree", produce_map_tree(tmp_tree_object))
         return
@@ -362,6 +383,12 @@ class DatabaseOTL(
             yield None, None
             yield interx_maker_result["map-interx-repseq"]
 
+        def produce_index_interx(interx_maker_result, interxmap_key):
+            yield None, None
+            yield interx_index.make_interx_index_arrays(
+                interx_maker_result[interxmap_key]
+            )
+
         tmp_interx_result = transformer.make_interxmaps(storage_manager)
         storage_manager.commit_to_storage(
             "map-interx-taxon", produce_map_interx_taxon(tmp_interx_result)
@@ -369,6 +396,14 @@ class DatabaseOTL(
         storage_manager.commit_to_storage(
             "map-interx-repseq", produce_map_interx_repseq(tmp_interx_result)
         )
+        storage_manager.commit_to_storage(
+            "index-interx-taxon",
+            produce_index_interx(tmp_interx_result, "map-interx-taxon"),
+        )
+        storage_manager.commit_to_storage(
+            "index-interx-repseq",
+            produce_index_interx(tmp_interx_result, "map-interx-repseq"),
+        )
         return
 
     @property
@@ -4,11 +4,16 @@ from pmaf.database._core._tax_base import DatabaseTaxonomyMixin
 from pmaf.database._core._seq_base import DatabaseSequenceMixin
 from pmaf.database._core._acs_base import DatabaseAccessionMixin
 from pmaf.database._manager import DatabaseStorageManager
+from pmaf.database._shared._common import DATABASE_ELEMENT_ENCODINGS
 import pmaf.database._shared._assemblers as transformer
+import pmaf.database._shared._tax_index as tax_index
+import pmaf.database._shared._interx_index as interx_index
 import pmaf.database._shared._summarizers as summarizer
+import pmaf.database._shared._parallel as parallel
 import numpy as np
 import pandas as pd
-from typing import Any, Tuple
+from typing import Any, Tuple, Optional
+from concurrent.futures import Executor
 from pmaf.internal._typing import AnyGenericIdentifier
 
 
@@ -30,6 +35,9 @@ class DatabaseUNITE(
         stamp_dict: dict,
         force: bool = False,
         chunksize: int = 500,
+        single_pass: bool = True,
+        workers: int = 1,
+        repseq_format: str = "table",
         **kwargs: Any
     ):
         """Factory method to build new database :term:`hdf5`
@@ -49,6 +57,16 @@ class DatabaseUNITE(
         chunksize
             Sequence/Alignment data processing chunk size. Longer chunks are
             faster to process but require more memory.
+        single_pass
+            Parse sequence FASTA files only once and get storage column
+            widths from lightweight pre-scan. Set to False to use legacy two-pass parsing.
+        workers
+            Number of worker processes. If greater than one, tree processing,
+            FASTA parsing and per-chunk statistics run in parallel while
+            the main process remains the only writer of the storage.
+        repseq_format
+            Storage format of representative sequences. Either "table" or
+            "packed" to store nucleotides with two bits per base.
         **kwargs
             Compatibility.
 
@@ -68,29 +86,41 @@ class DatabaseUNITE(
                 raise ValueError("`chunksize` must be greater than zero.")
         else:
             raise TypeError("`chunksize` must be integer.")
+        if repseq_format not in DATABASE_ELEMENT_ENCODINGS["sequence-representative"]:
+            raise ValueError("Invalid `repseq_format` provided.")
+        tmp_worker_pool_context = parallel.make_worker_pool(workers)
 
         tmp_storage_manager = DatabaseStorageManager(
             hdf5_filepath=storage_hdf5_fp,
             storage_name=cls.DATABASE_NAME,
             force_new=force,
         )
+        tmp_storage_manager.set_element_encoding(
+            "sequence-representative", repseq_format
+        )
 
         removed_rids, novel_tids, index_mapper, tmp_recap = cls.__process_tax_acs_map(
             tmp_storage_manager, taxonomy_map_csv_fp
         )
 
-        tmp_recap = cls.__process_sequence(
-            tmp_storage_manager,
-            index_mapper,
-            removed_rids,
-            tmp_recap,
-            sequence_fasta_fp,
-            chunksize,
-        )
+        with tmp_worker_pool_context as tmp_worker_pool:
+            tmp_recap = cls.__process_sequence(
+                tmp_storage_manager,
+                index_mapper,
+                removed_rids,
+                tmp_recap,
+                sequence_fasta_fp,
+                chunksize,
+                single_pass,
+                tmp_worker_pool,
+            )
 
-        tmp_storage_manager.commit_to_storage(
-            "stat-reps", transformer.produce_rep_stats(tmp_storage_manager, chunksize)
-        )
+            tmp_storage_manager.commit_to_storage(
+                "stat-reps",
+                transformer.produce_rep_stats(
+                    tmp_storage_manager, chunksize, tmp_worker_pool, workers
+                ),
+            )
         tmp_storage_manager.commit_to_storage(
             "stat-taxs", transformer.produce_tax_stats(tmp_storage_manager, novel_tids)
         )
@@ -163,6 +193,16 @@ class DatabaseUNITE(
             yield None, None
             yield transformation_details["map-rep2tid"]
 
+        def produce_taxonomy_index(transformation_details):
+            """The *taxonomy-index* storage element producer function."""
+            yield None, None
+            yield tax_index.make_taxonomy_index(transformation_details["map-rep2tid"])
+
+        def produce_map_tid2rep(transformation_details):
+            """The *map-tid2rep* storage element producer function."""
+            yield None, None
+            yield tax_index.make_tid_rid_index(transformation_details["map-rep2tid"])
+
         tmp_taxonomy_prior = read_qiime_taxonomy_map(taxonomy_map_csv_fp)
         index_mapper = transformer.make_rid_index_mapper(tmp_taxonomy_prior.index)
         taxonomy_prior = storage_manager.commit_to_storage(
@@ -198,6 +238,12 @@ class DatabaseUNITE(
         storage_manager.commit_to_storage(
             "map-rep2tid", produce_map_rep2tid(transformation_details)
         )
+        storage_manager.commit_to_storage(
+            "taxonomy-index", produce_taxonomy_index(transformation_details)
+        )
+        storage_manager.commit_to_storage(
+            "map-tid2rep", produce_map_tid2rep(transformation_details)
+        )
         return (
             removed_rids,
             transformation_details["novel-tids"],
@@ -214,6 +260,8 @@ class DatabaseUNITE(
         prior_recap: pd.Series,
         sequence_fasta_fp: str,
         chunksize: int,
+        single_pass: bool,
+        worker_pool: Optional[Executor] = None,
     ) -> pd.Series:
         """Process sequences.
 
@@ -231,6 +279,10 @@ class DatabaseUNITE(
             Path to sequence FASTA file
         chunksize
             Size of sequence processing chunks
+        single_pass
+            Whether to parse FASTA files in single pass
+        worker_pool
+            If provided, FASTA files are parsed in separate process.
 
         Returns
         -------
@@ -244,9 +296,18 @@ class DatabaseUNITE(
         ):
             """The *sequence-representative* storage element producer
             function."""
-            sequence_parser = parse_qiime_sequence_generator(
-                sequence_fasta_fp, chunksize, False
-            )
+            if worker_pool is None:
+                sequence_parser = parse_qiime_sequence_generator(
+                    sequence_fasta_fp, chunksize, False, single_pass
+                )
+            else:
+                sequence_parser = parallel.iterate_in_process(
+                    parse_qiime_sequence_generator,
+                    sequence_fasta_fp,
+                    chunksize,
+                    False,
+                    single_pass,
+                )
             preparse_info, first_chunk = next(sequence_parser)
             yield preparse_info.copy()
             preparse_info["max_rows"] = preparse_info["max_rows"] - len(dropped_taxa)
@@ -295,6 +356,14 @@ class DatabaseUNITE(
             yield None, None
             yield interx_maker_result["map-interx-repseq"]
 
+        def produce_index_interx(interx_maker_result, interxmap_key):
+            """The *index-interx-taxon* and *index-interx-repseq* storage
+            element producer function."""
+            yield None, None
+            yield interx_index.make_interx_index_arrays(
+                interx_maker_result[interxmap_key]
+            )
+
         tmp_interx_result = transformer.make_interxmaps(storage_manager)
         storage_manager.commit_to_storage(
             "map-interx-taxon", produce_map_interx_taxon(tmp_interx_result)
@@ -302,6 +371,14 @@ class DatabaseUNITE(
         storage_manager.commit_to_storage(
             "map-interx-repseq", produce_map_interx_repseq(tmp_interx_result)
         )
+        storage_manager.commit_to_storage(
+            "index-interx-taxon",
+            produce_index_interx(tmp_interx_result, "map-interx-taxon"),
+        )
+        storage_manager.commit_to_storage(
+            "index-interx-repseq",
+            produce_index_interx(tmp_interx_result, "map-interx-repseq"),
+        )
         return
 
     @property
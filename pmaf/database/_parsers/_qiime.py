@@ -1,13 +1,18 @@
 import os
 import pandas as pd
 import numpy as np
-from itertools import chain
 from pmaf.internal._extensions._cpython._pmafc_extension._helper import (
     make_sequence_record_tuple,
 )
 from pmaf.internal.io._seq import SequenceIO
+from pmaf.internal._shared import pivot_ranked_taxa
 from typing import Generator, Tuple, Union
 
+# Code points stripped by :meth:`str.strip`.
+WHITESPACE_CODE_POINTS = np.asarray(
+    [point for point in range(0x3001) if chr(point).isspace()], dtype=np.uint32
+)
+
 
 def read_qiime_taxonomy_map(taxonomy_tsv_fp: str) -> pd.Series:
     """Reads taxonomy file in QIIME/Greengenes notation.
@@ -37,7 +42,9 @@ def read_qiime_taxonomy_map(taxonomy_tsv_fp: str) -> pd.Series:
         raise FileNotFoundError("Given file does not exists.")
 
 
-def parse_qiime_taxonomy_map(taxonomy_map_df: pd.DataFrame) -> pd.DataFrame:
+def parse_qiime_taxonomy_map(
+    taxonomy_map_df: pd.DataFrame, chunksize: int = 100000
+) -> pd.DataFrame:
     """Parse taxonomy :class:`~pandas.DataFrame` in QIIME/Greengenes notation.
     Result produce class:`~pandas.DataFrame` where taxa are reorganized into ordered but unvalidated ranks.
 
@@ -45,8 +52,8 @@ def parse_qiime_taxonomy_map(taxonomy_map_df: pd.DataFrame) -> pd.DataFrame:
     ----------
     taxonomy_map_df :
         :class:`~pandas.DataFrame` with taxonomy data.
-    taxonomy_map_df: pd.DataFrame :
-
+    chunksize :
+        Number of lineages that are split at once.
 
     Returns
     -------
@@ -59,90 +66,168 @@ def parse_qiime_taxonomy_map(taxonomy_map_df: pd.DataFrame) -> pd.DataFrame:
     if taxonomy_map_df.empty or (taxonomy_map_df.shape[1] != 1):
         raise ValueError("DataFrame cannot be empty.")
     taxonomy_map = taxonomy_map_df.iloc[:, 0]
-    zip_list = list(
-        chain(
-            *taxonomy_map.map(
-                lambda lineage: [
-                    e.strip().split("__")[0] for e in lineage.split(";") if ("__" in e)
-                ]
-            )
-            .ravel()
-            .tolist()
+    tmp_lineages = taxonomy_map.astype(str).tolist()
+    tmp_element_rows = []
+    tmp_element_ranks = []
+    tmp_element_taxa = []
+    for chunk_start in range(0, len(tmp_lineages), chunksize):
+        tmp_rows, tmp_ranks, tmp_taxa = _split_lineage_elements(
+            tmp_lineages[chunk_start : chunk_start + chunksize]
         )
+        tmp_element_rows.append(tmp_rows + chunk_start)
+        tmp_element_ranks.extend(tmp_ranks)
+        tmp_element_taxa.extend(tmp_taxa)
+    found_levels, tmp_sheet_values = pivot_ranked_taxa(
+        np.concatenate(tmp_element_rows),
+        tmp_element_ranks,
+        tmp_element_taxa,
+        len(tmp_lineages),
+    )
+    return pd.DataFrame(
+        index=list(taxonomy_map.index),
+        data=dict(zip(found_levels, tmp_sheet_values)),
+        columns=found_levels,
+        dtype=object,
     )
 
-    def get_unique(zip_list):
-        """Get unique values.
-
-        Parameters
-        ----------
-        zip_list :
-
-
-        Returns
-        -------
-
-        """
-        seen = set()
-        seen_add = seen.add
-        return [x for x in zip_list if not (x in seen or seen_add(x))]
 
-    found_levels = get_unique(zip_list)
+def _split_lineage_elements(lineages):
+    """Split lineages in QIIME/Greengenes notation into ranked elements.
 
-    def allocator(lineage, levels):  # TODO: No need for vectorization, make a Cython
-        """
+    Lineages are joined into single string and delimiters are located on its
+    code points with :mod:`numpy`. Elements are separated by ";" and stripped
+    from whitespace. Rank of element is the text before first "__" and taxon
+    is the text between first and second "__". Elements without "__" are
+    skipped.
 
-        Parameters
-        ----------
-        lineage :
+    Parameters
+    ----------
+    lineages
+        List of lineage strings.
 
-        levels :
+    Returns
+    -------
+        Tuple with lineage positions of elements, list of ranks and list of
+        taxa where empty taxa are None.
+    """
+    tmp_joined = ";".join(lineages)
+    tmp_points = np.frombuffer(tmp_joined.encode("utf-32-le"), dtype=np.uint32)
+    tmp_total_points = tmp_points.shape[0]
+    tmp_delimiters = np.flatnonzero(tmp_points == 59)
+    tmp_starts = np.concatenate([[0], tmp_delimiters + 1])
+    tmp_stops = np.append(tmp_delimiters, tmp_total_points)
+    tmp_lineage_starts = np.cumsum([0] + [len(lineage) + 1 for lineage in lineages])
+    tmp_rows = np.searchsorted(tmp_lineage_starts, tmp_starts, side="right") - 1
+    # Bounds of elements stripped from whitespace.
+    tmp_solid = np.flatnonzero(~np.isin(tmp_points, WHITESPACE_CODE_POINTS))
+    tmp_solid = np.append(tmp_solid, tmp_total_points)
+    tmp_starts = tmp_solid[np.searchsorted(tmp_solid, tmp_starts)]
+    tmp_stops = tmp_solid[(np.searchsorted(tmp_solid, tmp_stops) - 1).clip(0)] + 1
+    # Positions of non-overlapping "__" separators.
+    tmp_underscores = tmp_points == 95
+    tmp_separators = np.flatnonzero(tmp_underscores[:-1] & tmp_underscores[1:])
+    tmp_separators = np.append(tmp_separators, tmp_total_points)
+    tmp_rank_stops = tmp_separators[np.searchsorted(tmp_separators, tmp_starts)]
+    tmp_valid = tmp_rank_stops + 2 <= tmp_stops
+    tmp_rows = tmp_rows[tmp_valid]
+    tmp_starts = tmp_starts[tmp_valid]
+    tmp_stops = tmp_stops[tmp_valid]
+    tmp_rank_stops = tmp_rank_stops[tmp_valid]
+    tmp_taxon_stops = tmp_separators[
+        np.searchsorted(tmp_separators, tmp_rank_stops + 2)
+    ]
+    tmp_taxon_stops = np.where(
+        tmp_taxon_stops + 2 <= tmp_stops, tmp_taxon_stops, tmp_stops
+    )
+    tmp_ranks = [
+        tmp_joined[start:stop]
+        for start, stop in zip(tmp_starts.tolist(), tmp_rank_stops.tolist())
+    ]
+    tmp_taxa = [
+        tmp_joined[start:stop] if start < stop else None
+        for start, stop in zip((tmp_rank_stops + 2).tolist(), tmp_taxon_stops.tolist())
+    ]
+    return tmp_rows, tmp_ranks, tmp_taxa
 
 
-        Returns
-        -------
+def scan_fasta_dimensions(sequence_fasta_fp: str, blocksize: int = 2**22) -> dict:
+    """Lightweight pre-scan of FASTA file that collects the dimensions required
+    for the storage column widths without constructing sequence records.
 
-        """
-        #  function instead or think about something else.
-        """Function to parse individual taxonomic consensus lineage in
-        QIIME/Greengenes notation. Vectorization in this case does not provide speed
-        boost, I assumed it did back in the day."""
+    File is read as raw bytes in blocks of whole lines and sequence lengths are
+    counted with :mod:`numpy` from newline positions. Carriage returns and spaces
+    are not counted, same as in :mod:`Bio.SeqIO`.
 
-        taxa_dict = {
-            e[0]: e[1]
-            for e in [e.strip().split("__") for e in lineage.split(";") if ("__" in e)]
-        }  # Anonymous function that explodes lineage into dictionary
-        taxa_dict_allowed = {
-            rank: taxa_dict[rank] for rank in taxa_dict.keys() if rank in levels
-        }  # Drops forbidden ranks
-        # Following loop sets unavailable ranks to '', which is necessary for generating taxonomy sheet
-        for key in levels:
-            if not (key in taxa_dict_allowed.keys()):
-                taxa_dict_allowed[key] = ""
-        taxa_list_ordered = [
-            taxa_dict_allowed[rank] for rank in levels
-        ]  # Sort ranks according to Consts.MAIN_RANKS rank order
-        return taxa_list_ordered
+    Parameters
+    ----------
+    sequence_fasta_fp
+        Path to sequence data in FASTA format
+    blocksize
+        Approximate size of raw blocks in bytes.
 
-    allocator_vectorized = np.vectorize(
-        allocator, excluded=["levels"], otypes=[list]
-    )  # Vectorizes function in order gain performance
-    master_taxonomy_sheet = pd.DataFrame(
-        index=list(taxonomy_map.index),
-        data=list(
-            allocator_vectorized(lineage=list(taxonomy_map.values), levels=found_levels)
-        ),
-        columns=found_levels,
-    )
-    return master_taxonomy_sheet.applymap(
-        lambda x: None if (x == "" or pd.isna(x)) else x
-    )
+    Returns
+    -------
+        Dictionary with keys `sequence`(maximum length), `min_sequence`(minimum length)
+        and `max_rows`(total records).
+    """
+    record_lengths = []
+    open_length = 0  # Length of the record that continues into next block
+    record_open = False
+    with open(sequence_fasta_fp, "rb") as fasta_file:
+        while True:
+            block = fasta_file.read(blocksize)
+            if not block:
+                break
+            block = block + fasta_file.readline()  # Complete the last line
+            block_array = np.frombuffer(block, dtype=np.uint8)
+            line_ends = np.flatnonzero(block_array == 10)
+            if len(line_ends) == 0 or line_ends[-1] != len(block_array) - 1:
+                line_ends = np.append(line_ends, len(block_array))
+            line_starts = np.concatenate(([0], line_ends[:-1] + 1))
+            header_lines = block_array[line_starts] == 62  # Lines starting with ">"
+            ignored_positions = np.flatnonzero(
+                (block_array == 13) | (block_array == 32)
+            )  # Carriage returns and spaces
+            line_lengths = (line_ends - line_starts) - np.bincount(
+                np.searchsorted(line_starts, ignored_positions, side="right") - 1,
+                minlength=len(line_starts),
+            )
+            line_records = np.cumsum(header_lines)
+            total_headers = int(line_records[-1])
+            block_lengths = np.bincount(
+                line_records[~header_lines],
+                weights=line_lengths[~header_lines],
+                minlength=total_headers + 1,
+            ).astype(np.int64)
+            if total_headers > 0:
+                if record_open:
+                    record_lengths.append([open_length + block_lengths[0]])
+                record_lengths.append(block_lengths[1:total_headers])
+                open_length = block_lengths[total_headers]
+                record_open = True
+            elif record_open:
+                open_length = open_length + block_lengths[0]
+    if record_open:
+        record_lengths.append([open_length])
+    max_seq_length = 0
+    min_seq_length = 99999  # Assuming no marker sequence can be longer than this
+    max_rows = 0
+    if len(record_lengths) > 0:
+        record_lengths = np.concatenate(record_lengths)
+        max_seq_length = int(record_lengths.max())
+        min_seq_length = int(record_lengths.min())
+        max_rows = len(record_lengths)
+    return {
+        "sequence": max_seq_length,
+        "min_sequence": min_seq_length,
+        "max_rows": max_rows,
+    }
 
 
 # TODO:  Generating two products with different sizes are not good solution.
 #  Improve the generator to keep products consistent.
 def parse_qiime_sequence_generator(
-    sequence_fasta_fp: str, chunk_size: int, alignment: bool
+    sequence_fasta_fp: str, chunk_size: int, alignment: bool, single_pass: bool = True
 ) -> Generator[Union[Tuple[dict, pd.DataFrame], pd.DataFrame], None, None]:
     """Parser for sequence/alignment data in FASTA format provided in QIIME-styled databases.
 
@@ -154,29 +239,47 @@ def parse_qiime_sequence_generator(
         Chunk size to generate chunk :class:`~pandas.DataFrame`.
     alignment :
         True if MSA are supplied.
+    single_pass :
+        If True(default) FASTA records are parsed only once and column widths
+        are obtained from :func:`scan_fasta_dimensions` pre-scan. If False the
+        file is fully parsed twice, first to get dimensions and then to produce chunks.
     sequence_fasta_fp: str :
 
     chunk_size: int :
 
     alignment: bool :
 
+    single_pass: bool :
+
 
     Returns
     -------
 
     """
     seqio = SequenceIO(sequence_fasta_fp, ftype="fasta", upper=True)
-    max_seq_length = 0
-    min_seq_length = 99999  # Assuming no marker sequence can be longer than this
-    max_id_length = 0
-    max_rows = 0
-    for s_id, s_seq in seqio.pull_parser(id=True, description=False, sequence=True):
-        seq_length = len(s_seq)
-        id_length = len(str(s_id))
-        max_seq_length = seq_length if seq_length > max_seq_length else max_seq_length
-        min_seq_length = seq_length if seq_length < min_seq_length else min_seq_length
-        max_id_length = id_length if id_length > max_id_length else max_id_length
-        max_rows = max_rows + 1
+    if single_pass:
+        pre_state_dict = scan_fasta_dimensions(sequence_fasta_fp)
+    else:
+        max_seq_length = 0
+        min_seq_length = 99999  # Assuming no marker sequence can be longer than this
+        max_id_length = 0
+        max_rows = 0
+        for s_id, s_seq in seqio.pull_parser(id=True, description=False, sequence=True):
+            seq_length = len(s_seq)
+            id_length = len(str(s_id))
+            max_seq_length = (
+                seq_length if seq_length > max_seq_length else max_seq_length
+            )
+            min_seq_length = (
+                seq_length if seq_length < min_seq_length else min_seq_length
+            )
+            max_id_length = id_length if id_length > max_id_length else max_id_length
+            max_rows = max_rows + 1
+        pre_state_dict = {
+            "sequence": max_seq_length,
+            "min_sequence": min_seq_length,
+            "max_rows": max_rows,
+        }
     seq_iterator = seqio.pull_parser(id=True, description=False, sequence=True)
     chunk_counter = chunk_size
     next_chunk = True
@@ -208,11 +311,6 @@ def parse_qiime_sequence_generator(
                 chunk_df = chunk_df.astype({"length": "int32", "tab": "int32"})
             if first_chunk:
                 first_chunk = False
-                pre_state_dict = {
-                    "sequence": max_seq_length,
-                    "min_sequence": min_seq_length,
-                    "max_rows": max_rows,
-                }
                 yield pre_state_dict, chunk_df
             else:
                 yield chunk_df
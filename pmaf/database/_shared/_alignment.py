@@ -0,0 +1,702 @@
+import numpy as np
+import pandas as pd
+import tables
+from pmaf.database._shared._packed import (
+    get_row_coordinates,
+    get_row_runs,
+    create_packed_element,
+    append_packed_chunk,
+    read_packed_metadata,
+    read_packed_rows,
+)
+
+# Characters that are treated as alignment gaps.
+ALIGNMENT_GAP_CHARS = b"-."
+_GAP_CODES = np.frombuffer(ALIGNMENT_GAP_CHARS, dtype=np.uint8)
+# Column and row extent of alignment matrix chunks. Column regions are read
+# only from chunks that overlap them.
+MATRIX_CHUNK_COLUMNS = 1024
+MATRIX_CHUNK_ROWS = 64
+# Prefix of arrays with additional numeric columns of the alignment table.
+ALIGNMENT_COLUMN_PREFIX = "column_"
+# Upper limit of chunk size of one-dimensional element arrays.
+MAX_CHUNK_BYTES = 2**16
+
+
+def alignment_to_matrix(sequences):
+    """Convert aligned sequences into character matrix.
+
+    Parameters
+    ----------
+    sequences
+        List of aligned sequence strings of same width.
+
+    Returns
+    -------
+        :class:`~numpy.ndarray` of :class:`~numpy.uint8` with one row per
+        sequence.
+    """
+    tmp_widths = set(map(len, sequences))
+    if len(tmp_widths) > 1:
+        raise ValueError("Aligned sequences must have same width.")
+    tmp_width = tmp_widths.pop() if len(tmp_widths) else 0
+    return np.frombuffer("".join(sequences).encode("ascii"), dtype=np.uint8).reshape(
+        len(sequences), tmp_width
+    )
+
+
+def matrix_to_alignment(matrix):
+    """Convert character matrix into aligned sequences.
+
+    Parameters
+    ----------
+    matrix
+        :class:`~numpy.ndarray` of :class:`~numpy.uint8` with one row per
+        sequence.
+
+    Returns
+    -------
+        List of aligned sequence strings.
+    """
+    tmp_width = matrix.shape[1]
+    if tmp_width == 0:
+        return [""] * matrix.shape[0]
+    tmp_buffer = np.ascontiguousarray(matrix).tobytes()
+    return [
+        tmp_buffer[start : start + tmp_width].decode("ascii")
+        for start in range(0, len(tmp_buffer), tmp_width)
+    ]
+
+
+def slice_alignment_frame(alignment_df, region):
+    """Keep only alignment columns within `region`
+
+    Parameters
+    ----------
+    alignment_df
+        :class:`~pandas.DataFrame` with `sequence` column of aligned sequences.
+    region
+        :class:`slice` of alignment columns.
+
+    Returns
+    -------
+        :class:`~pandas.DataFrame` with sliced sequences. Column `length` is
+        updated to new width if present.
+    """
+    product = alignment_df.copy()
+    product["sequence"] = product["sequence"].str[region]
+    if "length" in product.columns:
+        product["length"] = (
+            product["sequence"].str.len().astype(alignment_df["length"].dtype)
+        )
+    return product
+
+
+def drop_gap_columns(alignment_df):
+    """Drop alignment columns that contain only gaps.
+
+    Parameters
+    ----------
+    alignment_df
+        :class:`~pandas.DataFrame` with `sequence` column of aligned sequences.
+
+    Returns
+    -------
+        :class:`~pandas.DataFrame` without all-gap columns. Column `length` is
+        updated to new width if present.
+    """
+    tmp_matrix = alignment_to_matrix(alignment_df["sequence"].tolist())
+    tmp_residue_columns = ~np.isin(tmp_matrix, _GAP_CODES).all(axis=0)
+    product = alignment_df.copy()
+    product["sequence"] = matrix_to_alignment(tmp_matrix[:, tmp_residue_columns])
+    if "length" in product.columns:
+        product["length"] = np.asarray(
+            tmp_residue_columns.sum(), dtype=alignment_df["length"].dtype
+        )
+    return product
+
+
+def drop_gap_buffer_columns(buffer, offsets):
+    """Drop alignment columns that contain only gaps from character buffer.
+
+    Parameters
+    ----------
+    buffer
+        :class:`~numpy.ndarray` of uint8 character codes of aligned
+        sequences of same width.
+    offsets
+        Offsets of sequences within `buffer` with one extra element.
+
+    Returns
+    -------
+        Tuple of (new `buffer`, new `offsets`).
+    """
+    tmp_rows = offsets.shape[0] - 1
+    if tmp_rows == 0:
+        return buffer, offsets
+    tmp_matrix = buffer.reshape(tmp_rows, -1)
+    tmp_matrix = tmp_matrix[:, ~np.isin(tmp_matrix, _GAP_CODES).all(axis=0)]
+    return (
+        tmp_matrix.reshape(-1),
+        np.arange(tmp_rows + 1, dtype=np.int64) * tmp_matrix.shape[1],
+    )
+
+
+def _create_row_arrays(hdf5_file, element_group, first_chunk, expectedrows):
+    """Create arrays of index and numeric columns of alignment element."""
+    tmp_extra_columns = [
+        column for column in first_chunk.columns if column != "sequence"
+    ]
+    for column in tmp_extra_columns:
+        if not (
+            pd.api.types.is_numeric_dtype(first_chunk[column])
+            or pd.api.types.is_bool_dtype(first_chunk[column])
+        ):
+            raise TypeError(
+                "Alignment element supports only numeric columns besides `sequence`."
+            )
+    tmp_array_atoms = {"index": tables.Int64Atom()}
+    for column in tmp_extra_columns:
+        tmp_array_atoms[ALIGNMENT_COLUMN_PREFIX + column] = tables.Atom.from_dtype(
+            first_chunk[column].dtype
+        )
+    for array_name, array_atom in tmp_array_atoms.items():
+        _create_earray(hdf5_file, element_group, array_name, array_atom, expectedrows)
+    element_group._v_attrs.columns = list(first_chunk.columns)
+    return
+
+
+def _create_earray(hdf5_file, element_group, array_name, array_atom, expectedrows):
+    """Create one-dimensional array with chunks sized by `expectedrows`"""
+    return hdf5_file.create_earray(
+        element_group,
+        array_name,
+        atom=array_atom,
+        shape=(0,),
+        title=array_name,
+        expectedrows=expectedrows,
+        chunkshape=(int(np.clip(expectedrows, 1, MAX_CHUNK_BYTES // array_atom.size)),),
+    )
+
+
+def _append_row_arrays(element_group, chunk):
+    """Append index and numeric columns of `chunk` to alignment element."""
+    if list(chunk.columns) != list(element_group._v_attrs.columns):
+        raise ValueError("Chunk columns do not match alignment element.")
+    element_group.index.append(chunk.index.values.astype(np.int64))
+    for column in chunk.columns:
+        if column != "sequence":
+            element_group._f_get_child(ALIGNMENT_COLUMN_PREFIX + column).append(
+                chunk[column].values
+            )
+    return
+
+
+def _read_row_arrays(element_group):
+    """Read index and numeric columns of alignment element."""
+    tmp_columns = list(element_group._v_attrs.columns)
+    metadata = {"index": element_group.index.read()}
+    for column in tmp_columns:
+        if column != "sequence":
+            metadata[ALIGNMENT_COLUMN_PREFIX + column] = element_group._f_get_child(
+                ALIGNMENT_COLUMN_PREFIX + column
+            ).read()
+    metadata["columns"] = tmp_columns
+    return metadata
+
+
+def _make_row_frame(metadata, rows, columns, sequences, region_width=None):
+    """Assemble retrieved rows in same layout as table element."""
+    product = {}
+    for column in columns:
+        if column == "sequence":
+            product[column] = sequences
+        else:
+            product[column] = metadata[ALIGNMENT_COLUMN_PREFIX + column][rows]
+    if region_width is not None and "length" in product:
+        product["length"] = np.full(
+            len(rows), region_width, dtype=product["length"].dtype
+        )
+    return pd.DataFrame(
+        product,
+        index=pd.Index(metadata["index"][rows], name="index"),
+        columns=columns,
+    )
+
+
+def _get_region_columns(region, width):
+    """Convert `region` into :class:`range` of alignment columns."""
+    return range(*(region if region is not None else slice(None)).indices(width))
+
+
+def create_matrix_element(hdf5_file, element_path, first_chunk, expectedrows):
+    """Create arrays of column-chunked alignment element and store
+    `first_chunk`.
+
+    Parameters
+    ----------
+    hdf5_file
+        :mod:`tables` file opened for writing.
+    element_path
+        Path of existing element group.
+    first_chunk
+        :class:`~pandas.DataFrame` with `sequence` column and optional
+        numeric columns.
+    expectedrows
+        Expected total number of rows.
+
+    Returns
+    -------
+        Element group node.
+    """
+    tmp_group = hdf5_file.get_node(element_path)
+    _create_row_arrays(hdf5_file, tmp_group, first_chunk, expectedrows)
+    tmp_width = alignment_to_matrix(first_chunk["sequence"].iloc[:1].tolist()).shape[1]
+    hdf5_file.create_earray(
+        tmp_group,
+        "matrix",
+        atom=tables.UInt8Atom(),
+        shape=(0, tmp_width),
+        title="matrix",
+        expectedrows=expectedrows,
+        chunkshape=(
+            int(np.clip(expectedrows, 1, MATRIX_CHUNK_ROWS)),
+            int(np.clip(tmp_width, 1, MATRIX_CHUNK_COLUMNS)),
+        ),
+    )
+    append_matrix_chunk(tmp_group, first_chunk)
+    return tmp_group
+
+
+def append_matrix_chunk(element_group, chunk):
+    """Append alignment `chunk` to column-chunked alignment element.
+
+    Parameters
+    ----------
+    element_group
+        Element group node created by :func:`.create_matrix_element`
+    chunk
+        :class:`~pandas.DataFrame` with same columns as first chunk.
+    """
+    tmp_matrix = alignment_to_matrix(chunk["sequence"].tolist())
+    if tmp_matrix.shape[1] != element_group.matrix.shape[1]:
+        raise ValueError("Aligned sequences must have same width.")
+    _append_row_arrays(element_group, chunk)
+    element_group.matrix.append(tmp_matrix)
+    return
+
+
+def read_matrix_metadata(element_group):
+    """Read all arrays of column-chunked alignment element except matrix.
+
+    Parameters
+    ----------
+    element_group
+        Element group node of alignment matrix.
+
+    Returns
+    -------
+        Dictionary with arrays, `columns` list of original table and `width`
+        of alignment.
+    """
+    metadata = _read_row_arrays(element_group)
+    metadata["width"] = element_group.matrix.shape[1]
+    return metadata
+
+
+def _read_matrix(element_group, rows, region_columns):
+    """Read character matrix of `rows` within `region_columns`"""
+    # Matrix is read once per run of consecutive rows and only within
+    # `region` so that chunks outside of it are not touched.
+    tmp_column_slice = slice(
+        region_columns.start, region_columns.stop, region_columns.step
+    )
+    tmp_matrix = [
+        element_group.matrix[first_row : last_row + 1, tmp_column_slice]
+        for first_row, last_row in get_row_runs(rows)
+    ]
+    return (
+        np.concatenate(tmp_matrix)
+        if tmp_matrix
+        else np.empty((0, len(region_columns)), dtype=np.uint8)
+    )
+
+
+def read_matrix_rows(element_group, metadata, rows=None, columns=None, region=None):
+    """Read rows of column-chunked alignment element into table.
+
+    Parameters
+    ----------
+    element_group
+        Element group node of alignment matrix.
+    metadata
+        Arrays returned by :func:`.read_matrix_metadata`
+    rows
+        Row coordinates, :class:`slice` or None for all rows.
+    columns
+        Target columns or None for all columns.
+    region
+        :class:`slice` of alignment columns or None for whole alignment.
+
+    Returns
+    -------
+        :class:`~pandas.DataFrame` in same layout as table element.
+    """
+    rows = get_row_coordinates(rows, metadata["index"].shape[0])
+    tmp_columns = metadata["columns"] if columns is None else list(columns)
+    tmp_region = _get_region_columns(region, metadata["width"])
+    tmp_sequences = None
+    if "sequence" in tmp_columns:
+        tmp_sequences = matrix_to_alignment(
+            _read_matrix(element_group, rows, tmp_region)
+        )
+    return _make_row_frame(
+        metadata,
+        rows,
+        tmp_columns,
+        tmp_sequences,
+        len(tmp_region) if region is not None else None,
+    )
+
+
+def encode_gap_runs(matrix):
+    """Encode gaps of alignment character matrix as runs over shared column
+    map.
+
+    Columns where all rows have the first gap character are excluded by the
+    column map. Remaining columns of every row are split into runs of
+    residues or same gap character.
+
+    Parameters
+    ----------
+    matrix
+        :class:`~numpy.ndarray` of :class:`~numpy.uint8` with one row per
+        sequence.
+
+    Returns
+    -------
+        Dictionary with `column_map` boolean array of mapped columns,
+        `run_counts` per row, `run_lengths` and `run_codes` arrays and
+        `residues` list of ungapped sequences. Run code is zero for
+        residues or gap character otherwise.
+    """
+    tmp_column_map = ~(matrix == _GAP_CODES[0]).all(axis=0)
+    tmp_mapped = matrix[:, tmp_column_map]
+    tmp_gaps = np.isin(tmp_mapped, _GAP_CODES)
+    tmp_classes = np.where(tmp_gaps, tmp_mapped, 0).astype(np.uint8)
+    tmp_run_starts = np.ones(tmp_classes.shape, dtype=bool)
+    tmp_run_starts[:, 1:] = tmp_classes[:, 1:] != tmp_classes[:, :-1]
+    tmp_start_rows, tmp_start_columns = np.nonzero(tmp_run_starts)
+    tmp_run_counts = np.bincount(tmp_start_rows, minlength=matrix.shape[0])
+    tmp_run_stops = np.r_[tmp_start_columns[1:], 0]
+    tmp_row_ends = np.cumsum(tmp_run_counts)[tmp_run_counts > 0] - 1
+    tmp_run_stops[tmp_row_ends] = tmp_mapped.shape[1]
+    tmp_residue_counts = (~tmp_gaps).sum(axis=1)
+    tmp_residue_buffer = tmp_mapped[~tmp_gaps].tobytes()
+    tmp_residue_starts = np.cumsum(tmp_residue_counts) - tmp_residue_counts
+    return {
+        "column_map": tmp_column_map,
+        "run_counts": tmp_run_counts,
+        "run_lengths": (tmp_run_stops - tmp_start_columns).astype(np.int32),
+        "run_codes": tmp_classes[tmp_start_rows, tmp_start_columns],
+        "residues": [
+            tmp_residue_buffer[start : start + count].decode("ascii")
+            for start, count in zip(
+                tmp_residue_starts.tolist(), tmp_residue_counts.tolist()
+            )
+        ],
+    }
+
+
+def decode_gap_runs(width, column_maps, residues, run_lengths, run_codes, region=None):
+    """Rebuild alignment character matrix from gap runs.
+
+    Parameters
+    ----------
+    width
+        Width of alignment.
+    column_maps
+        Boolean array with column map of each row.
+    residues
+        List of ungapped sequences.
+    run_lengths
+        Lengths of runs of all rows.
+    run_codes
+        Codes of runs of all rows.
+    region
+        :class:`slice` of alignment columns or None for whole alignment.
+
+    Returns
+    -------
+        :class:`~numpy.ndarray` of :class:`~numpy.uint8` with one row per
+        sequence.
+    """
+    product = np.full((len(residues), width), _GAP_CODES[0], dtype=np.uint8)
+    # Runs of each row cover its mapped columns in order.
+    product[column_maps] = np.repeat(run_codes, run_lengths)
+    product[product == 0] = np.frombuffer(
+        "".join(residues).encode("ascii"), dtype=np.uint8
+    )
+    return product if region is None else product[:, region]
+
+
+def create_gaprle_element(hdf5_file, element_path, first_chunk, expectedrows):
+    """Create arrays of gap run-length encoded alignment element and store
+    `first_chunk`.
+
+    Ungapped residues are packed as in :mod:`._packed` under `residues`
+    group. Each committed chunk stores column map of columns that are not
+    gaps in all of its rows. Gaps within mapped columns are stored as runs.
+
+    Parameters
+    ----------
+    hdf5_file
+        :mod:`tables` file opened for writing.
+    element_path
+        Path of existing element group.
+    first_chunk
+        :class:`~pandas.DataFrame` with `sequence` column and optional
+        numeric columns.
+    expectedrows
+        Expected total number of rows.
+
+    Returns
+    -------
+        Element group node.
+    """
+    tmp_group = hdf5_file.get_node(element_path)
+    _create_row_arrays(hdf5_file, tmp_group, first_chunk, expectedrows)
+    tmp_matrix = alignment_to_matrix(first_chunk["sequence"].tolist())
+    tmp_encoded = encode_gap_runs(tmp_matrix)
+    tmp_expected_chunks = -(-expectedrows // max(len(first_chunk), 1))
+    tmp_expected_runs = int(
+        tmp_encoded["run_counts"].sum() * expectedrows / max(len(first_chunk), 1)
+    )
+    hdf5_file.create_earray(
+        tmp_group,
+        "column_maps",
+        atom=tables.UInt8Atom(),
+        shape=(0, -(-tmp_matrix.shape[1] // 8)),
+        title="column_maps",
+        expectedrows=tmp_expected_chunks,
+        chunkshape=(1, max(-(-tmp_matrix.shape[1] // 8), 1)),
+    )
+    for array_name, array_atom, array_rows in [
+        ("row_chunks", tables.Int32Atom(), expectedrows),
+        ("run_offsets", tables.Int64Atom(), expectedrows),
+        ("run_lengths", tables.Int32Atom(), tmp_expected_runs),
+        ("run_codes", tables.UInt8Atom(), tmp_expected_runs),
+    ]:
+        _create_earray(hdf5_file, tmp_group, array_name, array_atom, array_rows)
+    tmp_group.run_offsets.append(np.zeros(1, dtype=np.int64))
+    tmp_group._v_attrs.width = tmp_matrix.shape[1]
+    hdf5_file.create_group(tmp_group, "residues", title="residues")
+    create_packed_element(
+        hdf5_file,
+        tmp_group.residues._v_pathname,
+        pd.DataFrame({"sequence": tmp_encoded["residues"]}, index=first_chunk.index),
+        expectedrows,
+    )
+    _append_gaprle_encoded(tmp_group, first_chunk, tmp_encoded)
+    return tmp_group
+
+
+def append_gaprle_chunk(element_group, chunk):
+    """Append alignment `chunk` to gap run-length encoded alignment element.
+
+    Parameters
+    ----------
+    element_group
+        Element group node created by :func:`.create_gaprle_element`
+    chunk
+        :class:`~pandas.DataFrame` with same columns as first chunk.
+    """
+    tmp_matrix = alignment_to_matrix(chunk["sequence"].tolist())
+    if tmp_matrix.shape[1] != element_group._v_attrs.width:
+        raise ValueError("Aligned sequences must have same width.")
+    tmp_encoded = encode_gap_runs(tmp_matrix)
+    append_packed_chunk(
+        element_group.residues,
+        pd.DataFrame({"sequence": tmp_encoded["residues"]}, index=chunk.index),
+    )
+    _append_gaprle_encoded(element_group, chunk, tmp_encoded)
+    return
+
+
+def _append_gaprle_encoded(element_group, chunk, encoded):
+    """Append encoded gap runs of `chunk` except residues."""
+    _append_row_arrays(element_group, chunk)
+    element_group.row_chunks.append(
+        np.full(len(chunk), element_group.column_maps.nrows, dtype=np.int32)
+    )
+    element_group.column_maps.append(np.packbits(encoded["column_map"])[np.newaxis, :])
+    element_group.run_offsets.append(
+        element_group.run_offsets[-1] + np.cumsum(encoded["run_counts"])
+    )
+    element_group.run_lengths.append(encoded["run_lengths"])
+    element_group.run_codes.append(encoded["run_codes"])
+    return
+
+
+def read_gaprle_metadata(element_group):
+    """Read all arrays of gap run-length encoded alignment element except
+    runs and packed residues.
+
+    Parameters
+    ----------
+    element_group
+        Element group node of gap run-length encoded alignment.
+
+    Returns
+    -------
+        Dictionary with arrays, `columns` list of original table, `width` of
+        alignment and `residues` metadata of packed residues.
+    """
+    metadata = _read_row_arrays(element_group)
+    metadata["width"] = int(element_group._v_attrs.width)
+    metadata["row_chunks"] = element_group.row_chunks.read()
+    metadata["run_offsets"] = element_group.run_offsets.read()
+    metadata["column_maps"] = element_group.column_maps.read()
+    metadata["residues"] = read_packed_metadata(element_group.residues)
+    return metadata
+
+
+def _read_gaprle_matrix(element_group, metadata, rows, region):
+    """Decode character matrix of `rows` within `region`"""
+    tmp_region = _get_region_columns(region, metadata["width"])
+    tmp_run_offsets = metadata["run_offsets"]
+    tmp_row_runs = get_row_runs(rows)
+    tmp_run_lengths = [
+        element_group.run_lengths.read(
+            tmp_run_offsets[first_row], tmp_run_offsets[last_row + 1]
+        )
+        for first_row, last_row in tmp_row_runs
+    ]
+    tmp_run_codes = [
+        element_group.run_codes.read(
+            tmp_run_offsets[first_row], tmp_run_offsets[last_row + 1]
+        )
+        for first_row, last_row in tmp_row_runs
+    ]
+    return decode_gap_runs(
+        metadata["width"],
+        np.unpackbits(
+            metadata["column_maps"][metadata["row_chunks"][rows]],
+            axis=1,
+            count=metadata["width"],
+        ).astype(bool),
+        read_packed_rows(
+            element_group.residues, metadata["residues"], rows, ["sequence"]
+        )["sequence"].tolist(),
+        np.concatenate(tmp_run_lengths) if tmp_row_runs else np.empty(0, np.int32),
+        np.concatenate(tmp_run_codes) if tmp_row_runs else np.empty(0, np.uint8),
+        (
+            None
+            if region is None
+            else slice(tmp_region.start, tmp_region.stop, tmp_region.step)
+        ),
+    )
+
+
+def read_gaprle_rows(element_group, metadata, rows=None, columns=None, region=None):
+    """Decode rows of gap run-length encoded alignment element into table.
+
+    Parameters
+    ----------
+    element_group
+        Element group node of gap run-length encoded alignment.
+    metadata
+        Arrays returned by :func:`.read_gaprle_metadata`
+    rows
+        Row coordinates, :class:`slice` or None for all rows.
+    columns
+        Target columns or None for all columns.
+    region
+        :class:`slice` of alignment columns or None for whole alignment.
+
+    Returns
+    -------
+        :class:`~pandas.DataFrame` in same layout as table element.
+    """
+    rows = get_row_coordinates(rows, metadata["index"].shape[0])
+    tmp_columns = metadata["columns"] if columns is None else list(columns)
+    tmp_region = _get_region_columns(region, metadata["width"])
+    tmp_sequences = None
+    if "sequence" in tmp_columns:
+        tmp_sequences = matrix_to_alignment(
+            _read_gaprle_matrix(element_group, metadata, rows, region)
+        )
+    return _make_row_frame(
+        metadata,
+        rows,
+        tmp_columns,
+        tmp_sequences,
+        len(tmp_region) if region is not None else None,
+    )
+
+
+def _matrix_to_buffer(metadata, rows, matrix):
+    """Flatten character `matrix` of `rows` into buffer with row offsets."""
+    return (
+        metadata["index"][rows],
+        matrix.reshape(-1),
+        np.arange(matrix.shape[0] + 1, dtype=np.int64) * matrix.shape[1],
+    )
+
+
+def read_matrix_buffer(element_group, metadata, rows=None, region=None):
+    """Read rows of column-chunked alignment element into single character
+    buffer.
+
+    Parameters
+    ----------
+    element_group
+        Element group node of alignment matrix.
+    metadata
+        Arrays returned by :func:`.read_matrix_metadata`
+    rows
+        Row coordinates, :class:`slice` or None for all rows.
+    region
+        :class:`slice` of alignment columns or None for whole alignment.
+
+    Returns
+    -------
+        Tuple of (:class:`~numpy.ndarray` with index of rows,
+        :class:`~numpy.ndarray` of uint8 character codes,
+        :class:`~numpy.ndarray` of row offsets with one extra element).
+    """
+    rows = get_row_coordinates(rows, metadata["index"].shape[0])
+    return _matrix_to_buffer(
+        metadata,
+        rows,
+        _read_matrix(
+            element_group, rows, _get_region_columns(region, metadata["width"])
+        ),
+    )
+
+
+def read_gaprle_buffer(element_group, metadata, rows=None, region=None):
+    """Decode rows of gap run-length encoded alignment element into single
+    character buffer.
+
+    Parameters
+    ----------
+    element_group
+        Element group node of gap run-length encoded alignment.
+    metadata
+        Arrays returned by :func:`.read_gaprle_metadata`
+    rows
+        Row coordinates, :class:`slice` or None for all rows.
+    region
+        :class:`slice` of alignment columns or None for whole alignment.
+
+    Returns
+    -------
+        Tuple of (:class:`~numpy.ndarray` with index of rows,
+        :class:`~numpy.ndarray` of uint8 character codes,
+        :class:`~numpy.ndarray` of row offsets with one extra element).
+    """
+    rows = get_row_coordinates(rows, metadata["index"].shape[0])
+    return _matrix_to_buffer(
+        metadata, rows, _read_gaprle_matrix(element_group, metadata, rows, region)
+    )
@@ -11,7 +11,10 @@ from pmaf.internal._constants import MAIN_RANKS, VALID_RANKS
 # from pmaf.internal._constants import VALID_RANKS
 
 from pmaf.internal._shared import get_stats_for_sequence_record_df
+from pmaf.database._shared._parallel import map_in_pool, PREFETCH_PER_WORKER
+from pmaf.database._shared._tree_arrays import make_tree_arrays
 from tempfile import NamedTemporaryFile
+from ete3 import Tree
 from pmaf.database._shared._summarizers import merge_recaps
 
 # MAIN_RANKS = VALID_RANKS
@@ -79,6 +82,7 @@ def finalize_storage_construction(storage_manager, stamp_data, prior_recap, **kw
             complevel=complevel, complib=complib, overwrite=overwrite
         ):
             raise RuntimeError("Could not compress storage file.")
+    storage_manager.shutdown()
     print("Storage is Ready.")
     return
 
@@ -245,6 +249,66 @@ def make_tree_map(tree_object):
     return tree_map.applymap(str)
 
 
+def assemble_tree_elements(tree_newick_string, index_mapper, newick_format=0):
+    """Produce *tree-parsed*, *tree-array* and *map-tree* storage element
+    products at once. Picklable so that it can run in worker process.
+
+    Parameters
+    ----------
+    tree_newick_string :
+        Prior Newick string.
+    index_mapper :
+        New index mapper.
+    newick_format :
+        Newick format of `tree_newick_string` (Default value = 0)
+
+    Returns
+    -------
+        Dictionary with storage element keys and their products.
+    """
+    tmp_newick_parsed = reparse_tree(
+        Tree(tree_newick_string, format=newick_format), index_mapper
+    )
+    tmp_tree_object = Tree(tmp_newick_parsed, format=2, quoted_node_names=True)
+    tmp_rebuilded_tree = rebuild_phylo(
+        Tree(tmp_newick_parsed, format=2, quoted_node_names=True)
+    )
+    return {
+        "tree-parsed": tmp_newick_parsed,
+        "tree-array": make_tree_arrays(tmp_tree_object),
+        "map-tree": make_tree_map(tmp_rebuilded_tree),
+    }
+
+
+def commit_tree_elements(storage_manager, tree_future):
+    """Commit tree elements produced by :func:`assemble_tree_elements` in
+    worker process.
+
+    Parameters
+    ----------
+    storage_manager :
+        Active storage manager
+    tree_future :
+        Future of :func:`assemble_tree_elements`
+
+    Returns
+    -------
+
+    """
+
+    def produce_tree_element(product):
+        """Storage element producer function for precomputed product."""
+        yield None, None
+        yield product
+
+    tmp_tree_elements = tree_future.result()
+    for element_key in ["tree-parsed", "tree-array", "map-tree"]:
+        storage_manager.commit_to_storage(
+            element_key, produce_tree_element(tmp_tree_elements[element_key])
+        )
+    return
+
+
 def reconstruct_taxonomy(master_taxonomy_sheet_df, index_mapper, reject_taxa=None):
     """
 
@@ -475,7 +539,7 @@ def make_column_details(storage_manager):
     return tmp_column_summary
 
 
-def produce_rep_stats(storage_manager, chunksize):
+def produce_rep_stats(storage_manager, chunksize, worker_pool=None, workers=1):
     """
 
     Parameters
@@ -484,6 +548,10 @@ def produce_rep_stats(storage_manager, chunksize):
 
     chunksize :
 
+    worker_pool :
+        Process pool to compute chunk statistics in parallel. (Default value = None)
+    workers :
+        Number of worker processes of `worker_pool`. (Default value = 1)
 
     Returns
     -------
@@ -495,13 +563,22 @@ def produce_rep_stats(storage_manager, chunksize):
     repseq_generator = storage_manager.retrieve_data_by_element(
         "sequence-representative", chunksize=chunksize
     )
+    if worker_pool is None:
+        stats_generator = map(get_stats_for_sequence_record_df, repseq_generator)
+    else:
+        stats_generator = map_in_pool(
+            worker_pool,
+            get_stats_for_sequence_record_df,
+            repseq_generator,
+            PREFETCH_PER_WORKER * workers,
+        )
 
     yield {
         "index_columns": ["index"],
         "max_rows": total_repseqs,
-    }, get_stats_for_sequence_record_df(next(repseq_generator))
-    for repseq_df in repseq_generator:
-        yield get_stats_for_sequence_record_df(repseq_df)
+    }, next(stats_generator)
+    for stats_df in stats_generator:
+        yield stats_df
 
 
 def produce_tax_stats(storage_manager, novel_tids):
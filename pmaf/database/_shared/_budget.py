@@ -0,0 +1,160 @@
+import sys
+from collections import Counter
+import numpy as np
+import tables
+
+# Element is loaded as whole only after it was accessed this many times.
+ELEMENT_LOAD_MIN_ACCESSES = 2
+# Overhead of Python string object over its characters.
+STRING_OVERHEAD_BYTES = sys.getsizeof("")
+
+
+class ElementCachePolicy:
+    """Memory budget policy for storage elements kept resident in memory.
+
+    Whole elements are admitted in order of their access frequency as long
+    as they fit to the budget. Less frequently accessed elements are evicted
+    to make room for more frequently accessed ones. Budget that is not taken
+    by resident elements is left for row blocks of the remaining elements.
+    """
+
+    def __init__(self, memory_budget):
+        """Constructor for :class:`.ElementCachePolicy`
+
+        Parameters
+        ----------
+        memory_budget
+            Approximate maximum memory in bytes for cached data.
+        """
+        if isinstance(memory_budget, int) and not isinstance(memory_budget, bool):
+            if memory_budget < 0:
+                raise ValueError("`memory_budget` must be non-negative.")
+        else:
+            raise TypeError("`memory_budget` must be integer.")
+        self._memory_budget = memory_budget
+        self._access_counts = Counter()
+        self._resident_sizes = {}
+        self._rejected_sizes = {}
+
+    def record_access(self, element_key):
+        """Count access to `element_key`
+
+        Parameters
+        ----------
+        element_key
+            Target storage element
+        """
+        self._access_counts[element_key] += 1
+        return
+
+    def select_evictions(self, element_key, element_bytes):
+        """Decide whether `element_key` should be loaded to memory.
+
+        Parameters
+        ----------
+        element_key
+            Target storage element that is not resident.
+        element_bytes
+            Expected size of `element_key` in memory.
+
+        Returns
+        -------
+            List of resident elements to evict before loading `element_key`
+            or None if `element_key` should not be loaded.
+        """
+        tmp_access_count = self._access_counts[element_key]
+        if tmp_access_count < ELEMENT_LOAD_MIN_ACCESSES:
+            return None
+        element_bytes = max(element_bytes, self._rejected_sizes.get(element_key, 0))
+        if element_bytes > self._memory_budget:
+            return None
+        tmp_free_bytes = self.free_bytes
+        evictions = []
+        for resident_key in sorted(
+            self._resident_sizes,
+            key=lambda key: (self._access_counts[key], -self._resident_sizes[key]),
+        ):
+            if tmp_free_bytes >= element_bytes:
+                break
+            if self._access_counts[resident_key] >= tmp_access_count:
+                break
+            evictions.append(resident_key)
+            tmp_free_bytes += self._resident_sizes[resident_key]
+        return evictions if tmp_free_bytes >= element_bytes else None
+
+    def admit(self, element_key, element_bytes):
+        """Register `element_key` as resident.
+
+        Parameters
+        ----------
+        element_key
+            Target storage element
+        element_bytes
+            Measured size of `element_key` in memory.
+
+        Returns
+        -------
+            True if element fits to the budget, otherwise False.
+        """
+        if element_bytes > self.free_bytes:
+            self._rejected_sizes[element_key] = element_bytes
+            return False
+        self._resident_sizes[element_key] = element_bytes
+        return True
+
+    def evict(self, element_key):
+        """Unregister resident `element_key`
+
+        Parameters
+        ----------
+        element_key
+            Target storage element
+        """
+        self._resident_sizes.pop(element_key, None)
+        return
+
+    @property
+    def free_bytes(self):
+        """Budget that is not taken by resident elements."""
+        return self._memory_budget - sum(self._resident_sizes.values())
+
+    @property
+    def resident_sizes(self):
+        """Size of resident elements in bytes."""
+        return dict(self._resident_sizes)
+
+    @property
+    def access_counts(self):
+        """Number of accesses per storage element."""
+        return dict(self._access_counts)
+
+
+def estimate_node_bytes(hdf5_node):
+    """Estimate memory size of :term:`hdf5` node after loading it to memory.
+
+    Parameters
+    ----------
+    hdf5_node
+        :mod:`tables` leaf or group of storage element.
+
+    Returns
+    -------
+        Approximate size in bytes.
+    """
+    if isinstance(hdf5_node, tables.Leaf):
+        tmp_leaves = [hdf5_node]
+    else:
+        tmp_leaves = hdf5_node._f_walknodes("Leaf")
+    total_bytes = 0
+    for leaf in tmp_leaves:
+        total_bytes += leaf.size_in_memory
+        if isinstance(leaf, tables.Table):
+            # Fixed width strings are loaded as Python objects.
+            for column_name, column_type in leaf.coltypes.items():
+                if column_type == "string":
+                    total_bytes += (
+                        leaf.nrows
+                        * int(np.prod(leaf.coldescrs[column_name].shape))
+                        * STRING_OVERHEAD_BYTES
+                    )
+    return total_bytes
@@ -14,8 +14,10 @@ DATABASE_HDF5_STRUCT = {
     "tree-prior": "/tre/master/value",  # Newick string UTF-8 encoded bytes. /value is explicitly refered in order to ease acess with simple .read()
     "tree-parsed": "/tre/parsed/value",  # Newick string UTF-8 encoded bytes. /value is explicitly refered in order to ease acess with simple .read()
     "tree-object": "/tre/pickled/value",  # Pickled bytes
+    "tree-array": "/tre/array",  # Group of postorder node arrays. See `pmaf.database._shared._tree_arrays`
     "taxonomy-prior": "/tax/master",
     "taxonomy-sheet": "/tax/parsed",
+    "taxonomy-index": "/tax/index",  # Group of nested-set hierarchy arrays. See `pmaf.database._shared._tax_index`
     "sequence-representative": "/seq/reps",
     "sequence-aligned": "/seq/algn",
     "sequence-accession": "/seq/accs",
@@ -25,11 +27,40 @@ DATABASE_HDF5_STRUCT = {
     "metadata-db-history": "/meta/history",  # pandas Series that contain all of the information about the _local processing. Data must be sufficient to reconstruct _local to the prior state.
     "map-interx-taxon": "/map/interxtax",
     "map-interx-repseq": "/map/interxreps",
+    "index-interx-taxon": "/map/xindextax",  # Group of sorted identifier and coordinate arrays of *map-interx-taxon*. See `pmaf.database._shared._interx_index`
+    "index-interx-repseq": "/map/xindexreps",  # Group of sorted identifier and coordinate arrays of *map-interx-repseq*. See `pmaf.database._shared._interx_index`
     "map-rep2tid": "/map/reptid",  # DataFrame of size len(# Valid RepSeqs) x (7 ranks + 1 TaxonID)
     "map-repseq": "/map/repseq",  # DataFrame of size len(# TaxonIDs) x (1 Selected RepSeqID + 1 All Related RepSeqIDs separated by `|`
     "map-tree": "/map/tree",
+    "map-tid2rep": "/map/tidrep",  # Group of CSR arrays of rids per TaxonID. See `pmaf.database._shared._tax_index`
 }
 
+# Storage elements that were introduced later and may be absent in older storage files.
+DATABASE_OPTIONAL_ELEMENTS = [
+    "tree-array",
+    "taxonomy-index",
+    "map-tid2rep",
+    "index-interx-taxon",
+    "index-interx-repseq",
+]
+
+# Storage elements that are stored as groups of plain arrays.
+DATABASE_ARRAY_ELEMENTS = [
+    "tree-array",
+    "taxonomy-index",
+    "map-tid2rep",
+    "index-interx-taxon",
+    "index-interx-repseq",
+]
+
+# Alternative storage encodings per storage element. First one is the default.
+DATABASE_ELEMENT_ENCODINGS = {
+    "sequence-representative": ["table", "packed"],
+    "sequence-aligned": ["table", "matrix", "gap-rle"],
+}
+# Encodings whose readers apply alignment column regions while decoding rows.
+DATABASE_REGION_ENCODINGS = ["matrix", "gap-rle"]
+
 
 def get_element_mode(element_key):
     """
@@ -43,7 +74,10 @@ def get_element_mode(element_key):
     -------
 
     """
-    if element_key in ["tree-prior", "tree-parsed", "tree-object"]:
+    if (
+        element_key in ["tree-prior", "tree-parsed", "tree-object"]
+        or element_key in DATABASE_ARRAY_ELEMENTS
+    ):
         return 1
     else:
         return 2
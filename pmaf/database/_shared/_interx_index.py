@@ -0,0 +1,163 @@
+import h5py
+import numpy as np
+import pandas as pd
+
+INTERX_INDEX_NAMES = ["index", "coordinates", "columns"]
+
+
+def make_interx_index_arrays(interxmap_df):
+    """Build sorted identifier index of interx map element.
+
+    Arrays are stored as *index-interx-taxon* or *index-interx-repseq*
+    storage element within the :term:`hdf5` file so that
+    :meth:`.InterxIndexMap.from_storage` can map them to memory.
+
+    Parameters
+    ----------
+    interxmap_df :
+        Interx map dataframe as stored in :term:`hdf5`
+
+    Returns
+    -------
+        Dictionary with arrays named as in :data:`INTERX_INDEX_NAMES` or None
+        if identifiers of the interx map are not integers.
+    """
+    if interxmap_df.index.dtype.kind not in "iu":
+        return None
+    tmp_order = np.argsort(interxmap_df.index.values, kind="stable")
+    return {
+        "index": np.ascontiguousarray(
+            interxmap_df.index.values[tmp_order], dtype=np.int64
+        ),
+        "coordinates": np.ascontiguousarray(interxmap_df.values[tmp_order]),
+        "columns": np.asarray(interxmap_df.columns.tolist(), dtype=bytes),
+    }
+
+
+class InterxIndexMap:
+    """Sorted identifier index of interx map element.
+
+    Index of storage files with *index-interx-taxon* and
+    *index-interx-repseq* elements is opened via :class:`numpy.memmap` at
+    dataset offsets within the :term:`hdf5` file, so that opening is cheap
+    and index pages are shared between processes through the OS page
+    cache. Index of older storage files is built from interx map in memory.
+    """
+
+    def __init__(self, index_array, coordinates_array, columns):
+        """Constructor for :class:`.InterxIndexMap`
+
+        Parameters
+        ----------
+        index_array
+            Sorted identifiers.
+        coordinates_array
+            Storage coordinates with one row per identifier and one column
+            per storage element.
+        columns
+            Storage element keys of `coordinates_array` columns.
+        """
+        self._index_array = index_array
+        self._coordinates_array = coordinates_array
+        self._columns = list(columns)
+        self._index = None
+
+    @classmethod
+    def from_frame(cls, interxmap_df):
+        """Create in-memory index from interx map dataframe.
+
+        Parameters
+        ----------
+        interxmap_df
+            Interx map dataframe as stored in :term:`hdf5`
+
+        Returns
+        -------
+            Instance of :class:`.InterxIndexMap`
+        """
+        tmp_order = np.argsort(interxmap_df.index.values, kind="stable")
+        return cls(
+            np.ascontiguousarray(interxmap_df.index.values[tmp_order]),
+            np.ascontiguousarray(interxmap_df.values[tmp_order]),
+            interxmap_df.columns,
+        )
+
+    @classmethod
+    def from_storage(cls, hdf5_filepath, group_path):
+        """Open index arrays of storage element at `group_path` as read-only
+        :class:`numpy.memmap`
+
+        Parameters
+        ----------
+        hdf5_filepath
+            Path to :term:`hdf5` file
+        group_path
+            Path to group of arrays from :func:`.make_interx_index_arrays`
+
+        Returns
+        -------
+            Instance of :class:`.InterxIndexMap`
+        """
+        with h5py.File(hdf5_filepath, "r") as storage_file:
+            tmp_group = storage_file[group_path]
+            return cls(
+                cls.__map_dataset(hdf5_filepath, tmp_group["index"]),
+                cls.__map_dataset(hdf5_filepath, tmp_group["coordinates"]),
+                [column.decode("utf8") for column in tmp_group["columns"][:]],
+            )
+
+    @staticmethod
+    def __map_dataset(hdf5_filepath, dataset):
+        """Map contiguous `dataset` to memory. Datasets without allocated
+        storage are read instead."""
+        tmp_offset = dataset.id.get_offset()
+        if tmp_offset is None:
+            return dataset[()]
+        return np.memmap(
+            hdf5_filepath,
+            dtype=dataset.dtype,
+            mode="r",
+            offset=tmp_offset,
+            shape=dataset.shape,
+        )
+
+    def get_coordinates(self, element_key, ids):
+        """Get storage coordinates of `element_key` for target `ids`.
+
+        Coordinates are ordered by identifiers same as the interx map.
+
+        Parameters
+        ----------
+        element_key
+            Target storage element
+        ids
+            Target identifiers
+
+        Returns
+        -------
+            :class:`~numpy.ndarray` with coordinates.
+        """
+        target_ids = np.asarray(ids)
+        if target_ids.dtype.kind in "iu" and self._index_array.dtype.kind in "iu":
+            positions = np.searchsorted(self._index_array, target_ids)
+            positions = np.unique(positions[positions < self._index_array.shape[0]])
+            positions = positions[np.isin(self._index_array[positions], target_ids)]
+        else:
+            positions = np.flatnonzero(self.index.isin(target_ids))
+        if positions.shape[0] != target_ids.shape[0]:
+            raise ValueError("Invalid identifiers are provided.")
+        return np.asarray(
+            self._coordinates_array[positions, self._columns.index(element_key)]
+        )
+
+    @property
+    def index(self) -> pd.Index:
+        """Sorted identifiers of the interx map."""
+        if self._index is None:
+            self._index = pd.Index(self._index_array, name="index", copy=False)
+        return self._index
+
+    @property
+    def columns(self):
+        """Storage elements covered by interx map."""
+        return list(self._columns)
@@ -0,0 +1,461 @@
+import numpy as np
+import pandas as pd
+import tables
+
+# Nucleotides that are encoded with two bits. All other characters are kept
+# in exception arrays so that sequences are restored exactly.
+PACKED_ALPHABET = b"ACGT"
+BASES_PER_BYTE = 4
+# Marker of characters that are not in `PACKED_ALPHABET`
+_EXCEPTION_CODE = 255
+_BASE_CODES = np.full(256, _EXCEPTION_CODE, dtype=np.uint8)
+_BASE_CODES[np.frombuffer(PACKED_ALPHABET, dtype=np.uint8)] = np.arange(
+    len(PACKED_ALPHABET), dtype=np.uint8
+)
+_BASE_SYMBOLS = np.frombuffer(PACKED_ALPHABET, dtype=np.uint8)
+_BIT_SHIFTS = np.array([6, 4, 2, 0], dtype=np.uint8)
+
+# Arrays that are stored under the element group of packed sequences.
+PACKED_SEQUENCE_ARRAYS = [
+    "index",
+    "lengths",
+    "byte_offsets",
+    "packed",
+    "exception_rows",
+    "exception_positions",
+    "exception_codes",
+]
+# Upper limit of chunk size of packed element arrays.
+MAX_CHUNK_BYTES = 2**16
+# Prefix of arrays with additional numeric columns of the sequence table.
+PACKED_COLUMN_PREFIX = "column_"
+
+
+def _expand_ranges(starts, stops):
+    """Concatenate ranges from `starts` to `stops` into single array."""
+    tmp_sizes = stops - starts
+    tmp_total = int(tmp_sizes.sum())
+    if tmp_total == 0:
+        return np.empty(0, dtype=np.int64)
+    tmp_shifts = np.repeat(starts - np.cumsum(tmp_sizes) + tmp_sizes, tmp_sizes)
+    return np.arange(tmp_total, dtype=np.int64) + tmp_shifts
+
+
+def get_row_coordinates(rows, total_rows):
+    """Convert `rows` selection into array of row coordinates.
+
+    Parameters
+    ----------
+    rows
+        Row coordinates, :class:`slice` or None for all rows.
+    total_rows
+        Number of rows in storage element.
+
+    Returns
+    -------
+        :class:`~numpy.ndarray` with row coordinates.
+    """
+    if rows is None:
+        rows = slice(0, total_rows)
+    if isinstance(rows, slice):
+        return np.arange(*rows.indices(total_rows), dtype=np.int64)
+    else:
+        return np.asarray(rows, dtype=np.int64)
+
+
+def get_row_runs(rows):
+    """Split row coordinates into runs of consecutive rows.
+
+    Parameters
+    ----------
+    rows
+        :class:`~numpy.ndarray` with row coordinates.
+
+    Returns
+    -------
+        List of (first row, last row) tuples in order of `rows`
+    """
+    if len(rows) == 0:
+        return []
+    tmp_run_breaks = np.flatnonzero(np.diff(rows) != 1) + 1
+    return list(
+        zip(
+            rows[np.r_[0, tmp_run_breaks]].tolist(),
+            rows[np.r_[tmp_run_breaks - 1, len(rows) - 1]].tolist(),
+        )
+    )
+
+
+def pack_sequences(sequences):
+    """Encode sequences with two bits per nucleotide.
+
+    Every sequence is padded to whole bytes so that rows can be decoded
+    independently. Characters other than `A`, `C`, `G` and `T`, including
+    lowercase and IUPAC ambiguity codes, are stored as exceptions.
+
+    Parameters
+    ----------
+    sequences
+        List of sequence strings.
+
+    Returns
+    -------
+        Dictionary with `lengths`, `byte_counts`, `packed`, `exception_rows`,
+        `exception_positions` and `exception_codes` arrays.
+    """
+    tmp_lengths = np.fromiter(map(len, sequences), dtype=np.int64, count=len(sequences))
+    tmp_chars = np.frombuffer("".join(sequences).encode("ascii"), dtype=np.uint8)
+    tmp_codes = _BASE_CODES[tmp_chars]
+    tmp_exceptions = np.flatnonzero(tmp_codes == _EXCEPTION_CODE)
+    tmp_codes[tmp_exceptions] = 0
+    tmp_byte_counts = -(-tmp_lengths // BASES_PER_BYTE)
+    tmp_rows = np.repeat(np.arange(len(tmp_lengths), dtype=np.int64), tmp_lengths)
+    tmp_row_starts = np.cumsum(tmp_lengths) - tmp_lengths
+    tmp_padded_starts = (np.cumsum(tmp_byte_counts) - tmp_byte_counts) * BASES_PER_BYTE
+    tmp_positions = np.arange(len(tmp_chars), dtype=np.int64) - tmp_row_starts[tmp_rows]
+    tmp_padded_codes = np.zeros(
+        int(tmp_byte_counts.sum()) * BASES_PER_BYTE, dtype=np.uint8
+    )
+    tmp_padded_codes[tmp_padded_starts[tmp_rows] + tmp_positions] = tmp_codes
+    tmp_packed = np.bitwise_or.reduce(
+        tmp_padded_codes.reshape(-1, BASES_PER_BYTE) << _BIT_SHIFTS, axis=1
+    ).astype(np.uint8)
+    return {
+        "lengths": tmp_lengths,
+        "byte_counts": tmp_byte_counts,
+        "packed": tmp_packed,
+        "exception_rows": tmp_rows[tmp_exceptions],
+        "exception_positions": tmp_positions[tmp_exceptions],
+        "exception_codes": tmp_chars[tmp_exceptions],
+    }
+
+
+def _unpack_symbols(
+    packed, byte_counts, exception_rows, exception_positions, exception_codes
+):
+    """Decode packed bytes into padded character codes and row starts."""
+    tmp_symbols = _BASE_SYMBOLS[
+        ((packed[:, np.newaxis] >> _BIT_SHIFTS) & 3).reshape(-1)
+    ]
+    tmp_padded_starts = (np.cumsum(byte_counts) - byte_counts) * BASES_PER_BYTE
+    tmp_symbols[tmp_padded_starts[exception_rows] + exception_positions] = (
+        exception_codes
+    )
+    return tmp_symbols, tmp_padded_starts
+
+
+def unpack_sequences(
+    packed, lengths, byte_counts, exception_rows, exception_positions, exception_codes
+):
+    """Decode sequences produced by :func:`.pack_sequences`
+
+    Parameters
+    ----------
+    packed
+        Packed bytes of consecutive rows.
+    lengths
+        Sequence length of each row.
+    byte_counts
+        Number of packed bytes of each row.
+    exception_rows
+        Row of each exception relative to the first row.
+    exception_positions
+        Position of each exception within its row.
+    exception_codes
+        Original character codes of exceptions.
+
+    Returns
+    -------
+        List of sequence strings.
+    """
+    tmp_symbols, tmp_padded_starts = _unpack_symbols(
+        packed, byte_counts, exception_rows, exception_positions, exception_codes
+    )
+    tmp_buffer = tmp_symbols.tobytes()
+    return [
+        tmp_buffer[start : start + length].decode("ascii")
+        for start, length in zip(tmp_padded_starts.tolist(), lengths.tolist())
+    ]
+
+
+def unpack_buffer(
+    packed, lengths, byte_counts, exception_rows, exception_positions, exception_codes
+):
+    """Decode sequences produced by :func:`.pack_sequences` into single
+    character buffer.
+
+    Parameters
+    ----------
+    packed
+        Packed bytes of consecutive rows.
+    lengths
+        Sequence length of each row.
+    byte_counts
+        Number of packed bytes of each row.
+    exception_rows
+        Row of each exception relative to the first row.
+    exception_positions
+        Position of each exception within its row.
+    exception_codes
+        Original character codes of exceptions.
+
+    Returns
+    -------
+        Tuple of (:class:`~numpy.ndarray` of uint8 character codes of all
+        rows, :class:`~numpy.ndarray` of row offsets with one extra
+        element).
+    """
+    tmp_symbols, tmp_padded_starts = _unpack_symbols(
+        packed, byte_counts, exception_rows, exception_positions, exception_codes
+    )
+    tmp_offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=tmp_offsets[1:])
+    return (
+        tmp_symbols[_expand_ranges(tmp_padded_starts, tmp_padded_starts + lengths)],
+        tmp_offsets,
+    )
+
+
+def sequences_to_buffer(sequences):
+    """Concatenate sequence strings into single character buffer.
+
+    Parameters
+    ----------
+    sequences
+        List of ASCII sequence strings.
+
+    Returns
+    -------
+        Tuple of (:class:`~numpy.ndarray` of uint8 character codes of all
+        sequences, :class:`~numpy.ndarray` of sequence offsets with one extra
+        element).
+    """
+    tmp_offsets = np.zeros(len(sequences) + 1, dtype=np.int64)
+    np.cumsum(
+        np.fromiter(map(len, sequences), dtype=np.int64, count=len(sequences)),
+        out=tmp_offsets[1:],
+    )
+    tmp_buffer = np.frombuffer("".join(sequences).encode("ascii"), dtype=np.uint8)
+    return tmp_buffer, tmp_offsets
+
+
+def create_packed_element(hdf5_file, element_path, first_chunk, expectedrows):
+    """Create arrays of packed sequence element and store `first_chunk`.
+
+    Parameters
+    ----------
+    hdf5_file
+        :mod:`tables` file opened for writing.
+    element_path
+        Path of existing element group.
+    first_chunk
+        :class:`~pandas.DataFrame` with `sequence` column and optional
+        numeric columns.
+    expectedrows
+        Expected total number of rows.
+
+    Returns
+    -------
+        Element group node.
+    """
+    tmp_extra_columns = [
+        column for column in first_chunk.columns if column != "sequence"
+    ]
+    for column in tmp_extra_columns:
+        if not (
+            pd.api.types.is_numeric_dtype(first_chunk[column])
+            or pd.api.types.is_bool_dtype(first_chunk[column])
+        ):
+            raise TypeError(
+                "Packed sequence element supports only numeric columns besides `sequence`."
+            )
+    tmp_group = hdf5_file.get_node(element_path)
+    tmp_array_atoms = {
+        "index": tables.Int64Atom(),
+        "lengths": tables.Int64Atom(),
+        "byte_offsets": tables.Int64Atom(),
+        "packed": tables.UInt8Atom(),
+        "exception_rows": tables.Int64Atom(),
+        "exception_positions": tables.Int64Atom(),
+        "exception_codes": tables.UInt8Atom(),
+    }
+    for column in tmp_extra_columns:
+        tmp_array_atoms[PACKED_COLUMN_PREFIX + column] = tables.Atom.from_dtype(
+            first_chunk[column].dtype
+        )
+    # Chunks are sized by expected array lengths so that small storages are
+    # not inflated by default chunk size of :mod:`tables`
+    tmp_expected_bytes = int(
+        first_chunk["sequence"].str.len().sum()
+        * expectedrows
+        / max(len(first_chunk), 1)
+        / BASES_PER_BYTE
+    )
+    for array_name, array_atom in tmp_array_atoms.items():
+        tmp_expected_length = (
+            tmp_expected_bytes if array_name == "packed" else expectedrows
+        )
+        hdf5_file.create_earray(
+            tmp_group,
+            array_name,
+            atom=array_atom,
+            shape=(0,),
+            title=array_name,
+            expectedrows=expectedrows,
+            chunkshape=(
+                int(
+                    np.clip(tmp_expected_length, 1, MAX_CHUNK_BYTES // array_atom.size)
+                ),
+            ),
+        )
+    tmp_group.byte_offsets.append(np.zeros(1, dtype=np.int64))
+    tmp_group._v_attrs.columns = list(first_chunk.columns)
+    append_packed_chunk(tmp_group, first_chunk)
+    return tmp_group
+
+
+def append_packed_chunk(element_group, chunk):
+    """Append sequence `chunk` to packed sequence element.
+
+    Parameters
+    ----------
+    element_group
+        Element group node created by :func:`.create_packed_element`
+    chunk
+        :class:`~pandas.DataFrame` with same columns as first chunk.
+    """
+    if list(chunk.columns) != list(element_group._v_attrs.columns):
+        raise ValueError("Chunk columns do not match packed sequence element.")
+    tmp_row_offset = element_group.index.nrows
+    tmp_byte_offset = element_group.byte_offsets[-1]
+    tmp_packed = pack_sequences(chunk["sequence"].tolist())
+    element_group.index.append(chunk.index.values.astype(np.int64))
+    element_group.lengths.append(tmp_packed["lengths"])
+    element_group.byte_offsets.append(
+        tmp_byte_offset + np.cumsum(tmp_packed["byte_counts"])
+    )
+    element_group.packed.append(tmp_packed["packed"])
+    element_group.exception_rows.append(tmp_packed["exception_rows"] + tmp_row_offset)
+    element_group.exception_positions.append(tmp_packed["exception_positions"])
+    element_group.exception_codes.append(tmp_packed["exception_codes"])
+    for column in chunk.columns:
+        if column != "sequence":
+            element_group._f_get_child(PACKED_COLUMN_PREFIX + column).append(
+                chunk[column].values
+            )
+    return
+
+
+def read_packed_metadata(element_group):
+    """Read all arrays of packed sequence element except packed bytes.
+
+    Parameters
+    ----------
+    element_group
+        Element group node of packed sequences.
+
+    Returns
+    -------
+        Dictionary with arrays and `columns` list of original table.
+    """
+    tmp_columns = list(element_group._v_attrs.columns)
+    metadata = {
+        array_name: element_group._f_get_child(array_name).read()
+        for array_name in PACKED_SEQUENCE_ARRAYS
+        if array_name != "packed"
+    }
+    for column in tmp_columns:
+        if column != "sequence":
+            metadata[PACKED_COLUMN_PREFIX + column] = element_group._f_get_child(
+                PACKED_COLUMN_PREFIX + column
+            ).read()
+    metadata["columns"] = tmp_columns
+    return metadata
+
+
+def _read_packed_arguments(element_group, metadata, rows):
+    """Read packed bytes and exceptions of `rows` as arguments of
+    :func:`.unpack_sequences`"""
+    tmp_byte_offsets = metadata["byte_offsets"]
+    tmp_exception_rows = metadata["exception_rows"]
+    # Packed bytes are read once per run of consecutive rows.
+    tmp_packed = [
+        element_group.packed.read(
+            tmp_byte_offsets[first_row], tmp_byte_offsets[last_row + 1]
+        )
+        for first_row, last_row in get_row_runs(rows)
+    ]
+    tmp_exception_starts = np.searchsorted(tmp_exception_rows, rows, side="left")
+    tmp_exception_stops = np.searchsorted(tmp_exception_rows, rows, side="right")
+    tmp_exceptions = _expand_ranges(tmp_exception_starts, tmp_exception_stops)
+    return (
+        np.concatenate(tmp_packed) if tmp_packed else np.empty(0, dtype=np.uint8),
+        metadata["lengths"][rows],
+        tmp_byte_offsets[rows + 1] - tmp_byte_offsets[rows],
+        np.repeat(
+            np.arange(len(rows), dtype=np.int64),
+            tmp_exception_stops - tmp_exception_starts,
+        ),
+        metadata["exception_positions"][tmp_exceptions],
+        metadata["exception_codes"][tmp_exceptions],
+    )
+
+
+def read_packed_rows(element_group, metadata, rows=None, columns=None):
+    """Decode rows of packed sequence element into table.
+
+    Parameters
+    ----------
+    element_group
+        Element group node of packed sequences.
+    metadata
+        Arrays returned by :func:`.read_packed_metadata`
+    rows
+        Row coordinates, :class:`slice` or None for all rows.
+    columns
+        Target columns or None for all columns.
+
+    Returns
+    -------
+        :class:`~pandas.DataFrame` in same layout as table element.
+    """
+    rows = get_row_coordinates(rows, metadata["index"].shape[0])
+    tmp_columns = metadata["columns"] if columns is None else list(columns)
+    product = {}
+    if "sequence" in tmp_columns:
+        product["sequence"] = unpack_sequences(
+            *_read_packed_arguments(element_group, metadata, rows)
+        )
+    for column in tmp_columns:
+        if column != "sequence":
+            product[column] = metadata[PACKED_COLUMN_PREFIX + column][rows]
+    return pd.DataFrame(
+        product,
+        index=pd.Index(metadata["index"][rows], name="index"),
+        columns=tmp_columns,
+    )
+
+
+def read_packed_buffer(element_group, metadata, rows=None):
+    """Decode rows of packed sequence element into single character buffer.
+
+    Parameters
+    ----------
+    element_group
+        Element group node of packed sequences.
+    metadata
+        Arrays returned by :func:`.read_packed_metadata`
+    rows
+        Row coordinates, :class:`slice` or None for all rows.
+
+    Returns
+    -------
+        Tuple of (:class:`~numpy.ndarray` with index of rows,
+        :class:`~numpy.ndarray` of uint8 character codes,
+        :class:`~numpy.ndarray` of row offsets with one extra element).
+    """
+    rows = get_row_coordinates(rows, metadata["index"].shape[0])
+    tmp_buffer, tmp_offsets = unpack_buffer(
+        *_read_packed_arguments(element_group, metadata, rows)
+    )
+    return metadata["index"][rows], tmp_buffer, tmp_offsets
@@ -0,0 +1,138 @@
+import multiprocessing
+from queue import Empty
+from collections import deque
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor
+
+# Forked children would inherit the open HDF5 file descriptor and its lock,
+# which prevents the writer from reopening the storage file.
+MP_CONTEXT = multiprocessing.get_context("spawn")
+
+FEEDER_ITEM = 0
+FEEDER_DONE = 1
+FEEDER_FAILED = 2
+# Number of tasks submitted ahead of the consumer per worker process.
+PREFETCH_PER_WORKER = 2
+
+
+def make_worker_pool(workers):
+    """Create process pool for parallel database construction.
+
+    Parameters
+    ----------
+    workers :
+        Number of worker processes. Value of 1 means sequential build.
+
+    Returns
+    -------
+        Context manager of :class:`~concurrent.futures.ProcessPoolExecutor`
+        or of None if `workers` is 1.
+    """
+    if isinstance(workers, int) and not isinstance(workers, bool):
+        if workers < 1:
+            raise ValueError("`workers` must be greater than zero.")
+    else:
+        raise TypeError("`workers` must be integer.")
+    return (
+        ProcessPoolExecutor(max_workers=workers, mp_context=MP_CONTEXT)
+        if workers > 1
+        else nullcontext()
+    )
+
+
+def _feed_queue(queue, generator_function, args):
+    """Worker process target that pushes generator items into the queue.
+
+    Parameters
+    ----------
+    queue :
+        Bounded queue shared with parent process.
+    generator_function :
+        Picklable generator function.
+    args :
+        Arguments for `generator_function`.
+    """
+    try:
+        for item in generator_function(*args):
+            queue.put((FEEDER_ITEM, item))
+        queue.put((FEEDER_DONE, None))
+    except BaseException as error:
+        queue.put((FEEDER_FAILED, error))
+
+
+def iterate_in_process(generator_function, *args, prefetch=4):
+    """Run generator in separate process and iterate over its items.
+
+    The generator runs ahead of the consumer by at most `prefetch` items
+    so that parsing overlaps with writing to the storage in parent process.
+
+    Parameters
+    ----------
+    generator_function :
+        Picklable (module level) generator function.
+    *args :
+        Arguments for `generator_function`.
+    prefetch :
+        Maximum number of items to prefetch. (Default value = 4)
+
+    Returns
+    -------
+        Generator of items produced by `generator_function`.
+    """
+    tmp_queue = MP_CONTEXT.Queue(maxsize=prefetch)
+    tmp_feeder = MP_CONTEXT.Process(
+        target=_feed_queue, args=(tmp_queue, generator_function, args), daemon=True
+    )
+    tmp_feeder.start()
+    try:
+        while True:
+            try:
+                status, item = tmp_queue.get(timeout=1)
+            except Empty:
+                if not tmp_feeder.is_alive():
+                    raise RuntimeError("Feeder process terminated unexpectedly.")
+                continue
+            if status == FEEDER_DONE:
+                break
+            elif status == FEEDER_FAILED:
+                raise item
+            yield item
+        tmp_feeder.join()
+    finally:
+        if tmp_feeder.is_alive():
+            tmp_feeder.terminate()
+            tmp_feeder.join()
+        tmp_queue.close()
+
+
+def map_in_pool(worker_pool, function, iterable, prefetch):
+    """Ordered map of `function` over `iterable` using `worker_pool`.
+
+    At most `prefetch` items are submitted ahead of the consumer so that
+    chunked data is never fully loaded to memory.
+
+    Parameters
+    ----------
+    worker_pool :
+        Active :class:`~concurrent.futures.ProcessPoolExecutor`
+    function :
+        Picklable (module level) function.
+    iterable :
+        Iterable of items to process.
+    prefetch :
+        Maximum number of pending tasks. Usually :const:`PREFETCH_PER_WORKER`
+        times the number of workers of `worker_pool`.
+
+    Returns
+    -------
+        Generator of results in the order of `iterable`.
+    """
+    if prefetch < 1:
+        raise ValueError("`prefetch` must be greater than zero.")
+    pending = deque()
+    for item in iterable:
+        pending.append(worker_pool.submit(function, item))
+        if len(pending) >= prefetch:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
@@ -0,0 +1,203 @@
+import sys
+import threading
+from collections import OrderedDict, defaultdict
+import numpy as np
+import pandas as pd
+
+# Approximate per-row overhead of cache entry and its key.
+ROW_OVERHEAD_BYTES = 200
+
+
+class RowCache:
+    """Least recently used cache of table rows bounded by size in bytes.
+
+    Rows are keyed by storage element and row coordinate within the element
+    so that retrieval can be split into cached rows and rows that must be
+    selected from the storage file.
+    """
+
+    def __init__(self, max_bytes):
+        """Constructor for :class:`.RowCache`
+
+        Parameters
+        ----------
+        max_bytes
+            Maximum approximate size of cached rows in bytes.
+        """
+        if isinstance(max_bytes, int) and not isinstance(max_bytes, bool):
+            if max_bytes < 0:
+                raise ValueError("`max_bytes` must be non-negative.")
+        else:
+            raise TypeError("`max_bytes` must be integer.")
+        self._max_bytes = max_bytes
+        self._lock = threading.RLock()
+        self._rows = OrderedDict()
+        self._element_layouts = {}
+        self._size_bytes = 0
+        self._element_bytes = defaultdict(int)
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def split_coordinates(self, element_key, coordinates):
+        """Split `coordinates` into cached and missing ones.
+
+        Parameters
+        ----------
+        element_key
+            Target storage element
+        coordinates
+            Row coordinates of target storage element
+
+        Returns
+        -------
+            Tuple of (dictionary with coordinates and cached rows,
+            :class:`~numpy.ndarray` with coordinates that are not cached).
+        """
+        cached_rows = {}
+        missing = []
+        with self._lock:
+            for coordinate in coordinates:
+                tmp_key = (element_key, coordinate)
+                if tmp_key in self._rows:
+                    self._rows.move_to_end(tmp_key)
+                    cached_rows[coordinate] = self._rows[tmp_key][0]
+                else:
+                    missing.append(coordinate)
+            self._misses += len(missing)
+            self._hits += len(cached_rows)
+        return cached_rows, np.asarray(missing, dtype=np.int64)
+
+    def assemble(
+        self, element_key, coordinates, cached_rows, missing_coordinates, missing_df
+    ):
+        """Combine cached rows with newly selected rows and cache the latter.
+
+        Parameters
+        ----------
+        element_key
+            Target storage element
+        coordinates
+            Row coordinates of target storage element in output order.
+        cached_rows
+            Cached rows returned by :meth:`.split_coordinates`
+        missing_coordinates
+            Coordinates that were returned by :meth:`.split_coordinates`
+        missing_df
+            Rows selected from storage for `missing_coordinates`
+
+        Returns
+        -------
+            :class:`~pandas.DataFrame` with rows for `coordinates`
+        """
+        product_rows = dict(cached_rows)
+        with self._lock:
+            if missing_df is not None:
+                self._element_layouts[element_key] = (
+                    missing_df.columns,
+                    missing_df.dtypes,
+                    missing_df.index.name,
+                )
+                for coordinate, row in zip(
+                    missing_coordinates.tolist(),
+                    missing_df.itertuples(index=True, name=None),
+                ):
+                    product_rows[coordinate] = row
+                    self.__put((element_key, coordinate), row)
+            columns, dtypes, index_name = self._element_layouts[element_key]
+        product_rows = [product_rows[coordinate] for coordinate in coordinates]
+        product = pd.DataFrame.from_records(
+            [row[1:] for row in product_rows],
+            columns=columns,
+            index=pd.Index([row[0] for row in product_rows], name=index_name),
+        )
+        return product.astype(dtypes.to_dict())
+
+    def __put(self, row_key, row):
+        """Cache single row and evict least recently used rows."""
+        row_bytes = ROW_OVERHEAD_BYTES + sum(sys.getsizeof(value) for value in row)
+        if row_bytes > self._max_bytes:
+            return
+        if row_key in self._rows:
+            self.__pop(row_key)
+        self._rows[row_key] = (row, row_bytes)
+        self._size_bytes += row_bytes
+        self._element_bytes[row_key[0]] += row_bytes
+        self.__evict()
+        return
+
+    def __pop(self, row_key=None):
+        """Remove row by `row_key` or least recently used row if None."""
+        if row_key is None:
+            row_key, (_, row_bytes) = self._rows.popitem(last=False)
+        else:
+            _, row_bytes = self._rows.pop(row_key)
+        self._size_bytes -= row_bytes
+        self._element_bytes[row_key[0]] -= row_bytes
+        return
+
+    def __evict(self):
+        """Evict least recently used rows until cache fits `max_bytes`"""
+        while self._size_bytes > self._max_bytes:
+            self.__pop()
+            self._evictions += 1
+        return
+
+    def resize(self, max_bytes):
+        """Change maximum size of cache and evict rows if necessary.
+
+        Parameters
+        ----------
+        max_bytes
+            New maximum approximate size of cached rows in bytes.
+        """
+        with self._lock:
+            self._max_bytes = max(int(max_bytes), 0)
+            self.__evict()
+        return
+
+    def discard_element(self, element_key):
+        """Drop all cached rows of `element_key`
+
+        Parameters
+        ----------
+        element_key
+            Target storage element
+        """
+        with self._lock:
+            for row_key in [
+                row_key for row_key in self._rows.keys() if row_key[0] == element_key
+            ]:
+                self.__pop(row_key)
+        return
+
+    def clear(self):
+        """Drop all cached rows. Counters are kept."""
+        with self._lock:
+            self._rows.clear()
+            self._element_layouts.clear()
+            self._element_bytes.clear()
+            self._size_bytes = 0
+        return
+
+    @property
+    def element_sizes(self):
+        """Size of cached rows in bytes per storage element."""
+        with self._lock:
+            return {
+                element_key: element_bytes
+                for element_key, element_bytes in self._element_bytes.items()
+                if element_bytes > 0
+            }
+
+    @property
+    def stats(self):
+        """Cache counters and current size."""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "rows": len(self._rows),
+            "size_bytes": self._size_bytes,
+            "max_bytes": self._max_bytes,
+        }
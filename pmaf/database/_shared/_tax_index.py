@@ -0,0 +1,294 @@
+import numpy as np
+
+TAXONOMY_INDEX_NAMES = [
+    "ranks",
+    "rids",
+    "row_order",
+    "tids",
+    "tid_ranks",
+    "row_starts",
+    "row_stops",
+    "tid_stops",
+]
+
+
+def make_taxonomy_index(map2tid):
+    """Build nested-set index of taxonomy hierarchy from *map-rep2tid*
+
+    Rows are ordered lexicographically by rank columns so that :term:`rids`
+    of every :term:`tid` form single contiguous block. Taxa are numbered in
+    preorder of their blocks so that all :term:`subs` of a taxon directly
+    follow it.
+
+    Parameters
+    ----------
+    map2tid :
+        :class:`~pandas.DataFrame` of *map-rep2tid* storage element.
+
+    Returns
+    -------
+        Dictionary with arrays named as in :data:`TAXONOMY_INDEX_NAMES` or
+        None if any :term:`tid` has more than one parent or rank.
+    """
+    tmp_ranks = [rank for rank in map2tid.columns if rank != "tid"]
+    tmp_values = map2tid[tmp_ranks].values
+    tmp_total_rows = tmp_values.shape[0]
+    tmp_row_order = np.lexsort(tmp_values.T[::-1]).astype(np.int64)
+    tmp_sorted = tmp_values[tmp_row_order]
+    tmp_tids = []
+    tmp_tid_ranks = []
+    tmp_row_starts = []
+    tmp_row_stops = []
+    for rank_position in range(len(tmp_ranks)):
+        tmp_column = tmp_sorted[:, rank_position]
+        tmp_breaks = np.flatnonzero(tmp_column[1:] != tmp_column[:-1]) + 1
+        tmp_starts = np.concatenate([[0], tmp_breaks])[:tmp_total_rows]
+        tmp_stops = np.append(tmp_breaks, tmp_total_rows)[: tmp_starts.shape[0]]
+        tmp_valid = tmp_column[tmp_starts] > 0
+        tmp_starts, tmp_stops = tmp_starts[tmp_valid], tmp_stops[tmp_valid]
+        # Sorted block has single parent only if its first and last rows
+        # share all higher ranks.
+        if (
+            tmp_sorted[tmp_starts, :rank_position]
+            != tmp_sorted[tmp_stops - 1, :rank_position]
+        ).any():
+            return None
+        tmp_tids.append(tmp_column[tmp_starts])
+        tmp_tid_ranks.append(np.full(tmp_starts.shape[0], rank_position, np.int8))
+        tmp_row_starts.append(tmp_starts)
+        tmp_row_stops.append(tmp_stops)
+    tids = np.concatenate(tmp_tids)
+    if np.unique(tids).shape[0] != tids.shape[0]:
+        return None
+    tid_ranks = np.concatenate(tmp_tid_ranks)
+    row_starts = np.concatenate(tmp_row_starts).astype(np.int64)
+    row_stops = np.concatenate(tmp_row_stops).astype(np.int64)
+    tmp_preorder = np.lexsort((tid_ranks, row_starts))
+    row_starts = row_starts[tmp_preorder]
+    row_stops = row_stops[tmp_preorder]
+    return {
+        "ranks": np.asarray(tmp_ranks, dtype=bytes),
+        "rids": map2tid.index.values,
+        "row_order": tmp_row_order,
+        "tids": tids[tmp_preorder],
+        "tid_ranks": tid_ranks[tmp_preorder],
+        "row_starts": row_starts,
+        "row_stops": row_stops,
+        "tid_stops": np.searchsorted(row_starts, row_stops, side="left").astype(
+            np.int64
+        ),
+    }
+
+
+class TaxonomyIndex:
+    """Nested-set index of taxonomy hierarchy produced by
+    :func:`.make_taxonomy_index`
+
+    :term:`subs` and :term:`rids` under a :term:`tid` are retrieved as
+    slices of preorder arrays.
+    """
+
+    def __init__(self, index_arrays):
+        """Constructor for :class:`.TaxonomyIndex`
+
+        Parameters
+        ----------
+        index_arrays
+            Dictionary with arrays named as in :data:`TAXONOMY_INDEX_NAMES`
+        """
+        self._ranks = [
+            rank.decode() if isinstance(rank, bytes) else str(rank)
+            for rank in index_arrays["ranks"]
+        ]
+        self._rids = index_arrays["rids"]
+        self._row_order = index_arrays["row_order"]
+        self._tids = index_arrays["tids"]
+        self._tid_ranks = index_arrays["tid_ranks"]
+        self._row_starts = index_arrays["row_starts"]
+        self._row_stops = index_arrays["row_stops"]
+        self._tid_stops = index_arrays["tid_stops"]
+        self._tid_sorter = np.argsort(self._tids, kind="stable")
+        self._sorted_tids = self._tids[self._tid_sorter]
+
+    def get_positions(self, tids):
+        """Get preorder positions of `tids`
+
+        Parameters
+        ----------
+        tids
+            Target :term:`tids`
+
+        Returns
+        -------
+            :class:`~numpy.ndarray` of positions with -1 for :term:`tids`
+            that are absent in the hierarchy.
+        """
+        tmp_tids = np.asarray(tids)
+        tmp_sorted_tids = self._sorted_tids
+        if tmp_sorted_tids.shape[0] == 0:
+            return np.full(tmp_tids.shape[0], -1, dtype=np.int64)
+        tmp_found = np.searchsorted(tmp_sorted_tids, tmp_tids).clip(
+            0, tmp_sorted_tids.shape[0] - 1
+        )
+        return np.where(
+            tmp_sorted_tids[tmp_found] == tmp_tids, self._tid_sorter[tmp_found], -1
+        )
+
+    def get_rank(self, position):
+        """Get rank of :term:`tid` at preorder `position`"""
+        return self._ranks[self._tid_ranks[position]]
+
+    def get_sub_tids(self, position, ranks=None):
+        """Get :term:`subs` of :term:`tid` at preorder `position`
+
+        Parameters
+        ----------
+        position
+            Preorder position from :meth:`.get_positions`
+        ranks
+            Ranks of :term:`subs` to keep or None for all ranks.
+
+        Returns
+        -------
+            Sorted :class:`~numpy.ndarray` of :term:`subs`
+        """
+        tmp_slice = slice(position + 1, self._tid_stops[position])
+        tmp_sub_tids = self._tids[tmp_slice]
+        if ranks is not None:
+            tmp_rank_positions = [
+                rank_position
+                for rank_position, rank in enumerate(self._ranks)
+                if rank in ranks
+            ]
+            tmp_sub_tids = tmp_sub_tids[
+                np.isin(self._tid_ranks[tmp_slice], tmp_rank_positions)
+            ]
+        return np.sort(tmp_sub_tids)
+
+    def get_rids(self, position):
+        """Get :term:`rids` under :term:`tid` at preorder `position` in
+        storage order.
+
+        Parameters
+        ----------
+        position
+            Preorder position from :meth:`.get_positions`
+
+        Returns
+        -------
+            :class:`~numpy.ndarray` of :term:`rids`
+        """
+        return self._rids[
+            np.sort(
+                self._row_order[self._row_starts[position] : self._row_stops[position]]
+            )
+        ]
+
+
+def make_tid_rid_index(map2tid):
+    """Build compressed sparse row index of :term:`rids` per :term:`tid`
+    from *map-rep2tid*
+
+    Parameters
+    ----------
+    map2tid :
+        :class:`~pandas.DataFrame` of *map-rep2tid* storage element.
+
+    Returns
+    -------
+        Dictionary with sorted unique :term:`tids` as *tids*, :term:`rids`
+        grouped by :term:`tid` in storage order as *rids* and *offsets* of
+        each group within *rids*.
+    """
+    tmp_row_tids = map2tid["tid"].values
+    tmp_row_order = np.argsort(tmp_row_tids, kind="stable")
+    tmp_sorted_tids = tmp_row_tids[tmp_row_order]
+    tids = np.unique(tmp_sorted_tids)
+    return {
+        "tids": tids,
+        "rids": map2tid.index.values[tmp_row_order],
+        "offsets": np.append(
+            np.searchsorted(tmp_sorted_tids, tids, side="left"),
+            tmp_sorted_tids.shape[0],
+        ).astype(np.int64),
+    }
+
+
+class TidRidIndex:
+    """Compressed sparse row index of :term:`rids` per :term:`tid` produced
+    by :func:`.make_tid_rid_index`"""
+
+    def __init__(self, index_arrays):
+        """Constructor for :class:`.TidRidIndex`
+
+        Parameters
+        ----------
+        index_arrays
+            Dictionary with *tids*, *rids* and *offsets* arrays
+        """
+        self._tids = index_arrays["tids"]
+        self._rids = index_arrays["rids"]
+        self._offsets = index_arrays["offsets"]
+
+    def get_bounds(self, tids):
+        """Get start and stop offsets of :term:`rids` for `tids`
+
+        Parameters
+        ----------
+        tids
+            Target :term:`tids`
+
+        Returns
+        -------
+            Tuple of start and stop :class:`~numpy.ndarray`. Both are equal for
+            :term:`tids` without :term:`rids`.
+        """
+        tmp_tids = np.asarray(tids)
+        tmp_found = np.searchsorted(self._tids, tmp_tids)
+        tmp_valid = np.zeros(tmp_tids.shape[0], dtype=bool)
+        tmp_in_range = tmp_found < self._tids.shape[0]
+        tmp_valid[tmp_in_range] = (
+            self._tids[tmp_found[tmp_in_range]] == tmp_tids[tmp_in_range]
+        )
+        tmp_starts = self._offsets[tmp_found.clip(0, self._tids.shape[0])]
+        tmp_stops = np.where(
+            tmp_valid, self._offsets[(tmp_found + 1).clip(0, self._tids.shape[0])], 0
+        )
+        return np.where(tmp_valid, tmp_starts, 0), tmp_stops
+
+    def get_rids(self, tids):
+        """Get :term:`rids` of each :term:`tid` in `tids`
+
+        Parameters
+        ----------
+        tids
+            Target :term:`tids`
+
+        Returns
+        -------
+            List of :class:`~numpy.ndarray` of :term:`rids` in storage order
+        """
+        tmp_starts, tmp_stops = self.get_bounds(tids)
+        return [
+            self._rids[start:stop]
+            for start, stop in zip(tmp_starts.tolist(), tmp_stops.tolist())
+        ]
+
+    def get_flat_rids(self, tids):
+        """Get sorted unique :term:`rids` of all `tids`
+
+        Parameters
+        ----------
+        tids
+            Target :term:`tids`
+
+        Returns
+        -------
+            :class:`~numpy.ndarray` of :term:`rids`
+        """
+        tmp_starts, tmp_stops = self.get_bounds(np.unique(tids))
+        tmp_lengths = tmp_stops - tmp_starts
+        tmp_positions = np.repeat(
+            tmp_starts - np.cumsum(tmp_lengths) + tmp_lengths, tmp_lengths
+        ) + np.arange(tmp_lengths.sum())
+        return np.unique(self._rids[tmp_positions])
@@ -0,0 +1,391 @@
+import numpy as np
+import ete3
+
+TREE_ARRAY_NAMES = [
+    "parent",
+    "length",
+    "support",
+    "name_id",
+    "name_offsets",
+    "name_buffer",
+    "tip_rids",
+    "tip_nodes",
+]
+
+
+def make_tree_arrays(tree_object):
+    """Convert tree to columnar arrays in postorder.
+
+    Nodes are numbered in postorder so that every child precedes its parent
+    and the root is the last node. Node names are deduplicated and kept as
+    single UTF-8 buffer with offsets so that only required names are ever
+    decoded. Tips with :term:`rid` names are indexed by sorted `tip_rids`.
+
+    Parameters
+    ----------
+    tree_object :
+        :mod:`ete3` tree with :term:`rids` as tip names.
+
+    Returns
+    -------
+        Dictionary with arrays named as in :data:`TREE_ARRAY_NAMES`
+    """
+    tmp_nodes = list(tree_object.traverse("postorder"))
+    tmp_node_positions = {node: position for position, node in enumerate(tmp_nodes)}
+    parent = np.asarray(
+        [
+            tmp_node_positions[node.up] if node.up is not None else -1
+            for node in tmp_nodes
+        ],
+        dtype=np.int64,
+    )
+    length = np.asarray([node.dist for node in tmp_nodes], dtype=np.float64)
+    support = np.asarray([node.support for node in tmp_nodes], dtype=np.float64)
+    names, name_id = np.unique(
+        np.asarray([str(node.name) for node in tmp_nodes], dtype=object),
+        return_inverse=True,
+    )
+    encoded_names = [name.encode("utf-8") for name in names]
+    name_offsets = np.zeros(len(encoded_names) + 1, dtype=np.int64)
+    name_offsets[1:] = np.cumsum([len(name) for name in encoded_names])
+    name_buffer = np.frombuffer(b"".join(encoded_names), dtype=np.uint8)
+
+    tip_rids = []
+    tip_nodes = []
+    for position, node in enumerate(tmp_nodes):
+        if node.is_leaf():
+            tmp_name = str(node.name)
+            if tmp_name.isdigit() and str(int(tmp_name)) == tmp_name:
+                tip_rids.append(int(tmp_name))
+                tip_nodes.append(position)
+    tip_rids = np.asarray(tip_rids, dtype=np.int64)
+    tip_nodes = np.asarray(tip_nodes, dtype=np.int64)
+    tip_order = np.argsort(tip_rids, kind="stable")
+    return {
+        "parent": parent,
+        "length": length,
+        "support": support,
+        "name_id": name_id.astype(np.int64),
+        "name_offsets": name_offsets,
+        "name_buffer": name_buffer.copy(),
+        "tip_rids": tip_rids[tip_order],
+        "tip_nodes": tip_nodes[tip_order],
+    }
+
+
+def _expand_ranges(starts, stops):
+    """Concatenate ranges between `starts` and `stops` without looping."""
+    counts = stops - starts
+    return np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(
+        counts.sum(), dtype=np.int64
+    )
+
+
+def find_tip_nodes(tree_arrays, rids):
+    """Find tip nodes for target :term:`rids`
+
+    Parameters
+    ----------
+    tree_arrays :
+        Tree arrays as produced by :func:`make_tree_arrays`
+    rids :
+        Target :term:`rids`
+
+    Returns
+    -------
+        Tuple of (postorder node positions, :term:`rids` of these nodes).
+        Tips that share a :term:`rid` are all included.
+    """
+    target_rids = np.unique(np.asarray(rids, dtype=np.int64))
+    tip_rids = tree_arrays["tip_rids"]
+    positions = _expand_ranges(
+        np.searchsorted(tip_rids, target_rids, side="left"),
+        np.searchsorted(tip_rids, target_rids, side="right"),
+    )
+    return tree_arrays["tip_nodes"][positions], tip_rids[positions]
+
+
+def find_group_tip_nodes(tree_arrays, group_rids):
+    """Find tip nodes for many groups of :term:`rids` at once.
+
+    Parameters
+    ----------
+    tree_arrays :
+        Tree arrays as produced by :func:`make_tree_arrays`
+    group_rids :
+        List with :term:`rids` of each group.
+
+    Returns
+    -------
+        Tuple of (group index of each tip, postorder node positions).
+    """
+    group_sizes = np.asarray([len(rids) for rids in group_rids], dtype=np.int64)
+    flat_rids = np.fromiter(
+        (rid for rids in group_rids for rid in rids),
+        dtype=np.int64,
+        count=group_sizes.sum(),
+    )
+    flat_groups = np.repeat(np.arange(group_sizes.shape[0]), group_sizes)
+    tip_rids = tree_arrays["tip_rids"]
+    starts = np.searchsorted(tip_rids, flat_rids, side="left")
+    stops = np.searchsorted(tip_rids, flat_rids, side="right")
+    return (
+        np.repeat(flat_groups, stops - starts),
+        tree_arrays["tip_nodes"][_expand_ranges(starts, stops)],
+    )
+
+
+def get_subtree_starts(parent):
+    """Get first postorder position of the subtree of every node.
+
+    In postorder every subtree occupies contiguous range of positions that
+    ends with its root. The range starts at the leftmost tip, which is found
+    by jumping over first children.
+
+    Parameters
+    ----------
+    parent :
+        Postorder parent index array.
+
+    Returns
+    -------
+        Array with first postorder position of each subtree.
+    """
+    node_indices = np.arange(parent.shape[0], dtype=np.int64)
+    has_parent = parent >= 0
+    subtree_starts = node_indices.copy()
+    np.minimum.at(subtree_starts, parent[has_parent], node_indices[has_parent])
+    while True:
+        next_starts = subtree_starts[subtree_starts]
+        if np.array_equal(next_starts, subtree_starts):
+            return subtree_starts
+        subtree_starts = next_starts
+
+
+def mark_root_paths(parent, target_nodes, subtree_starts=None):
+    """Mark all nodes that are on the paths from `target_nodes` to root.
+
+    Node is on the path of a target if target falls within the postorder
+    range of its subtree, so that union of all paths is marked at once.
+
+    Parameters
+    ----------
+    parent :
+        Postorder parent index array.
+    target_nodes :
+        Postorder positions of target nodes.
+    subtree_starts :
+        Output of :func:`get_subtree_starts`. Computed if not provided.
+
+    Returns
+    -------
+        Boolean mask of marked nodes. Root is always marked.
+    """
+    if subtree_starts is None:
+        subtree_starts = get_subtree_starts(parent)
+    target_nodes = np.unique(np.asarray(target_nodes, dtype=np.int64))
+    marked = np.searchsorted(target_nodes, subtree_starts, side="left") < (
+        np.searchsorted(target_nodes, np.arange(parent.shape[0]), side="right")
+    )
+    marked[-1] = True
+    return marked
+
+
+def find_mrca_nodes(
+    parent, group_indices, group_nodes, total_groups=None, subtree_starts=None
+):
+    """Find most recent common ancestor for each group of nodes.
+
+    Parameters
+    ----------
+    parent :
+        Postorder parent index array.
+    group_indices :
+        Group index of every node in `group_nodes`. Groups are numbered
+        from zero.
+    group_nodes :
+        Postorder positions of grouped nodes.
+    total_groups :
+        Total number of groups. Inferred from `group_indices` if not provided.
+    subtree_starts :
+        Output of :func:`get_subtree_starts`. Computed if not provided.
+
+    Returns
+    -------
+        Tuple of (postorder positions of common ancestors, first postorder
+        position within each group). Groups without nodes get -1.
+    """
+    if subtree_starts is None:
+        subtree_starts = get_subtree_starts(parent)
+    group_indices = np.asarray(group_indices, dtype=np.int64)
+    group_nodes = np.asarray(group_nodes, dtype=np.int64)
+    if total_groups is None:
+        total_groups = group_indices.max() + 1 if group_indices.shape[0] > 0 else 0
+    group_firsts = np.full(total_groups, parent.shape[0], dtype=np.int64)
+    group_lasts = np.full(total_groups, -1, dtype=np.int64)
+    np.minimum.at(group_firsts, group_indices, group_nodes)
+    np.maximum.at(group_lasts, group_indices, group_nodes)
+    mrca_nodes = group_lasts.copy()
+    active = np.flatnonzero(mrca_nodes >= 0)
+    active = active[subtree_starts[mrca_nodes[active]] > group_firsts[active]]
+    while active.shape[0] > 0:
+        mrca_nodes[active] = parent[mrca_nodes[active]]
+        active = active[subtree_starts[mrca_nodes[active]] > group_firsts[active]]
+    group_firsts[group_lasts < 0] = -1
+    return mrca_nodes, group_firsts
+
+
+def _climb_removed_nodes(parent, length, removed, upper_nodes, upper_lengths):
+    """Move `upper_nodes` up over `removed` nodes and sum their lengths."""
+    upper_nodes = np.array(upper_nodes, dtype=np.int64)
+    upper_lengths = np.array(upper_lengths, dtype=np.float64)
+    active = np.flatnonzero(upper_nodes >= 0)
+    active = active[removed[upper_nodes[active]]]
+    while active.shape[0] > 0:
+        upper_lengths[active] += length[upper_nodes[active]]
+        upper_nodes[active] = parent[upper_nodes[active]]
+        active = active[removed[upper_nodes[active]]]
+    return upper_nodes, upper_lengths
+
+
+def collapse_unary_nodes(
+    parent, length, marked, anchors=None, anchor_length=1.0, collapse_root=False
+):
+    """Get induced subtree of `marked` nodes with collapsed unary nodes.
+
+    Every marked node except root that has single marked child is removed
+    and its branch length is added to the child. Root is always kept.
+
+    Parameters
+    ----------
+    parent :
+        Postorder parent index array.
+    length :
+        Postorder branch length array.
+    marked :
+        Boolean mask of nodes to include. Parent of every marked node except
+        the root must be marked as well.
+    anchors :
+        Postorder positions of marked nodes that receive new tip as last
+        child. New tips count as children during collapsing.
+    anchor_length :
+        Branch length of new tips. (Default value = 1.0)
+    collapse_root :
+        Whether to merge unary root with its only child if the child is not
+        a tip. Root then takes over the children of the merged node and its
+        branch length, same as :meth:`ete3.TreeNode.prune` does.
+        (Default value = False)
+
+    Returns
+    -------
+        Tuple of (kept postorder positions, their parent positions, their
+        branch lengths, parent positions of new tips, branch lengths of new
+        tips).
+    """
+    has_parent = parent >= 0
+    child_counts = np.bincount(parent[marked & has_parent], minlength=parent.shape[0])
+    if anchors is None:
+        anchors = np.empty(0, dtype=np.int64)
+    else:
+        anchors = np.asarray(anchors, dtype=np.int64)
+        child_counts += np.bincount(anchors, minlength=parent.shape[0])
+    removed = marked & has_parent & (child_counts == 1)
+    kept_nodes = np.flatnonzero(marked & ~removed)
+    kept_parents, kept_lengths = _climb_removed_nodes(
+        parent, length, removed, parent[kept_nodes], length[kept_nodes]
+    )
+    anchor_parents, anchor_lengths = _climb_removed_nodes(
+        parent,
+        length,
+        removed,
+        anchors,
+        np.full(anchors.shape[0], anchor_length, dtype=np.float64),
+    )
+    if collapse_root:
+        root_node = parent.shape[0] - 1
+        root_children = np.flatnonzero(kept_parents == root_node)
+        if root_children.shape[0] == 1 and child_counts[root_node] == 1:
+            merged_position = root_children[0]
+            merged_node = kept_nodes[merged_position]
+            if (kept_parents == merged_node).any() or (
+                anchor_parents == merged_node
+            ).any():
+                kept_lengths[-1] += kept_lengths[merged_position]
+                kept_parents[kept_parents == merged_node] = root_node
+                anchor_parents[anchor_parents == merged_node] = root_node
+                kept_nodes, kept_parents, kept_lengths = (
+                    np.delete(kept_nodes, merged_position),
+                    np.delete(kept_parents, merged_position),
+                    np.delete(kept_lengths, merged_position),
+                )
+    return kept_nodes, kept_parents, kept_lengths, anchor_parents, anchor_lengths
+
+
+def get_node_names(tree_arrays, nodes):
+    """Decode names for target nodes only.
+
+    Parameters
+    ----------
+    tree_arrays :
+        Tree arrays as produced by :func:`make_tree_arrays`
+    nodes :
+        Postorder positions of target nodes.
+
+    Returns
+    -------
+        List of node names.
+    """
+    name_ids = tree_arrays["name_id"][nodes]
+    name_offsets = tree_arrays["name_offsets"]
+    name_buffer = tree_arrays["name_buffer"]
+    return [
+        name_buffer[name_offsets[name_id] : name_offsets[name_id + 1]]
+        .tobytes()
+        .decode("utf-8")
+        for name_id in name_ids
+    ]
+
+
+def build_ete3_subtree(tree_arrays, nodes, node_parents, node_lengths):
+    """Build :mod:`ete3` tree from nodes produced by
+    :func:`collapse_unary_nodes`.
+
+    Children keep the order of the original tree.
+
+    Parameters
+    ----------
+    tree_arrays :
+        Tree arrays as produced by :func:`make_tree_arrays`
+    nodes :
+        Ascending postorder positions of nodes to include.
+    node_parents :
+        Postorder positions of parents of `nodes` or -1 for root.
+    node_lengths :
+        Branch lengths of `nodes`
+
+    Returns
+    -------
+        Tuple of (root of new tree, dictionary with postorder positions and
+        new nodes).
+    """
+    node_names = get_node_names(tree_arrays, nodes)
+    node_supports = tree_arrays["support"][nodes].tolist()
+    node_map = {}
+    root_node = None
+    for node, node_parent, name, dist, support in zip(
+        np.asarray(nodes).tolist(),
+        np.asarray(node_parents).tolist(),
+        node_names,
+        np.asarray(node_lengths).tolist(),
+        node_supports,
+    ):
+        node_map[node] = ete3.TreeNode(name=name, dist=dist, support=support)
+        if node_parent < 0:
+            root_node = node_map[node]
+    # Parents follow their children in postorder.
+    for node, node_parent in zip(
+        np.asarray(nodes).tolist(), np.asarray(node_parents).tolist()
+    ):
+        if node_parent >= 0:
+            node_map[node_parent].add_child(node_map[node])
+    return root_node, node_map
@@ -1,6 +1,7 @@
 import csv
 import pandas as pd
 import numpy as np
+import scipy.sparse as sp
 import os
 import dateparser
 from ._constants import (
@@ -14,8 +15,7 @@ from ._constants import (
     ITS,
 )
 from ._extensions import cython_functions  # pragma: no cover
-import statistics
-from itertools import groupby, islice
+from itertools import islice, chain
 from pathlib import Path
 from typing import Union, Sequence, Optional
 
@@ -45,20 +45,27 @@ def to_array(data):
         return np.asarray([])
 
 
-def get_stats_for_sequence_record_df(sequence_record_df: pd.DataFrame) -> pd.DataFrame:
+def get_stats_for_sequence_record_df(
+    sequence_record_df: pd.DataFrame, blocksize: int = 2**22
+) -> pd.DataFrame:
     """Retrieve stats for :class:`pandas.DataFrame` with  sequence records.
 
+    Stats are computed for the whole chunk at once. Sequences are
+    concatenated into a single byte buffer that is processed in blocks of
+    at most `blocksize` bytes.
+
     Parameters
     ----------
     sequence_record_df
         Sequence record dataframe where cols/keys are 'sequence', 'length', 'tab'
+    blocksize
+        Approximate number of sequence bytes to process at once.
 
     Returns
     -------
         :class:`pandas.DataFrame` with sequence stats.
     """
     reps_ex_columns = list(IUPAC_AMBIGUOUS.keys())
-    reps_ex_buffer = {col: [] for col in reps_ex_columns}
     reps_columns = (
         [
             "length",
@@ -73,47 +80,91 @@ def get_stats_for_sequence_record_df(sequence_record_df: pd.DataFrame) -> pd.Dat
         + ["{}_repmax".format(col) for col in reps_ex_columns]
         + ["{}_repmin".format(col) for col in reps_ex_columns]
     )
+    total_bases = len(IUPAC_BASES)
+    total_ex = len(reps_ex_columns)
+    code_lookup = np.full(256, total_bases, dtype=np.int32)
+    for code, base in enumerate(IUPAC_BASES):
+        code_lookup[ord(base)] = code
+    ex_lookup = np.full(total_bases + 1, -1, dtype=np.int32)
+    for ex_code, base in enumerate(reps_ex_columns):
+        ex_lookup[IUPAC_BASES.index(base)] = ex_code
+    complexity_weights = np.asarray(
+        [len(IUPAC_AMBIGUOUS[base]) for base in reps_ex_columns], dtype=np.int64
+    )
 
-    def process_rep(rep_series):
-        """Generate stats for representative sequences."""
-        complexity_level = 0
-        abase_count = []
-        for b, bb in IUPAC_AMBIGUOUS.items():
-            total_abases = rep_series["sequence"].count(b)
-            abase_count.append(total_abases)
-            complexity_level = complexity_level + total_abases * len(bb)
-            if total_abases > 0:
-                base_reps = [
-                    len(list(y)) for (c, y) in groupby(rep_series["sequence"]) if c == b
-                ]
-                reps_ex_buffer[b] = [max(base_reps), min(base_reps)]
-            else:
-                reps_ex_buffer[b] = [0, 0]
-        base_count_list = [rep_series["sequence"].count(b) for b in IUPAC_BASES]
-        amb_repmax_list = [reps_ex_buffer[col][0] for col in reps_ex_columns]
-        amb_repmin_list = [reps_ex_buffer[col][1] for col in reps_ex_columns]
-        amb_mean = statistics.mean(abase_count)
-        amb_repmax_mean = statistics.mean(amb_repmax_list)
-        amb_repmin_mean = statistics.mean(amb_repmin_list)
-        amb_rep_mean = statistics.mean([amb_repmax_mean, amb_repmin_mean])
-        return (
-            [
-                rep_series["length"],
-                rep_series["tab"],
-                complexity_level,
-                amb_mean,
-                amb_rep_mean,
-                amb_repmax_mean,
-                amb_repmin_mean,
-            ]
-            + base_count_list
-            + amb_repmax_list
-            + amb_repmin_list
+    sequences = sequence_record_df["sequence"].tolist()
+    sequence_lengths = np.fromiter(map(len, sequences), dtype=np.int64)
+    total_rows = len(sequences)
+    base_counts = np.zeros((total_rows, total_bases), dtype=np.int64)
+    ex_repmax = np.zeros((total_rows, total_ex), dtype=np.int64)
+    ex_repmin = np.zeros((total_rows, total_ex), dtype=np.int64)
+
+    sequence_ends = np.cumsum(sequence_lengths)
+    block_first = 0
+    while block_first < total_rows:
+        block_offset = sequence_ends[block_first] - sequence_lengths[block_first]
+        block_last = max(
+            int(np.searchsorted(sequence_ends, block_offset + blocksize, side="right")),
+            block_first + 1,
         )
-
-    sequence_stats = sequence_record_df.apply(process_rep, axis=1, result_type="expand")
-    sequence_stats.columns = reps_columns
-    return sequence_stats
+        block_lengths = sequence_lengths[block_first:block_last]
+        block_rows = block_last - block_first
+        block_buffer = "".join(sequences[block_first:block_last]).encode(
+            "ascii", errors="replace"
+        )
+        block_codes = code_lookup[np.frombuffer(block_buffer, dtype=np.uint8)]
+        block_row_ids = np.repeat(np.arange(block_rows, dtype=np.int64), block_lengths)
+        base_counts[block_first:block_last] = np.bincount(
+            block_row_ids * (total_bases + 1) + block_codes,
+            minlength=block_rows * (total_bases + 1),
+        ).reshape(block_rows, total_bases + 1)[:, :total_bases]
+
+        if block_codes.size > 0:
+            run_marks = np.empty(block_codes.size, dtype=bool)
+            run_marks[0] = True
+            np.not_equal(block_codes[1:], block_codes[:-1], out=run_marks[1:])
+            row_starts = np.cumsum(block_lengths) - block_lengths
+            run_marks[row_starts[row_starts < block_codes.size]] = True
+            run_starts = np.flatnonzero(run_marks)
+            run_lengths = np.diff(np.append(run_starts, block_codes.size))
+            run_ex_codes = ex_lookup[block_codes[run_starts]]
+            ex_runs = run_ex_codes >= 0
+            run_keys = (
+                block_row_ids[run_starts[ex_runs]] * total_ex + run_ex_codes[ex_runs]
+            )
+            run_lengths = run_lengths[ex_runs]
+            block_repmax = np.zeros(block_rows * total_ex, dtype=np.int64)
+            np.maximum.at(block_repmax, run_keys, run_lengths)
+            block_repmin = np.full(block_rows * total_ex, np.iinfo(np.int64).max)
+            np.minimum.at(block_repmin, run_keys, run_lengths)
+            block_repmin[block_repmax == 0] = 0
+            ex_repmax[block_first:block_last] = block_repmax.reshape(-1, total_ex)
+            ex_repmin[block_first:block_last] = block_repmin.reshape(-1, total_ex)
+        block_first = block_last
+
+    ex_counts = base_counts[:, [IUPAC_BASES.index(base) for base in reps_ex_columns]]
+    amb_repmax_mean = ex_repmax.sum(axis=1) / total_ex
+    amb_repmin_mean = ex_repmin.sum(axis=1) / total_ex
+    stats_values = np.column_stack(
+        [
+            sequence_record_df["length"].to_numpy(),
+            sequence_record_df["tab"].to_numpy(),
+            ex_counts @ complexity_weights,
+            ex_counts.sum(axis=1) / total_ex,
+            (amb_repmax_mean + amb_repmin_mean) / 2,
+            amb_repmax_mean,
+            amb_repmin_mean,
+            base_counts,
+            ex_repmax,
+            ex_repmin,
+        ]
+    ).astype(np.float64)
+    if total_rows > 0 and np.all(np.mod(stats_values, 1) == 0):
+        # Row-wise stats used to yield integers when all means were exact.
+        stats_values = stats_values.astype(np.int64)
+    return pd.DataFrame(
+        stats_values, index=sequence_record_df.index, columns=reps_columns
+    )
 
 
 def chunk_generator(iterable, chunksize):
@@ -466,6 +517,170 @@ def cut_lineages(in_lineages, levels):
     return new_lineages_series
 
 
+def findall_ranked_taxa(pattern, lineages):
+    """Find ranked taxa elements of lineages with `pattern`.
+
+    Parameters
+    ----------
+    pattern
+        Compiled regular expression with rank and taxon groups like
+        :const:`pmaf.internal._constants.jRegexGG`
+    lineages
+        List of lineage strings.
+
+    Returns
+    -------
+        Tuple with lineage position of each element, list of ranks and list
+        of taxa.
+    """
+    tmp_matches = [pattern.findall(lineage) for lineage in lineages]
+    tmp_rows = np.repeat(
+        np.arange(len(lineages)),
+        np.fromiter(map(len, tmp_matches), dtype=np.int64, count=len(lineages)),
+    )
+    tmp_elements = list(chain.from_iterable(tmp_matches))
+    tmp_ranks, tmp_taxa = zip(*tmp_elements) if tmp_elements else ((), ())
+    return tmp_rows, list(tmp_ranks), list(tmp_taxa)
+
+
+def pivot_ranked_taxa(rows, ranks, taxa, total_rows):
+    """Pivot ranked taxa elements of lineages into taxa per rank.
+
+    Parameters
+    ----------
+    rows
+        Lineage position of each element.
+    ranks
+        Rank of each element.
+    taxa
+        Taxon of each element.
+    total_rows
+        Total number of lineages.
+
+    Returns
+    -------
+        Tuple with list of ranks in order of their first appearance and
+        :class:`numpy.ndarray` of taxa with shape (ranks, lineages). Last
+        taxon of the same rank within lineage is kept and missing taxa are
+        None.
+    """
+    tmp_rows = np.asarray(rows, dtype=np.int64)
+    tmp_rank_codes, tmp_ranks = pd.factorize(pd.Series(ranks, dtype=object))
+    tmp_taxa = np.empty(len(taxa), dtype=object)
+    tmp_taxa[:] = taxa
+    tmp_keys = tmp_rank_codes * total_rows + tmp_rows
+    _, tmp_last_elements = np.unique(tmp_keys[::-1], return_index=True)
+    tmp_last_elements = len(tmp_keys) - 1 - tmp_last_elements
+    tmp_sheet_values = np.full((len(tmp_ranks), total_rows), None, dtype=object)
+    tmp_sheet_values[tmp_rank_codes[tmp_last_elements], tmp_rows[tmp_last_elements]] = (
+        tmp_taxa[tmp_last_elements]
+    )
+    return tmp_ranks.tolist(), tmp_sheet_values
+
+
+def make_group_codes(mapping, ids):
+    """Translate group `mapping` into integer group codes of members.
+
+    Parameters
+    ----------
+    mapping
+        Map with values as list-like of member identifiers of each group.
+    ids
+        :class:`~pandas.Index` with identifiers of all members.
+
+    Returns
+    -------
+        Tuple with list of group keys, :class:`numpy.ndarray` of member
+        positions in `ids` and :class:`numpy.ndarray` of group code of each
+        member.
+    """
+    tmp_keys = list(mapping.keys())
+    tmp_groups = list(mapping.values())
+    tmp_sizes = np.fromiter(
+        (len(group) for group in tmp_groups), dtype=np.int64, count=len(tmp_groups)
+    )
+    tmp_positions = pd.Index(ids).get_indexer(list(chain.from_iterable(tmp_groups)))
+    if (tmp_positions < 0).any():
+        raise ValueError("Invalid ids were found.")
+    return tmp_keys, tmp_positions, np.repeat(np.arange(len(tmp_keys)), tmp_sizes)
+
+
+def aggregate_by_group_codes(data, positions, codes, total_groups, aggfunc):
+    """Aggregate rows of `data` by group codes from :func:`.make_group_codes`
+
+    Dense data is aggregated with single :meth:`~pandas.DataFrame.groupby`.
+    Sums and means of sparse data are computed as product with group
+    indicator matrix while other functions densify rows of one group at a
+    time. Sparse sums keep dtype of `data`.
+
+    Parameters
+    ----------
+    data
+        :class:`~pandas.DataFrame` or :mod:`scipy.sparse` matrix.
+    positions
+        Row positions of group members.
+    codes
+        Group code of each member.
+    total_groups
+        Total number of groups.
+    aggfunc
+        Aggregation function
+
+    Returns
+    -------
+        Aggregated :class:`~pandas.DataFrame` with group codes as index or
+        :mod:`scipy.sparse` matrix with one row per group.
+    """
+    tmp_positions = np.asarray(positions, dtype=np.int64)
+    tmp_codes = np.asarray(codes, dtype=np.int64)
+    if isinstance(data, pd.DataFrame):
+        tmp_total_rows = data.shape[0]
+        if (
+            tmp_positions.shape[0] == tmp_total_rows
+            and np.bincount(tmp_positions, minlength=tmp_total_rows).max(initial=1) == 1
+        ):
+            # Every row belongs to exactly one group so no rows are taken.
+            tmp_row_codes = np.empty(tmp_total_rows, dtype=np.int64)
+            tmp_row_codes[tmp_positions] = tmp_codes
+            tmp_grouped = data.groupby(tmp_row_codes, sort=True)
+        else:
+            tmp_grouped = data.take(tmp_positions).groupby(tmp_codes, sort=True)
+        tmp_aggregated = tmp_grouped.agg(aggfunc)
+        if isinstance(aggfunc, str) and aggfunc == "sum":
+            # Empty groups sum to zero like grouped sum with min_count=0.
+            return tmp_aggregated.reindex(np.arange(total_groups), fill_value=0)
+        return tmp_aggregated.reindex(np.arange(total_groups))
+    tmp_matrix = sp.csr_matrix(data)
+    if isinstance(aggfunc, str) and aggfunc in ("sum", "mean"):
+        tmp_weights = np.ones(tmp_positions.shape[0], dtype=np.float64)
+        if aggfunc == "mean":
+            tmp_sizes = np.bincount(tmp_codes, minlength=total_groups)
+            tmp_weights = 1 / tmp_sizes[tmp_codes]
+        tmp_indicator = sp.csr_matrix(
+            (tmp_weights, (tmp_codes, tmp_positions)),
+            shape=(total_groups, tmp_matrix.shape[0]),
+        )
+        tmp_product = tmp_indicator @ tmp_matrix
+        if aggfunc == "sum":
+            # Sums keep dtype of counts like dense grouped sums.
+            return tmp_product.astype(tmp_matrix.dtype)
+        return tmp_product
+    tmp_member_order = np.argsort(tmp_codes, kind="stable")
+    tmp_offsets = np.searchsorted(
+        tmp_codes[tmp_member_order], np.arange(total_groups + 1)
+    )
+    tmp_rows = []
+    for start, stop in zip(tmp_offsets[:-1], tmp_offsets[1:]):
+        tmp_rows.append(
+            pd.DataFrame(
+                tmp_matrix[tmp_positions[tmp_member_order[start:stop]]].toarray()
+            )
+            .agg(func=aggfunc, axis=0)
+            .values
+        )
+    return sp.csr_matrix(np.vstack(tmp_rows))
+
+
 def ensure_new_dir(dir_name):
     """Creates new directory if it does not exist. If it does exist then it
     checks if existing directory was generated via this function if it does it
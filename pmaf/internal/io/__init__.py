@@ -10,9 +10,11 @@ I/O Types (Classes)
 -------------------
 
 .. autoclass:: SequenceIO
+.. autoclass:: BiomReader
 
 """
 
 from ._seq import SequenceIO
+from ._biom import BiomReader
 
-__all__ = ["SequenceIO"]
+__all__ = ["SequenceIO", "BiomReader"]
@@ -0,0 +1,347 @@
+from pmaf.internal.io._metakit import FileIOBackboneMetabase
+from contextlib import contextmanager
+from os import path
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+import h5py
+import biom
+from typing import Union, Any, Optional, Generator
+from pmaf.internal._typing import AnyGenericIdentifier
+
+BIOM_LIST_METADATA = ["taxonomy", "Taxonomy", "KEGG_Pathways", "collapsed_ids"]
+
+
+class BiomReader(FileIOBackboneMetabase):
+    """Lazy reader of :mod:`biom` files.
+
+    BIOM 2.x (HDF5) file is opened once and only requested observations
+    and samples are read from its compressed sparse datasets. Other
+    :mod:`biom` formats are loaded with :func:`biom.load_table`.
+    """
+
+    def __init__(self, filepath: str, **kwargs: Any):
+        """Constructor for :class:`.BiomReader`
+
+        Parameters
+        ----------
+        filepath
+            Path to :mod:`biom` file.
+        kwargs
+            Compatibility
+        """
+        if not path.isfile(filepath):
+            raise FileNotFoundError("Provided `filepath` is invalid.")
+        self.__filepath = path.abspath(filepath)
+        self.__ids = {}
+        if h5py.is_hdf5(filepath):
+            self.__type = "hdf5"
+            self.__file = h5py.File(filepath, "r")
+            self.__table = None
+        else:
+            self.__type = "table"
+            self.__file = None
+            self.__table = biom.load_table(filepath)
+
+    def __enter__(self) -> "BiomReader":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the file handle."""
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+
+    def get_ids(self, axis: str) -> pd.Index:
+        """Get identifiers of `axis`
+
+        Parameters
+        ----------
+        axis
+            Either 'observation' or 'sample'
+
+        Returns
+        -------
+            :class:`~pandas.Index` with identifiers.
+        """
+        if axis not in ["observation", "sample"]:
+            raise ValueError("`axis` is invalid.")
+        if axis not in self.__ids:
+            if self.__table is not None:
+                tmp_ids = self.__table.ids(axis=axis)
+            else:
+                tmp_ids_dataset = self.__file[axis]["ids"]
+                tmp_ids = (
+                    tmp_ids_dataset.asstr()[:]
+                    if tmp_ids_dataset.size > 0
+                    else tmp_ids_dataset[:]
+                )
+            self.__ids[axis] = pd.Index(tmp_ids, dtype=object)
+        return self.__ids[axis]
+
+    def has_metadata(self, axis: str) -> bool:
+        """Check if `axis` has metadata.
+
+        Parameters
+        ----------
+        axis
+            Either 'observation' or 'sample'
+        """
+        if self.__table is not None:
+            return self.__table.metadata(axis=axis) is not None
+        return len(self.__file[axis]["metadata"]) > 0
+
+    def read_frequency(
+        self,
+        rids: Optional[AnyGenericIdentifier] = None,
+        sids: Optional[AnyGenericIdentifier] = None,
+        sparse: bool = False,
+    ) -> pd.DataFrame:
+        """Read frequency table.
+
+        Parameters
+        ----------
+        rids
+            Observation identifiers to read or None for all observations.
+        sids
+            Sample identifiers to read or None for all samples.
+        sparse
+            Return sparse :class:`~pandas.DataFrame`.
+
+        Returns
+        -------
+            :class:`~pandas.DataFrame` with observations as index and
+            samples as columns.
+        """
+        tmp_rows = self.__get_positions("observation", rids)
+        tmp_columns = self.__get_positions("sample", sids)
+        tmp_observation_ids = self.get_ids("observation")
+        tmp_sample_ids = self.get_ids("sample")
+        if self.__table is not None:
+            tmp_matrix = self.__table.matrix_data.tocsr()
+            if tmp_rows is not None:
+                tmp_matrix = tmp_matrix[tmp_rows]
+            if tmp_columns is not None:
+                tmp_matrix = tmp_matrix[:, tmp_columns]
+        elif tmp_columns is not None and (
+            tmp_rows is None
+            or self.__count_entries("sample", tmp_columns)
+            <= self.__count_entries("observation", tmp_rows)
+        ):
+            tmp_matrix = self.__read_compressed("sample", tmp_columns).T
+            if tmp_rows is not None:
+                tmp_matrix = tmp_matrix.tocsr()[tmp_rows]
+        else:
+            tmp_matrix = self.__read_compressed("observation", tmp_rows)
+            if tmp_columns is not None:
+                tmp_matrix = tmp_matrix.tocsc()[:, tmp_columns]
+        tmp_index = (
+            tmp_observation_ids if tmp_rows is None else tmp_observation_ids[tmp_rows]
+        )
+        tmp_columns_index = (
+            tmp_sample_ids if tmp_columns is None else tmp_sample_ids[tmp_columns]
+        )
+        if sparse:
+            return pd.DataFrame.sparse.from_spmatrix(
+                tmp_matrix, index=tmp_index, columns=tmp_columns_index
+            )
+        return pd.DataFrame(
+            tmp_matrix.toarray(), index=tmp_index, columns=tmp_columns_index
+        )
+
+    def read_metadata(
+        self, axis: str, ids: Optional[AnyGenericIdentifier] = None
+    ) -> Optional[pd.DataFrame]:
+        """Read metadata of `axis` like
+        :meth:`biom.Table.metadata_to_dataframe`
+
+        List-like metadata such as taxonomy is expanded into columns with
+        suffixes like `taxonomy_0`.
+
+        Parameters
+        ----------
+        axis
+            Either 'observation' or 'sample'
+        ids
+            Identifiers to read or None for all identifiers.
+
+        Returns
+        -------
+            :class:`~pandas.DataFrame` with metadata or None if `axis` has
+            no metadata.
+        """
+        if not self.has_metadata(axis):
+            return None
+        tmp_positions = self.__get_positions(axis, ids)
+        tmp_ids = self.get_ids(axis)
+        tmp_index = tmp_ids if tmp_positions is None else tmp_ids[tmp_positions]
+        if self.__table is not None:
+            return self.__table.metadata_to_dataframe(axis).loc[tmp_index]
+        tmp_columns = {}
+        for category, dataset in self.__file[axis]["metadata"].items():
+            category = category.replace("@@SLASH@@", "/")
+            tmp_values = (
+                dataset[:]
+                if tmp_positions is None
+                else self.__read_rows(dataset, tmp_positions)
+            )
+            if category in BIOM_LIST_METADATA or tmp_values.ndim > 1:
+                # Number of levels is the stored width of the whole dataset
+                # so that subsets of short lineages keep all columns.
+                tmp_total_levels = int(np.prod(dataset.shape[1:]))
+                tmp_values = self.__decode(tmp_values).reshape(
+                    tmp_values.shape[0], tmp_total_levels
+                )
+                tmp_empty = pd.isna(tmp_values) | (tmp_values == "")
+                tmp_values = np.take_along_axis(
+                    np.where(tmp_empty, None, tmp_values),
+                    np.argsort(tmp_empty, axis=1, kind="stable"),
+                    axis=1,
+                )
+                for level in range(tmp_total_levels):
+                    tmp_columns["{}_{}".format(category, level)] = tmp_values[:, level]
+            elif tmp_values.dtype.kind in "OSU":
+                tmp_columns[category] = self.__decode(tmp_values)
+            else:
+                # Numeric and boolean metadata keep their stored dtype.
+                tmp_columns[category] = tmp_values
+        return pd.DataFrame(tmp_columns, index=tmp_index)
+
+    def __get_positions(
+        self, axis: str, ids: Optional[AnyGenericIdentifier]
+    ) -> Optional[np.ndarray]:
+        """Get positions of `ids` in `axis` or None for all."""
+        if ids is None:
+            return None
+        tmp_positions = self.get_ids(axis).get_indexer(np.asarray(ids).astype(str))
+        if (tmp_positions < 0).any():
+            raise ValueError("Invalid ids are provided.")
+        return tmp_positions
+
+    def __count_entries(self, axis: str, positions: np.ndarray) -> int:
+        """Count stored entries of `positions` in compressed matrix of
+        `axis`"""
+        tmp_indptr = self.__file[axis]["matrix"]["indptr"][:]
+        return int((tmp_indptr[positions + 1] - tmp_indptr[positions]).sum())
+
+    def __read_compressed(
+        self, axis: str, positions: Optional[np.ndarray]
+    ) -> sp.csr_matrix:
+        """Read rows of compressed matrix of `axis` at `positions`
+
+        Runs of consecutive positions are read with single slice.
+
+        Parameters
+        ----------
+        axis
+            Either 'observation' or 'sample'
+        positions
+            Positions along `axis` or None for all.
+
+        Returns
+        -------
+            :class:`~scipy.sparse.csr_matrix` with one row per position.
+        """
+        tmp_group = self.__file[axis]["matrix"]
+        tmp_indptr = tmp_group["indptr"][:].astype(np.int64)
+        tmp_width = len(
+            self.get_ids("sample" if axis == "observation" else "observation")
+        )
+        if positions is None:
+            return sp.csr_matrix(
+                (tmp_group["data"][:], tmp_group["indices"][:], tmp_indptr),
+                shape=(tmp_indptr.shape[0] - 1, tmp_width),
+            )
+        tmp_unique, tmp_inverse = np.unique(positions, return_inverse=True)
+        tmp_breaks = np.flatnonzero(np.diff(tmp_unique) > 1) + 1
+        tmp_data = []
+        tmp_indices = []
+        for run in np.split(tmp_unique, tmp_breaks):
+            if run.shape[0] > 0:
+                tmp_slice = slice(tmp_indptr[run[0]], tmp_indptr[run[-1] + 1])
+                tmp_data.append(tmp_group["data"][tmp_slice])
+                tmp_indices.append(tmp_group["indices"][tmp_slice])
+        tmp_lengths = tmp_indptr[tmp_unique + 1] - tmp_indptr[tmp_unique]
+        tmp_matrix = sp.csr_matrix(
+            (
+                np.concatenate(tmp_data) if tmp_data else np.zeros(0),
+                np.concatenate(tmp_indices) if tmp_indices else np.zeros(0, np.int32),
+                np.append(0, np.cumsum(tmp_lengths)),
+            ),
+            shape=(tmp_unique.shape[0], tmp_width),
+        )
+        return tmp_matrix[tmp_inverse]
+
+    @staticmethod
+    def __read_rows(dataset: h5py.Dataset, positions: np.ndarray) -> np.ndarray:
+        """Read rows of `dataset` at `positions`
+
+        Sorted positions that are less than chunk apart are read with single
+        slice so that no chunk is read twice and rows between distant
+        positions are not read.
+
+        Parameters
+        ----------
+        dataset
+            Metadata dataset.
+        positions
+            Row positions.
+
+        Returns
+        -------
+            :class:`~numpy.ndarray` with one row per position.
+        """
+        tmp_unique, tmp_inverse = np.unique(positions, return_inverse=True)
+        tmp_gap = dataset.chunks[0] if dataset.chunks is not None else 1
+        tmp_runs = np.split(
+            tmp_unique, np.flatnonzero(np.diff(tmp_unique) > tmp_gap) + 1
+        )
+        tmp_blocks = [
+            dataset[run[0] : run[-1] + 1][run - run[0]]
+            for run in tmp_runs
+            if run.shape[0] > 0
+        ]
+        if not tmp_blocks:
+            return dataset[:0]
+        return np.concatenate(tmp_blocks)[tmp_inverse]
+
+    @staticmethod
+    def __decode(values: np.ndarray) -> np.ndarray:
+        """Decode UTF-8 bytes within `values`"""
+        tmp_values = np.empty(values.size, dtype=object)
+        tmp_values[:] = [
+            value.decode("utf8") if isinstance(value, bytes) else value
+            for value in values.ravel().tolist()
+        ]
+        return tmp_values
+
+    @property
+    def type(self) -> str:
+        """Type of the :mod:`biom` file: 'hdf5' or 'table'"""
+        return self.__type
+
+    @property
+    def src(self) -> str:
+        """Path to :mod:`biom` file."""
+        return self.__filepath
+
+
+@contextmanager
+def open_biom(source: Union[str, BiomReader]) -> Generator[BiomReader, None, None]:
+    """Context manager that yields :class:`.BiomReader` for `source`
+
+    Readers passed as `source` are left open.
+
+    Parameters
+    ----------
+    source
+        Path to :mod:`biom` file or opened :class:`.BiomReader`
+    """
+    if isinstance(source, BiomReader):
+        yield source
+    else:
+        with BiomReader(source) as reader:
+            yield reader
@@ -7,10 +7,11 @@ from io import StringIO, IOBase
 from shutil import copyfileobj
 import copy
 import numpy as np
+import pandas as pd
 from pmaf.internal.io._seq import SequenceIO
 from pmaf.sequence._sequence._nucleotide import Nucleotide
 from pmaf.sequence._metakit import MultiSequenceMetabase, NucleotideMetabase
-from pmaf.sequence._shared import validate_seq_mode
+from pmaf.sequence._shared import validate_seq_mode, mode_as_skbio
 from typing import Union, Optional, Any, Sequence, Generator
 from pmaf.internal._typing import AnyGenericIdentifier
 
@@ -382,6 +383,87 @@ class MultiSequence(MultiSequenceMetabase):
         tmp_multiseq.restore_buckle(buckled_pack)
         return tmp_multiseq
 
+    @classmethod
+    def from_arrays(
+        cls,
+        ids: AnyGenericIdentifier,
+        sequences: Sequence[Union[str, bytes]],
+        metadata: Optional[pd.DataFrame] = None,
+        name: Optional[str] = None,
+        mode: str = "DNA",
+        aligned: bool = False,
+        **kwargs: Any
+    ) -> "MultiSequence":
+        """Factory method to create :class:`.MultiSequence` from arrays of
+        identifiers and sequence strings.
+
+        All sequences are validated at once and :mod:`skbio` sequences are not
+        created until they are required.
+
+        Parameters
+        ----------
+        ids
+            Names of the sequences
+        sequences
+            Sequence strings or bytes in same order as `ids`
+        metadata
+            :class:`~pandas.DataFrame` with metadata of the sequences in same
+            order as `ids` or None
+        name
+            Name of the multi-sequence instance
+        mode
+            Mode of the sequences
+        aligned
+            True if sequences are aligned. Default is False
+        kwargs
+            Compatibility
+
+        Returns
+        -------
+            New instance of :class:`.MultiSequence`
+        """
+        if validate_seq_mode(mode):
+            tmp_skbio_mode = mode_as_skbio(mode)
+        else:
+            raise ValueError("`mode` is invalid.")
+        tmp_ids = list(ids)
+        tmp_sequences = [
+            (
+                sequence.decode("ascii") if isinstance(sequence, bytes) else sequence
+            ).upper()
+            for sequence in sequences
+        ]
+        if len(tmp_ids) != len(tmp_sequences):
+            raise ValueError("`ids` and `sequences` must have same length.")
+        if metadata is None:
+            tmp_metadata = [{} for _ in tmp_ids]
+        elif isinstance(metadata, pd.DataFrame):
+            if metadata.shape[0] != len(tmp_ids):
+                raise ValueError("`metadata` must have same length as `ids`.")
+            tmp_metadata = metadata.to_dict(orient="records")
+        else:
+            raise TypeError("`metadata` can be DataFrame or None")
+        try:
+            tmp_bytes = "".join(tmp_sequences).encode("ascii")
+        except TypeError:
+            raise TypeError("`sequences` must contain only str or bytes.")
+        except UnicodeEncodeError:
+            raise ValueError("`sequences` must contain only ASCII characters.")
+        tmp_alphabet = "".join(tmp_skbio_mode.alphabet).encode("ascii")
+        if len(tmp_bytes.translate(None, tmp_alphabet)) > 0:
+            raise ValueError(
+                "`sequences` contain characters that are invalid for `mode`."
+            )
+        tmp_nucleotides = [
+            Nucleotide._from_validated(
+                sequence_str, sequence_id, sequence_metadata, tmp_skbio_mode
+            )
+            for sequence_id, sequence_str, sequence_metadata in zip(
+                tmp_ids, tmp_sequences, tmp_metadata
+            )
+        ]
+        return cls(tmp_nucleotides, name=name, aligned=aligned, **kwargs)
+
     @property
     def count(self):
         """Total number of sequences."""
@@ -76,6 +76,7 @@ class Nucleotide(NucleotideMetabase):
         else:
             tmp_skbio_type = mode_as_skbio(tmp_mode)
         self.__sequence = tmp_skbio_type(tmp_sequence_str)
+        self.__sequence_str = tmp_sequence_str
         self.__mode = mode_as_str(tmp_skbio_type)
         self.__skbio_mode = tmp_skbio_type
         if tmp_name is not None:
@@ -84,10 +85,52 @@ class Nucleotide(NucleotideMetabase):
         self.__name = tmp_name
         self.__buckled = bool(kwargs.get("buckled", None))
 
+    @classmethod
+    def _from_validated(
+        cls, sequence_str: str, name: Any, metadata: dict, skbio_mode: type
+    ) -> "Nucleotide":
+        """Create instance from already validated uppercase sequence string.
+
+        The :mod:`skbio` sequence is not created until it is required. Used
+        by bulk constructors that validate all sequences at once.
+
+        Parameters
+        ----------
+        sequence_str
+            Uppercase sequence string that is valid for `skbio_mode`
+        name
+            Name of the sequence instance
+        metadata
+            Metadata of the sequence instance
+        skbio_mode
+            The :mod:`skbio` sequence type
+
+        Returns
+        -------
+            New instance of :class:`.Nucleotide`
+        """
+        tmp_nucleotide = cls.__new__(cls)
+        tmp_nucleotide.__sequence = None
+        tmp_nucleotide.__sequence_str = sequence_str
+        tmp_nucleotide.__mode = mode_as_str(skbio_mode)
+        tmp_nucleotide.__skbio_mode = skbio_mode
+        tmp_nucleotide.__metadata = metadata
+        tmp_nucleotide.__name = name
+        tmp_nucleotide.__buckled = False
+        return tmp_nucleotide
+
+    def __get_skbio(self):
+        """Get :mod:`skbio` sequence and create it if it was deferred."""
+        if self.__sequence is None:
+            self.__sequence = self.__skbio_mode(self.__sequence_str)
+            if self.__name is not None:
+                self.__sequence.metadata["id"] = self.__name
+        return self.__sequence
+
     def __repr__(self):
         class_name = self.__class__.__name__
         name = self.__name if self.__name is not None else "N/A"
-        length = len(self.__sequence)
+        length = len(self.__sequence_str)
         metadata_state = "Present" if len(self.__metadata) > 0 else "N/A"
         mode = self.__mode.upper() if self.__mode is not None else "N/A"
         repr_str = "<{}:[{}], Name:[{}], Mode:[{}], Metadata:[{}]>".format(
@@ -115,7 +158,7 @@ class Nucleotide(NucleotideMetabase):
                 "__name": self.__name,
             }
             self.__name = uid
-            self.__sequence.metadata["id"] = uid
+            self.__get_skbio().metadata["id"] = uid
             self.__buckled = True
             return packed_metadata
         else:
@@ -129,7 +172,7 @@ class Nucleotide(NucleotideMetabase):
             If instance is buckled the return the `uid`. Otherwise raise error.
         """
         if self.__buckled:
-            return self.__sequence.metadata["id"]
+            return self.__get_skbio().metadata["id"]
         else:
             raise RuntimeError("Nucleotide instance is not buckled.")
 
@@ -149,7 +192,7 @@ class Nucleotide(NucleotideMetabase):
             if isinstance(buckled_pack, dict):
                 if len(buckled_pack) > 0:
                     self.__name = buckled_pack["__name"]
-                    self.__sequence.metadata["id"] = buckled_pack["__name"]
+                    self.__get_skbio().metadata["id"] = buckled_pack["__name"]
                     self.__metadata.update(buckled_pack["master-metadata"])
                 else:
                     ValueError("`buckled_pack` is empty.")
@@ -195,8 +238,9 @@ class Nucleotide(NucleotideMetabase):
 
     def __write_by_handle(self, file, format, mode="w", **kwargs):
         """Write into the IO handler."""
-        self.__sequence.metadata = self.__metadata
-        self.__sequence.metadata["id"] = self.__name
+        tmp_sequence = self.__get_skbio()
+        tmp_sequence.metadata = self.__metadata
+        tmp_sequence.metadata["id"] = self.__name
         if isinstance(file, IOBase):
             if file.writable():
                 if mode[0] == "a":
@@ -213,14 +257,14 @@ class Nucleotide(NucleotideMetabase):
         else:
             raise ValueError("`file` is invalid.")
         with StringIO() as tmp_io:  # This is done to compensate skbio bug. Skbio writer does not recogine mode kwarg properly.
-            self.__sequence.write(tmp_io, format=format, **kwargs)
+            tmp_sequence.write(tmp_io, format=format, **kwargs)
             tmp_io.seek(0, 0)
             tmp_file.write(tmp_io.read())
-        self.__sequence.metadata = {"id": self.__name}
+        tmp_sequence.metadata = {"id": self.__name}
 
     def complement(self):
         """Return the sequence complement as new instance."""
-        seq_complement = str(self.__sequence.complement())
+        seq_complement = str(self.__get_skbio().complement())
         return type(self)(
             seq_complement, name=self.__name, metadata=self.__metadata, mode=self.__mode
         )
@@ -291,12 +335,12 @@ class Nucleotide(NucleotideMetabase):
     def skbio(self) -> GrammaredSequence:
         """The :mod:`skbio` representation of the sequence as
         :class:`skbio.sequence.GrammaredSequence`"""
-        return self.__sequence
+        return self.__get_skbio()
 
     @property
     def text(self) -> str:
         """Sequence as string."""
-        return str(self.__sequence)
+        return self.__sequence_str
 
     @property
     def metadata(self) -> dict:
@@ -316,7 +360,7 @@ class Nucleotide(NucleotideMetabase):
     @property
     def length(self) -> int:
         """Length of the sequence."""
-        return len(self.__sequence)
+        return len(self.__sequence_str)
 
     @property
     def name(self) -> str:
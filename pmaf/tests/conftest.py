@@ -1,3 +1,4 @@
+import shutil
 import pytest
 from pmaf.database import DatabaseGreengenes
 import pandas as pd
@@ -8,10 +9,12 @@ TEST_DATA_ROOT = "pmaf/tests/data/"
 
 
 @pytest.fixture(scope="module")
-def tdb_greengenes():
-    db = DatabaseGreengenes(
-        path.join(TEST_DATA_ROOT, "tdbs/greengenes/gg_13_8_demo.hdf5")
+def tdb_greengenes(tmp_path_factory):
+    hdf5_fp = str(tmp_path_factory.mktemp("tdbs") / "gg_13_8_demo.hdf5")
+    shutil.copyfile(
+        path.join(TEST_DATA_ROOT, "tdbs/greengenes/gg_13_8_demo.hdf5"), hdf5_fp
     )
+    db = DatabaseGreengenes(hdf5_fp)
     yield db
     db.close()
 
@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import tables
+from pmaf.database._manager import DatabaseStorageManager
+from pmaf.database._shared._alignment import (
+    create_matrix_element,
+    append_matrix_chunk,
+    read_matrix_metadata,
+    read_matrix_rows,
+    create_gaprle_element,
+    append_gaprle_chunk,
+    read_gaprle_metadata,
+    read_gaprle_rows,
+    drop_gap_columns,
+)
+
+TEST_HDF5_FP = "pmaf/tests/data/tdbs/greengenes/gg_13_8_demo.hdf5"
+
+
+def test_alignment_matrix(tmp_path):
+    storage_manager = DatabaseStorageManager(TEST_HDF5_FP, "Greengenes")
+    should_product = storage_manager.retrieve_data_by_element("sequence-aligned")
+    should_region = storage_manager.get_element_data_by_ids(
+        "sequence-aligned", should_product.index[[0, 1, 2, 50]], region=slice(100, 900)
+    )
+    storage_manager.shutdown()
+
+    with tables.open_file(str(tmp_path / "matrix.hdf5"), mode="w") as hdf5_file:
+        hdf5_file.create_group("/", "algn")
+        element_group = create_matrix_element(
+            hdf5_file, "/algn", should_product.iloc[:30], len(should_product)
+        )
+        append_matrix_chunk(element_group, should_product.iloc[30:])
+        metadata = read_matrix_metadata(element_group)
+        product = read_matrix_rows(element_group, metadata)
+        product_region = read_matrix_rows(
+            element_group, metadata, np.array([0, 1, 2, 50]), region=slice(100, 900)
+        )
+
+    pd.testing.assert_frame_equal(product, should_product)
+    pd.testing.assert_frame_equal(product_region.sort_index(), should_region)
+    assert (product_region["length"] == 800).all()
+
+    product_dropped = drop_gap_columns(product_region)
+    assert product_dropped["sequence"].str.len().iloc[0] < 800
+    assert (
+        product_dropped["sequence"].str.replace("-", "")
+        == product_region["sequence"].str.replace("-", "")
+    ).all()
+
+
+def test_alignment_gaprle(tmp_path):
+    storage_manager = DatabaseStorageManager(TEST_HDF5_FP, "Greengenes")
+    should_product = storage_manager.retrieve_data_by_element("sequence-aligned")
+    storage_manager.shutdown()
+    should_product.iloc[0, 0] = "..acgtN" + should_product.iloc[0, 0][7:]
+    should_region = should_product.iloc[[0, 1, 2, 50]].copy()
+    should_region["sequence"] = should_region["sequence"].str.slice(100, 900)
+    should_region["length"] = 800
+
+    with tables.open_file(str(tmp_path / "gaprle.hdf5"), mode="w") as hdf5_file:
+        hdf5_file.create_group("/", "algn")
+        element_group = create_gaprle_element(
+            hdf5_file, "/algn", should_product.iloc[:30], len(should_product)
+        )
+        append_gaprle_chunk(element_group, should_product.iloc[30:])
+        metadata = read_gaprle_metadata(element_group)
+        encoded_bytes = sum(
+            node.size_in_memory for node in element_group._f_walknodes("Leaf")
+        )
+        product = read_gaprle_rows(element_group, metadata)
+        product_region = read_gaprle_rows(
+            element_group, metadata, np.array([0, 1, 2, 50]), region=slice(100, 900)
+        )
+
+    pd.testing.assert_frame_equal(product, should_product)
+    pd.testing.assert_frame_equal(product_region, should_region)
+    assert encoded_bytes * 5 < should_product["sequence"].str.len().sum()
@@ -0,0 +1,65 @@
+import biom
+import h5py
+import numpy as np
+import pandas as pd
+from pmaf.biome.assembly import BiomeAssembly
+from pmaf.internal.io import BiomReader
+
+
+def make_biom_file(filepath):
+    rng = np.random.default_rng(0)
+    biom_table = biom.Table(
+        rng.poisson(1, size=(20, 6)).astype(np.float64),
+        ["O{}".format(i) for i in range(20)],
+        ["S{}".format(i) for i in range(6)],
+        observation_metadata=[
+            {
+                "taxonomy": ["k__K{}".format(i % 2), "p__P{}".format(i % 5)]
+                + (["c__C{}".format(i % 3)] if i % 4 == 0 else [])
+            }
+            for i in range(20)
+        ],
+        sample_metadata=[
+            {"site": "gut" if i % 2 else "skin", "depth": i, "ph": 6.5 + i}
+            for i in range(6)
+        ],
+    )
+    with h5py.File(filepath, "w") as biom_file:
+        biom_table.to_hdf5(biom_file, "test")
+    return biom_table
+
+
+def test_biom_reader(tmp_path):
+    filepath = str(tmp_path / "table.biom")
+    biom_table = make_biom_file(filepath)
+    should_frequency = biom_table.to_dataframe(dense=True)
+    rids = ["O7", "O2", "O3"]
+    sids = ["S5", "S0"]
+    with BiomReader(filepath) as biom_reader:
+        assert biom_reader.type == "hdf5"
+        pd.testing.assert_frame_equal(biom_reader.read_frequency(), should_frequency)
+        pd.testing.assert_frame_equal(
+            biom_reader.read_frequency(rids, sids), should_frequency.loc[rids, sids]
+        )
+        pd.testing.assert_frame_equal(
+            biom_reader.read_frequency(sids=sids, sparse=True).sparse.to_dense(),
+            should_frequency.loc[:, sids],
+        )
+        should_metadata = biom_table.metadata_to_dataframe("observation")
+        pd.testing.assert_frame_equal(
+            biom_reader.read_metadata("observation"), should_metadata
+        )
+        # Lineages of `rids` are shorter than the longest lineage.
+        pd.testing.assert_frame_equal(
+            biom_reader.read_metadata("observation", rids),
+            should_metadata.loc[rids],
+        )
+        pd.testing.assert_frame_equal(
+            biom_reader.read_metadata("sample", sids),
+            biom.load_table(filepath).metadata_to_dataframe("sample").loc[sids],
+        )
+
+    assembly = BiomeAssembly.from_biom(filepath, sids=sids)
+    assert assembly.shape == (20, 2)
+    assert assembly.RepTaxonomy.get_lineage_by_id(["O7"]).tolist() == ["k__K1; p__P2"]
+    assert assembly.SampleMetadata.data.loc["S5", "site"] == "gut"
@@ -0,0 +1,39 @@
+import pandas as pd
+from pmaf.database._manager import DatabaseStorageManager
+
+TEST_HDF5_FP = "pmaf/tests/data/tdbs/greengenes/gg_13_8_demo.hdf5"
+
+
+def test_memory_budget():
+    storage_manager = DatabaseStorageManager(TEST_HDF5_FP, "Greengenes")
+    target_ids = storage_manager.repseq_ids.values[:10]
+    should_product = storage_manager.get_element_data_by_ids(
+        "sequence-representative", target_ids
+    )
+    storage_manager.initiate_memory_cache(memory_budget=2**18)
+    for _ in range(2):
+        product = storage_manager.get_element_data_by_ids(
+            "sequence-representative", target_ids
+        )
+        pd.testing.assert_frame_equal(product, should_product)
+    resident_sizes = storage_manager.resident_sizes
+    assert resident_sizes.index.tolist() == ["sequence-representative"]
+    assert resident_sizes.sum() <= 2**18
+
+    storage_manager.initiate_memory_cache(memory_budget=2**10)
+    for _ in range(3):
+        product = storage_manager.get_element_data_by_ids(
+            "sequence-representative", target_ids
+        )
+        pd.testing.assert_frame_equal(product, should_product)
+    assert storage_manager.resident_sizes.sum() <= 2**10
+
+    storage_manager.initiate_memory_cache(memory_budget=2**18)
+    storage_manager.initiate_row_cache(None)
+    for _ in range(2):
+        product = storage_manager.get_element_data_by_ids(
+            "sequence-representative", target_ids
+        )
+        pd.testing.assert_frame_equal(product, should_product)
+    assert storage_manager.resident_sizes.index.tolist() == ["sequence-representative"]
+    storage_manager.shutdown()
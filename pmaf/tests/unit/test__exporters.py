@@ -0,0 +1,35 @@
+import gzip
+from os import path
+from pmaf.database._helpers import export_database_by_rid
+
+TEST_OUTPUTS = ["refseq.fa", "refaln.fa", "reftax.txt", "tree.nwk"]
+
+
+def test_export_database_by_rid(tdb_greengenes, tmp_path):
+    database = tdb_greengenes
+    target_ids = database.xrid[:40]
+    should_sequences = database.get_sequence_by_rid(
+        target_ids, iterator=False, like="asis"
+    )
+    (tmp_path / "plain").mkdir()
+    (tmp_path / "gzip").mkdir()
+    export_database_by_rid(
+        database, str(tmp_path / "plain"), target_ids, workers=1, buffer_size=5000
+    )
+    export_database_by_rid(
+        database, str(tmp_path / "gzip"), target_ids, workers=4, compress=True
+    )
+    assert not database.storage_manager.concurrent_state
+    assert database.get_sequence_by_rid(target_ids, iterator=False, like="asis").equals(
+        should_sequences
+    )
+
+    for output_name in TEST_OUTPUTS:
+        with open(path.join(tmp_path / "plain", output_name), "rb") as output:
+            plain_output = output.read()
+        with gzip.open(path.join(tmp_path / "gzip", output_name + ".gz")) as output:
+            assert output.read() == plain_output
+    with open(path.join(tmp_path / "plain", "refseq.fa")) as output:
+        records = output.read().split("\n")
+    assert records[0::2][:-1] == [">{}".format(rid) for rid in should_sequences.index]
+    assert records[1::2] == should_sequences["sequence"].tolist()
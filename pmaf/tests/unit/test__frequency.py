@@ -0,0 +1,122 @@
+import numpy as np
+import pandas as pd
+from pmaf.biome.essentials import FrequencyTable
+
+
+def make_frequency_frame():
+    rng = np.random.default_rng(0)
+    values = rng.integers(0, 5, size=(60, 8)) * (rng.random((60, 8)) < 0.3)
+    values[:, 3] = 0
+    return pd.DataFrame(
+        values.astype(np.float64),
+        index=["f{}".format(i) for i in range(60)],
+        columns=["s{}".format(i) for i in range(8)],
+    )
+
+
+def test_frequency_sparse():
+    frequency = make_frequency_frame()
+    dense_table = FrequencyTable(frequency.copy())
+    sparse_table = FrequencyTable(frequency.copy(), sparse=True)
+    assert sparse_table.is_sparse and not dense_table.is_sparse
+    assert isinstance(sparse_table.data.dtypes.iloc[0], pd.SparseDtype)
+
+    feature_map = {
+        "g1": ["f1", "f2", "f9"],
+        "g2": ["f10"],
+        "g3": ["f{}".format(i) for i in range(20, 50)],
+    }
+    sample_map = {"A": ["s0", "s1"], "B": ["s2", "s3", "s4"]}
+    for table in (dense_table, sparse_table):
+        table.merge_features_by_map(feature_map, "max")
+        table.drop_samples_by_id(["s7"])
+        table.drop_features_without_counts()
+        table.merge_samples_by_map(sample_map, "sum")
+    pd.testing.assert_frame_equal(sparse_table.to_dense(), dense_table.data)
+
+    dense_table = FrequencyTable(frequency.astype(np.int64))
+    sparse_table = FrequencyTable(frequency.astype(np.int64), sparse=True)
+    for table in (dense_table, sparse_table):
+        table.merge_features_by_map(feature_map, "sum")
+        table.merge_samples_by_map(sample_map, "sum")
+    assert (dense_table.data.dtypes == np.int64).all()
+    pd.testing.assert_frame_equal(sparse_table.to_dense(), dense_table.data)
+
+    dense_table = FrequencyTable(frequency.copy())
+    sparse_table = FrequencyTable(frequency.copy(), sparse=True)
+    for table in (dense_table, sparse_table):
+        table.transform_to_relative_abundance()
+    pd.testing.assert_frame_equal(sparse_table.to_dense(), dense_table.data.fillna(0))
+    assert list(sparse_table._export(ascending=False)[0].index) == list(
+        dense_table._export(ascending=False)[0].index
+    )
+    sparse_subset = sparse_table.get_subset(["f5", "f1"], ["s6", "s2"])
+    assert sparse_subset.is_sparse
+    pd.testing.assert_frame_equal(
+        sparse_subset.to_dense(),
+        dense_table.get_subset(["f5", "f1"], ["s6", "s2"]).data,
+    )
+
+
+def test_frequency_outofcore(tmp_path):
+    frequency = make_frequency_frame()
+    dense_table = FrequencyTable(frequency.copy())
+    outofcore_table = FrequencyTable(
+        frequency.copy(), outofcore=str(tmp_path), block_size=3
+    )
+    assert outofcore_table.is_outofcore and not dense_table.is_outofcore
+
+    feature_map = {
+        "g1": ["f1", "f2", "f9"],
+        "g2": ["f{}".format(i) for i in range(20, 50)],
+    }
+    sample_map = {"A": ["s0", "s1"], "B": ["s2", "s3", "s4"], "C": ["s6"]}
+    for table in (dense_table, outofcore_table):
+        table.merge_features_by_map(feature_map, "max")
+        table.drop_samples_by_id(["s7"])
+        table.drop_features_without_counts()
+        table.merge_samples_by_map(sample_map, "mean")
+    pd.testing.assert_frame_equal(outofcore_table.data, dense_table.data)
+
+    dense_table = FrequencyTable(frequency.copy())
+    outofcore_table = FrequencyTable(
+        frequency.copy(), outofcore=str(tmp_path), block_size=3
+    )
+    for table in (dense_table, outofcore_table):
+        table.transform_to_relative_abundance()
+    pd.testing.assert_frame_equal(outofcore_table.data, dense_table.data)
+    assert outofcore_table.any_nan
+    outofcore_subset = outofcore_table.get_subset(["f5", "f1"], ["s6", "s3", "s2"])
+    assert outofcore_subset.is_outofcore
+    pd.testing.assert_frame_equal(
+        outofcore_subset.data,
+        dense_table.get_subset(["f5", "f1"], ["s6", "s3", "s2"]).data,
+    )
+
+    dense_table = FrequencyTable(frequency.astype(np.int32))
+    outofcore_table = FrequencyTable(
+        frequency.astype(np.int32), outofcore=str(tmp_path), block_size=3
+    )
+    for table in (dense_table, outofcore_table):
+        table.merge_features_by_map(feature_map, "sum")
+        table.drop_samples_by_id(["s7"])
+        table.drop_features_without_counts()
+        table.replace_nan_with(0)
+    assert (outofcore_table.data.dtypes == np.int32).all()
+    pd.testing.assert_frame_equal(outofcore_table.data, dense_table.data)
+    pd.testing.assert_frame_equal(outofcore_table.copy().data, dense_table.copy().data)
+    subset_rids = dense_table.xrid[[1, 0]]
+    pd.testing.assert_frame_equal(
+        outofcore_table.get_subset(subset_rids, ["s6", "s2"]).data,
+        dense_table.get_subset(subset_rids, ["s6", "s2"]).data,
+    )
+    pd.testing.assert_frame_equal(
+        outofcore_table._export()[0], dense_table._export()[0]
+    )
+    for table in (dense_table, outofcore_table):
+        table.merge_samples_by_map(sample_map, "mean")
+        table.transform_to_relative_abundance()
+    assert (outofcore_table.data.dtypes == np.float64).all()
+    pd.testing.assert_frame_equal(outofcore_table.data, dense_table.data)
+    del outofcore_table, outofcore_subset, table
+    assert list(tmp_path.iterdir()) == []
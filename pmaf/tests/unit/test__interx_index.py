@@ -0,0 +1,52 @@
+import os
+import shutil
+import numpy as np
+import pandas as pd
+import pytest
+import tables
+from pmaf.database._shared._common import DATABASE_HDF5_STRUCT
+from pmaf.database._shared._interx_index import (
+    InterxIndexMap,
+    make_interx_index_arrays,
+)
+
+TEST_HDF5_FP = "pmaf/tests/data/tdbs/greengenes/gg_13_8_demo.hdf5"
+
+
+def test_interx_index_map(tmp_path):
+    hdf5_fp = str(tmp_path / "gg.hdf5")
+    shutil.copyfile(TEST_HDF5_FP, hdf5_fp)
+    interxmap_df = pd.read_hdf(hdf5_fp, DATABASE_HDF5_STRUCT["map-interx-repseq"])
+    with tables.open_file(hdf5_fp, mode="a") as storage_file:
+        storage_file.create_group("/map", "xindexreps", title="index-interx-repseq")
+        for array_name, array in make_interx_index_arrays(interxmap_df).items():
+            storage_file.create_array(
+                DATABASE_HDF5_STRUCT["index-interx-repseq"],
+                array_name,
+                obj=array,
+                title=array_name,
+            )
+
+    index_map = InterxIndexMap.from_storage(
+        hdf5_fp, DATABASE_HDF5_STRUCT["index-interx-repseq"]
+    )
+    assert os.listdir(tmp_path) == ["gg.hdf5"]
+    assert isinstance(index_map._index_array, np.memmap)
+    assert isinstance(index_map._coordinates_array, np.memmap)
+    assert index_map.index.equals(interxmap_df.index)
+    assert index_map.columns == interxmap_df.columns.tolist()
+
+    frame_index_map = InterxIndexMap.from_frame(interxmap_df)
+    target_ids = np.asarray([7, 3, 42, 1])
+    for element_key in interxmap_df.columns:
+        should_product = interxmap_df.loc[
+            interxmap_df.index.isin(target_ids), element_key
+        ].values
+        for product_map in (index_map, frame_index_map):
+            product = product_map.get_coordinates(element_key, target_ids)
+            assert np.array_equal(product, should_product)
+    with pytest.raises(ValueError):
+        index_map.get_coordinates("stat-reps", [1, 1])
+    with pytest.raises(ValueError):
+        index_map.get_coordinates("stat-reps", [1, -5])
+    assert make_interx_index_arrays(interxmap_df.rename(index=str)) is None
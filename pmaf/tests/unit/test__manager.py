@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from pmaf.database import DatabaseGreengenes
+
+TEST_HDF5_FP = "pmaf/tests/data/tdbs/greengenes/gg_13_8_demo.hdf5"
+TEST_ELEMENTS = {
+    "sequence-representative": "repseq_ids",
+    "sequence-aligned": "repseq_ids",
+    "taxonomy-sheet": "taxon_ids",
+    "stat-reps": "repseq_ids",
+}
+
+
+def test_concurrent_reads():
+    database = DatabaseGreengenes(TEST_HDF5_FP)
+    storage_manager = database.storage_manager
+    rng = np.random.default_rng(0)
+    tasks = []
+    for _ in range(400):
+        element_key = rng.choice(list(TEST_ELEMENTS.keys()))
+        ids = getattr(storage_manager, TEST_ELEMENTS[element_key]).values
+        tasks.append((element_key, rng.choice(ids, rng.integers(1, 20), False)))
+    should_products = [
+        storage_manager.get_element_data_by_ids(element_key, ids)
+        for element_key, ids in tasks
+    ]
+
+    def read_task(task):
+        return storage_manager.get_element_data_by_ids(*task)
+
+    storage_manager.initiate_concurrent_mode()
+    for memory_budget in [None, 2**19]:
+        if memory_budget is not None:
+            storage_manager.initiate_memory_cache(memory_budget=memory_budget)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            products = list(executor.map(read_task, tasks))
+        for product, should_product in zip(products, should_products):
+            pd.testing.assert_frame_equal(product, should_product)
+    assert len(storage_manager._thread_stores) <= 8
+    database.close()
@@ -0,0 +1,44 @@
+import pandas as pd
+import pytest
+from pmaf.sequence import MultiSequence, Nucleotide
+
+
+def test_multiple_from_arrays():
+    ids = [3, 1, 2]
+    sequences = ["ACGT-", b"acgtn", "RYKM."]
+    metadata = pd.DataFrame({"length": [5, 5, 5], "tab": [0, 1, 2]})
+    should_multiseq = MultiSequence(
+        [
+            Nucleotide(
+                sequence if isinstance(sequence, str) else sequence.decode(),
+                name=sequence_id,
+                metadata=sequence_metadata,
+                mode="DNA",
+            )
+            for sequence_id, sequence, sequence_metadata in zip(
+                ids, sequences, metadata.to_dict(orient="records")
+            )
+        ],
+        name="test",
+        aligned=True,
+    )
+    multiseq = MultiSequence.from_arrays(
+        ids, sequences, metadata, name="test", aligned=True
+    )
+
+    assert all(
+        sequence._Nucleotide__sequence is None for sequence in multiseq.sequences
+    )
+    assert multiseq.index.tolist() == ids
+    assert multiseq.is_alignment
+    assert [sequence.metadata for sequence in multiseq.sequences] == [
+        sequence.metadata for sequence in should_multiseq.sequences
+    ]
+    assert multiseq.get_string_as() == should_multiseq.get_string_as()
+    assert str(multiseq.get_consensus().skbio) == str(
+        should_multiseq.get_consensus().skbio
+    )
+    with pytest.raises(ValueError):
+        MultiSequence.from_arrays([1, 2], ["ACGT", "ACGZ"])
+    with pytest.raises(ValueError):
+        MultiSequence.from_arrays([1, 2], ["ACGT"])
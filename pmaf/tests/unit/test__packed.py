@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import tables
+from pmaf.database._manager import DatabaseStorageManager
+from pmaf.database._shared._packed import (
+    create_packed_element,
+    append_packed_chunk,
+    read_packed_metadata,
+    read_packed_rows,
+    read_packed_buffer,
+    sequences_to_buffer,
+)
+
+TEST_HDF5_FP = "pmaf/tests/data/tdbs/greengenes/gg_13_8_demo.hdf5"
+
+
+def test_packed_sequences(tmp_path):
+    storage_manager = DatabaseStorageManager(TEST_HDF5_FP, "Greengenes")
+    should_product = storage_manager.retrieve_data_by_element("sequence-representative")
+    storage_manager.shutdown()
+    should_product.iloc[0, 0] = "acgtNRYK-" + should_product.iloc[0, 0]
+    should_product.iloc[1, 0] = ""
+
+    with tables.open_file(str(tmp_path / "packed.hdf5"), mode="w") as hdf5_file:
+        hdf5_file.create_group("/", "reps")
+        element_group = create_packed_element(
+            hdf5_file, "/reps", should_product.iloc[:30], len(should_product)
+        )
+        append_packed_chunk(element_group, should_product.iloc[30:])
+        metadata = read_packed_metadata(element_group)
+        packed_bytes = element_group.packed.size_in_memory
+        product = read_packed_rows(element_group, metadata)
+        product_rows = read_packed_rows(
+            element_group, metadata, np.array([0, 1, 2, 50, 51, 99])
+        )
+        index, buffer, offsets = read_packed_buffer(
+            element_group, metadata, np.array([0, 1, 2, 50, 51, 99])
+        )
+
+    pd.testing.assert_frame_equal(product, should_product)
+    pd.testing.assert_frame_equal(
+        product_rows, should_product.iloc[[0, 1, 2, 50, 51, 99]]
+    )
+    assert packed_bytes * 3 < should_product["sequence"].str.len().sum()
+    should_buffer, should_offsets = sequences_to_buffer(
+        product_rows["sequence"].tolist()
+    )
+    np.testing.assert_array_equal(index, product_rows.index.values)
+    np.testing.assert_array_equal(buffer, should_buffer)
+    np.testing.assert_array_equal(offsets, should_offsets)
@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+from os import path
+from pmaf.database import DatabaseGreengenes
+from pmaf.database._manager import DatabaseStorageManager
+from pmaf.database._parsers._qiime import parse_qiime_sequence_generator
+from pmaf.database._shared._parallel import (
+    iterate_in_process,
+    make_worker_pool,
+    map_in_pool,
+    PREFETCH_PER_WORKER,
+)
+from pmaf.internal._shared import get_stats_for_sequence_record_df
+
+TEST_RAW_ROOT = "pmaf/tests/data/tdbs/greengenes/raw/"
+
+
+def test_parallel_sequence_pipeline():
+    fasta_fp = path.join(TEST_RAW_ROOT, "refseq.fa")
+    should_chunks = list(parse_qiime_sequence_generator(fasta_fp, 30, False))
+    actual_chunks = list(
+        iterate_in_process(parse_qiime_sequence_generator, fasta_fp, 30, False)
+    )
+    assert should_chunks[0][0] == actual_chunks[0][0]
+    pd.testing.assert_frame_equal(should_chunks[0][1], actual_chunks[0][1])
+    for should_chunk, actual_chunk in zip(should_chunks[1:], actual_chunks[1:]):
+        pd.testing.assert_frame_equal(should_chunk, actual_chunk)
+
+    sequence_chunks = [should_chunks[0][1]] + should_chunks[1:]
+    with make_worker_pool(2) as worker_pool:
+        actual_stats = list(
+            map_in_pool(
+                worker_pool,
+                get_stats_for_sequence_record_df,
+                sequence_chunks,
+                PREFETCH_PER_WORKER * 2,
+            )
+        )
+    for sequence_chunk, stats_chunk in zip(sequence_chunks, actual_stats):
+        pd.testing.assert_frame_equal(
+            get_stats_for_sequence_record_df(sequence_chunk), stats_chunk
+        )
+
+
+def test_parallel_build(tmp_path):
+    storage_managers = []
+    for workers in (1, 2):
+        storage_hdf5_fp = str(tmp_path / "workers_{}.hdf5".format(workers))
+        DatabaseGreengenes.build_database_storage(
+            storage_hdf5_fp,
+            path.join(TEST_RAW_ROOT, "reftax.txt"),
+            path.join(TEST_RAW_ROOT, "tree.nwk"),
+            path.join(TEST_RAW_ROOT, "refseq.fa"),
+            path.join(TEST_RAW_ROOT, "refaln.fa"),
+            {"version": "13.8"},
+            chunksize=50,
+            workers=workers,
+        )
+        storage_managers.append(
+            DatabaseStorageManager(storage_hdf5_fp, DatabaseGreengenes.DATABASE_NAME)
+        )
+    should_manager, manager = storage_managers
+    assert manager.active_elements == should_manager.active_elements
+    assert {"index-interx-taxon", "index-interx-repseq"} <= set(manager.active_elements)
+    assert "tree-object" not in manager.active_elements
+    for element_key in should_manager.active_elements:
+        product = manager.retrieve_data_by_element(element_key)
+        should_product = should_manager.retrieve_data_by_element(element_key)
+        if isinstance(should_product, dict):
+            assert product.keys() == should_product.keys()
+            for name, values in should_product.items():
+                assert np.array_equal(product[name], values)
+        elif isinstance(should_product, (pd.DataFrame, pd.Series)):
+            assert product.equals(should_product)
+        else:
+            assert product == should_product
+    assert manager.initiate_memory_cache(level=4) == 4
+    assert "tree-object" not in manager.resident_sizes.index
+    assert manager.resident_sizes["tree-array"] > 0
+    for storage_manager in storage_managers:
+        storage_manager.shutdown()
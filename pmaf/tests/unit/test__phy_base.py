@@ -0,0 +1,85 @@
+import pickle
+from collections import defaultdict
+import ete3
+import numpy as np
+
+
+def legacy_prune_tree(ref_tree, rids, tid_rid_map=None):
+    """Prune `ref_tree` as :mod:`pmaf` did before *tree-array* element was
+    introduced. Rids are grouped into tids if `tid_rid_map` is given."""
+    target_nodes = [node for node in ref_tree.iter_leaves() if node.name in rids]
+    node_map = {ref_tree: ete3.TreeNode(name=ref_tree.name, dist=ref_tree.dist)}
+    for node in target_nodes:
+        for ancestor in ([node] + node.get_ancestors())[::-1][1:]:
+            if ancestor not in node_map:
+                node_map[ancestor] = node_map[ancestor.up].add_child(
+                    name=ancestor.name, dist=ancestor.dist
+                )
+    tmp_tree = node_map[ref_tree]
+    tmp_tree.standardize(preserve_branch_length=True)
+    if tid_rid_map is None:
+        return tmp_tree
+    tid_rid_node_map = defaultdict(list)
+    for node in target_nodes:
+        for tid, tid_rids in tid_rid_map.items():
+            if node.name in tid_rids:
+                tid_rid_node_map[tid].append(node_map[node])
+    for tid, rid_nodes in tid_rid_node_map.items():
+        if len(rid_nodes) > 1:
+            tmp_tree.get_common_ancestor(rid_nodes).add_child(name="t{}".format(tid))
+        else:
+            rid_nodes[0].add_child(name="t{}".format(tid))
+    tmp_tree.prune(
+        ["t{}".format(tid) for tid in tid_rid_node_map.keys()],
+        preserve_branch_length=True,
+    )
+    for node in tmp_tree.traverse():
+        if node.name.startswith("t"):
+            node.name = node.name[1:]
+    return tmp_tree
+
+
+def assert_same_tree(tree, should_tree):
+    """Assert that trees match topologically with same tip names and same
+    branch lengths up to the order of children."""
+    assert sorted(tree.get_leaf_names()) == sorted(should_tree.get_leaf_names())
+    assert tree.robinson_foulds(should_tree, unrooted_trees=False)[0] == 0
+    tree_copy, should_tree_copy = tree.copy(), should_tree.copy()
+    for tmp_tree in (tree_copy, should_tree_copy):
+        for node in tmp_tree.traverse():
+            node.dist = round(node.dist, 8)
+            if not node.is_leaf():
+                node.name = ""
+        tmp_tree.sort_descendants()
+    assert tree_copy.write(format=1) == should_tree_copy.write(format=1)
+
+
+def test_prune_tree_by_rid(tdb_greengenes):
+    database = tdb_greengenes
+    ref_tree = pickle.loads(
+        database.storage_manager.retrieve_data_by_element("tree-object")
+    )
+    tree_rids = np.asarray(ref_tree.get_leaf_names(), dtype=int)
+    for target_rids in (tree_rids[::7], tree_rids[:2], tree_rids):
+        pruned_tree = database.prune_tree_by_rid(target_rids)._backend
+        should_tree = legacy_prune_tree(ref_tree, list(map(str, target_rids)))
+        assert_same_tree(pruned_tree, should_tree)
+
+
+def test_prune_tree_by_tid(tdb_greengenes):
+    database = tdb_greengenes
+    ref_tree = pickle.loads(
+        database.storage_manager.retrieve_data_by_element("tree-object")
+    )
+    tree_rids = np.asarray(ref_tree.get_leaf_names(), dtype=int)
+    target_tids = database.find_tid_by_rid(tree_rids[::5], flatten=True)
+    pruned_tree = database.prune_tree_by_tid(target_tids, subreps=True)._backend
+    repseq_map = database.find_rid_by_tid(
+        target_tids, subs=True, iterator=False, flatten=False, mode="dict"
+    )
+    should_tree = legacy_prune_tree(
+        ref_tree,
+        [str(rid) for rids in repseq_map.values() for rid in rids],
+        {tid: list(map(str, rids)) for tid, rids in repseq_map.items()},
+    )
+    assert_same_tree(pruned_tree, should_tree)
@@ -0,0 +1,46 @@
+import pytest
+import pandas as pd
+from os import path
+from pmaf.database._parsers._qiime import (
+    scan_fasta_dimensions,
+    parse_qiime_sequence_generator,
+    parse_qiime_taxonomy_map,
+)
+
+TEST_RAW_ROOT = "pmaf/tests/data/tdbs/greengenes/raw/"
+
+
+@pytest.mark.parametrize(
+    "fasta_name,alignment", [("refseq.fa", False), ("refaln.fa", True)]
+)
+def test_scan_fasta_dimensions(fasta_name, alignment):
+    fasta_fp = path.join(TEST_RAW_ROOT, fasta_name)
+    two_pass_parser = parse_qiime_sequence_generator(fasta_fp, 30, alignment, False)
+    should_product, _ = next(two_pass_parser)
+    assert scan_fasta_dimensions(fasta_fp, blocksize=1000) == should_product
+
+
+def test_parse_qiime_taxonomy_map():
+    taxonomy_map_df = pd.DataFrame(
+        {
+            "taxonomy": [
+                "k__Bacteria; p__Firmicutes; g__",
+                " p__Mixed__Name ;k__Archaea;;nothing; p__Override",
+                "s__Only species",
+                "Unassigned",
+            ]
+        },
+        index=["1", "2", "3", "4"],
+    )
+    should_product = pd.DataFrame(
+        {
+            "k": ["Bacteria", "Archaea", None, None],
+            "p": ["Firmicutes", "Override", None, None],
+            "g": [None, None, None, None],
+            "s": [None, None, "Only species", None],
+        },
+        index=["1", "2", "3", "4"],
+        dtype=object,
+    )
+    product = parse_qiime_taxonomy_map(taxonomy_map_df, chunksize=3)
+    pd.testing.assert_frame_equal(product, should_product)
@@ -0,0 +1,29 @@
+import pandas as pd
+from pmaf.database._manager import DatabaseStorageManager
+
+TEST_HDF5_FP = "pmaf/tests/data/tdbs/greengenes/gg_13_8_demo.hdf5"
+
+
+def test_row_cache():
+    storage_manager = DatabaseStorageManager(TEST_HDF5_FP, "Greengenes")
+    target_ids = storage_manager.repseq_ids.values[:10]
+    should_product = storage_manager.get_element_data_by_ids(
+        "sequence-representative", target_ids
+    )
+    storage_manager.initiate_row_cache(2**20)
+    storage_manager.get_element_data_by_ids("sequence-representative", target_ids[:5])
+    product = storage_manager.get_element_data_by_ids(
+        "sequence-representative", target_ids
+    )
+    pd.testing.assert_frame_equal(product, should_product)
+    assert storage_manager.row_cache_stats["hits"] == 5
+    assert storage_manager.row_cache_stats["misses"] == 10
+    assert storage_manager.row_cache_stats["evictions"] == 0
+
+    storage_manager.initiate_row_cache(2**13)
+    storage_manager.get_element_data_by_ids("sequence-representative", target_ids)
+    assert storage_manager.row_cache_stats["size_bytes"] <= 2**13
+    assert storage_manager.row_cache_stats["evictions"] > 0
+
+    storage_manager.shutdown()
+    assert storage_manager.row_cache_stats is None
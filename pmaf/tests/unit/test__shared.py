@@ -1,5 +1,12 @@
 import pytest
-from pmaf.internal._shared import generate_lineages_from_taxa
+import pandas as pd
+import scipy.sparse as sp
+from pmaf.internal._shared import (
+    generate_lineages_from_taxa,
+    get_stats_for_sequence_record_df,
+    make_group_codes,
+    aggregate_by_group_codes,
+)
 
 
 def test_generate_lineages_from_taxa(
@@ -8,3 +15,51 @@ def test_generate_lineages_from_taxa(
     product = generate_lineages_from_taxa(input_taxonomy_all_ranks)
     should_product = product_generate_lineages_from_taxa_default
     assert product.equals(should_product)
+
+
+def test_get_stats_for_sequence_record_df(tdb_greengenes):
+    storage_manager = tdb_greengenes.storage_manager
+    repseq_df = storage_manager.retrieve_data_by_element("sequence-representative")
+    should_product = storage_manager.retrieve_data_by_element("stat-reps")
+    product = get_stats_for_sequence_record_df(repseq_df, blocksize=2000)
+    assert product.equals(should_product)
+
+
+def test_aggregate_by_group_codes():
+    frame = pd.DataFrame(
+        {"s1": [1, 0, 3, 4], "s2": [0, 2, 0, 1]}, index=["f1", "f2", "f3", "f4"]
+    )
+    mapping = {"g1": ["f4", "f1"], "g2": ["f2"], "g3": ["f1", "f3"]}
+    keys, positions, codes = make_group_codes(mapping, frame.index)
+    assert keys == ["g1", "g2", "g3"]
+    assert positions.tolist() == [3, 0, 1, 0, 2]
+    assert codes.tolist() == [0, 0, 1, 2, 2]
+    should_sums = [[5, 1], [0, 2], [4, 0]]
+    product = aggregate_by_group_codes(frame, positions, codes, len(keys), "sum")
+    assert product.values.tolist() == should_sums
+    product_sparse = aggregate_by_group_codes(
+        sp.csc_matrix(frame.values), positions, codes, len(keys), "sum"
+    )
+    assert product_sparse.toarray().tolist() == should_sums
+    product_max = aggregate_by_group_codes(
+        sp.csc_matrix(frame.values), positions, codes, len(keys), "max"
+    )
+    assert product_max.toarray().tolist() == [[4, 1], [0, 2], [3, 0]]
+    with pytest.raises(ValueError):
+        make_group_codes({"g1": ["f5"]}, frame.index)
+
+
+def test_aggregate_by_group_codes_empty_group():
+    frame = pd.DataFrame(
+        {"s1": [1.0, 2.0, None], "s2": [3.0, None, None]}, index=["f1", "f2", "f3"]
+    )
+    mapping = {"g1": ["f1"], "g2": [], "g3": ["f2", "f3"]}
+    keys, positions, codes = make_group_codes(mapping, frame.index)
+    product = aggregate_by_group_codes(frame, positions, codes, len(keys), "sum")
+    assert product.values.tolist() == [[1.0, 3.0], [0.0, 0.0], [2.0, 0.0]]
+    product_sparse = aggregate_by_group_codes(
+        sp.csc_matrix(frame.fillna(0).values), positions, codes, len(keys), "sum"
+    )
+    assert product_sparse.toarray().tolist() == product.values.tolist()
+    product_mean = aggregate_by_group_codes(frame, positions, codes, len(keys), "mean")
+    assert product_mean.loc[1].isna().all()
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+from pmaf.biome.assembly import BiomeAssembly
+from pmaf.biome.essentials import FrequencyTable
+from pmaf.biome.survey._shared import mergeFrequencyTable, parse_assembly_maps
+
+
+def test_merge_frequency_table_by_label():
+    assembly_map = {
+        "A": BiomeAssembly(
+            [
+                FrequencyTable(
+                    pd.DataFrame(
+                        {"s1": [1.0, 2.0], "s2": [3.0, 4.0]}, index=["f1", "f2"]
+                    )
+                )
+            ]
+        ),
+        "B": BiomeAssembly(
+            [
+                FrequencyTable(
+                    pd.DataFrame(
+                        {"s2": [5.0, 6.0], "s3": [7.0, 8.0]}, index=["f2", "f3"]
+                    )
+                )
+            ]
+        ),
+    }
+    features_map, samples_map = parse_assembly_maps("label", "label", assembly_map)
+    essentials_map = {
+        FrequencyTable: {
+            label: assembly.essentials[0] for label, assembly in assembly_map.items()
+        }
+    }
+    product = mergeFrequencyTable(
+        "label",
+        "label",
+        features_map,
+        samples_map,
+        essentials_map,
+        {FrequencyTable: {0: "sum", 1: "sum"}},
+    ).data
+    should_product = pd.DataFrame(
+        {
+            "s1": [1.0, 2.0, np.nan],
+            "s2": [3.0, 9.0, 6.0],
+            "s3": [np.nan, 7.0, 8.0],
+        },
+        index=["f1", "f2", "f3"],
+    )
+    pd.testing.assert_frame_equal(
+        product.loc[should_product.index, should_product.columns], should_product
+    )
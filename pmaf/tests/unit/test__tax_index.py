@@ -0,0 +1,57 @@
+import numpy as np
+from pmaf.database._shared._tax_index import (
+    make_taxonomy_index,
+    make_tid_rid_index,
+    TaxonomyIndex,
+    TidRidIndex,
+)
+
+
+def test_taxonomy_index(tdb_greengenes):
+    database = tdb_greengenes
+    map2tid = database.storage_manager.retrieve_data_by_element("map-rep2tid")
+    taxonomy_index = TaxonomyIndex(make_taxonomy_index(map2tid))
+    target_ids = database.xtid.values[:25]
+    sub_tids = database.find_sub_tids_by_tid(target_ids, mode="dict")
+    sub_tids_ter = database.find_sub_tids_by_tid(target_ids, ter_rank="o", mode="dict")
+    rids = database.find_rid_by_tid(target_ids, subs=True, mode="dict")
+    flat_sub_tids = database.find_sub_tids_by_tid(target_ids, flatten=True)
+    database._DatabaseBase__taxonomy_index = False
+    should_sub_tids = database.find_sub_tids_by_tid(target_ids, mode="dict")
+    should_sub_tids_ter = database.find_sub_tids_by_tid(
+        target_ids, ter_rank="o", mode="dict"
+    )
+    should_rids = database.find_rid_by_tid(target_ids, subs=True, mode="dict")
+    should_flat_sub_tids = database.find_sub_tids_by_tid(target_ids, flatten=True)
+    database._DatabaseBase__taxonomy_index = None
+
+    for product, should_product in [
+        (sub_tids, should_sub_tids),
+        (sub_tids_ter, should_sub_tids_ter),
+        (rids, should_rids),
+    ]:
+        assert product.keys() == should_product.keys()
+        for tid in product:
+            assert np.array_equal(np.sort(product[tid]), np.sort(should_product[tid]))
+    assert flat_sub_tids.dtype == np.int64
+    assert np.array_equal(flat_sub_tids, np.sort(should_flat_sub_tids))
+    assert (taxonomy_index.get_positions(np.array([-5])) == -1).all()
+
+
+def test_tid_rid_index(tdb_greengenes):
+    database = tdb_greengenes
+    map2tid = database.storage_manager.retrieve_data_by_element("map-rep2tid")
+    target_ids = database.xtid.values[[5, 0, 5, 90]]
+    rids = database.find_rid_by_tid(target_ids, iterator=True)
+    flat_rids = database.find_rid_by_tid(target_ids, flatten=True)
+    tid_rid_index = TidRidIndex(make_tid_rid_index(map2tid))
+
+    should_rids = {
+        tid: map2tid.index.values[map2tid["tid"].values == tid] for tid in target_ids
+    }
+    for tid, product in rids:
+        assert np.array_equal(product, should_rids[tid])
+    assert np.array_equal(
+        flat_rids, np.unique(np.concatenate(list(should_rids.values())))
+    )
+    assert tid_rid_index.get_rids([-5])[0].shape[0] == 0
@@ -0,0 +1,59 @@
+import pandas as pd
+from pmaf.biome.essentials import RepTaxonomy
+
+
+def test_taxonomy_from_lineages():
+    lineages = pd.Series(
+        [
+            "k__Bacteria; p__Firmicutes; c__[bacilli] ; g__",
+            "k__Archaea; p__A; p__B",
+            "Unassigned",
+        ],
+        index=["f1", "f2", "f3"],
+    )
+    taxonomy = RepTaxonomy(taxonomy=lineages)
+    should_taxa = pd.DataFrame(
+        {
+            "k": ["Bacteria", "Archaea", None],
+            "p": ["Firmicutes", "B", None],
+            "c": ["Bacilli", None, None],
+            "g": [None, None, None],
+        },
+        index=["f1", "f2", "f3"],
+        dtype=object,
+    )
+    pd.testing.assert_frame_equal(
+        taxonomy.data.loc[:, ["k", "p", "c", "g"]], should_taxa
+    )
+    assert taxonomy.avail_ranks == ["k", "p", "c"]
+
+    silva_taxonomy = RepTaxonomy(
+        taxonomy=pd.Series(["Bacteria;Firmicutes;[Bacilli]", "Bacteria;;"]),
+        taxonomy_notation="silva",
+        order_ranks=["k", "p", "c"],
+    )
+    assert silva_taxonomy.data.loc[:, "c"].tolist() == ["Bacilli", None]
+
+
+def get_internal_memory(taxonomy):
+    """Memory of pandas objects that are kept by `taxonomy` instance."""
+    return {
+        name: int(pd.DataFrame(value).memory_usage(deep=True).sum())
+        for name, value in vars(taxonomy).items()
+        if isinstance(value, (pd.DataFrame, pd.Series))
+    }
+
+
+def test_taxonomy_data_memory():
+    lineages = pd.Series(
+        ["k__Bacteria; p__Firmicutes; c__Bacilli", "k__Archaea; p__A"] * 500
+    )
+    taxonomy = RepTaxonomy(taxonomy=lineages)
+    before_memory = get_internal_memory(taxonomy)
+    data = taxonomy.data
+    after_memory = get_internal_memory(taxonomy)
+    assert taxonomy.data.equals(data)
+    assert get_internal_memory(taxonomy) == after_memory
+    assert after_memory.pop("_RepTaxonomy__internal_lineages") > 0
+    assert after_memory == before_memory
+    assert data.memory_usage(deep=True).sum() > sum(before_memory.values())
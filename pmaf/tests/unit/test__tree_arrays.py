@@ -0,0 +1,58 @@
+import ete3
+import numpy as np
+from pmaf.database._shared._tree_arrays import (
+    make_tree_arrays,
+    find_tip_nodes,
+    find_group_tip_nodes,
+    mark_root_paths,
+    find_mrca_nodes,
+    collapse_unary_nodes,
+    build_ete3_subtree,
+)
+
+TEST_NEWICK = "((1:1,2:2)a:0.5,(3:3,(4:4,-x:5)b:0.25)c:0.75)root;"
+
+
+def test_tree_arrays_subtree():
+    tree_arrays = make_tree_arrays(ete3.Tree(TEST_NEWICK, format=1))
+    assert tree_arrays["parent"][-1] == -1
+    assert np.all(tree_arrays["parent"][:-1] > np.arange(8))
+    assert tree_arrays["tip_rids"].tolist() == [1, 2, 3, 4]
+
+    tip_nodes, tip_rids = find_tip_nodes(tree_arrays, [4, 1, 2])
+    assert tip_rids.tolist() == [1, 2, 4]
+    marked = mark_root_paths(tree_arrays["parent"], tip_nodes)
+    assert np.flatnonzero(marked).tolist() == [0, 1, 2, 4, 6, 7, 8]
+    nodes, parents, lengths, _, _ = collapse_unary_nodes(
+        tree_arrays["parent"], tree_arrays["length"], marked
+    )
+    subtree, node_map = build_ete3_subtree(tree_arrays, nodes, parents, lengths)
+    assert len(node_map) == 5
+    assert (
+        subtree.write(format=1, format_root_node=True) == "((1:1,2:2)a:0.5,4:5)root:0;"
+    )
+
+
+def test_tree_arrays_groups():
+    tree_arrays = make_tree_arrays(ete3.Tree(TEST_NEWICK, format=1))
+    group_indices, group_nodes = find_group_tip_nodes(
+        tree_arrays, [[1, 2], [4, 3], [2]]
+    )
+    mrca_nodes, group_firsts = find_mrca_nodes(
+        tree_arrays["parent"], group_indices, group_nodes, total_groups=4
+    )
+    assert mrca_nodes.tolist() == [2, 7, 1, -1]
+    assert group_firsts.tolist() == [0, 3, 1, -1]
+
+    anchors = np.asarray([2, 0])
+    marked = mark_root_paths(tree_arrays["parent"], anchors)
+    nodes, parents, _, anchor_parents, anchor_lengths = collapse_unary_nodes(
+        tree_arrays["parent"],
+        tree_arrays["length"],
+        marked,
+        anchors=anchors,
+        collapse_root=True,
+    )
+    assert nodes.tolist() == [8]
+    assert anchor_parents.tolist() == [8, 8]
+    assert anchor_lengths.tolist() == [1.0, 2.0]
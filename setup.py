@@ -64,10 +64,12 @@ setup(
         "pandas",
         "dateparser",
         "numpy",
+        "scipy",
         #"pytest",
         "urllib3",
         "ete3",
         "tables",
+        "h5py",
         "biopython",
         "scikit-bio",
     ],